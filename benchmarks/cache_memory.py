@@ -0,0 +1,154 @@
+"""Memory benchmark for the tool cache.
+
+Compares the memory held by cached place searches, geocodes and elevations
+stored as the raw Google responses (what the cache held before) with the
+compact records of ``core/records.py``, and reports how many entries of each
+kind fit in a gigabyte. Responses are decoded from JSON like upstream
+responses, so no strings are shared between entries by accident. Runs offline.
+
+Usage:
+    python benchmarks/cache_memory.py [--entries 2000] [--places 20]
+"""
+
+import argparse
+import json
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from georgian_guide.core.records import pack_result
+from georgian_guide.schemas.base import ToolType
+
+GIGABYTE = 1024 ** 3
+
+# Type lists Google returns for places in Georgia
+TYPE_LISTS = [
+    ["restaurant", "food", "point_of_interest", "establishment"],
+    ["cafe", "food", "point_of_interest", "establishment"],
+    ["lodging", "point_of_interest", "establishment"],
+    ["tourist_attraction", "point_of_interest", "establishment"],
+    ["church", "place_of_worship", "point_of_interest", "establishment"],
+]
+
+
+def make_place(index: int, rng: random.Random) -> Dict[str, Any]:
+    """Build a place result shaped like the Google text search response."""
+    lat, lng = 41.69 + rng.uniform(-0.1, 0.1), 44.80 + rng.uniform(-0.1, 0.1)
+    return {
+        "business_status": "OPERATIONAL",
+        "formatted_address": f"{index} Rustaveli Ave, Tbilisi 0108, Georgia",
+        "geometry": {
+            "location": {"lat": round(lat, 7), "lng": round(lng, 7)},
+            "viewport": {
+                "northeast": {"lat": round(lat + 0.0013, 7), "lng": round(lng + 0.0013, 7)},
+                "southwest": {"lat": round(lat - 0.0013, 7), "lng": round(lng - 0.0013, 7)},
+            },
+        },
+        "icon": "https://maps.gstatic.com/mapfiles/place_api/icons/v1/png_71/restaurant-71.png",
+        "icon_background_color": "#FF9E67",
+        "icon_mask_base_uri": "https://maps.gstatic.com/mapfiles/place_api/icons/v2/restaurant_pinlet",
+        "name": f"რესტორანი {index}",
+        "opening_hours": {"open_now": rng.random() < 0.7},
+        "photos": [{
+            "height": 3024,
+            "html_attributions": [f"<a href=\"https://maps.google.com/maps/contrib/{index}\">A photo</a>"],
+            "photo_reference": "Aap_uE" + "x" * 200,
+            "width": 4032,
+        }],
+        "place_id": f"ChIJ{index:023d}",
+        "plus_code": {"compound_code": "MQ2V+8F Tbilisi, Georgia", "global_code": "8HJ9MQ2V+8F"},
+        "price_level": rng.randint(1, 3),
+        "rating": round(rng.uniform(3.5, 5.0), 1),
+        "reference": f"ChIJ{index:023d}",
+        "types": list(rng.choice(TYPE_LISTS)),
+        "user_ratings_total": rng.randint(5, 5000),
+    }
+
+
+def make_search(entry: int, places: int, rng: random.Random) -> Dict[str, Any]:
+    """Build a places search response (places recur across searches, as in practice)."""
+    return {
+        "html_attributions": [],
+        "status": "OK",
+        "results": [make_place(rng.randrange(entry * 5 + places), rng) for _ in range(places)],
+    }
+
+
+def make_geocode(entry: int, rng: random.Random) -> Dict[str, Any]:
+    """Build a geocode response shaped like the Google Geocoding response."""
+    lat, lng = 41.0 + rng.uniform(0, 2), 42.0 + rng.uniform(0, 4)
+    return {
+        "status": "OK",
+        "results": [{
+            "address_components": [
+                {"long_name": f"Street {entry}", "short_name": f"Street {entry}", "types": ["route"]},
+                {"long_name": "Tbilisi", "short_name": "Tbilisi", "types": ["locality", "political"]},
+                {"long_name": "Georgia", "short_name": "GE", "types": ["country", "political"]},
+            ],
+            "formatted_address": f"Street {entry}, Tbilisi, Georgia",
+            "geometry": {
+                "location": {"lat": round(lat, 7), "lng": round(lng, 7)},
+                "location_type": "GEOMETRIC_CENTER",
+                "viewport": {
+                    "northeast": {"lat": round(lat + 0.001, 7), "lng": round(lng + 0.001, 7)},
+                    "southwest": {"lat": round(lat - 0.001, 7), "lng": round(lng - 0.001, 7)},
+                },
+            },
+            "place_id": f"ChIJ{entry:023d}",
+            "types": ["route"],
+        }],
+    }
+
+
+def make_elevation(entry: int, rng: random.Random) -> Dict[str, Any]:
+    """Build an elevation response for a few points."""
+    return {
+        "status": "OK",
+        "results": [
+            {
+                "elevation": rng.uniform(0, 5000),
+                "location": {"lat": round(41 + rng.uniform(0, 2), 7), "lng": round(42 + rng.uniform(0, 4), 7)},
+                "resolution": 152.7032318115234,
+            }
+            for _ in range(3)
+        ],
+    }
+
+
+def measure(build: Callable[[], List[Any]]) -> Tuple[int, List[Any]]:
+    """Return the bytes still allocated after building a list of entries."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entries = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used, entries
+
+
+def main() -> None:
+    """Run the benchmark and print the memory per entry of each representation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=2000, help="Cache entries per tool")
+    parser.add_argument("--places", type=int, default=20, help="Places per search result")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    kinds = [
+        (ToolType.SEARCH_PLACES, [json.dumps(make_search(i, args.places, rng)) for i in range(args.entries)]),
+        (ToolType.GEOCODE, [json.dumps(make_geocode(i, rng)) for i in range(args.entries)]),
+        (ToolType.ELEVATION, [json.dumps(make_elevation(i, rng)) for i in range(args.entries)]),
+    ]
+
+    print(f"{'tool':<16}{'raw B/entry':>14}{'compact B/entry':>17}{'raw /GB':>12}{'compact /GB':>14}{'ratio':>8}")
+    for tool_type, payloads in kinds:
+        raw, _ = measure(lambda: [json.loads(payload) for payload in payloads])
+        compact, _ = measure(lambda: [pack_result(tool_type, json.loads(payload)) for payload in payloads])
+        raw_entry, compact_entry = raw / len(payloads), compact / len(payloads)
+        print(
+            f"{tool_type.value:<16}{raw_entry:>14.0f}{compact_entry:>17.0f}"
+            f"{GIGABYTE / raw_entry:>12.0f}{GIGABYTE / compact_entry:>14.0f}{raw_entry / compact_entry:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Offline benchmark for the router model cascade.
+
+Routes a file of queries (one per line) through the router with the given
+cascade and reports, per model tier, the number of calls, latency, cost and
+escalation rate. Requires OPENAI_API_KEY.
+
+Usage:
+    python benchmarks/model_tiering.py queries.txt [--models gpt-4o-mini,gpt-4o]
+"""
+
+import argparse
+import asyncio
+from typing import List
+
+
+async def route_all(queries: List[str], models: List[str], concurrency: int) -> None:
+    """Route every query through the router cascade.
+
+    Args:
+        queries: Queries to route
+        models: Router model cascade, cheapest first
+        concurrency: Maximum concurrent routing calls
+    """
+    from georgian_guide.core.factory import load_environment
+    from georgian_guide.llm.router import OpenAILLMRouter
+    from georgian_guide.schemas.query import UserQuery
+
+    load_environment()
+    router = OpenAILLMRouter(models=models)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def route(text: str) -> None:
+        async with semaphore:
+            await router.route(UserQuery(query=text))
+
+    await asyncio.gather(*(route(text) for text in queries))
+
+
+def main() -> None:
+    """Run the benchmark and print a per-tier report."""
+    from georgian_guide.core.metrics import metrics
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("queries", help="File with one query per line")
+    parser.add_argument("--models", default="gpt-4o-mini,gpt-4o", help="Cascade, cheapest first")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent routing calls")
+    args = parser.parse_args()
+
+    with open(args.queries, encoding="utf-8") as f:
+        queries = [line.strip() for line in f if line.strip()]
+    models = [model.strip() for model in args.models.split(",")]
+
+    asyncio.run(route_all(queries, models, args.concurrency))
+
+    snapshot = metrics.snapshot()
+    counters, histograms = snapshot["counters"], snapshot["histograms"]
+    print(f"{len(queries)} queries\n")
+    print(f"{'model':<16}{'calls':>7}{'served':>8}{'escalated':>11}{'p50 s':>8}{'p95 s':>8}{'cost $':>10}")
+    for model in models:
+        labels = f"component=router,model={model}"
+        calls = counters.get(f"llm_tier_calls_total{{{labels}}}", 0)
+        served = counters.get(f"llm_tier_served_total{{{labels}}}", 0)
+        escalated = sum(
+            value for name, value in counters.items()
+            if name.startswith("llm_escalations_total{") and f"model={model}," in name
+        )
+        latency = histograms.get(f"llm_tier_latency_seconds{{{labels}}}", {})
+        cost = counters.get(f"llm_tier_cost_usd{{{labels}}}", 0.0)
+        print(
+            f"{model:<16}{calls:>7.0f}{served:>8.0f}{escalated:>11.0f}"
+            f"{latency.get('p50', 0.0):>8.2f}{latency.get('p95', 0.0):>8.2f}{cost:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Replay a captured query log as a load test.
+
+Re-drives the queries of a query log (``QUERY_LOG_PATH``) at their original
+pace, scaled by ``--speed``, or as fast as ``--concurrency`` allows with
+``--speed 0``. Queries go either to a running server (``--url``) or to an
+in-process query processor built from the current settings, whose Google Maps
+and OpenAI upstreams are replaced by stubs with the given latencies, so cache
+sizes, rate limits and concurrency settings can be compared offline. Reports
+latency percentiles, throughput and, in-process, cache hit rates.
+
+Usage:
+    python benchmarks/replay.py queries.jsonl [--speed 2] [--url http://localhost:8000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from georgian_guide.core.context import RequestTrace, request_context
+from georgian_guide.core.query_log import query_from_entry
+from georgian_guide.schemas.query import UserQuery
+from georgian_guide.tools.session import MapsBackend
+
+
+def read_log(path: str) -> List[Tuple[float, UserQuery]]:
+    """Read (arrival time, query) pairs from a query log, oldest first."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            entries.append((data.get("ts", 0.0), query_from_entry(data)))
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def jitter(seconds: float) -> float:
+    """Vary a latency by +-50%."""
+    return seconds * random.uniform(0.5, 1.5)
+
+
+class StubMapsBackend(MapsBackend):
+    """Maps backend answering every function with a small canned payload."""
+
+    trusted = True
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def call(self, function_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(jitter(self.latency))
+        seed = abs(hash(json.dumps(parameters, sort_keys=True, default=str))) % 10_000
+        if function_name.endswith("search_places"):
+            return {"status": "OK", "results": [
+                {
+                    "place_id": f"stub-{seed}-{i}",
+                    "name": f"Place {seed}-{i}",
+                    "formatted_address": "Tbilisi, Georgia",
+                    "geometry": {"location": {"lat": 41.69 + i / 1000, "lng": 44.80 + i / 1000}},
+                    "rating": 4.0 + i % 10 / 10,
+                    "user_ratings_total": 50 + seed % 500,
+                }
+                for i in range(10)
+            ]}
+        if function_name.endswith("geocode"):
+            return {"status": "OK", "results": [{
+                "formatted_address": "Tbilisi, Georgia",
+                "geometry": {"location": {"lat": 41.7151, "lng": 44.8271}},
+                "place_id": f"stub-{seed}",
+            }]}
+        if function_name.endswith("distance_matrix"):
+            return {"status": "OK", "rows": [
+                {"elements": [
+                    {"status": "OK", "duration": {"value": 900}, "distance": {"value": 5000}}
+                    for _ in parameters.get("destinations", [])
+                ]}
+                for _ in parameters.get("origins", [])
+            ]}
+        return {"status": "OK", "results": [], "routes": []}
+
+
+class StubChatClient:
+    """Stand-in for AsyncOpenAI returning fixed JSON completions."""
+
+    def __init__(self, latency: float, reply: Callable[[List[Dict[str, str]]], Dict[str, Any]]):
+        self.latency = latency
+        self.reply = reply
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs: Any) -> Any:
+        await asyncio.sleep(jitter(self.latency))
+        content = json.dumps(self.reply(kwargs["messages"]))
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None
+        )
+
+
+def route_reply(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Route every query to a place search for the query text."""
+    return {
+        "selected_tools": [{
+            "tool_type": "search_places",
+            "parameters": [{"name": "query", "value": messages[-1]["content"]}],
+            "explanation": "stub",
+        }],
+        "query_analysis": "stub",
+    }
+
+
+def answer_reply(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """Answer with a fixed text."""
+    return {"response": "Stub answer.", "follow_up_questions": []}
+
+
+def stub_processor(llm_latency: float, maps_latency: float) -> Any:
+    """Build a query processor from the current settings with stubbed upstreams."""
+    from georgian_guide.core.config import Settings
+    from georgian_guide.core.factory import create_processor
+    from georgian_guide.tools.registry import ToolRegistry
+    from georgian_guide.tools.session import MapsSession
+
+    settings = Settings.from_env()
+    session = MapsSession(
+        StubMapsBackend(maps_latency),
+        concurrency=settings.tool_concurrency,
+        default_concurrency=settings.default_tool_concurrency
+    )
+    processor = create_processor(settings, tools=ToolRegistry(settings, session=session))
+    processor.router._client = StubChatClient(llm_latency, route_reply)
+    # The LLM receiver may be wrapped by the template receiver
+    receiver = getattr(processor.output_receiver, "receiver", processor.output_receiver)
+    receiver._client = StubChatClient(llm_latency, answer_reply)
+    return processor
+
+
+async def replay(
+    entries: List[Tuple[float, UserQuery]],
+    send: Callable[[UserQuery], Awaitable[bool]],
+    speed: float,
+    concurrency: int
+) -> Tuple[List[float], List[float], int, float]:
+    """Send the queries on the log's schedule.
+
+    Returns:
+        Latencies (s), start delays behind schedule (s), errors, wall time (s)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    delays: List[float] = []
+    errors = 0
+    first = entries[0][0] if entries else 0.0
+    start = time.perf_counter()
+
+    async def run(ts: float, query: UserQuery) -> None:
+        nonlocal errors
+        due = (ts - first) / speed if speed > 0 else 0.0
+        await asyncio.sleep(max(0.0, due - (time.perf_counter() - start)))
+        async with semaphore:
+            began = time.perf_counter()
+            delays.append(max(0.0, began - start - due))
+            ok = await send(query)
+            latencies.append(time.perf_counter() - began)
+            errors += not ok
+
+    await asyncio.gather(*(run(ts, query) for ts, query in entries))
+    return latencies, delays, errors, time.perf_counter() - start
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Return a percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Replay the log and print the report."""
+    entries = read_log(args.log)
+    cache: Dict[str, List[int]] = {}
+
+    if args.url:
+        import httpx
+
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+
+        async def send(query: UserQuery) -> bool:
+            try:
+                response = await client.post("/query", json=query.model_dump())
+                return response.status_code == 200
+            except httpx.HTTPError:
+                return False
+    else:
+        client = None
+        processor = stub_processor(args.llm_latency, args.maps_latency)
+
+        async def send(query: UserQuery) -> bool:
+            trace = RequestTrace()
+            try:
+                with request_context(trace=trace):
+                    await processor.process_query(query)
+                return True
+            except Exception:
+                return False
+            finally:
+                for name, (hits, misses) in trace.cache.items():
+                    totals = cache.setdefault(name, [0, 0])
+                    totals[0] += hits
+                    totals[1] += misses
+
+    try:
+        latencies, delays, errors, seconds = await replay(entries, send, args.speed, args.concurrency)
+    finally:
+        if client is not None:
+            await client.aclose()
+
+    print(f"{len(entries)} queries in {seconds:.1f}s ({len(entries) / seconds if seconds else 0:.1f}/s), {errors} errors")
+    print(
+        f"latency s: p50 {percentile(latencies, 0.5):.3f}  p90 {percentile(latencies, 0.9):.3f}  "
+        f"p99 {percentile(latencies, 0.99):.3f}  max {max(latencies, default=0.0):.3f}"
+    )
+    print(f"behind schedule s: mean {statistics.fmean(delays) if delays else 0.0:.3f}  max {max(delays, default=0.0):.3f}")
+    for name, (hits, misses) in sorted(cache.items()):
+        print(f"{name} cache: {hits}/{hits + misses} hits ({hits / (hits + misses):.1%})")
+
+
+def main() -> None:
+    """Parse arguments and run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", help="Query log (JSONL)")
+    parser.add_argument("--url", help="Server to replay against (default: in-process with stubs)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Pace multiplier (0 = as fast as possible)")
+    parser.add_argument("--concurrency", type=int, default=64, help="Maximum queries in flight")
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="Stub OpenAI latency (s)")
+    parser.add_argument("--maps-latency", type=float, default=0.15, help="Stub Maps latency (s)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="HTTP timeout (s)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
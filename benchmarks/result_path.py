@@ -0,0 +1,135 @@
+"""Microbenchmark for the tool result path.
+
+Compares the CPU time spent turning raw Google Maps payloads into the output
+receiver's prompt with the old path (validate, ``.dict()`` copy, re-validate in
+``ToolCallResult``, indented JSON) against the current one (validate or trust
+the raw dict, ``model_construct``, compact JSON). Runs offline.
+
+Usage:
+    python benchmarks/result_path.py [--places 20] [--steps 40] [--iterations 2000]
+"""
+
+import argparse
+import json
+import time
+import warnings
+from typing import Any, Callable, Dict, List, Tuple
+
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import ToolCallResult
+from georgian_guide.schemas.tools import DirectionsResponse, PlacesSearchResponse
+
+
+def make_places(count: int) -> Dict[str, Any]:
+    """Build a text search payload shaped like the Google Places response."""
+    return {
+        "status": "OK",
+        "results": [
+            {
+                "place_id": f"ChIJ{i:08d}",
+                "name": f"რესტორანი {i}",
+                "formatted_address": f"{i} Rustaveli Ave, Tbilisi, Georgia",
+                "geometry": {"location": {"lat": 41.69 + i / 1000, "lng": 44.80 + i / 1000}},
+                "rating": 4.5,
+                "user_ratings_total": 100 + i,
+                "types": ["restaurant", "food", "point_of_interest", "establishment"],
+                "opening_hours": {"open_now": True},
+                "photos": [{"height": 1200, "width": 1600, "photo_reference": "x" * 200}],
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def make_directions(steps: int) -> Dict[str, Any]:
+    """Build a directions payload shaped like the Google Directions response."""
+    return {
+        "status": "OK",
+        "routes": [{
+            "summary": "E60",
+            "legs": [{
+                "distance": {"text": "20 km", "value": 20000},
+                "duration": {"text": "25 mins", "value": 1500},
+                "steps": [
+                    {
+                        "html_instructions": f"Continue onto <b>E60</b> step {i}",
+                        "distance": {"text": "0.5 km", "value": 500},
+                        "duration": {"text": "1 min", "value": 60},
+                        "polyline": {"points": "a" * 120},
+                    }
+                    for i in range(steps)
+                ],
+            }],
+        }],
+    }
+
+
+def old_path(payloads: List[Tuple[ToolType, Any, Dict[str, Any]]]) -> str:
+    """Validate, dump, re-validate and pretty-print every result."""
+    results = [
+        ToolCallResult(tool_type=tool_type, result=schema(**payload).dict(), success=True)
+        for tool_type, schema, payload in payloads
+    ]
+    return json.dumps([
+        {"tool_type": r.tool_type.value, "success": r.success, "result": r.result, "error_message": r.error_message}
+        for r in results
+    ], indent=2)
+
+
+def new_path(payloads: List[Tuple[ToolType, Any, Dict[str, Any]]], trusted: bool) -> str:
+    """Validate (unless trusted) and serialize every result once, compactly."""
+    results = []
+    for tool_type, schema, payload in payloads:
+        if not trusted:
+            schema.model_validate(payload)
+        results.append(ToolCallResult.model_construct(
+            tool_type=tool_type, result=payload, success=True, error_message=None
+        ))
+    return json.dumps([
+        {"tool_type": r.tool_type.value, "success": r.success, "result": r.result, "error_message": r.error_message}
+        for r in results
+    ], ensure_ascii=False, separators=(",", ":"))
+
+
+def measure(run: Callable[[], str], iterations: int) -> Tuple[float, int]:
+    """Return the mean CPU seconds per run and the size of the output."""
+    output = run()
+    start = time.process_time()
+    for _ in range(iterations):
+        run()
+    return (time.process_time() - start) / iterations, len(output.encode("utf-8"))
+
+
+def main() -> None:
+    """Run the benchmark and print the per-query cost of each path."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--places", type=int, default=20, help="Places per search result")
+    parser.add_argument("--steps", type=int, default=40, help="Steps per directions route")
+    parser.add_argument("--iterations", type=int, default=2000, help="Queries to time per path")
+    args = parser.parse_args()
+
+    # One query's worth of tool results: a places search and a route
+    payloads = [
+        (ToolType.SEARCH_PLACES, PlacesSearchResponse, make_places(args.places)),
+        (ToolType.DIRECTIONS, DirectionsResponse, make_directions(args.steps)),
+    ]
+
+    warnings.simplefilter("ignore", DeprecationWarning)
+    rows = [
+        ("old (validate + dict + re-validate + indent)", lambda: old_path(payloads)),
+        ("new (validate, no copy, compact)", lambda: new_path(payloads, trusted=False)),
+        ("new (trusted backend)", lambda: new_path(payloads, trusted=True)),
+    ]
+
+    print(f"{'path':<46}{'CPU µs/query':>14}{'prompt bytes':>14}")
+    baseline = None
+    for name, run in rows:
+        seconds, size = measure(run, args.iterations)
+        baseline = baseline or seconds
+        print(f"{name:<46}{seconds * 1e6:>14.1f}{size:>14}")
+        if seconds is not baseline:
+            print(f"{'  saved per query':<46}{(baseline - seconds) * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Startup-time benchmark for the Georgian Guide CLI and API.
+
+Reports the wall-clock time of ``georgian-guide --help`` and of importing the
+entry point modules, plus the slowest imports as measured by
+``python -X importtime``.
+
+Usage:
+    python benchmarks/startup.py [--runs 10] [--top 15]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# (label, python arguments) for every measured command
+COMMANDS: List[Tuple[str, List[str]]] = [
+    ("cli --help", ["-m", "georgian_guide.cli", "--help"]),
+    ("import cli", ["-c", "import georgian_guide.cli"]),
+    ("import api", ["-c", "import georgian_guide.api.main"]),
+    ("first-query imports", [
+        "-c",
+        "from georgian_guide.core.factory import create_processor, preload_modules; "
+        "create_processor(); preload_modules()",
+    ]),
+]
+
+
+def time_command(arguments: List[str], runs: int) -> List[float]:
+    """Run a Python command several times and return wall-clock times.
+
+    Args:
+        arguments: Arguments passed to the Python interpreter
+        runs: Number of runs
+
+    Returns:
+        Durations in milliseconds
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *arguments],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def import_times(arguments: List[str]) -> Dict[str, int]:
+    """Collect cumulative import times using ``python -X importtime``.
+
+    Args:
+        arguments: Arguments passed to the Python interpreter
+
+    Returns:
+        Cumulative import time in microseconds by top-level package
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    totals: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Only count top-level entries so nested imports are not double counted
+        if not name.startswith("  "):
+            package = name.strip().split(".")[0]
+            totals[package] = totals.get(package, 0) + int(cumulative)
+    return totals
+
+
+def main() -> None:
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command")
+    parser.add_argument("--top", type=int, default=15, help="Packages to list")
+    args = parser.parse_args()
+
+    print(f"{'command':<22}{'median ms':>12}{'min ms':>10}")
+    for label, arguments in COMMANDS:
+        durations = time_command(arguments, args.runs)
+        print(f"{label:<22}{statistics.median(durations):>12.1f}{min(durations):>10.1f}")
+
+    for label, arguments in COMMANDS:
+        totals = import_times(arguments)
+        print(f"\nSlowest imports for '{label}' (cumulative ms):")
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        for package, micros in ranked[: args.top]:
+            print(f"  {package:<30}{micros / 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
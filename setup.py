@@ -13,9 +13,13 @@ if __name__ == "__main__":
             "pydantic>=2.5.0",
             "openai>=1.5.0",
             "fastapi>=0.103.1",
-            "uvicorn>=0.23.2",
+            "uvicorn[standard]>=0.23.2",
             "python-dotenv>=1.0.0",
+            "httpx>=0.25.0",
         ],
+        extras_require={
+            "http2": ["h2>=4.1.0"],
+        },
         entry_points={
             "console_scripts": [
                 "georgian-guide=georgian_guide.cli:main",
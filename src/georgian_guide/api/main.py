@@ -3,39 +3,35 @@
 This module defines the FastAPI application and endpoints.
 """
 
-import os
+import asyncio
+import json
+import random
+import secrets
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, TypeVar
 
-from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.requests import HTTPConnection
+from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-
-from georgian_guide.core.interfaces import ToolInterface
-from georgian_guide.core.processor import QueryProcessor
-from georgian_guide.llm.output_receiver import OpenAIOutputReceiver
-from georgian_guide.llm.router import OpenAILLMRouter
-from georgian_guide.schemas.base import ToolType
-from georgian_guide.schemas.query import AssistantResponse, UserQuery
-from georgian_guide.tools.google_maps import (
-    DirectionsMapsTool,
-    DistanceMatrixMapsTool,
-    ElevationMapsTool,
-    GeocodeMapsTool,
-    PlaceDetailsMapsTool,
-    ReverseGeocodeMapsTool,
-    SearchPlacesMapsTool,
-)
+from pydantic import ValidationError
+
+from georgian_guide.core.context import Budget, RequestTrace, request_context
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.query_log import log_entry
+from georgian_guide.core.ranking import resolved_places
+from georgian_guide.core.scheduler import SchedulerQueueFull
+from georgian_guide.schemas.jobs import Job, JobRequest
+from georgian_guide.schemas.query import AssistantResponse, ToolCallResult, UserQuery
 
-# Load environment variables from .env file
-load_dotenv()
+T = TypeVar("T")
 
-# Check for required API keys
-if not os.environ.get("OPENAI_API_KEY"):
-    raise ValueError("OPENAI_API_KEY environment variable is required")
+# Queries one WebSocket connection may have in flight at once
+MAX_SOCKET_QUERIES = 4
 
 # Get the directory of the static files
 current_dir = Path(__file__).parent
@@ -64,69 +60,625 @@ app.mount("/static", StaticFiles(directory=static_dir), name="static")
 # Initialize components on startup
 @app.on_event("startup")
 async def startup_event():
-    """Initialize application components on startup."""
-    # Create tool instances
-    tools: Dict[ToolType, ToolInterface] = {
-        ToolType.GEOCODE: GeocodeMapsTool(),
-        ToolType.REVERSE_GEOCODE: ReverseGeocodeMapsTool(),
-        ToolType.SEARCH_PLACES: SearchPlacesMapsTool(),
-        ToolType.PLACE_DETAILS: PlaceDetailsMapsTool(),
-        ToolType.DISTANCE_MATRIX: DistanceMatrixMapsTool(),
-        ToolType.ELEVATION: ElevationMapsTool(),
-        ToolType.DIRECTIONS: DirectionsMapsTool(),
-    }
-    
-    # Create router and output receiver
-    router = OpenAILLMRouter()
-    output_receiver = OpenAIOutputReceiver()
+    """Initialize application components on startup.
+    
+    The environment is validated here rather than at import time, and the
+    processor modules are imported lazily so that importing this module stays
+    cheap. Tools are instantiated on first use by the tool registry.
+    """
+    from georgian_guide.core.config import Settings
+    from georgian_guide.core.factory import (
+        create_processor,
+        create_tool_registry,
+        load_environment,
+        preload_modules,
+    )
+    from georgian_guide.core.jobs import JobQueue, JobStore
+    from georgian_guide.core.profiling import Profiler
+    from georgian_guide.core.query_log import QueryLog
+    from georgian_guide.core.snapshot import load_snapshot, processor_caches
+    
+    # Load environment variables and check for required API keys
+    load_environment()
+    app.state.settings = Settings.from_env()
+    
+    # Build the tools once; they share a single pooled Maps session
+    app.state.tools = create_tool_registry(app.state.settings)
     
     # Create query processor
-    app.state.processor = QueryProcessor(
-        router=router,
-        output_receiver=output_receiver,
-        tools=tools
+    app.state.processor = create_processor(app.state.settings, tools=app.state.tools)
+    
+    # Start with the caches warmed at deploy time, if a snapshot was written
+    settings = app.state.settings
+    if settings.cache_snapshot_path:
+        try:
+            counts = load_snapshot(
+                settings.cache_snapshot_path, processor_caches(app.state.processor)
+            )
+        except (OSError, ValueError):
+            metrics.counter("cache_snapshot_load_failures_total").inc()
+        else:
+            for name, count in counts.items():
+                metrics.gauge("cache_snapshot_entries", cache=name).set(count)
+    
+    # Record incoming queries for replay, if configured
+    app.state.query_log = None
+    if settings.query_log_path:
+        app.state.query_log = QueryLog(
+            settings.query_log_path,
+            max_bytes=settings.query_log_max_bytes,
+            backups=settings.query_log_backups
+        )
+        app.state.query_log.start()
+    
+    # Sample the stacks of profiled requests, if profiling is enabled
+    app.state.profiler = None
+    if settings.profile_requests or settings.profile_sample_rate > 0:
+        app.state.profiler = Profiler(interval=settings.profile_interval_ms / 1000)
+        app.state.profiler.install()
+    
+    # Start the workers of the job queue; jobs left over from a previous run
+    # are picked up again
+    app.state.jobs = JobQueue(
+        JobStore(settings.jobs_db_path),
+        app.state.processor,
+        workers=settings.jobs_workers,
+        max_queued=settings.jobs_max_queued,
+        lease_seconds=settings.jobs_lease_seconds,
+        callback_hosts=settings.jobs_callback_hosts
     )
+    app.state.jobs.start()
+    
+    # Import the remaining heavy modules off the event loop so the first
+    # query does not pay for them
+    app.state.preload = asyncio.create_task(asyncio.to_thread(preload_modules))
 
 
-@app.post("/query", response_model=AssistantResponse)
-async def process_query(query: UserQuery) -> AssistantResponse:
-    """Process a user query using POST.
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown."""
+    await app.state.jobs.stop()
+    app.state.jobs.store.close()
+    if app.state.query_log is not None:
+        await app.state.query_log.stop()
+    if app.state.profiler is not None:
+        await app.state.profiler.close()
+    await app.state.tools.aclose()
+
+
+def overloaded(error: SchedulerQueueFull) -> HTTPException:
+    """Build the response for a query rejected because upstreams are saturated.
+    
+    Args:
+        error: The scheduler error
+        
+    Returns:
+        HTTP 503 exception asking the client to retry later
+    """
+    return HTTPException(
+        status_code=503,
+        detail=f"Service overloaded: {str(error)}",
+        headers={"Retry-After": "1"}
+    )
+
+
+def wants_profile(request: Request) -> bool:
+    """Decide whether to profile a request.
+    
+    Args:
+        request: The HTTP request
+        
+    Returns:
+        Whether the request asked to be profiled or was sampled
+    """
+    settings = app.state.settings
+    if app.state.profiler is None:
+        return False
+    flag = request.headers.get("X-Profile") or request.query_params.get("profile") or ""
+    if settings.profile_requests and flag.strip().lower() in ("1", "true", "yes", "on"):
+        return True
+    return random.random() < settings.profile_sample_rate
+
+
+def request_budget(request: HTTPConnection) -> Optional[Budget]:
+    """Start the time budget of a query.
+    
+    The deadline defaults to REQUEST_DEADLINE; clients may ask for a shorter
+    one with an ``X-Deadline-Ms`` header.
+    
+    Args:
+        request: The HTTP request or WebSocket connection
+        
+    Returns:
+        Budget of the query, or None without a deadline
+    """
+    seconds = app.state.settings.request_deadline
+    try:
+        requested = float(request.headers.get("X-Deadline-Ms", "0")) / 1000
+    except ValueError:
+        requested = 0.0
+    if requested > 0:
+        seconds = min(seconds, requested) if seconds > 0 else requested
+    return Budget.start(seconds) if seconds > 0 else None
+
+
+class ClientDisconnected(Exception):
+    """Raised when the client closed the connection before the answer was ready."""
+
+
+async def until_disconnected(request: Request) -> None:
+    """Return once the client has closed the connection.
+    
+    Args:
+        request: The HTTP request (its body must already have been read)
+    """
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def unless_disconnected(request: Request, work: Awaitable[T]) -> T:
+    """Run work, cancelling it if the client disconnects first.
+    
+    Args:
+        request: The HTTP request
+        work: Coroutine producing the response
+        
+    Returns:
+        Result of the work
+        
+    Raises:
+        ClientDisconnected: If the client disconnected (the work is cancelled)
+    """
+    task = asyncio.ensure_future(work)
+    watcher = asyncio.ensure_future(until_disconnected(request))
+    try:
+        done, _ = await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+    if task not in done:
+        # Let the work unwind, so shared calls see their waiters leave
+        await asyncio.gather(task, return_exceptions=True)
+        raise ClientDisconnected()
+    return task.result()
+
+
+def record_cancelled(trace: RequestTrace) -> None:
+    """Count a query abandoned by its client, by the stage it had reached."""
+    stage = trace.stages[-1][0] if trace.stages else "received"
+    metrics.counter("requests_cancelled_total", stage=stage).inc()
+
+
+async def answer(
+    query: UserQuery,
+    endpoint: str,
+    request: Request,
+    response: Response
+) -> AssistantResponse:
+    """Process a query, recording it in the query log and profiling it if asked.
     
     Args:
         query: The user query
+        endpoint: Endpoint that received the query
+        request: The HTTP request
+        response: The HTTP response, to report the profile id in
         
     Returns:
         Assistant response
     """
+    received_at = time.time()
+    trace = RequestTrace()
+    status = "ok"
+    profiling = (
+        app.state.profiler.profile(f"{endpoint} {query.query[:80]}")
+        if wants_profile(request) else nullcontext()
+    )
     try:
-        return await app.state.processor.process_query(query)
+        with request_context(trace=trace, budget=request_budget(request)), profiling as profile:
+            if profile is not None:
+                response.headers["X-Profile-Id"] = profile.profile_id
+            return await unless_disconnected(request, app.state.processor.process_query(query))
+    except (asyncio.CancelledError, ClientDisconnected) as e:
+        status = "cancelled"
+        record_cancelled(trace)
+        if isinstance(e, ClientDisconnected):
+            # Nobody is listening; the status is only seen in access logs
+            raise HTTPException(status_code=499, detail="Client closed the connection")
+        raise
+    except SchedulerQueueFull as e:
+        status = "overloaded"
+        raise overloaded(e)
     except Exception as e:
+        status = "error"
         raise HTTPException(
             status_code=500,
             detail=f"Error processing query: {str(e)}"
         )
+    finally:
+        if app.state.query_log is not None:
+            app.state.query_log.record(
+                log_entry(query, endpoint, status, trace, received_at)
+            )
+
+
+def sse(event: str, data: Any) -> str:
+    """Format one server-sent event.
+    
+    Args:
+        event: Event name
+        data: JSON-serializable payload
+        
+    Returns:
+        The event in text/event-stream format
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def stream_answer(query: UserQuery, endpoint: str, request: Request) -> StreamingResponse:
+    """Stream the answer to a query as server-sent events.
+    
+    The answer text arrives as 'delta' events ({"text": ...}) and the
+    complete answer as a final 'done' event. Once streaming has started the
+    status code cannot change, so failures are sent as an 'error' event
+    ({"status": ..., "detail": ...}).
+    
+    Args:
+        query: The user query
+        endpoint: Endpoint that received the query
+        request: The HTTP request
+        
+    Returns:
+        Event stream response
+    """
+    budget = request_budget(request)
+    
+    async def events() -> AsyncIterator[str]:
+        received_at = time.time()
+        trace = RequestTrace()
+        status = "ok"
+        try:
+            with request_context(trace=trace, budget=budget):
+                async for event in app.state.processor.stream_query(query):
+                    if event.response is not None:
+                        yield sse("done", event.response.model_dump(mode="json"))
+                    elif event.event == "delta":
+                        yield sse("delta", {"text": event.text})
+        except (asyncio.CancelledError, GeneratorExit):
+            # The server stops the stream when the client disconnects
+            status = "cancelled"
+            record_cancelled(trace)
+            raise
+        except SchedulerQueueFull as e:
+            status = "overloaded"
+            yield sse("error", {"status": 503, "detail": f"Service overloaded: {str(e)}"})
+        except Exception as e:
+            status = "error"
+            yield sse("error", {"status": 500, "detail": f"Error processing query: {str(e)}"})
+        finally:
+            if app.state.query_log is not None:
+                app.state.query_log.record(
+                    log_entry(query, endpoint, status, trace, received_at)
+                )
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/query", response_model=AssistantResponse)
+async def process_query(query: UserQuery, request: Request, response: Response) -> AssistantResponse:
+    """Process a user query using POST.
+    
+    Args:
+        query: The user query
+        request: The HTTP request
+        response: The HTTP response
+        
+    Returns:
+        Assistant response
+    """
+    return await answer(query, "/query", request, response)
 
 
 @app.get("/api/ask", response_model=AssistantResponse)
-async def get_query(query: str) -> AssistantResponse:
+async def get_query(
+    query: str,
+    request: Request,
+    response: Response,
+    language: Optional[str] = None
+) -> AssistantResponse:
     """Process a user query using GET.
     
     Args:
         query: The user query as a query parameter
+        request: The HTTP request
+        response: The HTTP response
+        language: Response language (detected from the query if omitted)
         
     Returns:
         Assistant response
     """
+    return await answer(UserQuery(query=query, language=language), "/api/ask", request, response)
+
+
+@app.post("/query/stream")
+async def stream_query(query: UserQuery, request: Request) -> StreamingResponse:
+    """Process a user query using POST, streaming the answer.
+    
+    Args:
+        query: The user query
+        request: The HTTP request
+        
+    Returns:
+        Server-sent events with the answer text as it is written
+    """
+    return stream_answer(query, "/query/stream", request)
+
+
+@app.get("/api/ask/stream")
+async def get_query_stream(
+    query: str,
+    request: Request,
+    language: Optional[str] = None
+) -> StreamingResponse:
+    """Process a user query using GET, streaming the answer.
+    
+    Args:
+        query: The user query as a query parameter
+        request: The HTTP request
+        language: Response language (detected from the query if omitted)
+        
+    Returns:
+        Server-sent events with the answer text as it is written
+    """
+    return stream_answer(UserQuery(query=query, language=language), "/api/ask/stream", request)
+
+
+@dataclass
+class ChatSession:
+    """State of one WebSocket connection.
+    
+    The user's location and language carry over from one query to the next,
+    so follow-up questions need not repeat them, and so do the places the
+    last answer resolved ("how far is it from there?"). Messages to the client go
+    through one outbox, so events of concurrent queries never interleave
+    mid-message and each query's events keep their order.
+    """
+    
+    websocket: WebSocket
+    location: Optional[Dict[str, float]] = None
+    language: Optional[str] = None
+    places: List[Dict[str, Any]] = field(default_factory=list)
+    # Query id -> task answering the query
+    queries: Dict[str, "asyncio.Task[None]"] = field(default_factory=dict)
+    outbox: "asyncio.Queue[Dict[str, Any]]" = field(default_factory=asyncio.Queue)
+    received: int = 0
+    
+    def post(self, message: Dict[str, Any]) -> None:
+        """Queue a message for the client."""
+        self.outbox.put_nowait(message)
+    
+    def fail(self, query_id: Optional[str], status: int, detail: str) -> None:
+        """Queue an 'error' event for the client."""
+        self.post({"type": "error", "id": query_id, "status": status, "detail": detail})
+    
+    async def write(self) -> None:
+        """Send queued messages to the client until the connection closes."""
+        while True:
+            message = await self.outbox.get()
+            await self.websocket.send_text(json.dumps(message, ensure_ascii=False))
+    
+    def query(self, message: Dict[str, Any]) -> UserQuery:
+        """Build the query of a message and remember the location and language it sets.
+        
+        Args:
+            message: 'query' or 'context' message
+            
+        Returns:
+            The user query, with the context the session remembers
+            
+        Raises:
+            ValidationError: If the message is invalid; nothing is remembered then
+        """
+        query = UserQuery(
+            query=message.get("query"),
+            language=message["language"] if "language" in message else self.language,
+            location=message["location"] if "location" in message else self.location,
+            recent_places=self.places or None
+        )
+        self.location = query.location
+        self.language = query.language
+        return query
+
+
+def summarize_tools(tool_results: List[ToolCallResult]) -> List[Dict[str, Any]]:
+    """Describe the outcome of each tool call for a 'tools' event."""
+    return [
+        {
+            "tool_type": result.tool_type.value,
+            "success": result.success,
+            "status": result.result.get("status") if result.success else result.error_message,
+        }
+        for result in tool_results
+    ]
+
+
+async def socket_answer(session: ChatSession, query_id: str, query: UserQuery) -> None:
+    """Answer one query received over a WebSocket, streaming its events.
+    
+    Args:
+        session: The connection's session
+        query_id: Id the client gave the query
+        query: The user query
+    """
+    received_at = time.time()
+    trace = RequestTrace()
+    status = "ok"
+    
+    def on_stage(stage: str) -> None:
+        session.post({"type": "stage", "id": query_id, "stage": stage})
+    
     try:
-        user_query = UserQuery(query=query)
-        return await app.state.processor.process_query(user_query)
+        context = request_context(
+            trace=trace, budget=request_budget(session.websocket), stage_callback=on_stage
+        )
+        with context:
+            async for event in app.state.processor.stream_query(query):
+                if event.response is not None:
+                    response = event.response.model_dump(mode="json")
+                    session.post({"type": "done", "id": query_id, "response": response})
+                elif event.tool_results is not None:
+                    session.places = resolved_places(event.tool_results) or session.places
+                    tools = summarize_tools(event.tool_results)
+                    session.post({"type": "tools", "id": query_id, "tools": tools})
+                else:
+                    session.post({"type": "delta", "id": query_id, "text": event.text})
+    except asyncio.CancelledError:
+        status = "cancelled"
+        record_cancelled(trace)
+        raise
+    except SchedulerQueueFull as e:
+        status = "overloaded"
+        session.fail(query_id, 503, f"Service overloaded: {str(e)}")
     except Exception as e:
+        status = "error"
+        session.fail(query_id, 500, f"Error processing query: {str(e)}")
+    finally:
+        session.queries.pop(query_id, None)
+        if app.state.query_log is not None:
+            app.state.query_log.record(log_entry(query, "/ws", status, trace, received_at))
+
+
+def handle_socket_message(session: ChatSession, message: Any) -> None:
+    """Act on one message received over a WebSocket.
+    
+    Args:
+        session: The connection's session
+        message: Decoded JSON message
+    """
+    if not isinstance(message, dict):
+        session.fail(None, 400, "Messages must be JSON objects")
+        return
+    session.received += 1
+    query_id = str(message.get("id", session.received))
+    kind = message.get("type")
+    
+    if kind == "context":
+        try:
+            session.query({**message, "query": ""})
+        except ValidationError as e:
+            session.fail(query_id, 422, f"Invalid context: {str(e)}")
+    elif kind == "cancel":
+        task = session.queries.get(query_id)
+        if task is not None:
+            task.cancel()
+            session.post({"type": "cancelled", "id": query_id})
+    elif kind == "query":
+        if query_id in session.queries:
+            session.fail(query_id, 409, "Query id is already in flight")
+            return
+        if len(session.queries) >= MAX_SOCKET_QUERIES:
+            session.fail(query_id, 429, "Too many queries in flight")
+            return
+        try:
+            query = session.query(message)
+        except ValidationError as e:
+            session.fail(query_id, 422, f"Invalid query: {str(e)}")
+            return
+        session.queries[query_id] = asyncio.create_task(socket_answer(session, query_id, query))
+    else:
+        session.fail(query_id, 400, f"Unknown message type: {kind}")
+
+
+@app.websocket("/ws")
+async def chat_socket(websocket: WebSocket) -> None:
+    """Answer queries over a WebSocket connection.
+    
+    Clients send JSON messages: {"type": "query", "id": ..., "query": ...}
+    (optionally with "language" and "location", which the connection
+    remembers for later queries), {"type": "context", ...} to change them
+    without asking, and {"type": "cancel", "id": ...}. Several queries may be
+    in flight at once; every reply carries the id of its query. A query
+    produces 'stage' events as it moves through the pipeline, a 'tools'
+    event with the outcome of each tool, 'delta' events with the answer text
+    and a final 'done' event with the complete answer and follow-up
+    questions. Failures are sent as 'error' events ({"status": ...,
+    "detail": ...}), like on the streaming HTTP endpoints.
+    
+    Args:
+        websocket: The WebSocket connection
+    """
+    await websocket.accept()
+    session = ChatSession(websocket)
+    writer = asyncio.create_task(session.write())
+    metrics.gauge("websocket_connections").inc()
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                session.fail(None, 400, "Messages must be JSON")
+                continue
+            handle_socket_message(session, message)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        metrics.gauge("websocket_connections").dec()
+        # Nobody is left to read the answers
+        queries = list(session.queries.values())
+        for task in queries:
+            task.cancel()
+        await asyncio.gather(*queries, return_exceptions=True)
+        writer.cancel()
+        await asyncio.gather(writer, return_exceptions=True)
+
+
+@app.post("/jobs", response_model=Job, status_code=202)
+async def submit_job(request: JobRequest) -> Job:
+    """Queue a query for asynchronous processing.
+    
+    Args:
+        request: The user query, optionally with a callback URL
+        
+    Returns:
+        The queued job, to be polled at /jobs/{job_id}
+    """
+    from georgian_guide.core.jobs import InvalidCallbackUrl, JobQueueFull
+    
+    try:
+        return await app.state.jobs.submit(request)
+    except InvalidCallbackUrl as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except JobQueueFull as e:
         raise HTTPException(
-            status_code=500,
-            detail=f"Error processing query: {str(e)}"
+            status_code=503,
+            detail=f"Job queue full: {str(e)}",
+            headers={"Retry-After": "30"}
         )
 
 
+@app.get("/jobs/{job_id}", response_model=Job)
+async def get_job(job_id: str) -> Job:
+    """Return the state of a job.
+    
+    Args:
+        job_id: Job identifier
+        
+    Returns:
+        The job, including the answer once it succeeded
+    """
+    job = await app.state.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
 @app.get("/", response_class=HTMLResponse)
 async def get_index():
     """Serve the index.html file.
@@ -146,6 +698,68 @@ async def get_index():
         )
 
 
+def require_admin(request: Request) -> None:
+    """Check the admin token of a request to an /admin endpoint.
+    
+    Args:
+        request: The HTTP request
+        
+    Raises:
+        HTTPException: If no admin token is configured or it was not given
+    """
+    token = app.state.settings.admin_token
+    if not token:
+        raise HTTPException(status_code=404, detail="Admin endpoints are disabled")
+    given = request.headers.get("X-Admin-Token", "")
+    if not secrets.compare_digest(given.encode(), token.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@app.get("/admin/profiles")
+async def list_profiles(request: Request) -> Dict[str, Any]:
+    """List the recorded request profiles.
+    
+    Args:
+        request: The HTTP request
+        
+    Returns:
+        Summaries of the recorded profiles, newest first
+    """
+    require_admin(request)
+    profiler = app.state.profiler
+    profiles = list(profiler.finished)[::-1] if profiler is not None else []
+    return {"profiles": [profile.summary() for profile in profiles]}
+
+
+@app.get("/admin/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str, request: Request) -> PlainTextResponse:
+    """Return a request profile as collapsed stacks for flamegraph tools.
+    
+    Args:
+        profile_id: Profile identifier
+        request: The HTTP request
+        
+    Returns:
+        Collapsed stacks, one "frame;frame count" line per stack
+    """
+    require_admin(request)
+    profiler = app.state.profiler
+    profile = profiler.get(profile_id) if profiler is not None else None
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(profile.collapsed())
+
+
+@app.get("/metrics")
+async def get_metrics() -> Dict[str, Any]:
+    """Metrics endpoint.
+    
+    Returns:
+        Current counters, gauges and histogram summaries
+    """
+    return metrics.snapshot()
+
+
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
     """Health check endpoint.
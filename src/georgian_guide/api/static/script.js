@@ -37,6 +37,64 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
 
+    // Answers stream over one WebSocket kept open between questions; plain
+    // HTTP is used when WebSockets are unavailable or the socket drops
+    let socket = null;
+    let nextId = 0;
+    let currentId = null;
+    const pending = new Map();
+
+    function connect() {
+        if (!('WebSocket' in window)) {
+            return null;
+        }
+        if (socket && socket.readyState <= WebSocket.OPEN) {
+            return socket;
+        }
+        const scheme = window.location.protocol === 'https:' ? 'wss' : 'ws';
+        socket = new WebSocket(`${scheme}://${window.location.host}/ws`);
+        socket.addEventListener('open', function() {
+            pending.forEach((query, id) => sendOverSocket(id, query));
+        });
+        socket.addEventListener('message', handleSocketMessage);
+        socket.addEventListener('close', function() {
+            socket = null;
+            // Answer the questions the socket left unanswered over HTTP
+            const unanswered = Array.from(pending.values());
+            pending.clear();
+            unanswered.forEach(query => sendQueryHttp(query));
+        });
+        return socket;
+    }
+
+    function sendOverSocket(id, query) {
+        socket.send(JSON.stringify({ type: 'query', id: id, query: query }));
+    }
+
+    function handleSocketMessage(event) {
+        const message = JSON.parse(event.data);
+        // Events of questions replaced by a newer one are dropped
+        if (message.id !== currentId || !pending.has(message.id)) {
+            return;
+        }
+        if (message.type === 'delta') {
+            if (responseContainer.style.display !== 'block') {
+                responseContent.textContent = '';
+                followUpContainer.style.display = 'none';
+                responseContainer.style.display = 'block';
+            }
+            responseContent.textContent += message.text;
+        } else if (message.type === 'done') {
+            pending.delete(message.id);
+            displayResponse(message.response);
+            finishLoading();
+        } else if (message.type === 'error') {
+            pending.delete(message.id);
+            displayError(new Error(message.detail));
+            finishLoading();
+        }
+    }
+
     // Function to send query to API
     function sendQuery(query) {
         // Show loader, disable submit button
@@ -45,7 +103,28 @@ document.addEventListener('DOMContentLoaded', function() {
         
         // Hide previous response if any
         responseContainer.style.display = 'none';
-        
+
+        const ws = connect();
+        if (!ws) {
+            sendQueryHttp(query);
+            return;
+        }
+
+        // Only the latest question is shown; stop working on the previous one
+        if (currentId !== null && pending.has(currentId)) {
+            pending.delete(currentId);
+            if (ws.readyState === WebSocket.OPEN) {
+                ws.send(JSON.stringify({ type: 'cancel', id: currentId }));
+            }
+        }
+        currentId = String(++nextId);
+        pending.set(currentId, query);
+        if (ws.readyState === WebSocket.OPEN) {
+            sendOverSocket(currentId, query);
+        }
+    }
+
+    function sendQueryHttp(query) {
         // Prepare the request
         const url = `/api/ask?query=${encodeURIComponent(query)}`;
         
@@ -62,11 +141,13 @@ document.addEventListener('DOMContentLoaded', function() {
             .catch(error => {
                 displayError(error);
             })
-            .finally(() => {
-                // Hide loader, enable submit button
-                loader.style.display = 'none';
-                submitBtn.disabled = false;
-            });
+            .finally(finishLoading);
+    }
+
+    function finishLoading() {
+        // Hide loader, enable submit button
+        loader.style.display = 'none';
+        submitBtn.disabled = false;
     }
 
     // Function to display the API response
@@ -0,0 +1,219 @@
+"""In-memory caches for the Georgian Guide application.
+
+This module provides a bounded LRU cache whose entries expire after a TTL but
+remain available as "stale" values for a while longer, so callers can fall
+back to them when the upstream is failing, and a spatial cache that finds the
+nearest cached point within a tolerance radius, indexed by geohash cell.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+from georgian_guide.core.geo import geohash, geohash_cells_within, haversine
+
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    """Cached value with its expiry times."""
+
+    value: V
+    fresh_until: float
+    stale_until: float
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a deterministic string cache key.
+
+    Args:
+        *parts: JSON-serializable key parts
+
+    Returns:
+        Cache key
+    """
+    return json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class TTLCache(Generic[V]):
+    """Bounded LRU cache with fresh and stale expiry."""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0, stale_ttl: float = 0.0):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries
+            ttl: Seconds an entry is fresh
+            stale_ttl: Seconds an entry stays available as stale after expiring
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[str, _Entry[V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: str, now: float) -> Optional[_Entry[V]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if now >= entry.stale_until:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: str) -> Optional[V]:
+        """Return a fresh value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        now = time.monotonic()
+        entry = self._lookup(key, now)
+        if entry is None or now >= entry.fresh_until:
+            return None
+        return entry.value
+
+    def get_stale(self, key: str) -> Optional[V]:
+        """Return a value even if it has expired, as long as it is not too stale.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or past the stale window
+        """
+        entry = self._lookup(key, time.monotonic())
+        return entry.value if entry is not None else None
+
+    def set(self, key: str, value: V, ttl: Optional[float] = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds the value is fresh (defaults to the cache TTL)
+        """
+        now = time.monotonic()
+        fresh_until = now + (self.ttl if ttl is None else ttl)
+        self._entries[key] = _Entry(value, fresh_until, fresh_until + self.stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def items(self) -> Iterator[Tuple[str, V, float]]:
+        """Iterate over the fresh entries, least recently used first.
+
+        Yields:
+            Key, value and the seconds the value stays fresh
+        """
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if entry.fresh_until > now:
+                yield key, entry.value, entry.fresh_until - now
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+
+@dataclass
+class _Point(Generic[V]):
+    """Value cached for a point."""
+
+    latitude: float
+    longitude: float
+    value: V
+    fresh_until: float
+
+
+class SpatialCache(Generic[V]):
+    """Cache of values by location, answering for nearby points.
+
+    Points are grouped by geohash cell. A lookup checks the cell of the point
+    and the neighbouring cells the tolerance reaches, and returns the nearest
+    fresh value within the tolerance. Cells are evicted least recently used
+    first.
+    """
+
+    def __init__(
+        self,
+        precision: int = 7,
+        tolerance: float = 50.0,
+        max_cells: int = 1024,
+        ttl: float = 3600.0,
+        points_per_cell: int = 4
+    ):
+        """Initialize the cache.
+
+        Args:
+            precision: Geohash precision of the cells
+            tolerance: Default distance in meters within which a cached value answers
+            max_cells: Maximum number of cells
+            ttl: Seconds a value is fresh
+            points_per_cell: Maximum number of points kept per cell
+        """
+        self.precision = precision
+        self.tolerance = tolerance
+        self.ttl = ttl
+        self.points_per_cell = points_per_cell
+        self._cells: TTLCache[List[_Point[V]]] = TTLCache(max_size=max_cells, ttl=ttl)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        tolerance: Optional[float] = None
+    ) -> Optional[Tuple[V, float, bool]]:
+        """Find the nearest fresh value within the tolerance of a point.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            tolerance: Distance in meters (defaults to the cache tolerance)
+
+        Returns:
+            The value, its distance in meters and whether it came from the
+            point's own cell, or None if there is none
+        """
+        tolerance = self.tolerance if tolerance is None else tolerance
+        now = time.monotonic()
+        best: Optional[Tuple[V, float, bool]] = None
+        cells = geohash_cells_within(latitude, longitude, tolerance, self.precision)
+        for index, cell in enumerate(cells):
+            for point in self._cells.get(cell) or ():
+                if point.fresh_until <= now:
+                    continue
+                distance = haversine(latitude, longitude, point.latitude, point.longitude)
+                if distance <= tolerance and (best is None or distance < best[1]):
+                    best = (point.value, distance, index == 0)
+        return best
+
+    def set(self, latitude: float, longitude: float, value: V) -> None:
+        """Store the value of a point.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            value: Value to store
+        """
+        cell = geohash(latitude, longitude, self.precision)
+        now = time.monotonic()
+        points = [point for point in self._cells.get(cell) or () if point.fresh_until > now]
+        points.append(_Point(latitude, longitude, value, now + self.ttl))
+        self._cells.set(cell, points[-self.points_per_cell:])
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._cells.clear()
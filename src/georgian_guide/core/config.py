@@ -0,0 +1,295 @@
+"""Configuration for the Georgian Guide application.
+
+This module defines the application settings and how they are read from the
+environment.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from georgian_guide.schemas.base import ToolType
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _parse_limits(value: str) -> Dict[str, float]:
+    """Parse limits written as "name=limit,name=limit"."""
+    limits: Dict[str, float] = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, limit = item.partition("=")
+        limits[name.strip().lower()] = float(limit)
+    return limits
+
+
+def _parse_list(value: str) -> List[str]:
+    """Parse a comma-separated list."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _parse_tool_types(value: str) -> List[ToolType]:
+    """Parse a comma-separated list of tool types."""
+    return [ToolType(name.strip().lower()) for name in value.split(",") if name.strip()]
+
+
+def _parse_tool_limits(value: str) -> Dict[ToolType, float]:
+    """Parse per-tool limits written as "tool_type=limit,tool_type=limit"."""
+    return {ToolType(name): limit for name, limit in _parse_limits(value).items()}
+
+
+class Settings(BaseModel):
+    """Application settings."""
+
+    maps_backend: str = Field(
+        "mcp",
+        description="Google Maps backend to use: 'mcp' or 'http'"
+    )
+    google_maps_api_key: Optional[str] = Field(
+        None,
+        description="Google Maps API key, required for the 'http' backend"
+    )
+    maps_timeout: float = Field(10.0, description="Timeout for Maps requests in seconds")
+    maps_max_connections: int = Field(
+        20,
+        description="Maximum number of pooled connections to the Maps backend"
+    )
+    maps_max_keepalive: int = Field(
+        10,
+        description="Maximum number of idle keep-alive connections"
+    )
+    maps_keepalive_expiry: float = Field(
+        30.0,
+        description="Seconds an idle keep-alive connection is kept open"
+    )
+    maps_http2: bool = Field(
+        True,
+        description="Use HTTP/2 multiplexing when the 'h2' package is installed"
+    )
+    tool_concurrency: Dict[ToolType, int] = Field(
+        default_factory=dict,
+        description="Maximum concurrent upstream calls per tool type"
+    )
+    default_tool_concurrency: int = Field(
+        8,
+        description="Maximum concurrent upstream calls for tools without a limit"
+    )
+    upstream_rate_limits: Dict[str, float] = Field(
+        default_factory=lambda: {"google_maps": 50.0},
+        description="Requests per second per upstream ('google_maps', 'openai')"
+    )
+    tool_rate_limits: Dict[ToolType, float] = Field(
+        default_factory=dict,
+        description="Google Maps requests per second per tool type"
+    )
+    scheduler_max_queue: int = Field(
+        100,
+        description="Maximum number of calls waiting for each upstream"
+    )
+    tool_cache_size: int = Field(2048, description="Maximum number of cached tool results")
+    tool_cache_ttl: float = Field(3600.0, description="Seconds a cached tool result is fresh")
+    tool_cache_stale_ttl: float = Field(
+        86400.0,
+        description="Seconds an expired tool result may still be served when the upstream fails"
+    )
+    retry_max_attempts: int = Field(3, description="Maximum attempts per upstream call")
+    retry_base_delay: float = Field(0.1, description="Base backoff delay in seconds")
+    retry_max_delay: float = Field(2.0, description="Maximum backoff delay in seconds")
+    breaker_failure_threshold: int = Field(
+        5,
+        description="Consecutive failures that open an upstream's circuit"
+    )
+    breaker_reset_timeout: float = Field(
+        30.0,
+        description="Seconds an open circuit waits before a trial call"
+    )
+    hedged_tools: List[ToolType] = Field(
+        default_factory=lambda: [ToolType.GEOCODE],
+        description="Latency-critical tools whose slow calls are hedged"
+    )
+    router_models: List[str] = Field(
+        default_factory=lambda: ["gpt-4o-mini", "gpt-4o"],
+        description="Router model cascade, cheapest first"
+    )
+    output_models: List[str] = Field(
+        default_factory=lambda: ["gpt-4o"],
+        description="Output receiver model cascade, cheapest first"
+    )
+    hedge_percentile: float = Field(
+        95.0,
+        description="Latency percentile after which a hedged request is sent"
+    )
+    router_cache_size: int = Field(1024, description="Maximum number of cached routing decisions")
+    router_cache_ttl: float = Field(3600.0, description="Seconds a cached routing decision is reused")
+    response_cache_size: int = Field(
+        1024,
+        description="Maximum number of cached answers (0 disables the answer cache)"
+    )
+    response_cache_ttl: float = Field(900.0, description="Seconds a cached answer is reused")
+    cache_snapshot_path: Optional[str] = Field(
+        None,
+        description="Cache snapshot loaded by API workers at startup"
+    )
+    template_answers: bool = Field(
+        True,
+        description="Answer simple single-tool results from templates instead of the output model"
+    )
+    request_deadline: float = Field(
+        20.0,
+        description="Seconds an API query may take before parts of the answer are cut (0 disables)"
+    )
+    deadline_output_reserve: float = Field(
+        4.0,
+        description="Seconds of the deadline kept for writing the answer"
+    )
+    gazetteer_enabled: bool = Field(
+        True,
+        description="Geocode well-known Georgian places from the offline gazetteer"
+    )
+    gazetteer_min_confidence: float = Field(
+        0.9,
+        description="Minimum gazetteer match confidence for answering a geocode locally"
+    )
+    reverse_geocode_precision: int = Field(
+        7,
+        description="Geohash precision of the reverse geocode cache cells (7 is about 150 m)"
+    )
+    reverse_geocode_tolerance: float = Field(
+        50.0,
+        description="Meters within which a cached reverse geocode answers for a point (0 disables)"
+    )
+    opening_hours_index_size: int = Field(
+        20000,
+        description="Number of places whose weekly opening hours are indexed"
+    )
+    open_now_details_limit: int = Field(
+        5,
+        description="Place details calls per search for candidates with unknown opening hours"
+    )
+    knowledge_index_path: Optional[str] = Field(
+        None,
+        description="Knowledge index file to memory-map (default: built from the bundled corpus)"
+    )
+    knowledge_snippet_chars: int = Field(
+        600,
+        description="Maximum characters of each knowledge passage passed to the output stage"
+    )
+    place_top_k: int = Field(8, description="Number of ranked places passed to the output stage")
+    place_dedupe_meters: float = Field(
+        25.0,
+        description="Places with the same name closer than this are treated as duplicates"
+    )
+    place_distance_scale: float = Field(
+        2000.0,
+        description="Distance in meters at which a place's ranking score is halved"
+    )
+    query_log_path: Optional[str] = Field(
+        None,
+        description="JSONL file recording every API query (disabled if unset)"
+    )
+    query_log_max_bytes: int = Field(50_000_000, description="Size at which the query log rotates")
+    query_log_backups: int = Field(5, description="Number of rotated query log files kept")
+    profile_requests: bool = Field(
+        False,
+        description="Profile requests sent with an X-Profile header or profile=1 parameter"
+    )
+    profile_sample_rate: float = Field(0.0, description="Fraction of all requests profiled")
+    profile_interval_ms: float = Field(5.0, description="Milliseconds between profiler samples")
+    admin_token: Optional[str] = Field(
+        None,
+        description="Token required in the X-Admin-Token header by /admin endpoints (disabled if unset)"
+    )
+    jobs_db_path: str = Field("jobs.sqlite3", description="SQLite database holding queued jobs")
+    jobs_workers: int = Field(4, description="Number of jobs processed concurrently")
+    jobs_max_queued: int = Field(1000, description="Maximum number of queued jobs")
+    jobs_lease_seconds: float = Field(
+        300.0,
+        description="Seconds a running job may go without progress before it is retried"
+    )
+    jobs_callback_hosts: List[str] = Field(
+        default_factory=list,
+        description="Hosts job callback URLs may point to (empty: any public host)"
+    )
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """Create settings from environment variables.
+
+        Args:
+            environ: Environment mapping (defaults to os.environ)
+
+        Returns:
+            Settings populated from the environment
+        """
+        environ = os.environ if environ is None else environ
+        values = {
+            field: parse(environ[name])
+            for name, (field, parse) in ENV_VARS.items()
+            if name in environ
+        }
+        return cls(**values)
+
+
+# Environment variable name -> (settings field, parser)
+ENV_VARS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "MAPS_BACKEND": ("maps_backend", lambda value: value.strip().lower()),
+    "GOOGLE_MAPS_API_KEY": ("google_maps_api_key", str),
+    "MAPS_TIMEOUT": ("maps_timeout", float),
+    "MAPS_MAX_CONNECTIONS": ("maps_max_connections", int),
+    "MAPS_MAX_KEEPALIVE": ("maps_max_keepalive", int),
+    "MAPS_KEEPALIVE_EXPIRY": ("maps_keepalive_expiry", float),
+    "MAPS_HTTP2": ("maps_http2", _parse_bool),
+    "TOOL_CONCURRENCY": ("tool_concurrency", _parse_tool_limits),
+    "DEFAULT_TOOL_CONCURRENCY": ("default_tool_concurrency", int),
+    "UPSTREAM_RATE_LIMITS": ("upstream_rate_limits", _parse_limits),
+    "TOOL_RATE_LIMITS": ("tool_rate_limits", _parse_tool_limits),
+    "SCHEDULER_MAX_QUEUE": ("scheduler_max_queue", int),
+    "TOOL_CACHE_SIZE": ("tool_cache_size", int),
+    "TOOL_CACHE_TTL": ("tool_cache_ttl", float),
+    "TOOL_CACHE_STALE_TTL": ("tool_cache_stale_ttl", float),
+    "RETRY_MAX_ATTEMPTS": ("retry_max_attempts", int),
+    "RETRY_BASE_DELAY": ("retry_base_delay", float),
+    "RETRY_MAX_DELAY": ("retry_max_delay", float),
+    "BREAKER_FAILURE_THRESHOLD": ("breaker_failure_threshold", int),
+    "BREAKER_RESET_TIMEOUT": ("breaker_reset_timeout", float),
+    "HEDGED_TOOLS": ("hedged_tools", _parse_tool_types),
+    "HEDGE_PERCENTILE": ("hedge_percentile", float),
+    "ROUTER_MODELS": ("router_models", _parse_list),
+    "OUTPUT_MODELS": ("output_models", _parse_list),
+    "ROUTER_CACHE_SIZE": ("router_cache_size", int),
+    "ROUTER_CACHE_TTL": ("router_cache_ttl", float),
+    "RESPONSE_CACHE_SIZE": ("response_cache_size", int),
+    "RESPONSE_CACHE_TTL": ("response_cache_ttl", float),
+    "CACHE_SNAPSHOT_PATH": ("cache_snapshot_path", str),
+    "TEMPLATE_ANSWERS": ("template_answers", _parse_bool),
+    "REQUEST_DEADLINE": ("request_deadline", float),
+    "DEADLINE_OUTPUT_RESERVE": ("deadline_output_reserve", float),
+    "GAZETTEER_ENABLED": ("gazetteer_enabled", _parse_bool),
+    "GAZETTEER_MIN_CONFIDENCE": ("gazetteer_min_confidence", float),
+    "REVERSE_GEOCODE_PRECISION": ("reverse_geocode_precision", int),
+    "REVERSE_GEOCODE_TOLERANCE": ("reverse_geocode_tolerance", float),
+    "OPENING_HOURS_INDEX_SIZE": ("opening_hours_index_size", int),
+    "OPEN_NOW_DETAILS_LIMIT": ("open_now_details_limit", int),
+    "KNOWLEDGE_INDEX_PATH": ("knowledge_index_path", str),
+    "KNOWLEDGE_SNIPPET_CHARS": ("knowledge_snippet_chars", int),
+    "PLACE_TOP_K": ("place_top_k", int),
+    "PLACE_DEDUPE_METERS": ("place_dedupe_meters", float),
+    "PLACE_DISTANCE_SCALE": ("place_distance_scale", float),
+    "QUERY_LOG_PATH": ("query_log_path", str),
+    "QUERY_LOG_MAX_BYTES": ("query_log_max_bytes", int),
+    "QUERY_LOG_BACKUPS": ("query_log_backups", int),
+    "PROFILE_REQUESTS": ("profile_requests", _parse_bool),
+    "PROFILE_SAMPLE_RATE": ("profile_sample_rate", float),
+    "PROFILE_INTERVAL_MS": ("profile_interval_ms", float),
+    "ADMIN_TOKEN": ("admin_token", str),
+    "JOBS_DB_PATH": ("jobs_db_path", str),
+    "JOBS_WORKERS": ("jobs_workers", int),
+    "JOBS_MAX_QUEUED": ("jobs_max_queued", int),
+    "JOBS_LEASE_SECONDS": ("jobs_lease_seconds", float),
+    "JOBS_CALLBACK_HOSTS": ("jobs_callback_hosts", _parse_list),
+}
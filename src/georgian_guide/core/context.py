@@ -0,0 +1,159 @@
+"""Per-request context for the Georgian Guide application.
+
+The request context travels with a query through every await (it is stored in a
+context variable), so components deep in the pipeline can read request-level
+settings without threading extra arguments through the interfaces.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from georgian_guide.core.profiling import Profile
+
+
+class Priority(IntEnum):
+    """Scheduling priority of a request; lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+    PREFETCH = 2
+
+
+@dataclass
+class RequestTrace:
+    """Stage timings and cache outcomes recorded while a request is processed."""
+
+    started: float = field(default_factory=time.perf_counter)
+    # (stage, perf_counter time the stage was reached)
+    stages: List[Tuple[str, float]] = field(default_factory=list)
+    # Cache name -> [hits, misses]
+    cache: Dict[str, List[int]] = field(default_factory=dict)
+
+    def stage_milliseconds(self, finished: Optional[float] = None) -> Dict[str, float]:
+        """Return the time spent in each stage.
+
+        Args:
+            finished: perf_counter time the request finished (defaults to now)
+
+        Returns:
+            Milliseconds per stage, in stage order
+        """
+        finished = time.perf_counter() if finished is None else finished
+        ends = [start for _, start in self.stages[1:]] + [finished]
+        return {
+            stage: round((end - start) * 1000, 1)
+            for (stage, start), end in zip(self.stages, ends)
+        }
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request's deadline leaves no time for a step."""
+
+
+@dataclass
+class Budget:
+    """Time budget of a request with a latency SLA.
+
+    Budgets derived for a part of the pipeline (e.g. with an earlier deadline
+    for the tools) share the list of degraded parts with the request's budget.
+    """
+
+    # time.monotonic() time by which the answer is due
+    deadline: float
+    # Parts of the answer that were cut or served stale to meet the deadline
+    degraded: List[str] = field(default_factory=list)
+
+    @classmethod
+    def start(cls, seconds: float) -> "Budget":
+        """Create a budget ending the given number of seconds from now."""
+        return cls(deadline=time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Return the seconds left until the deadline (negative once it passed)."""
+        return self.deadline - time.monotonic()
+
+    def degrade(self, part: str) -> None:
+        """Record that a part of the answer was cut or served stale.
+
+        Args:
+            part: Description of the part, e.g. "tool:directions"
+        """
+        if part not in self.degraded:
+            self.degraded.append(part)
+
+
+@dataclass
+class RequestContext:
+    """State attached to the request currently being processed."""
+
+    priority: Priority = Priority.INTERACTIVE
+    # Called with the name of each pipeline stage as the query reaches it
+    stage_callback: Optional[Callable[[str], None]] = None
+    # Trace filled in for the query log
+    trace: Optional[RequestTrace] = None
+    # Profile recording the request's stack samples
+    profile: Optional["Profile"] = None
+    # Deadline of the request (None for no deadline)
+    budget: Optional[Budget] = None
+
+
+_current_context: ContextVar[RequestContext] = ContextVar(
+    "georgian_guide_request_context", default=RequestContext()
+)
+
+
+def get_context() -> RequestContext:
+    """Return the context of the current request.
+
+    Returns:
+        Current request context (a default context outside of a request)
+    """
+    return _current_context.get()
+
+
+@contextmanager
+def request_context(**changes: Any) -> Iterator[RequestContext]:
+    """Run a block with a request context derived from the current one.
+
+    Args:
+        **changes: RequestContext fields to override
+
+    Yields:
+        The new request context
+    """
+    context = replace(get_context(), **changes)
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
+
+
+def report_stage(stage: str) -> None:
+    """Report that the current request reached a pipeline stage.
+
+    Args:
+        stage: Name of the stage, e.g. "routing"
+    """
+    context = get_context()
+    if context.trace is not None:
+        context.trace.stages.append((stage, time.perf_counter()))
+    if context.stage_callback is not None:
+        context.stage_callback(stage)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Record a cache lookup of the current request in its trace.
+
+    Args:
+        cache: Name of the cache, e.g. "router"
+        hit: Whether the lookup found a fresh value
+    """
+    trace = get_context().trace
+    if trace is not None:
+        trace.cache.setdefault(cache, [0, 0])[0 if hit else 1] += 1
@@ -0,0 +1,131 @@
+"""Application factory for the Georgian Guide application.
+
+This module wires the concrete components into a query processor. Heavy
+dependencies (OpenAI client, tool implementations) are imported inside the
+functions so that entry points can start without paying for them up front.
+"""
+
+import os
+from importlib import import_module
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from georgian_guide.core.cache import TTLCache
+    from georgian_guide.core.config import Settings
+    from georgian_guide.core.processor import QueryProcessor
+    from georgian_guide.core.ranking import PlaceRanker
+    from georgian_guide.tools.registry import ToolRegistry
+
+# Modules needed to answer the first query, in the order they are used
+PRELOAD_MODULES: Tuple[str, ...] = (
+    "openai",
+    "georgian_guide.tools.google_maps",
+)
+
+
+def load_environment() -> None:
+    """Load environment variables from .env and check the required ones.
+
+    Raises:
+        ValueError: If a required environment variable is missing
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    if not os.environ.get("OPENAI_API_KEY"):
+        raise ValueError("OPENAI_API_KEY environment variable is required")
+
+
+def create_tool_registry(settings: Optional["Settings"] = None) -> "ToolRegistry":
+    """Create the tool registry described by the settings.
+
+    Args:
+        settings: Application settings (defaults to settings from the environment)
+
+    Returns:
+        Tool registry
+    """
+    from georgian_guide.tools.registry import ToolRegistry
+
+    return ToolRegistry(settings)
+
+
+def create_processor(
+    settings: Optional["Settings"] = None,
+    tools: Optional["ToolRegistry"] = None
+) -> "QueryProcessor":
+    """Create a query processor with the default components.
+
+    Args:
+        settings: Application settings (defaults to settings from the environment)
+        tools: Tool registry to use (defaults to a new registry for the settings)
+
+    Returns:
+        Configured query processor
+    """
+    from georgian_guide.core.cache import TTLCache
+    from georgian_guide.core.config import Settings
+    from georgian_guide.core.processor import QueryProcessor
+    from georgian_guide.core.ranking import PlaceRanker
+    from georgian_guide.core.resilience import RetryPolicy, configure_resilience
+    from georgian_guide.core.scheduler import create_scheduler, set_scheduler
+    from georgian_guide.core.templates import TemplateOutputReceiver
+    from georgian_guide.llm.output_receiver import OpenAIOutputReceiver
+    from georgian_guide.llm.router import OpenAILLMRouter
+
+    if settings is None:
+        settings = tools.settings if tools is not None else Settings.from_env()
+
+    # Rate limit upstream calls made by all components of this process
+    set_scheduler(create_scheduler(settings))
+
+    # Retry and circuit breaker parameters for all upstream calls
+    configure_resilience(
+        RetryPolicy(
+            max_attempts=settings.retry_max_attempts,
+            base_delay=settings.retry_base_delay,
+            max_delay=settings.retry_max_delay
+        ),
+        failure_threshold=settings.breaker_failure_threshold,
+        reset_timeout=settings.breaker_reset_timeout
+    )
+
+    response_cache = None
+    if settings.response_cache_size > 0:
+        response_cache = TTLCache(
+            max_size=settings.response_cache_size,
+            ttl=settings.response_cache_ttl
+        )
+
+    # Simple results are answered from templates before reaching the LLM
+    output_receiver = OpenAIOutputReceiver(models=settings.output_models)
+    if settings.template_answers:
+        output_receiver = TemplateOutputReceiver(output_receiver)
+
+    return QueryProcessor(
+        router=OpenAILLMRouter(
+            models=settings.router_models,
+            cache=TTLCache(max_size=settings.router_cache_size, ttl=settings.router_cache_ttl)
+        ),
+        output_receiver=output_receiver,
+        tools=tools if tools is not None else create_tool_registry(settings),
+        ranker=PlaceRanker(
+            top_k=settings.place_top_k,
+            dedupe_meters=settings.place_dedupe_meters,
+            distance_scale=settings.place_distance_scale
+        ),
+        response_cache=response_cache,
+        output_reserve=settings.deadline_output_reserve
+    )
+
+
+def preload_modules() -> None:
+    """Import the modules needed by the first query.
+
+    Long-running servers call this in a background thread after startup so the
+    first query does not pay the import cost, while the CLI simply imports them
+    on demand.
+    """
+    for module_name in PRELOAD_MODULES:
+        import_module(module_name)
@@ -0,0 +1,196 @@
+"""Offline gazetteer of Georgian place names.
+
+The gazetteer resolves the names of cities, regions and well-known landmarks
+locally, so spelling variants of the same place ("Mtskheta", "Mcxeta",
+"Mtsketa", "მცხეთა") do not each cost a geocoding round-trip. Names are
+reduced to canonical keys (see ``core.text``); exact key matches are resolved
+directly and other spellings are matched through a trigram index and scored
+by edit distance.
+"""
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from georgian_guide.core.text import canonical_key
+
+
+@dataclass(frozen=True)
+class GazetteerEntry:
+    """A place known to the gazetteer."""
+
+    name: str
+    kind: str
+    latitude: float
+    longitude: float
+    city: Optional[str] = None
+    aliases: Tuple[str, ...] = field(default=(), compare=False)
+
+    @property
+    def formatted_address(self) -> str:
+        """Address in the style of Google geocoding results."""
+        parts = [self.name] + ([self.city] if self.city else []) + ["Georgia"]
+        return ", ".join(parts)
+
+
+@dataclass(frozen=True)
+class GazetteerMatch:
+    """Result of a gazetteer lookup."""
+
+    entry: GazetteerEntry
+    confidence: float
+
+
+def trigrams(key: str) -> Set[str]:
+    """Return the trigrams of a key padded with boundary markers."""
+    padded = f"^{key}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: str, b: str) -> float:
+    """Return 1 - normalized Levenshtein distance between two keys."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return 1.0 - previous[-1] / max(len(a), len(b))
+
+
+class Gazetteer:
+    """Index of place names with transliteration-aware fuzzy lookup."""
+
+    def __init__(
+        self,
+        entries: Iterable[GazetteerEntry],
+        country_names: Iterable[str] = (),
+        candidates: int = 10,
+        ambiguity_margin: float = 0.05
+    ):
+        """Initialize the gazetteer.
+
+        Args:
+            entries: Places to index
+            country_names: Names of the country, ignored at the end of addresses
+            candidates: Number of trigram candidates scored by edit distance
+            ambiguity_margin: Minimum confidence lead over a different place
+        """
+        self.entries: List[GazetteerEntry] = list(entries)
+        self.country_keys = {canonical_key(name) for name in country_names}
+        self.candidates = candidates
+        self.ambiguity_margin = ambiguity_margin
+
+        # Canonical key -> entry, and trigram -> keys containing it
+        self._keys: Dict[str, GazetteerEntry] = {}
+        self._postings: Dict[str, List[str]] = defaultdict(list)
+        for entry in self.entries:
+            for name in (entry.name,) + entry.aliases:
+                key = canonical_key(name)
+                if key and key not in self._keys:
+                    self._keys[key] = entry
+                    for gram in trigrams(key):
+                        self._postings[gram].append(key)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def match(self, name: str) -> Optional[GazetteerMatch]:
+        """Find the place best matching a single name.
+
+        Args:
+            name: Place name in any script or transliteration
+
+        Returns:
+            Best match, or None if no place is close or the best is ambiguous
+        """
+        key = canonical_key(name)
+        if not key:
+            return None
+        entry = self._keys.get(key)
+        if entry is not None:
+            return GazetteerMatch(entry, 1.0)
+
+        # Shortlist keys sharing the most trigrams, then score by edit distance
+        overlap = Counter(
+            candidate for gram in trigrams(key) for candidate in self._postings.get(gram, ())
+        )
+        best: Dict[GazetteerEntry, float] = {}
+        for candidate, _ in overlap.most_common(self.candidates):
+            entry = self._keys[candidate]
+            best[entry] = max(best.get(entry, 0.0), similarity(key, candidate))
+        if not best:
+            return None
+
+        ranked = sorted(best.items(), key=lambda item: -item[1])
+        entry, confidence = ranked[0]
+        if len(ranked) > 1 and confidence - ranked[1][1] < self.ambiguity_margin:
+            return None
+        return GazetteerMatch(entry, confidence)
+
+    def resolve(self, address: str) -> Optional[GazetteerMatch]:
+        """Resolve a free-form address such as "Narikala, Tbilisi, Georgia".
+
+        A trailing country name is ignored. Addresses with further parts are
+        matched on their first part, and each remaining part must name the
+        place's city. Addresses containing digits (house numbers) are not
+        resolved.
+
+        Args:
+            address: Address or place name
+
+        Returns:
+            Match with its confidence, or None if the address is not a known place
+        """
+        if any(char.isdigit() for char in address):
+            return None
+
+        parts = [part.strip() for part in address.split(",") if part.strip()]
+        while parts and canonical_key(parts[-1]) in self.country_keys:
+            parts.pop()
+        if not parts:
+            return None
+
+        found = self.match(parts[0])
+        if found is None or len(parts) == 1:
+            return found
+
+        city_key = canonical_key(found.entry.city or found.entry.name)
+        confidences = [found.confidence]
+        for part in parts[1:]:
+            context = similarity(canonical_key(part), city_key)
+            if context < 0.8:
+                return None
+            confidences.append(context)
+        return GazetteerMatch(found.entry, min(confidences))
+
+
+_default_gazetteer: Optional[Gazetteer] = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """Return the gazetteer built from the bundled place data.
+
+    Returns:
+        Shared gazetteer, built on first use
+    """
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        from georgian_guide.data.gazetteer import COUNTRY_NAMES, GAZETTEER
+
+        _default_gazetteer = Gazetteer(
+            (
+                GazetteerEntry(name, kind, latitude, longitude, city, aliases)
+                for name, kind, latitude, longitude, city, aliases in GAZETTEER
+            ),
+            country_names=COUNTRY_NAMES
+        )
+    return _default_gazetteer
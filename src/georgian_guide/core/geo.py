@@ -0,0 +1,141 @@
+"""Geographic helpers.
+
+This module contains the small amount of spherical geometry the application
+needs, geohash cells for quantizing coordinates, and a helper that reads
+coordinates from the different location shapes used by Google Maps payloads
+and our own schemas.
+"""
+
+import math
+from typing import Any, List, Optional, Tuple
+
+# Mean Earth radius in meters
+EARTH_RADIUS_M = 6_371_008.8
+
+# Meters per degree of latitude
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+Coordinates = Tuple[float, float]
+
+
+def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Compute the great-circle distance between two points.
+
+    Args:
+        lat1: Latitude of the first point in degrees
+        lng1: Longitude of the first point in degrees
+        lat2: Latitude of the second point in degrees
+        lng2: Longitude of the second point in degrees
+
+    Returns:
+        Distance in meters
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def extract_coordinates(value: Any) -> Optional[Coordinates]:
+    """Read (latitude, longitude) from a location-like value.
+
+    Accepts Google results with ``geometry.location``, ``{"lat", "lng"}`` and
+    ``{"latitude", "longitude"}`` dicts, and dicts with a ``location`` key
+    holding either shape.
+
+    Args:
+        value: Location-like value
+
+    Returns:
+        Coordinates, or None if the value has none
+    """
+    if not isinstance(value, dict):
+        return None
+    if "geometry" in value:
+        return extract_coordinates(value["geometry"])
+
+    latitude = value.get("lat", value.get("latitude"))
+    longitude = value.get("lng", value.get("longitude"))
+    if latitude is None or longitude is None:
+        return extract_coordinates(value.get("location"))
+
+    try:
+        return float(latitude), float(longitude)
+    except (TypeError, ValueError):
+        return None
+
+
+def geohash(latitude: float, longitude: float, precision: int) -> str:
+    """Encode coordinates as the geohash cell containing them.
+
+    Args:
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        precision: Number of characters (7 is a cell of about 150 x 150 m)
+
+    Returns:
+        Geohash of the cell
+    """
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    value = bits = 0
+    even = True
+    while len(chars) < precision:
+        bounds, coordinate = (lng_range, longitude) if even else (lat_range, latitude)
+        middle = (bounds[0] + bounds[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            bounds[0] = middle
+        else:
+            bounds[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_GEOHASH_ALPHABET[value])
+            value = bits = 0
+    return "".join(chars)
+
+
+def geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """Return the height and width in degrees of geohash cells of a precision."""
+    total = 5 * precision
+    return 180.0 / 2 ** (total // 2), 360.0 / 2 ** ((total + 1) // 2)
+
+
+def geohash_cells_within(latitude: float, longitude: float, radius: float, precision: int) -> List[str]:
+    """Return the geohash cells that may hold points within a radius of a point.
+
+    The point's own cell comes first, followed by as many rings of
+    neighbouring cells as the radius needs.
+
+    Args:
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+        radius: Radius in meters
+        precision: Geohash precision
+
+    Returns:
+        Geohashes of the cells
+    """
+    height, width = geohash_cell_size(precision)
+    meters_per_lng = METERS_PER_DEGREE * max(math.cos(math.radians(latitude)), 1e-6)
+    rings_lat = math.ceil(radius / (height * METERS_PER_DEGREE))
+    rings_lng = min(math.ceil(radius / (width * meters_per_lng)), math.ceil(180 / width))
+
+    cells = [geohash(latitude, longitude, precision)]
+    seen = set(cells)
+    for d_lat in range(-rings_lat, rings_lat + 1):
+        cell_lat = latitude + d_lat * height
+        if not -90.0 <= cell_lat <= 90.0:
+            continue
+        for d_lng in range(-rings_lng, rings_lng + 1):
+            cell_lng = (longitude + d_lng * width + 180.0) % 360.0 - 180.0
+            cell = geohash(cell_lat, cell_lng, precision)
+            if cell not in seen:
+                seen.add(cell)
+                cells.append(cell)
+    return cells
@@ -4,11 +4,12 @@ This module defines the abstract interfaces for the application components.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 from georgian_guide.schemas.query import (
     AssistantResponse,
     RouterResponse,
+    StreamEvent,
     ToolCall,
     ToolCallResult,
     UserQuery,
@@ -45,6 +46,26 @@ class RouterInterface(ABC):
             Router response with selected tools
         """
         pass
+    
+    async def repair(
+        self,
+        query: UserQuery,
+        tool_calls: List[ToolCall],
+        errors: List[str]
+    ) -> List[ToolCall]:
+        """Ask the router to fix tool calls whose parameters failed validation.
+        
+        Routers that cannot repair calls return them unchanged.
+        
+        Args:
+            query: The user query
+            tool_calls: The invalid tool calls
+            errors: Validation error for each tool call
+            
+        Returns:
+            Corrected tool calls
+        """
+        return tool_calls
 
 
 class OutputReceiverInterface(ABC):
@@ -66,6 +87,26 @@ class OutputReceiverInterface(ABC):
             Final assistant response
         """
         pass
+    
+    async def stream_results(
+        self,
+        query: UserQuery,
+        tool_results: List[ToolCallResult]
+    ) -> AsyncIterator[StreamEvent]:
+        """Generate the final response as a stream of events.
+        
+        Receivers that cannot stream send the whole answer as one delta.
+        
+        Args:
+            query: The original user query
+            tool_results: Results from tool executions
+            
+        Yields:
+            'delta' events with answer text, then a 'done' event
+        """
+        response = await self.process_results(query, tool_results)
+        yield StreamEvent(event="delta", text=response.response)
+        yield StreamEvent(event="done", response=response)
 
 
 class QueryProcessorInterface(ABC):
@@ -81,4 +122,19 @@ class QueryProcessorInterface(ABC):
         Returns:
             Final assistant response
         """
-        pass 
\ No newline at end of file
+        pass 
+    
+    async def stream_query(self, query: UserQuery) -> AsyncIterator[StreamEvent]:
+        """Process a user query end-to-end, streaming the answer.
+        
+        Processors that cannot stream send the whole answer as one delta.
+        
+        Args:
+            query: The user query
+            
+        Yields:
+            'delta' events with answer text, then a 'done' event
+        """
+        response = await self.process_query(query)
+        yield StreamEvent(event="delta", text=response.response)
+        yield StreamEvent(event="done", response=response)
@@ -0,0 +1,247 @@
+"""Visiting-order optimization for multi-stop trips.
+
+Given travel times between the start and every stop, the planner finds the
+order that finishes the trip earliest while visiting each stop during its
+opening hours. Small trips are solved exactly with the Held-Karp dynamic
+program; larger ones start from a nearest-neighbour tour improved with 2-opt
+and or-opt moves. Schedules are simulated in minutes from the start of the
+week so opening hours can be checked directly.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from georgian_guide.core.opening_hours import WeeklyHours
+
+# Largest number of stops solved exactly (2^n * n^2 steps)
+HELD_KARP_MAX_STOPS = 10
+
+
+@dataclass
+class Stop:
+    """A stop to visit."""
+
+    name: str
+    visit_minutes: int = 60
+    hours: Optional[WeeklyHours] = None
+
+
+@dataclass
+class Visit:
+    """A scheduled visit of a stop."""
+
+    stop: int
+    travel_minutes: float
+    arrive: float
+    start: float
+    depart: float
+    open: bool
+
+
+@dataclass
+class Plan:
+    """A scheduled trip."""
+
+    order: List[int]
+    visits: List[Visit]
+    return_minutes: Optional[float]
+    finish: float
+    violations: int
+    solver: str
+
+
+class ItineraryPlanner:
+    """Plans the visiting order of a trip."""
+
+    def __init__(
+        self,
+        travel: Sequence[Sequence[float]],
+        stops: Sequence[Stop],
+        start_minute: int,
+        return_to_start: bool = True
+    ):
+        """Initialize the planner.
+
+        Args:
+            travel: Travel minutes between points; point 0 is the start and
+                point ``i`` is stop ``i - 1`` (``math.inf`` if unreachable)
+            stops: Stops to visit
+            start_minute: Departure time in minutes since the start of the week
+            return_to_start: Whether the trip ends back at the start
+        """
+        self.travel = travel
+        self.stops = list(stops)
+        self.start_minute = start_minute
+        self.return_to_start = return_to_start
+
+    def _visit(self, stop: int, previous: int, time: float) -> Tuple[float, float, bool]:
+        """Schedule a visit of stop ``stop`` after leaving point ``previous`` at ``time``.
+
+        Returns:
+            Arrival time, visit start time and whether the stop is open then
+        """
+        arrive = time + self.travel[previous][stop + 1]
+        info = self.stops[stop]
+        if info.hours is None or math.isinf(arrive):
+            return arrive, arrive, True
+        start = info.hours.earliest_start(int(math.ceil(arrive)), info.visit_minutes)
+        if start is None:
+            return arrive, arrive, False
+        return arrive, float(start), True
+
+    def schedule(self, order: Sequence[int], solver: str = "") -> Plan:
+        """Simulate a trip visiting the stops in the given order.
+
+        Args:
+            order: Stop indices in visiting order
+            solver: Name of the solver that produced the order
+
+        Returns:
+            Scheduled plan
+        """
+        time = float(self.start_minute)
+        previous = 0
+        visits: List[Visit] = []
+        violations = 0
+        for stop in order:
+            arrive, start, is_open = self._visit(stop, previous, time)
+            violations += not is_open
+            depart = start + self.stops[stop].visit_minutes
+            visits.append(Visit(stop, arrive - time, arrive, start, depart, is_open))
+            time, previous = depart, stop + 1
+
+        return_minutes = None
+        if self.return_to_start:
+            return_minutes = self.travel[previous][0]
+            time += return_minutes
+        return Plan(list(order), visits, return_minutes, time, violations, solver)
+
+    @staticmethod
+    def _key(plan: Plan) -> Tuple[int, float]:
+        """Rank plans by opening-hours violations, then by finish time."""
+        return plan.violations, plan.finish
+
+    def solve(self) -> Plan:
+        """Find the best visiting order.
+
+        Returns:
+            Best plan found
+        """
+        if len(self.stops) <= 1:
+            return self.schedule(list(range(len(self.stops))), "trivial")
+        if len(self.stops) <= HELD_KARP_MAX_STOPS:
+            return self.held_karp()
+        return self.local_search(self.nearest_neighbour())
+
+    def held_karp(self) -> Plan:
+        """Solve the visiting order with the Held-Karp dynamic program.
+
+        Each state (visited set, last stop) keeps its best (violations, time)
+        label; waiting for a place to open is allowed, so arriving earlier is
+        never worse. Without opening hours the result is optimal.
+
+        Returns:
+            Best plan
+        """
+        count = len(self.stops)
+        best: Dict[Tuple[int, int], Tuple[int, float, int]] = {}
+        for stop in range(count):
+            _, start, is_open = self._visit(stop, 0, float(self.start_minute))
+            best[(1 << stop, stop)] = (int(not is_open), start + self.stops[stop].visit_minutes, -1)
+
+        for mask in range(1, 1 << count):
+            for last in range(count):
+                label = best.get((mask, last))
+                if label is None:
+                    continue
+                violations, time, _ = label
+                for stop in range(count):
+                    if mask & (1 << stop):
+                        continue
+                    _, start, is_open = self._visit(stop, last + 1, time)
+                    candidate = (
+                        violations + (not is_open),
+                        start + self.stops[stop].visit_minutes,
+                        last,
+                    )
+                    key = (mask | (1 << stop), stop)
+                    current = best.get(key)
+                    if current is None or candidate[:2] < current[:2]:
+                        best[key] = candidate
+
+        full = (1 << count) - 1
+        final = {}
+        for last in range(count):
+            violations, time, _ = best[(full, last)]
+            if self.return_to_start:
+                time += self.travel[last + 1][0]
+            final[last] = (violations, time)
+        last = min(final, key=lambda stop: final[stop])
+
+        # Walk the predecessors back to the first stop
+        order = []
+        mask = full
+        while last != -1:
+            order.append(last)
+            previous = best[(mask, last)][2]
+            mask &= ~(1 << last)
+            last = previous
+        return self.schedule(order[::-1], "held_karp")
+
+    def nearest_neighbour(self) -> Plan:
+        """Build a tour by always travelling to the closest unvisited stop.
+
+        Returns:
+            Initial plan for local search
+        """
+        remaining = set(range(len(self.stops)))
+        order = []
+        previous = 0
+        while remaining:
+            stop = min(remaining, key=lambda candidate: self.travel[previous][candidate + 1])
+            order.append(stop)
+            remaining.discard(stop)
+            previous = stop + 1
+        return self.schedule(order, "nearest_neighbour")
+
+    def local_search(self, plan: Plan, max_rounds: int = 50) -> Plan:
+        """Improve a plan with 2-opt (segment reversal) and or-opt (segment move).
+
+        Args:
+            plan: Initial plan
+            max_rounds: Maximum number of improvement rounds
+
+        Returns:
+            Improved plan
+        """
+        best = plan
+        count = len(plan.order)
+        for _ in range(max_rounds):
+            improved = False
+            order = best.order
+
+            # 2-opt: reverse order[i..j]
+            for i in range(count - 1):
+                for j in range(i + 1, count):
+                    candidate = self.schedule(order[:i] + order[i:j + 1][::-1] + order[j + 1:])
+                    if self._key(candidate) < self._key(best):
+                        best, improved = candidate, True
+            order = best.order
+
+            # Or-opt: move a segment of 1-3 stops elsewhere
+            for length in (1, 2, 3):
+                for i in range(count - length + 1):
+                    segment = order[i:i + length]
+                    rest = order[:i] + order[i + length:]
+                    for j in range(len(rest) + 1):
+                        if j == i:
+                            continue
+                        candidate = self.schedule(rest[:j] + segment + rest[j:])
+                        if self._key(candidate) < self._key(best):
+                            best, improved = candidate, True
+
+            if not improved:
+                break
+        best.solver = "local_search"
+        return best
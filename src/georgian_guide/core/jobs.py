@@ -0,0 +1,461 @@
+"""Asynchronous job queue for long-running queries.
+
+Jobs are stored in a local SQLite database that doubles as the queue, so
+submitted queries survive restarts and several server processes can share one
+database. Workers claim a queued job under a lease; if a worker dies, the lease
+expires and another worker picks the job up again. Finished jobs can be
+polled, and are POSTed to the job's callback URL if one was given.
+"""
+
+import asyncio
+import ipaddress
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from georgian_guide.core.context import Priority, request_context
+from georgian_guide.core.interfaces import QueryProcessorInterface
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.resilience import call_with_retries
+from georgian_guide.core.scheduler import SchedulerQueueFull
+from georgian_guide.schemas.jobs import Job, JobRequest, JobStatus
+from georgian_guide.schemas.query import UserQuery
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    stage TEXT,
+    request TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_until REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+# Notifies a callback URL that a job finished
+Notifier = Callable[[str, Job], Awaitable[None]]
+
+
+class JobQueueFull(Exception):
+    """Raised when too many jobs are waiting to run."""
+
+
+class InvalidCallbackUrl(ValueError):
+    """Raised when a job's callback URL may not be called."""
+
+
+def _is_public_address(address: str) -> bool:
+    """Check whether an IP address is publicly routable."""
+    try:
+        return ipaddress.ip_address(address.split("%")[0]).is_global
+    except ValueError:
+        return False
+
+
+def check_callback_url(url: str, allowed_hosts: Sequence[str] = ()) -> str:
+    """Check that a callback URL may be called, without resolving its host.
+
+    Args:
+        url: Callback URL
+        allowed_hosts: Hosts callbacks are restricted to (empty for any public host)
+
+    Returns:
+        The URL's host name
+
+    Raises:
+        InvalidCallbackUrl: If the URL is not http(s), has no host, or names a
+            host that is not allowed (an internal address without an allow-list)
+    """
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if parts.scheme not in ("http", "https") or not host:
+        raise InvalidCallbackUrl("Callback URL must be an http(s) URL with a host")
+    if allowed_hosts:
+        if host not in allowed_hosts:
+            raise InvalidCallbackUrl(f"Callback host {host} is not allowed")
+        return host
+    if host == "localhost" or host.endswith((".localhost", ".local", ".internal")):
+        raise InvalidCallbackUrl(f"Callback host {host} is internal")
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return host
+    if not _is_public_address(host):
+        raise InvalidCallbackUrl(f"Callback address {host} is not public")
+    return host
+
+
+class JobStore:
+    """SQLite-backed job storage.
+
+    Methods are synchronous; the queue calls them from worker threads.
+    """
+
+    def __init__(self, path: str):
+        """Open (and create if necessary) the job database.
+
+        Args:
+            path: Database file path (":memory:" for a temporary store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _to_job(row: sqlite3.Row) -> Job:
+        """Convert a database row to a job."""
+        return Job(
+            job_id=row["id"],
+            status=JobStatus(row["status"]),
+            stage=row["stage"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+        )
+
+    def create(self, request: JobRequest, max_queued: Optional[int] = None) -> Job:
+        """Store a new queued job.
+
+        Args:
+            request: Submitted query
+            max_queued: Maximum number of queued jobs
+
+        Returns:
+            The new job
+
+        Raises:
+            JobQueueFull: If max_queued jobs are already waiting
+        """
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            if max_queued is not None:
+                (queued,) = self._connection.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE status = ?", (JobStatus.QUEUED.value,)
+                ).fetchone()
+                if queued >= max_queued:
+                    raise JobQueueFull(f"{queued} jobs are already queued")
+            self._connection.execute(
+                "INSERT INTO jobs (id, status, request, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, JobStatus.QUEUED.value, request.model_dump_json(), now, now),
+            )
+        return Job(job_id=job_id, status=JobStatus.QUEUED, created_at=now, updated_at=now)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if it does not exist."""
+        with self._lock:
+            row = self._connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_job(row) if row is not None else None
+
+    def claim(self, lease_seconds: float) -> Optional[Tuple[str, JobRequest, int]]:
+        """Claim the oldest queued job, or a running job whose lease expired.
+
+        Args:
+            lease_seconds: How long the claim is valid without progress
+
+        Returns:
+            (job id, request, attempt number) or None if nothing is waiting
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT id, request, attempts FROM jobs "
+                    "WHERE status = ? OR (status = ? AND lease_until < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (JobStatus.QUEUED.value, JobStatus.RUNNING.value, now),
+                ).fetchone()
+                if row is not None:
+                    self._connection.execute(
+                        "UPDATE jobs SET status = ?, stage = NULL, attempts = attempts + 1, "
+                        "lease_until = ?, updated_at = ? WHERE id = ?",
+                        (JobStatus.RUNNING.value, now + lease_seconds, now, row["id"]),
+                    )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        return row["id"], JobRequest.model_validate_json(row["request"]), row["attempts"] + 1
+
+    def requeue(self, job_id: str) -> None:
+        """Put a claimed job back in the queue without using up an attempt.
+
+        Used when the job could not start because upstreams shed load, which
+        says nothing about the job itself.
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, stage = NULL, attempts = MAX(attempts - 1, 0), "
+                "lease_until = NULL, updated_at = ? WHERE id = ?",
+                (JobStatus.QUEUED.value, time.time(), job_id),
+            )
+
+    def update_stage(self, job_id: str, stage: str, lease_seconds: float) -> None:
+        """Record the stage a running job reached and extend its lease."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET stage = ?, lease_until = ?, updated_at = ? WHERE id = ?",
+                (stage, now + lease_seconds, now, job_id),
+            )
+
+    def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> Optional[Job]:
+        """Record the outcome of a job.
+
+        Args:
+            job_id: Job identifier
+            status: New status (QUEUED puts the job back in the queue)
+            result: Answer of a succeeded job
+            error: Error message of a failed job
+
+        Returns:
+            The updated job
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, lease_until = NULL, "
+                "updated_at = ? WHERE id = ?",
+                (
+                    status.value,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+        return self.get(job_id)
+
+    def count(self, status: JobStatus) -> int:
+        """Return the number of jobs in a state."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (status.value,)
+            ).fetchone()
+        return count
+
+
+async def post_webhook(url: str, job: Job, allowed_hosts: Sequence[str] = ()) -> None:
+    """POST a finished job to its callback URL, retrying transient failures.
+
+    Without an allow-list, the host must resolve to public addresses only, so
+    callbacks cannot reach internal services.
+
+    Args:
+        url: Callback URL
+        job: The finished job
+        allowed_hosts: Hosts callbacks are restricted to (empty for any public host)
+
+    Raises:
+        InvalidCallbackUrl: If the URL may not be called
+    """
+    import httpx
+
+    host = check_callback_url(url, allowed_hosts)
+    if not allowed_hosts:
+        port = urlsplit(url).port or 443
+        addresses = await asyncio.get_running_loop().getaddrinfo(host, port)
+        if not all(_is_public_address(address[4][0]) for address in addresses):
+            raise InvalidCallbackUrl(f"Callback host {host} resolves to an internal address")
+
+    async with httpx.AsyncClient(timeout=10.0, follow_redirects=False) as client:
+        async def attempt() -> None:
+            response = await client.post(
+                url,
+                content=job.model_dump_json(),
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+
+        await call_with_retries(attempt)
+
+
+class JobQueue:
+    """Bounded pool of workers processing queued jobs."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        processor: QueryProcessorInterface,
+        workers: int = 4,
+        max_queued: int = 1000,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        notify: Optional[Notifier] = None,
+        callback_hosts: Sequence[str] = ()
+    ):
+        """Initialize the queue.
+
+        Args:
+            store: Job storage
+            processor: Query processor running the jobs
+            workers: Number of jobs processed concurrently
+            max_queued: Maximum number of queued jobs before submissions are rejected
+            lease_seconds: Time a running job may go without progress before
+                it is handed to another worker
+            max_attempts: Attempts before a repeatedly interrupted job fails
+            poll_interval: Seconds between checks for jobs submitted elsewhere
+            notify: Function notifying callback URLs (defaults to an HTTP POST)
+            callback_hosts: Hosts callback URLs are restricted to (empty for
+                any public host)
+        """
+        self.store = store
+        self.processor = processor
+        self.workers = workers
+        self.max_queued = max_queued
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.callback_hosts = [host.lower() for host in callback_hosts]
+        self.notify = notify or partial(post_webhook, allowed_hosts=self.callback_hosts)
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the workers on the running event loop."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Stop the workers; interrupted jobs are picked up again after their lease."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, request: JobRequest) -> Job:
+        """Queue a query.
+
+        Args:
+            request: Submitted query
+
+        Returns:
+            The queued job
+
+        Raises:
+            InvalidCallbackUrl: If the callback URL may not be called
+            JobQueueFull: If too many jobs are waiting
+        """
+        if request.callback_url:
+            check_callback_url(request.callback_url, self.callback_hosts)
+        job = await asyncio.to_thread(self.store.create, request, self.max_queued)
+        metrics.counter("jobs_submitted_total").inc()
+        self._wakeup.set()
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if it does not exist."""
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def _work(self) -> None:
+        """Claim and run jobs until cancelled."""
+        while True:
+            claimed = await asyncio.to_thread(self.store.claim, self.lease_seconds)
+            if claimed is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(*claimed)
+
+    async def _run(self, job_id: str, request: JobRequest, attempt: int) -> None:
+        """Run one claimed job and record its outcome."""
+        metrics.gauge("jobs_queued").set(await asyncio.to_thread(self.store.count, JobStatus.QUEUED))
+        if attempt > self.max_attempts:
+            # The job keeps taking its worker down; do not retry it forever
+            job = await asyncio.to_thread(
+                self.store.finish, job_id, JobStatus.FAILED, None, "Job was interrupted too many times"
+            )
+            metrics.counter("jobs_finished_total", status="failed").inc()
+            await self._notify(request, job)
+            return
+
+        # Stages are written off the event loop, one at a time and latest last
+        stages: List[str] = []
+        writer: Optional[asyncio.Task] = None
+
+        async def write_stages() -> None:
+            written = None
+            while stages[-1] != written:
+                written = stages[-1]
+                await asyncio.to_thread(self.store.update_stage, job_id, written, self.lease_seconds)
+
+        def on_stage(stage: str) -> None:
+            nonlocal writer
+            stages.append(stage)
+            if writer is None or writer.done():
+                writer = asyncio.ensure_future(write_stages())
+
+        query = UserQuery(**request.model_dump(exclude={"callback_url"}))
+        start = time.monotonic()
+        try:
+            # Jobs yield upstream capacity to interactive requests
+            with request_context(priority=Priority.BATCH, stage_callback=on_stage):
+                response = await self.processor.process_query(query)
+        except SchedulerQueueFull:
+            # Upstreams are saturated; put the job back for a later attempt,
+            # giving back the attempt its claim used
+            await self._stages_written(writer)
+            await asyncio.to_thread(self.store.requeue, job_id)
+            metrics.counter("jobs_requeued_total").inc()
+            await asyncio.sleep(self.poll_interval)
+            return
+        except Exception as e:
+            await self._stages_written(writer)
+            job = await asyncio.to_thread(self.store.finish, job_id, JobStatus.FAILED, None, str(e))
+            metrics.counter("jobs_finished_total", status="failed").inc()
+        else:
+            await self._stages_written(writer)
+            job = await asyncio.to_thread(
+                self.store.finish, job_id, JobStatus.SUCCEEDED, response.model_dump()
+            )
+            metrics.counter("jobs_finished_total", status="succeeded").inc()
+        metrics.histogram("job_duration_seconds").observe(time.monotonic() - start)
+        await self._notify(request, job)
+
+    @staticmethod
+    async def _stages_written(writer: Optional[asyncio.Task]) -> None:
+        """Wait for pending stage updates, so they cannot overwrite the outcome."""
+        if writer is not None:
+            await asyncio.gather(writer, return_exceptions=True)
+
+    async def _notify(self, request: JobRequest, job: Optional[Job]) -> None:
+        """Send a finished job to its callback URL, if it has one."""
+        if not request.callback_url or job is None:
+            return
+        try:
+            await self.notify(request.callback_url, job)
+        except Exception:
+            metrics.counter("job_webhook_failures_total").inc()
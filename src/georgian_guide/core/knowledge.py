@@ -0,0 +1,299 @@
+"""Retrieval over the travel knowledge corpus.
+
+Cultural and practical questions ("what is supra etiquette?", "best season for
+Svaneti") are answered from a curated corpus instead of the map tools. The
+corpus is split into passages and indexed for BM25 ranking. The index is one
+binary buffer, built in memory from the bundled corpus or memory-mapped from a
+file written at deploy time, so every worker of a host shares the same pages::
+
+    b"GGKNOW01" | header length (uint32 LE) | header JSON | arrays | passage text
+
+The header holds the vocabulary (term -> position and length of its postings)
+and the position of each section; the arrays are native uint32 arrays of
+passage lengths, posting passage ids, posting term frequencies and text
+offsets. Queries are transliterated like place names, so Georgian and
+Cyrillic queries match the Latin text.
+"""
+
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from georgian_guide.core.text import transliterate
+
+INDEX_MAGIC = b"GGKNOW01"
+_LENGTH = struct.Struct("<I")
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset("""
+a an and are as at be by can do does for from how i in is it its me my of on or should the
+there this to was what when where which who why will with you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index terms.
+
+    Text is transliterated to Latin, stopwords are dropped and plural endings
+    are stripped.
+
+    Args:
+        text: Text in any script
+
+    Returns:
+        Terms in text order
+    """
+    terms = []
+    for token in _TOKEN.findall(transliterate(text)):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+def bound_snippet(text: str, max_chars: int) -> str:
+    """Shorten a passage to at most max_chars, at a sentence or word boundary.
+
+    Args:
+        text: Passage text
+        max_chars: Maximum length
+
+    Returns:
+        The passage, or its beginning followed by "…"
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars - 1]
+    end = cut.rfind(". ")
+    if end >= max_chars // 2:
+        return cut[:end + 1]
+    return cut[:cut.rfind(" ")].rstrip(",;:") + "…" if " " in cut else cut + "…"
+
+
+def passages(entries: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Split corpus entries into (title, paragraph) passages."""
+    return [
+        (title, " ".join(paragraph.split()))
+        for title, text in entries
+        for paragraph in text.strip().split("\n\n")
+        if paragraph.strip()
+    ]
+
+
+def build_index(entries: Iterable[Tuple[str, str]]) -> bytes:
+    """Build the index of a corpus.
+
+    Args:
+        entries: (title, text) corpus entries
+
+    Returns:
+        Index buffer
+    """
+    items = passages(entries)
+    titles = list(dict.fromkeys(title for title, _ in items))
+    title_ids = array("I", (titles.index(title) for title, _ in items))
+
+    lengths = array("I")
+    postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for number, (title, text) in enumerate(items):
+        counts = Counter(tokenize(f"{title} {text}"))
+        lengths.append(sum(counts.values()))
+        for term, count in counts.items():
+            postings[term].append((number, count))
+
+    terms: Dict[str, List[int]] = {}
+    docs, frequencies = array("I"), array("I")
+    for term in sorted(postings):
+        terms[term] = [len(docs), len(postings[term])]
+        for number, count in postings[term]:
+            docs.append(number)
+            frequencies.append(count)
+
+    text = b""
+    offsets = array("I", [0])
+    for _, passage in items:
+        text += passage.encode()
+        offsets.append(len(text))
+
+    sections = {
+        "lengths": lengths.tobytes(),
+        "docs": docs.tobytes(),
+        "frequencies": frequencies.tobytes(),
+        "offsets": offsets.tobytes(),
+        "titles": title_ids.tobytes(),
+        "text": text,
+    }
+    positions = {}
+    position = 0
+    for name, body in sections.items():
+        positions[name] = [position, len(body)]
+        position += len(body)
+    header = json.dumps({
+        "byteorder": sys.byteorder,
+        "passages": len(items),
+        "average_length": sum(lengths) / max(1, len(items)),
+        "titles": titles,
+        "terms": terms,
+        "sections": positions,
+    }, ensure_ascii=False, separators=(",", ":")).encode()
+    # Arrays start at a multiple of 4 bytes
+    header += b" " * (-(len(INDEX_MAGIC) + _LENGTH.size + len(header)) % 4)
+    return INDEX_MAGIC + _LENGTH.pack(len(header)) + header + b"".join(sections.values())
+
+
+def save_index(path: str, entries: Iterable[Tuple[str, str]]) -> int:
+    """Write the index of a corpus to a file.
+
+    Args:
+        path: Index file path
+        entries: (title, text) corpus entries
+
+    Returns:
+        Size of the index in bytes
+    """
+    data = build_index(entries)
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, path)
+    return len(data)
+
+
+@dataclass(frozen=True)
+class KnowledgeHit:
+    """A passage matching a query."""
+
+    title: str
+    text: str
+    score: float
+
+
+class KnowledgeIndex:
+    """BM25 index over the passages of the knowledge corpus."""
+
+    def __init__(self, buffer: Any):
+        """Open an index buffer.
+
+        Args:
+            buffer: Index bytes or memory map
+
+        Raises:
+            ValueError: If the buffer is not a knowledge index for this machine
+        """
+        view = memoryview(buffer)
+        prefix = len(INDEX_MAGIC) + _LENGTH.size
+        if bytes(view[:len(INDEX_MAGIC)]) != INDEX_MAGIC:
+            raise ValueError("Not a knowledge index")
+        (header_length,) = _LENGTH.unpack(view[len(INDEX_MAGIC):prefix])
+        header = json.loads(bytes(view[prefix:prefix + header_length]))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError("Knowledge index was built on a machine of different byte order")
+
+        start = prefix + header_length
+
+        def section(name: str) -> memoryview:
+            offset, length = header["sections"][name]
+            return view[start + offset:start + offset + length]
+
+        self._buffer = buffer
+        self.size = header["passages"]
+        self.average_length = header["average_length"]
+        self.titles: List[str] = header["titles"]
+        self._terms: Dict[str, List[int]] = header["terms"]
+        self._lengths = section("lengths").cast("I")
+        self._docs = section("docs").cast("I")
+        self._frequencies = section("frequencies").cast("I")
+        self._offsets = section("offsets").cast("I")
+        self._title_ids = section("titles").cast("I")
+        self._text = section("text")
+
+    @classmethod
+    def open(cls, path: str) -> "KnowledgeIndex":
+        """Memory-map an index file.
+
+        Args:
+            path: Index file path
+
+        Returns:
+            The index
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a knowledge index
+        """
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def passage(self, number: int) -> Tuple[str, str]:
+        """Return the title and text of a passage."""
+        text = bytes(self._text[self._offsets[number]:self._offsets[number + 1]]).decode()
+        return self.titles[self._title_ids[number]], text
+
+    def search(self, query: str, top_k: int = 3) -> List[KnowledgeHit]:
+        """Find the passages best matching a query.
+
+        Args:
+            query: Question or keywords
+            top_k: Number of passages to return
+
+        Returns:
+            Matching passages, best first
+        """
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            entry = self._terms.get(term)
+            if entry is None:
+                continue
+            offset, count = entry
+            idf = math.log(1 + (self.size - count + 0.5) / (count + 0.5))
+            for number, frequency in zip(self._docs[offset:offset + count], self._frequencies[offset:offset + count]):
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[number] / self.average_length)
+                scores[number] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+
+        best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+        return [KnowledgeHit(*self.passage(number), round(score, 3)) for number, score in best]
+
+
+_default_index: Optional[KnowledgeIndex] = None
+
+
+def get_knowledge_index(path: Optional[str] = None) -> KnowledgeIndex:
+    """Return the shared knowledge index.
+
+    Args:
+        path: Index file to memory-map (defaults to building the index of the
+            bundled corpus in memory)
+
+    Returns:
+        Shared index, opened on first use
+    """
+    global _default_index
+    if _default_index is None:
+        if path:
+            _default_index = KnowledgeIndex.open(path)
+        else:
+            from georgian_guide.data.knowledge import KNOWLEDGE
+
+            _default_index = KnowledgeIndex(build_index(KNOWLEDGE))
+    return _default_index
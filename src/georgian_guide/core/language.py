@@ -0,0 +1,164 @@
+"""Response languages for the Georgian Guide application.
+
+The assistant answers in English, Georgian or Russian. This module normalizes
+the requested language, detects it from the query when none was requested,
+precomputes the per-language variants of the LLM system prompts and holds the
+localized fixed messages, so that answering in another language never needs a
+separate translation call.
+"""
+
+from typing import Dict, Optional
+
+from georgian_guide.core.text import has_cyrillic, has_georgian
+
+DEFAULT_LANGUAGE = "en"
+
+# Supported language codes -> language name used in prompts
+LANGUAGE_NAMES: Dict[str, str] = {
+    "en": "English",
+    "ka": "Georgian",
+    "ru": "Russian",
+}
+
+# Other ways clients name the supported languages
+LANGUAGE_ALIASES: Dict[str, str] = {
+    "english": "en",
+    "eng": "en",
+    "georgian": "ka",
+    "geo": "ka",
+    "kat": "ka",
+    "ქართული": "ka",
+    "russian": "ru",
+    "rus": "ru",
+    "русский": "ru",
+}
+
+# Fixed messages shown without an LLM call, per language
+MESSAGES: Dict[str, Dict[str, str]] = {
+    "clarify": {
+        "en": "Could you provide more details?",
+        "ka": "შეგიძლიათ მეტი დეტალი მოგვაწოდოთ?",
+        "ru": "Не могли бы вы уточнить детали?",
+    },
+    "router_error": {
+        "en": "I'm having trouble understanding your request. Could you please rephrase it?",
+        "ka": "ვერ გავიგე თქვენი მოთხოვნა. შეგიძლიათ სხვაგვარად ჩამოაყალიბოთ?",
+        "ru": "Мне не удалось понять ваш запрос. Не могли бы вы переформулировать его?",
+    },
+    "output_error": {
+        "en": "I apologize, but I encountered an error while processing your request: {error}. Could you please try again?",
+        "ka": "ბოდიში, თქვენი მოთხოვნის დამუშავებისას მოხდა შეცდომა: {error}. გთხოვთ, სცადოთ თავიდან.",
+        "ru": "Извините, при обработке вашего запроса произошла ошибка: {error}. Пожалуйста, попробуйте ещё раз.",
+    },
+    "no_answer": {
+        "en": "Sorry, I couldn't generate a proper response.",
+        "ka": "ბოდიში, სათანადო პასუხის მომზადება ვერ მოვახერხე.",
+        "ru": "Извините, мне не удалось подготовить нормальный ответ.",
+    },
+    "deadline_partial": {
+        "en": "I couldn't write a full answer in time, but here is what I found:",
+        "ka": "სრული პასუხის მომზადება დროულად ვერ მოვასწარი, მაგრამ აი, რა ვიპოვე:",
+        "ru": "Я не успел подготовить полный ответ, но вот что удалось найти:",
+    },
+    "deadline_empty": {
+        "en": "I couldn't find an answer in time. Please try again in a moment.",
+        "ka": "პასუხი დროულად ვერ ვიპოვე. გთხოვთ, ცოტა ხანში სცადოთ თავიდან.",
+        "ru": "Не удалось найти ответ вовремя. Пожалуйста, попробуйте ещё раз чуть позже.",
+    },
+    "fact_trip": {
+        "en": "{origin} → {destination}: {distance}, about {duration}",
+        "ka": "{origin} → {destination}: {distance}, დაახლოებით {duration}",
+        "ru": "{origin} → {destination}: {distance}, примерно {duration}",
+    },
+    "fact_place": {
+        "en": "{address} (coordinates {lat}, {lng})",
+        "ka": "{address} (კოორდინატები {lat}, {lng})",
+        "ru": "{address} (координаты {lat}, {lng})",
+    },
+    "fact_elevation": {
+        "en": "{place}: {meters} m above sea level",
+        "ka": "{place}: ზღვის დონიდან {meters} მ",
+        "ru": "{place}: {meters} м над уровнем моря",
+    },
+}
+
+
+def normalize_language(language: Optional[str]) -> Optional[str]:
+    """Map a requested language to a supported language code.
+
+    Args:
+        language: Language code or name, e.g. "ka", "ka-GE" or "Georgian"
+
+    Returns:
+        Supported language code, or None if the language is not supported
+    """
+    if not language:
+        return None
+    value = language.strip().lower()
+    value = LANGUAGE_ALIASES.get(value, value).split("-")[0].split("_")[0]
+    return value if value in LANGUAGE_NAMES else None
+
+
+def detect_language(text: str) -> str:
+    """Guess the language of a query from its script.
+
+    Args:
+        text: Query text
+
+    Returns:
+        "ka" for Georgian script, "ru" for Cyrillic, otherwise the default
+    """
+    if has_georgian(text):
+        return "ka"
+    if has_cyrillic(text):
+        return "ru"
+    return DEFAULT_LANGUAGE
+
+
+def resolve_language(language: Optional[str], text: str) -> str:
+    """Pick the response language for a query.
+
+    Args:
+        language: Requested language (None to detect it from the text)
+        text: Query text
+
+    Returns:
+        Supported language code
+    """
+    if language is None:
+        return detect_language(text)
+    return normalize_language(language) or DEFAULT_LANGUAGE
+
+
+def build_prompts(base: str, instruction: str) -> Dict[str, str]:
+    """Precompute a system prompt for every supported language.
+
+    The language instruction is appended, so all variants share the same
+    prompt prefix.
+
+    Args:
+        base: Language-independent system prompt
+        instruction: Instruction with a ``{language}`` placeholder
+
+    Returns:
+        System prompt per language code
+    """
+    return {
+        code: f"{base.rstrip()}\n\n{instruction.format(language=name)}\n"
+        for code, name in LANGUAGE_NAMES.items()
+    }
+
+
+def message(key: str, language: str, **values: str) -> str:
+    """Return a fixed message in the given language.
+
+    Args:
+        key: Message key in MESSAGES
+        language: Supported language code
+        **values: Values for the message's placeholders
+
+    Returns:
+        Localized message
+    """
+    variants = MESSAGES[key]
+    return variants.get(language, variants[DEFAULT_LANGUAGE]).format(**values)
@@ -0,0 +1,172 @@
+"""In-process metrics for the Georgian Guide application.
+
+This module provides a small registry of counters, gauges and histograms that
+components update directly and the API exposes as JSON.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    """Monotonically increasing counter."""
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Amount to add
+        """
+        self.value += amount
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge.
+
+        Args:
+            value: New value
+        """
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        self.value -= amount
+
+
+class Histogram:
+    """Distribution of observed values.
+
+    Totals cover every observation; percentiles are computed over a sliding
+    window of the most recent observations.
+    """
+
+    def __init__(self, window: int = 1024) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value
+        """
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        self.recent.append(value)
+
+    def percentile(self, percentile: float) -> float:
+        """Return a percentile of the recent observations.
+
+        Args:
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Percentile value, or 0.0 without observations
+        """
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, math.ceil(percentile / 100 * len(ordered)) - 1)
+        return ordered[max(index, 0)]
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summarize the histogram.
+
+        Returns:
+            Count, sum, mean, max and p50/p95/p99
+        """
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class MetricsRegistry:
+    """Registry of named, labelled metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelKey], Counter] = {}
+        self._gauges: Dict[Tuple[str, LabelKey], Gauge] = {}
+        self._histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, Any]) -> Tuple[str, LabelKey]:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def _get(self, store: Dict, factory: Any, name: str, labels: Dict[str, Any]) -> Any:
+        key = self._key(name, labels)
+        metric = store.get(key)
+        if metric is None:
+            with self._lock:
+                metric = store.setdefault(key, factory())
+        return metric
+
+    def counter(self, name: str, **labels: Any) -> Counter:
+        """Return the counter with the given name and labels."""
+        return self._get(self._counters, Counter, name, labels)
+
+    def gauge(self, name: str, **labels: Any) -> Gauge:
+        """Return the gauge with the given name and labels."""
+        return self._get(self._gauges, Gauge, name, labels)
+
+    def histogram(self, name: str, **labels: Any) -> Histogram:
+        """Return the histogram with the given name and labels."""
+        return self._get(self._histograms, Histogram, name, labels)
+
+    @staticmethod
+    def _format(key: Tuple[str, LabelKey]) -> str:
+        name, labels = key
+        if not labels:
+            return name
+        return name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the current value of every metric.
+
+        Returns:
+            Counters, gauges and histogram summaries keyed by "name{labels}"
+        """
+        return {
+            "counters": {self._format(k): c.value for k, c in list(self._counters.items())},
+            "gauges": {self._format(k): g.value for k, g in list(self._gauges.items())},
+            "histograms": {
+                self._format(k): h.snapshot() for k, h in list(self._histograms.items())
+            },
+        }
+
+    def reset(self) -> None:
+        """Remove every metric."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+
+# Process-wide metrics registry
+metrics = MetricsRegistry()
@@ -0,0 +1,305 @@
+"""Opening hours of places.
+
+This module parses the ``opening_hours.periods`` of Google place results into
+weekly intervals and answers when a place can next be visited. Times are
+minutes since the start of the week (Sunday 00:00, matching Google's day
+numbering) in Georgian local time.
+
+``OpeningHoursIndex`` keeps the hours of many places as weekly bitmaps of
+15-minute slots, stored per slot as one integer bitset over all places, so
+"which candidates are open at T" is answered with a few big-integer bit
+operations instead of a loop over the places.
+"""
+
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+MINUTES_PER_DAY = 24 * 60
+WEEK_MINUTES = 7 * MINUTES_PER_DAY
+
+# Resolution of the opening hours index
+SLOT_MINUTES = 15
+WEEK_SLOTS = WEEK_MINUTES // SLOT_MINUTES
+
+# Georgia has used UTC+4 without daylight saving time since 2005
+_FALLBACK_TZ = timezone(timedelta(hours=4), "Asia/Tbilisi")
+
+
+def tbilisi_tz() -> tzinfo:
+    """Return the Asia/Tbilisi time zone (fixed UTC+4 if tzdata is unavailable)."""
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo("Asia/Tbilisi")
+    except Exception:
+        return _FALLBACK_TZ
+
+
+def tbilisi_now() -> datetime:
+    """Return the current time in Georgia."""
+    return datetime.now(tbilisi_tz())
+
+
+def parse_local_time(value: Optional[str]) -> datetime:
+    """Parse a time given in Georgian local time.
+
+    Args:
+        value: "HH:MM" today, an ISO datetime (Georgian time if naive) or None for now
+
+    Returns:
+        The time in Georgian time
+    """
+    now = tbilisi_now()
+    if not value:
+        return now
+    if len(value) <= 5 and ":" in value:
+        hour, minute = (int(part) for part in value.split(":"))
+        return now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=tbilisi_tz())
+    return moment.astimezone(tbilisi_tz())
+
+
+def minute_of_week(moment: datetime) -> int:
+    """Return the minute of the week of a local time (Sunday 00:00 is 0)."""
+    day = moment.isoweekday() % 7
+    return day * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def _parse_point(point: Dict[str, Any]) -> int:
+    """Convert a Google {"day": 1, "time": "0930"} point to a minute of the week."""
+    time = str(point.get("time", "0000")).zfill(4)
+    return int(point["day"]) * MINUTES_PER_DAY + int(time[:2]) * 60 + int(time[2:])
+
+
+def parse_periods(opening_hours: Optional[Dict[str, Any]]) -> Optional[List[Tuple[int, int]]]:
+    """Parse Google opening hours into sorted weekly intervals.
+
+    Intervals that wrap past Saturday midnight are split in two. A single
+    period without a close time means the place is always open.
+
+    Args:
+        opening_hours: ``opening_hours`` object of a Google place result
+
+    Returns:
+        Sorted ``(open, close)`` minute-of-week intervals, or None if the
+        hours are unknown
+    """
+    periods = (opening_hours or {}).get("periods")
+    if not periods:
+        return None
+
+    intervals: List[Tuple[int, int]] = []
+    for period in periods:
+        if "open" not in period:
+            continue
+        start = _parse_point(period["open"])
+        if not period.get("close"):
+            return [(0, WEEK_MINUTES)]
+        end = _parse_point(period["close"])
+        if end <= start:
+            intervals.append((start, WEEK_MINUTES))
+            if end > 0:
+                intervals.append((0, end))
+        else:
+            intervals.append((start, end))
+    return sorted(intervals) or None
+
+
+class WeeklyHours:
+    """Weekly opening intervals of one place."""
+
+    def __init__(self, intervals: List[Tuple[int, int]]):
+        """Initialize the hours.
+
+        Args:
+            intervals: Sorted ``(open, close)`` minute-of-week intervals
+        """
+        self.intervals = intervals
+
+    @classmethod
+    def from_google(cls, opening_hours: Optional[Dict[str, Any]]) -> Optional["WeeklyHours"]:
+        """Build the hours from a Google ``opening_hours`` object.
+
+        Args:
+            opening_hours: ``opening_hours`` object of a place result
+
+        Returns:
+            Weekly hours, or None if the place has no periods
+        """
+        intervals = parse_periods(opening_hours)
+        return cls(intervals) if intervals is not None else None
+
+    def slots(self) -> List[Tuple[int, int]]:
+        """Return the ``(first, end)`` ranges of 15-minute slots the place is open throughout.
+
+        A slot the place opens or closes within counts as closed.
+        """
+        ranges = []
+        for start, end in self.intervals:
+            first, last = -(-start // SLOT_MINUTES), end // SLOT_MINUTES
+            if last > first:
+                ranges.append((first, last))
+        return ranges
+
+    def is_open(self, minute: int) -> bool:
+        """Check whether the place is open at a minute of the week."""
+        minute %= WEEK_MINUTES
+        return any(start <= minute < end for start, end in self.intervals)
+
+    def earliest_start(self, minute: int, duration: int = 0) -> Optional[int]:
+        """Find the earliest time a visit can start.
+
+        Args:
+            minute: Arrival time in minutes (may exceed one week)
+            duration: Length of the visit in minutes
+
+        Returns:
+            Earliest start time at or after the arrival (same scale as
+            ``minute``) such that the place stays open for the whole visit,
+            or None if no such time exists within a week
+        """
+        week_start = minute - minute % WEEK_MINUTES
+        # Join intervals that touch across midnight so long visits can span them
+        merged: List[Tuple[int, int]] = []
+        for offset in (0, WEEK_MINUTES):
+            for start, end in self.intervals:
+                start, end = week_start + start + offset, week_start + end + offset
+                if merged and start <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+                else:
+                    merged.append((start, end))
+
+        for start, end in merged:
+            begin = max(start, minute)
+            if begin + duration <= end:
+                return begin
+        return None
+
+
+class OpeningHoursIndex:
+    """Weekly opening hours of many places, as 15-minute slot bitsets.
+
+    Each place has a bit position; ``_slots[s]`` has the bit of every place
+    open throughout slot ``s`` set. Places whose hours were never added are
+    unknown rather than closed.
+    """
+
+    def __init__(self, max_places: int = 20000):
+        """Initialize the index.
+
+        Args:
+            max_places: Number of places kept; the older half is dropped when full
+        """
+        self.max_places = max_places
+        self._positions: Dict[str, int] = {}
+        self._hours: List[Optional[WeeklyHours]] = []
+        self._slots: List[int] = [0] * WEEK_SLOTS
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, place_id: object) -> bool:
+        return place_id in self._positions
+
+    def add(self, place_id: str, hours: WeeklyHours) -> None:
+        """Set the hours of a place.
+
+        Args:
+            place_id: Google place id
+            hours: Weekly opening hours
+        """
+        position = self._positions.get(place_id)
+        if position is not None:
+            self._set_bits(position, self._hours[position], clear=True)
+            self._hours[position] = hours
+        else:
+            if len(self._hours) >= self.max_places:
+                self._compact()
+            position = len(self._hours)
+            self._positions[place_id] = position
+            self._hours.append(hours)
+        self._set_bits(position, hours)
+
+    def add_google(self, place_id: str, opening_hours: Optional[Dict[str, Any]]) -> bool:
+        """Set the hours of a place from a Google ``opening_hours`` object.
+
+        Args:
+            place_id: Google place id
+            opening_hours: ``opening_hours`` object of a place result
+
+        Returns:
+            Whether the object had periods to index
+        """
+        hours = WeeklyHours.from_google(opening_hours)
+        if hours is None:
+            return False
+        self.add(place_id, hours)
+        return True
+
+    def _set_bits(self, position: int, hours: Optional[WeeklyHours], clear: bool = False) -> None:
+        """Set (or clear) a place's bit in the slots it is open."""
+        if hours is None:
+            return
+        bit = 1 << position
+        for first, end in hours.slots():
+            for slot in range(first, end):
+                if clear:
+                    self._slots[slot] &= ~bit
+                else:
+                    self._slots[slot] |= bit
+
+    def _compact(self) -> None:
+        """Drop the older half of the places and renumber the rest."""
+        keep = sorted(self._positions.items(), key=lambda item: item[1])[len(self._positions) // 2:]
+        hours = self._hours
+        self._positions, self._hours, self._slots = {}, [], [0] * WEEK_SLOTS
+        for place_id, position in keep:
+            self.add(place_id, hours[position])
+
+    def open_mask(self, minute: int, duration: int = 0) -> int:
+        """Return the bitset of places open from a minute of the week for a duration.
+
+        Args:
+            minute: Minute of the week
+            duration: Minutes the place must stay open
+
+        Returns:
+            Bitset of place positions
+        """
+        first = minute // SLOT_MINUTES
+        last = (minute + max(duration, 1) - 1) // SLOT_MINUTES
+        mask = -1
+        for slot in range(first, last + 1):
+            mask &= self._slots[slot % WEEK_SLOTS]
+            if not mask:
+                break
+        return mask
+
+    def filter_open(
+        self,
+        place_ids: Sequence[str],
+        moment: datetime,
+        duration: int = 0
+    ) -> Tuple[List[str], List[str]]:
+        """Split candidate places by whether they are open at a time.
+
+        Args:
+            place_ids: Candidate place ids
+            moment: Time in Georgian time
+            duration: Minutes the place must stay open
+
+        Returns:
+            The open places and the places with unknown hours, in input order
+        """
+        mask = self.open_mask(minute_of_week(moment), duration)
+        open_places: List[str] = []
+        unknown: List[str] = []
+        for place_id in place_ids:
+            position = self._positions.get(place_id)
+            if position is None:
+                unknown.append(place_id)
+            elif mask >> position & 1:
+                open_places.append(place_id)
+        return open_places, unknown
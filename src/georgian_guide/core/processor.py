@@ -3,21 +3,65 @@
 This module implements the end-to-end query processing logic.
 """
 
-from typing import Dict, List, Type
+import asyncio
+import time
+from dataclasses import replace
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+from georgian_guide.core.cache import TTLCache, make_cache_key
+from georgian_guide.core.context import (
+    Budget,
+    DeadlineExceeded,
+    get_context,
+    record_cache,
+    report_stage,
+    request_context,
+)
 from georgian_guide.core.interfaces import (
     OutputReceiverInterface,
     QueryProcessorInterface,
     RouterInterface,
     ToolInterface,
 )
+from georgian_guide.core.language import message, resolve_language
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.ranking import PlaceRanker
+from georgian_guide.core.scheduler import SchedulerQueueFull
+from georgian_guide.core.templates import fallback_response
+from georgian_guide.core.text import normalize_query
+from georgian_guide.core.validation import InvalidCall, ValidatedCall, validate_tool_calls
 from georgian_guide.schemas.base import ToolType
 from georgian_guide.schemas.query import (
     AssistantResponse,
+    StreamEvent,
+    ToolCall,
     ToolCallResult,
     UserQuery,
 )
 
+T = TypeVar("T")
+
+# Tools that enrich an answer rather than make it; under a tight deadline they
+# are cut first, when the router also selected other tools
+OPTIONAL_TOOLS = frozenset({
+    ToolType.PLACE_DETAILS,
+    ToolType.DIRECTIONS,
+    ToolType.ELEVATION,
+    ToolType.REVERSE_GEOCODE,
+})
+
 
 class QueryProcessor(QueryProcessorInterface):
     """Implementation of the query processor."""
@@ -26,82 +70,446 @@ class QueryProcessor(QueryProcessorInterface):
         self,
         router: RouterInterface,
         output_receiver: OutputReceiverInterface,
-        tools: Dict[ToolType, ToolInterface]
+        tools: Mapping[ToolType, ToolInterface],
+        ranker: Optional[PlaceRanker] = None,
+        response_cache: Optional[TTLCache[AssistantResponse]] = None,
+        output_reserve: float = 4.0,
+        tool_latency: Optional[Callable[[ToolType], float]] = None
     ):
         """Initialize the query processor.
         
         Args:
             router: LLM router component
             output_receiver: Output receiver component
-            tools: Dictionary mapping tool types to their implementations
+            tools: Mapping of tool types to their implementations
+            ranker: Ranker merging place search results before the output stage
+            response_cache: Cache of complete answers
+            output_reserve: Seconds of a request deadline kept for writing the answer
+            tool_latency: Typical seconds a tool call takes (defaults to the
+                90th percentile of the tool's recorded latency)
         """
         self.router = router
         self.output_receiver = output_receiver
         self.tools = tools
+        self.ranker = ranker or PlaceRanker()
+        self.response_cache = response_cache
+        self.output_reserve = output_reserve
+        self.tool_latency = tool_latency or self._recorded_latency
+    
+    @staticmethod
+    def _recorded_latency(tool_type: ToolType) -> float:
+        """Return the 90th percentile latency the resilience layer recorded for a tool."""
+        return metrics.histogram("tool_latency_seconds", tool=tool_type.value).percentile(90)
+    
+    @staticmethod
+    def response_cache_key(query: UserQuery) -> str:
+        """Return the answer cache key of a query.
+        
+        Args:
+            query: The user query
+            
+        Returns:
+            Cache key covering everything the answer depends on
+        """
+        return make_cache_key(
+            "answer",
+            resolve_language(query.language, query.query),
+            normalize_query(query.query),
+            query.location,
+            query.recent_places
+        )
+    
+    def _cached_response(self, query: UserQuery) -> Tuple[Optional[str], Optional[AssistantResponse]]:
+        """Look a query up in the answer cache.
+        
+        Args:
+            query: The user query
+            
+        Returns:
+            The cache key (None without an answer cache) and the cached answer
+        """
+        if self.response_cache is None:
+            return None, None
+        key = self.response_cache_key(query)
+        cached = self.response_cache.get(key)
+        record_cache("responses", cached is not None)
+        if cached is not None:
+            metrics.counter("response_cache_hits_total").inc()
+        return key, cached
     
     async def process_query(self, query: UserQuery) -> AssistantResponse:
         """Process a user query end-to-end.
         
+        Under a request deadline (the request context's budget), parts of the
+        answer are cut to finish in time; the response lists them.
+        
         Args:
             query: The user query
             
         Returns:
             Final assistant response
         """
+        key, cached = self._cached_response(query)
+        if cached is not None:
+            return cached
+        
+        early_answer, tool_results = await self._run_tools(query)
+        if early_answer is not None:
+            return self._finish(early_answer)
+        
+        # Process the results to generate the final response
+        report_stage("writing_answer")
+        response = self._finish(await self._write_answer(query, tool_results))
+        self._cache_response(key, response, tool_results)
+        return response
+    
+    async def stream_query(self, query: UserQuery) -> AsyncIterator[StreamEvent]:
+        """Process a user query end-to-end, streaming the answer as it is written.
+        
+        Under a request deadline, the answer falls back to a template if the
+        output receiver sends nothing in time; once text has been sent, the
+        answer is finished regardless of the deadline.
+        
+        Args:
+            query: The user query
+            
+        Yields:
+            A 'tools' event if tools were run, 'delta' events with answer
+            text, then a 'done' event
+        """
+        key, cached = self._cached_response(query)
+        if cached is None:
+            cached, tool_results = await self._run_tools(query)
+            if cached is not None:
+                cached = self._finish(cached)
+            elif tool_results:
+                yield StreamEvent(event="tools", tool_results=tool_results)
+        if cached is not None:
+            yield StreamEvent(event="delta", text=cached.response)
+            yield StreamEvent(event="done", response=cached)
+            return
+        
+        report_stage("writing_answer")
+        events = self.output_receiver.stream_results(query, tool_results)
+        budget = get_context().budget
+        if budget is not None:
+            try:
+                first = await self._before_deadline(events.__anext__, budget)
+            except StopAsyncIteration:
+                pass
+            except DeadlineExceeded:
+                await events.aclose()
+                response = self._finish(self._fallback_answer(query, tool_results, budget))
+                yield StreamEvent(event="delta", text=response.response)
+                yield StreamEvent(event="done", response=response)
+                return
+            else:
+                events = self._prepend(first, events)
+        
+        done = False
+        async for event in events:
+            if event.response is not None:
+                event = StreamEvent(event="done", response=self._finish(event.response))
+                self._cache_response(key, event.response, tool_results)
+                done = True
+            yield event
+        if done:
+            return
+        
+        # The receiver ended without an answer; clients still get a 'done' event
+        metrics.counter("stream_fallbacks_total").inc()
+        response = self._finish(fallback_response(query, tool_results).model_copy(update={"failed": True}))
+        yield StreamEvent(event="delta", text=response.response)
+        yield StreamEvent(event="done", response=response)
+    
+    @staticmethod
+    async def _prepend(first: StreamEvent, events: AsyncIterator[StreamEvent]) -> AsyncIterator[StreamEvent]:
+        """Yield an event taken from a stream, then the rest of the stream."""
+        yield first
+        async for event in events:
+            yield event
+    
+    @staticmethod
+    async def _before_deadline(call: Callable[[], Awaitable[T]], budget: Budget) -> T:
+        """Run a call, cutting it off at the deadline.
+        
+        Args:
+            call: Function starting the call
+            budget: Request budget
+            
+        Returns:
+            Result of the call
+            
+        Raises:
+            DeadlineExceeded: If the call does not finish before the deadline
+        """
+        remaining = budget.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("The request deadline has passed")
+        try:
+            return await asyncio.wait_for(call(), remaining)
+        except asyncio.TimeoutError as e:
+            raise DeadlineExceeded("The request deadline has passed") from e
+    
+    async def _write_answer(self, query: UserQuery, tool_results: List[ToolCallResult]) -> AssistantResponse:
+        """Generate the answer, falling back to a template at the deadline.
+        
+        Args:
+            query: The user query
+            tool_results: Results from tool executions
+            
+        Returns:
+            Assistant response
+        """
+        budget = get_context().budget
+        if budget is None:
+            return await self.output_receiver.process_results(query, tool_results)
+        try:
+            return await self._before_deadline(
+                lambda: self.output_receiver.process_results(query, tool_results), budget
+            )
+        except DeadlineExceeded:
+            return self._fallback_answer(query, tool_results, budget)
+    
+    @staticmethod
+    def _fallback_answer(
+        query: UserQuery,
+        tool_results: List[ToolCallResult],
+        budget: Budget
+    ) -> AssistantResponse:
+        """Answer from a template because the output receiver ran out of time."""
+        budget.degrade("answer")
+        metrics.counter("deadline_fallbacks_total", stage="answer").inc()
+        return fallback_response(query, tool_results)
+    
+    @staticmethod
+    def _finish(response: AssistantResponse) -> AssistantResponse:
+        """Mark an answer with the parts cut to meet the request deadline."""
+        budget = get_context().budget
+        if budget is None or not budget.degraded:
+            return response
+        return response.model_copy(update={"degraded": True, "degraded_parts": list(budget.degraded)})
+    
+    def _cache_response(
+        self,
+        key: Optional[str],
+        response: AssistantResponse,
+        tool_results: List[ToolCallResult]
+    ) -> None:
+        """Cache an answer, unless it failed, was degraded or built from failed tool calls."""
+        if key is None or response.degraded or response.failed:
+            return
+        if all(result.success for result in tool_results):
+            self.response_cache.set(key, response)
+    
+    async def _run_tools(
+        self,
+        query: UserQuery
+    ) -> Tuple[Optional[AssistantResponse], List[ToolCallResult]]:
+        """Route a query and run the selected tools.
+        
+        Args:
+            query: The user query
+            
+        Returns:
+            An answer to return instead (a clarification question, or an
+            apology if routing missed the deadline), or the tool results
+        """
         # Route the query to select appropriate tools
-        router_response = await self.router.route(query)
+        report_stage("routing")
+        budget = get_context().budget
+        if budget is None:
+            router_response = await self.router.route(query)
+        else:
+            try:
+                router_response = await self._before_deadline(
+                    lambda: self.router.route(query), budget
+                )
+            except DeadlineExceeded:
+                budget.degrade("routing")
+                metrics.counter("deadline_fallbacks_total", stage="routing").inc()
+                return AssistantResponse(
+                    response=message("deadline_empty", resolve_language(query.language, query.query))
+                ), []
         
-        # If clarification is needed, return early with the clarification question
+        # If clarification is needed, return early with the clarification question;
+        # it is not cached as an answer, since routing errors end up here too
         if router_response.requires_clarification:
             return AssistantResponse(
-                response=router_response.clarification_question or "Could you provide more details?",
+                response=router_response.clarification_question or message(
+                    "clarify", resolve_language(query.language, query.query)
+                ),
                 source_information=[],
                 follow_up_questions=[]
+            ), []
+        
+        # Validate every tool call before any of them touches the network
+        report_stage("validating")
+        valid_calls, invalid_calls = await self._prepare_tool_calls(
+            query, router_response.selected_tools
+        )
+        
+        # Calls that are still invalid fail without being executed
+        failed_results = [
+            ToolCallResult(
+                tool_type=invalid.tool_call.tool_type,
+                result={},
+                success=False,
+                error_message=f"Invalid parameters: {invalid.error}"
             )
+            for invalid in invalid_calls
+        ]
         
-        # Execute all selected tools and collect results
-        tool_results: List[ToolCallResult] = []
+        # Execute all valid tools concurrently, so one slow upstream does
+        # not hold up the others
+        report_stage("running_tools")
+        tool_results: List[ToolCallResult] = list(
+            await asyncio.gather(
+                *(
+                    self._execute_tool(call.tool_call.tool_type, call.parameters, tool_budget)
+                    for call, tool_budget in zip(valid_calls, self._tool_budgets(valid_calls))
+                )
+            )
+        ) + failed_results
+        
+        # Merge overlapping place searches into one compact, ranked list
+        return None, self.ranker.apply(query, tool_results)
+    
+    def _tool_budgets(self, calls: List[ValidatedCall]) -> List[Optional[Budget]]:
+        """Give each tool call its share of the request deadline.
+        
+        Required tools may use the whole budget (the answer then falls back
+        to a template). Optional tools must leave ``output_reserve`` seconds for
+        the answer; if a typical call would not fit, they get no time at all
+        and are answered from the stale cache or dropped.
         
-        for tool_call in router_response.selected_tools:
-            tool_type = tool_call.tool_type
+        Args:
+            calls: Validated tool calls
             
-            if tool_type not in self.tools:
-                # Skip tool if not implemented
-                tool_results.append(
-                    ToolCallResult(
-                        tool_type=tool_type,
-                        result={},
-                        success=False,
-                        error_message=f"Tool {tool_type} not implemented"
-                    )
-                )
+        Returns:
+            Budget per call (None without a deadline)
+        """
+        budget = get_context().budget
+        if budget is None:
+            return [None] * len(calls)
+        
+        types = [call.tool_call.tool_type for call in calls]
+        has_required = any(tool_type not in OPTIONAL_TOOLS for tool_type in types)
+        optional_deadline = budget.deadline - self.output_reserve
+        budgets = []
+        for tool_type in types:
+            if not has_required or tool_type not in OPTIONAL_TOOLS:
+                budgets.append(budget)
                 continue
+            expected = self.tool_latency(tool_type)
+            deadline = optional_deadline
+            if optional_deadline - time.monotonic() < expected:
+                deadline = time.monotonic()
+            budgets.append(replace(budget, deadline=deadline))
+        return budgets
+    
+    async def _prepare_tool_calls(
+        self,
+        query: UserQuery,
+        tool_calls: List[ToolCall]
+    ) -> Tuple[List[ValidatedCall], List[InvalidCall]]:
+        """Validate tool calls, asking the router once to repair invalid ones.
+        
+        Args:
+            query: The user query
+            tool_calls: Tool calls selected by the router
             
-            # Convert tool parameters to dictionary
-            parameters = {param.name: param.value for param in tool_call.parameters}
-            
+        Returns:
+            Valid tool calls with coerced parameters, and calls that stay invalid
+        """
+        valid_calls, invalid_calls = validate_tool_calls(tool_calls)
+        if not invalid_calls:
+            return valid_calls, invalid_calls
+        
+        for invalid in invalid_calls:
+            metrics.counter(
+                "tool_validation_failures_total", tool=invalid.tool_call.tool_type.value
+            ).inc()
+        
+        # One cheap repair round-trip instead of a failed tool call
+        def repair() -> Awaitable[List[ToolCall]]:
+            return self.router.repair(
+                query,
+                [invalid.tool_call for invalid in invalid_calls],
+                [invalid.error for invalid in invalid_calls]
+            )
+        
+        budget = get_context().budget
+        if budget is None:
+            repaired_calls = await repair()
+        else:
             try:
-                # Execute the tool
-                result = await self.tools[tool_type].execute(parameters)
-                
-                tool_results.append(
-                    ToolCallResult(
-                        tool_type=tool_type,
-                        result=result,
-                        success=True,
-                        error_message=None
-                    )
-                )
-            except Exception as e:
-                # Handle tool execution errors
-                tool_results.append(
-                    ToolCallResult(
-                        tool_type=tool_type,
-                        result={},
-                        success=False,
-                        error_message=str(e)
-                    )
-                )
+                repaired_calls = await self._before_deadline(repair, budget)
+            except DeadlineExceeded:
+                budget.degrade("repair")
+                return valid_calls, invalid_calls
+        repaired_valid, still_invalid = validate_tool_calls(repaired_calls)
+        metrics.counter("router_repairs_total", outcome="fixed").inc(len(repaired_valid))
+        metrics.counter("router_repairs_total", outcome="failed").inc(len(still_invalid))
         
-        # Process the results to generate the final response
-        return await self.output_receiver.process_results(query, tool_results) 
\ No newline at end of file
+        return valid_calls + repaired_valid, still_invalid
+    
+    async def _execute_tool(
+        self,
+        tool_type: ToolType,
+        parameters: Dict[str, Any],
+        budget: Optional[Budget] = None
+    ) -> ToolCallResult:
+        """Execute a single tool call.
+        
+        Args:
+            tool_type: Type of the tool to execute
+            parameters: Validated tool parameters
+            budget: Time budget of the call (None without a deadline)
+            
+        Returns:
+            Result of the tool call (failed if the tool raised an error)
+        """
+        if tool_type not in self.tools:
+            # Skip tool if not implemented
+            return ToolCallResult(
+                tool_type=tool_type,
+                result={},
+                success=False,
+                error_message=f"Tool {tool_type} not implemented"
+            )
+        
+        try:
+            # Execute the tool; upstream-backed tools enforce the budget
+            with request_context(budget=budget):
+                result = await self.tools[tool_type].execute(parameters)
+            
+            # Tool results were already checked by the tool, so the result
+            # dict is attached without another validation pass
+            return ToolCallResult.model_construct(
+                tool_type=tool_type,
+                result=result,
+                success=True,
+                error_message=None
+            )
+        except SchedulerQueueFull:
+            # Upstream overload fails the whole query rather than degrading it
+            raise
+        except DeadlineExceeded:
+            if budget is not None:
+                budget.degrade(f"tool:{tool_type.value}")
+            metrics.counter("deadline_tool_skips_total", tool=tool_type.value).inc()
+            return ToolCallResult(
+                tool_type=tool_type,
+                result={},
+                success=False,
+                error_message="Skipped to answer before the request deadline"
+            )
+        except Exception as e:
+            # Handle tool execution errors
+            return ToolCallResult(
+                tool_type=tool_type,
+                result={},
+                success=False,
+                error_message=str(e)
+            )
@@ -0,0 +1,228 @@
+"""Request profiling for the Georgian Guide application.
+
+A sampler thread reads the event loop thread's stack at a fixed interval while
+at least one profiled request is in flight. Samples are attributed to the
+request precisely: the tasks a profiled request creates are tracked through a
+task factory, a task whose coroutine is on the sampled stack is running
+("cpu" samples), and a suspended task contributes the chain of coroutines it
+is awaiting ("await" samples, i.e. time spent waiting for upstreams, the
+scheduler or worker threads). A monitor coroutine measures event loop lag.
+
+Profiles are kept in memory as collapsed stacks (``frame;frame;frame count``
+lines), the input format of flamegraph.pl and speedscope.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextlib import contextmanager
+from types import FrameType
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from georgian_guide.core.context import get_context, request_context
+from georgian_guide.core.metrics import metrics
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Label a frame as "module:function" (safe for collapsed stacks)."""
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_name}".replace(";", ":").replace(" ", "_")
+
+
+def _await_chain(coro: Any) -> List[str]:
+    """Return the labels of the coroutines a suspended coroutine is awaiting.
+
+    The chain ends with the type of the awaited object (e.g. ``Future``).
+    """
+    labels = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            # An awaitable that is not a coroutine: a future, task or gather
+            name = type(coro).__name__
+            labels.append("Future" if name == "FutureIter" else name)
+            break
+        labels.append(_frame_label(frame))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return labels
+
+
+class Profile:
+    """Samples collected for one request."""
+
+    def __init__(self, label: str):
+        """Initialize the profile.
+
+        Args:
+            label: Description of the profiled request
+        """
+        self.profile_id = uuid.uuid4().hex[:12]
+        self.label = label
+        self.started = time.time()
+        self.duration: Optional[float] = None
+        self.tasks: List[asyncio.Task] = []
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.max_loop_lag = 0.0
+
+    def collapsed(self) -> str:
+        """Return the samples as collapsed stacks, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self) -> Dict[str, Any]:
+        """Return a short description of the profile."""
+        return {
+            "profile_id": self.profile_id,
+            "label": self.label,
+            "started": self.started,
+            "duration": self.duration,
+            "samples": self.samples,
+            "max_loop_lag": round(self.max_loop_lag, 4),
+        }
+
+
+class Profiler:
+    """Per-request stack sampler for one event loop."""
+
+    def __init__(self, interval: float = 0.005, keep: int = 50, lag_interval: float = 0.05):
+        """Initialize the profiler.
+
+        Args:
+            interval: Seconds between stack samples
+            keep: Number of finished profiles kept
+            lag_interval: Seconds between event loop lag measurements
+        """
+        self.interval = interval
+        self.lag_interval = lag_interval
+        self.finished: Deque[Profile] = deque(maxlen=keep)
+        self._active: List[Profile] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+        self._lag_task: Optional[asyncio.Task] = None
+
+    def install(self) -> None:
+        """Attach the profiler to the running event loop.
+
+        Installs the task factory that tracks the tasks of profiled requests,
+        and starts the loop lag monitor and the sampler thread.
+        """
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        previous = loop.get_task_factory()
+
+        def task_factory(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> asyncio.Task:
+            if previous is not None:
+                task = previous(loop, coro, **kwargs)
+            else:
+                task = asyncio.Task(coro, loop=loop, **kwargs)
+            # Tasks copy their creator's context, so this is the creating request
+            profile = get_context().profile
+            if profile is not None:
+                profile.tasks.append(task)
+            return task
+
+        loop.set_task_factory(task_factory)
+        self._lag_task = loop.create_task(self._monitor_lag())
+        self._thread = threading.Thread(target=self._sample_loop, name="profiler", daemon=True)
+        self._thread.start()
+
+    async def close(self) -> None:
+        """Stop the sampler thread and the lag monitor."""
+        self._closed = True
+        self._wakeup.set()
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            await asyncio.gather(self._lag_task, return_exceptions=True)
+        if self._thread is not None:
+            await asyncio.to_thread(self._thread.join)
+
+    @contextmanager
+    def profile(self, label: str) -> Iterator[Profile]:
+        """Profile the current task and the tasks it creates.
+
+        Args:
+            label: Description of the profiled request
+
+        Yields:
+            The profile being recorded
+        """
+        profile = Profile(label)
+        task = asyncio.current_task()
+        if task is not None:
+            profile.tasks.append(task)
+        start = time.perf_counter()
+        with self._lock:
+            self._active.append(profile)
+        self._wakeup.set()
+        try:
+            with request_context(profile=profile):
+                yield profile
+        finally:
+            with self._lock:
+                self._active.remove(profile)
+            profile.duration = round(time.perf_counter() - start, 4)
+            # Tasks are only needed while sampling
+            profile.tasks = []
+            self.finished.append(profile)
+            metrics.counter("profiles_recorded_total").inc()
+
+    def get(self, profile_id: str) -> Optional[Profile]:
+        """Return a finished profile by id."""
+        for profile in self.finished:
+            if profile.profile_id == profile_id:
+                return profile
+        return None
+
+    async def _monitor_lag(self) -> None:
+        """Measure how late the event loop wakes up from a sleep."""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.lag_interval)
+            lag = max(0.0, time.perf_counter() - start - self.lag_interval)
+            metrics.histogram("event_loop_lag_seconds").observe(lag)
+            with self._lock:
+                for profile in self._active:
+                    profile.max_loop_lag = max(profile.max_loop_lag, lag)
+
+    def _sample_loop(self) -> None:
+        """Sample the event loop thread while profiles are active."""
+        while not self._closed:
+            with self._lock:
+                active = list(self._active)
+            if not active:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+            self._sample(active)
+            time.sleep(self.interval)
+
+    def _sample(self, profiles: List[Profile]) -> None:
+        """Take one sample for each active profile."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        running: List[FrameType] = []
+        while frame is not None:
+            running.append(frame)
+            frame = frame.f_back
+        positions = {id(frame): index for index, frame in enumerate(running)}
+
+        for profile in profiles:
+            profile.samples += 1
+            for task in list(profile.tasks):
+                if task.done():
+                    continue
+                coro = task.get_coro()
+                root = getattr(coro, "cr_frame", None)
+                if root is not None and id(root) in positions:
+                    # The task is running: record its stack, outermost first
+                    stack = ["cpu"] + [
+                        _frame_label(frame) for frame in reversed(running[:positions[id(root)] + 1])
+                    ]
+                else:
+                    stack = ["await"] + _await_chain(coro)
+                profile.stacks[";".join(stack)] += 1
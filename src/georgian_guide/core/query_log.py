@@ -0,0 +1,160 @@
+"""Query log for the Georgian Guide application.
+
+Every query received by the API is recorded as one compact JSON line: the
+fields of the user query, the time it arrived, its outcome, the time spent in
+each pipeline stage and the cache hits and misses it caused. Requests only
+append to an in-memory buffer; a background task writes the buffer to disk in
+a worker thread and rotates the file when it grows too large. The log can be
+replayed with ``benchmarks/replay.py`` and used as the query set of the cache
+warm-up.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from georgian_guide.core.context import RequestTrace
+from georgian_guide.core.metrics import metrics
+from georgian_guide.schemas.query import UserQuery
+
+
+def log_entry(
+    query: UserQuery,
+    endpoint: str,
+    status: str,
+    trace: RequestTrace,
+    received_at: float
+) -> Dict[str, Any]:
+    """Build the log entry of a processed query.
+
+    Args:
+        query: The user query
+        endpoint: API endpoint that received the query
+        status: Outcome ("ok", "error", "overloaded" or "cancelled")
+        trace: Trace recorded while the query was processed
+        received_at: Wall-clock time the query arrived
+
+    Returns:
+        Log entry (the user query fields at the top level)
+    """
+    finished = time.perf_counter()
+    entry = query.model_dump(exclude_none=True)
+    # Always written: null means the language was detected from the query
+    entry["language"] = query.language
+    entry.update({
+        "ts": round(received_at, 3),
+        "endpoint": endpoint,
+        "status": status,
+        "ms": round((finished - trace.started) * 1000, 1),
+        "stages": trace.stage_milliseconds(finished),
+    })
+    if trace.cache:
+        entry["cache"] = trace.cache
+    return entry
+
+
+def query_from_entry(data: Dict[str, Any]) -> UserQuery:
+    """Rebuild the user query of a log entry.
+
+    Args:
+        data: Log entry, or any JSON object with user query fields
+
+    Returns:
+        The user query; the language is detected when the entry has none
+    """
+    return UserQuery(**{name: data[name] for name in UserQuery.model_fields if name in data})
+
+
+class QueryLog:
+    """Rotating JSONL log written asynchronously."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 50_000_000,
+        backups: int = 5,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000
+    ):
+        """Initialize the log.
+
+        Args:
+            path: Log file path
+            max_bytes: Size at which the file is rotated
+            backups: Number of rotated files kept (path.1 is the newest)
+            flush_interval: Seconds between writes
+            max_pending: Entries buffered before new ones are dropped
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: List[str] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """Buffer an entry; never blocks the request.
+
+        Args:
+            entry: Log entry
+        """
+        if len(self._pending) >= self.max_pending:
+            # The disk cannot keep up; losing log lines beats slowing requests
+            metrics.counter("query_log_dropped_total").inc()
+            return
+        self._pending.append(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write the remaining entries."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush the buffer periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except OSError:
+                metrics.counter("query_log_write_failures_total").inc()
+
+    async def flush(self) -> None:
+        """Write the buffered entries to disk."""
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, []
+        await asyncio.to_thread(self._write, lines)
+
+    def _write(self, lines: List[str]) -> None:
+        """Append lines to the log, rotating it first if it is full."""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+        if size >= self.max_bytes:
+            self._rotate()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        metrics.counter("query_log_entries_total").inc(len(lines))
+
+    def _rotate(self) -> None:
+        """Shift path -> path.1 -> path.2 ..., dropping the oldest file."""
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
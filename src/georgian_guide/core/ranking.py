@@ -0,0 +1,243 @@
+"""Ranking of place search results.
+
+When the router issues several overlapping searches, the same places come
+back more than once. The ranker merges all SEARCH_PLACES results into one
+candidate set, drops duplicates, scores the candidates by rating, popularity and
+distance to the user, and keeps only a compact top-K list for the prompt.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Sequence
+
+from georgian_guide.core.geo import Coordinates, extract_coordinates, haversine
+from georgian_guide.core.metrics import metrics
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import ToolCallResult, UserQuery
+
+# Fields of a Google place result kept in the compact list
+_COMPACT_FIELDS = (
+    "place_id", "name", "rating", "user_ratings_total", "price_level", "business_status", "open_status"
+)
+
+
+def _normalize_name(name: Any) -> str:
+    """Normalize a place name for duplicate detection."""
+    return " ".join(str(name or "").casefold().split())
+
+
+def compact_place(place: Dict[str, Any], distance: Optional[float]) -> Dict[str, Any]:
+    """Reduce a Google place result to the fields the answer needs.
+
+    Args:
+        place: Place result from a Places search
+        distance: Distance to the user in meters, if known
+
+    Returns:
+        New compact place dict (the input is not modified)
+    """
+    compact = {name: place[name] for name in _COMPACT_FIELDS if place.get(name) is not None}
+    address = place.get("formatted_address") or place.get("vicinity") or place.get("address")
+    if address:
+        compact["address"] = address
+    coordinates = extract_coordinates(place)
+    if coordinates is not None:
+        compact["location"] = {"lat": coordinates[0], "lng": coordinates[1]}
+    open_now = (place.get("opening_hours") or {}).get("open_now")
+    if open_now is not None:
+        compact["open_now"] = open_now
+    if place.get("types"):
+        compact["types"] = place["types"][:3]
+    if distance is not None:
+        compact["distance_m"] = round(distance)
+    return compact
+
+
+def resolved_places(tool_results: Sequence[ToolCallResult], limit: int = 5) -> List[Dict[str, Any]]:
+    """Pick the places a query resolved, for follow-up questions about them.
+
+    Args:
+        tool_results: Results from tool executions (place searches already ranked)
+        limit: Maximum number of places returned
+
+    Returns:
+        Name, address and location of the places found, searches first
+    """
+    places = []
+    for result in tool_results:
+        if not result.success:
+            continue
+        if result.tool_type == ToolType.SEARCH_PLACES:
+            items = result.result.get("results", [])
+        elif result.tool_type == ToolType.PLACE_DETAILS:
+            items = [result.result.get("result") or {}]
+        elif result.tool_type == ToolType.GEOCODE:
+            items = result.result.get("results", [])[:1]
+        else:
+            continue
+        for item in items:
+            compact = compact_place(item, None)
+            if "location" in compact:
+                places.append({
+                    name: value for name, value in compact.items()
+                    if name in ("name", "address", "location")
+                })
+    return places[:limit]
+
+
+class PlaceRanker:
+    """Merges, deduplicates and ranks place search results."""
+
+    def __init__(
+        self,
+        top_k: int = 8,
+        dedupe_meters: float = 25.0,
+        distance_scale: float = 2000.0
+    ):
+        """Initialize the ranker.
+
+        Args:
+            top_k: Number of places kept for the prompt
+            dedupe_meters: Places with the same name closer than this are duplicates
+            distance_scale: Distance in meters at which a place's score is halved
+        """
+        self.top_k = top_k
+        self.dedupe_meters = dedupe_meters
+        self.distance_scale = distance_scale
+
+    def rank(
+        self,
+        places: Sequence[Dict[str, Any]],
+        origin: Optional[Coordinates] = None
+    ) -> List[Dict[str, Any]]:
+        """Rank places and return the compact top-K list.
+
+        The score is ``rating * log(1 + user_ratings_total) * decay`` where
+        ``decay = 1 / (1 + distance / distance_scale)``. Places without a
+        distance (no user location or no coordinates) get no decay.
+
+        Args:
+            places: Place results, possibly from several searches
+            origin: User coordinates used for the distance term
+
+        Returns:
+            Compact places, best first
+        """
+        # Merge by place_id, keeping the copy with the most ratings
+        merged: Dict[str, Dict[str, Any]] = {}
+        for index, place in enumerate(places):
+            key = place.get("place_id") or f"#{index}"
+            current = merged.get(key)
+            if current is None or (place.get("user_ratings_total") or 0) > (
+                current.get("user_ratings_total") or 0
+            ):
+                merged[key] = place
+        candidates = list(merged.values())
+        count = len(candidates)
+
+        # Score the whole candidate set column by column
+        ratings = array("d", (float(place.get("rating") or 0.0) for place in candidates))
+        totals = array("d", (float(place.get("user_ratings_total") or 0) for place in candidates))
+        coordinates = [extract_coordinates(place) for place in candidates]
+        distances = array("d", (
+            haversine(origin[0], origin[1], point[0], point[1])
+            if origin is not None and point is not None else -1.0
+            for point in coordinates
+        ))
+        scale = self.distance_scale
+        scores = array("d", (
+            rating * math.log1p(total) / (1.0 + max(distance, 0.0) / scale)
+            for rating, total, distance in zip(ratings, totals, distances)
+        ))
+
+        # Take the best places, skipping near-identical duplicates of ones already kept
+        order = sorted(range(count), key=lambda i: -scores[i])
+        kept: List[int] = []
+        for i in order:
+            if len(kept) == self.top_k:
+                break
+            if self._is_duplicate(i, kept, candidates, coordinates):
+                continue
+            kept.append(i)
+
+        metrics.counter("places_ranked_total").inc(count)
+        metrics.counter("places_dropped_total").inc(count - len(kept))
+        return [
+            compact_place(candidates[i], distances[i] if distances[i] >= 0 else None)
+            for i in kept
+        ]
+
+    def _is_duplicate(
+        self,
+        index: int,
+        kept: List[int],
+        candidates: List[Dict[str, Any]],
+        coordinates: List[Optional[Coordinates]]
+    ) -> bool:
+        """Check whether a candidate duplicates a place that is already kept."""
+        point = coordinates[index]
+        if point is None:
+            return False
+        name = _normalize_name(candidates[index].get("name"))
+        for other in kept:
+            other_point = coordinates[other]
+            if (
+                other_point is not None
+                and _normalize_name(candidates[other].get("name")) == name
+                and haversine(point[0], point[1], other_point[0], other_point[1]) <= self.dedupe_meters
+            ):
+                return True
+        return False
+
+    def apply(self, query: UserQuery, tool_results: List[ToolCallResult]) -> List[ToolCallResult]:
+        """Replace all successful place searches with one ranked result.
+
+        Args:
+            query: The user query (its location is used as the origin)
+            tool_results: Results from tool executions
+
+        Returns:
+            Tool results with the place searches merged and ranked
+        """
+        searches = [
+            result for result in tool_results
+            if result.tool_type == ToolType.SEARCH_PLACES and result.success
+        ]
+        if not searches:
+            return tool_results
+
+        places = [
+            place for result in searches for place in result.result.get("results", [])
+        ]
+        ranked = self.rank(places, self._origin(query, tool_results))
+        merged = ToolCallResult.model_construct(
+            tool_type=ToolType.SEARCH_PLACES,
+            result={"status": "OK" if ranked else "ZERO_RESULTS", "results": ranked},
+            success=True,
+            error_message=None
+        )
+
+        # The merged result takes the place of the first search
+        return [
+            merged if result is searches[0] else result
+            for result in tool_results
+            if result is searches[0] or all(result is not search for search in searches)
+        ]
+
+    @staticmethod
+    def _origin(query: UserQuery, tool_results: List[ToolCallResult]) -> Optional[Coordinates]:
+        """Pick the point distances are measured from.
+
+        The user's location is preferred; otherwise the first geocoded
+        location of the query (e.g. "near Liberty Square") is used.
+        """
+        origin = extract_coordinates(query.location)
+        if origin is not None:
+            return origin
+        for result in tool_results:
+            if result.tool_type == ToolType.GEOCODE and result.success:
+                for item in result.result.get("results", []):
+                    origin = extract_coordinates(item)
+                    if origin is not None:
+                        return origin
+        return None
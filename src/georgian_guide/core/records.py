@@ -0,0 +1,396 @@
+"""Compact records of cached tool results.
+
+Google place, geocode and elevation responses are large nested dicts (photos,
+viewports, plus codes, icons) of which the application reads only a few
+fields. The tool cache stores them as compact records instead: one object per
+response with column arrays, coordinates as int32 arrays in 1e-7 degrees (the
+precision Google returns, so they convert back exactly) and interned strings,
+so the same type lists, addresses and names are shared across entries. Nested
+fields the ``schemas/base.py`` models carry (photos, opening hours, address
+components) are kept as frozen tuples with interned strings.
+
+``expand`` turns a record back into a Google-shaped dict holding the fields
+the models and the pipeline read; those fields, the response's
+``error_message`` and ``next_page_token`` included, survive the round trip
+exactly. Viewports, icons and plus codes are dropped.
+"""
+
+import math
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from georgian_guide.schemas.base import ToolType
+
+# Canonical type lists, shared by every record that uses them
+_TYPE_LISTS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+# Marker of missing values in integer columns
+_MISSING = -1
+
+# Marker of missing coordinates in coordinate columns (outside +-180 degrees)
+_NO_COORDINATE = -(2 ** 31)
+
+# Top-level fields of a response kept besides its status and results
+_TOP_LEVEL = ("error_message", "next_page_token")
+
+
+def _intern(value: Any) -> Optional[str]:
+    """Intern a string (None and non-strings become None)."""
+    return sys.intern(value) if isinstance(value, str) else None
+
+
+def _type_list(types: Any) -> Tuple[str, ...]:
+    """Return the shared tuple of interned place types."""
+    key = tuple(sys.intern(name) for name in types or () if isinstance(name, str))
+    return _TYPE_LISTS.setdefault(key, key)
+
+
+class _FrozenDict(tuple):
+    """Frozen dict: a tuple of (key, frozen value) pairs."""
+
+    __slots__ = ()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested JSON data to tuples with interned strings."""
+    if isinstance(value, dict):
+        return _FrozenDict((sys.intern(str(key)), _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Convert frozen data back to the nested JSON data it was built from."""
+    if isinstance(value, _FrozenDict):
+        return {key: _thaw(item) for key, item in value}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _e7(degrees: float) -> int:
+    """Convert degrees to integer 1e-7 degrees."""
+    return round(degrees * 10_000_000)
+
+
+def _degrees(e7: int) -> float:
+    """Convert integer 1e-7 degrees back to degrees."""
+    return e7 / 10_000_000
+
+
+def _location(item: Dict[str, Any]) -> Tuple[float, float]:
+    """Read the coordinates of a Google result (NaN if it has none)."""
+    location = item.get("location") or (item.get("geometry") or {}).get("location") or {}
+    return _optional_float(location.get("lat")), _optional_float(location.get("lng"))
+
+
+def _coordinates(items: Sequence[Dict[str, Any]]) -> array:
+    """Store the coordinates of Google results in a coordinate column."""
+    column = array("i")
+    for item in items:
+        latitude, longitude = _location(item)
+        if math.isnan(latitude) or math.isnan(longitude):
+            column.extend((_NO_COORDINATE, _NO_COORDINATE))
+        else:
+            column.extend((_e7(latitude), _e7(longitude)))
+    return column
+
+
+def _point(column: array, index: int) -> Optional[Dict[str, float]]:
+    """Read the {"lat", "lng"} location of a result from a coordinate column."""
+    if column[2 * index] == _NO_COORDINATE:
+        return None
+    return {"lat": _degrees(column[2 * index]), "lng": _degrees(column[2 * index + 1])}
+
+
+def _optional_int(value: Any) -> int:
+    """Store an optional non-negative integer in an integer column."""
+    return int(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else _MISSING
+
+
+def _optional_bool(value: Any) -> int:
+    """Store an optional flag in an integer column."""
+    return int(value) if isinstance(value, bool) else _MISSING
+
+
+def _optional_float(value: Any) -> float:
+    """Store an optional number in a float column (NaN if missing)."""
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else math.nan
+
+
+class CompactResult:
+    """Compact record of one tool response."""
+
+    __slots__ = ("status", "error_message", "next_page_token")
+
+    # Name of the record type in cache snapshots
+    kind = ""
+
+    def __init__(self, status: str, **top_level: Optional[str]):
+        self.status = sys.intern(status)
+        self.error_message = top_level.get("error_message")
+        self.next_page_token = top_level.get("next_page_token")
+
+    @staticmethod
+    def _top_level(result: Dict[str, Any]) -> Dict[str, str]:
+        """Read the top-level fields a record keeps from a Google response."""
+        return {name: result[name] for name in _TOP_LEVEL if isinstance(result.get(name), str)}
+
+    def _response(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build a Google-shaped response around expanded results."""
+        response: Dict[str, Any] = {"status": self.status, "results": results}
+        for name in _TOP_LEVEL:
+            if getattr(self, name) is not None:
+                response[name] = getattr(self, name)
+        return response
+
+    @classmethod
+    def pack(cls, result: Dict[str, Any]) -> "CompactResult":
+        """Build a record from a Google response.
+
+        Args:
+            result: Tool response
+
+        Returns:
+            Compact record
+        """
+        raise NotImplementedError
+
+    def expand(self) -> Dict[str, Any]:
+        """Rebuild the Google-shaped response (with the fields the pipeline reads).
+
+        Returns:
+            New response dict
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def accepts(cls, result: Any) -> bool:
+        """Check whether a tool response has the shape this record stores."""
+        return (
+            isinstance(result, dict)
+            and isinstance(result.get("status", "OK"), str)
+            and isinstance(result.get("results"), list)
+            and all(isinstance(item, dict) for item in result["results"])
+        )
+
+
+class CompactPlaces(CompactResult):
+    """Places search response stored as columns."""
+
+    __slots__ = (
+        "place_ids", "names", "addresses", "vicinities", "types", "business_statuses",
+        "coordinates", "ratings", "ratings_total", "price_levels", "opening_hours", "photos",
+    )
+
+    kind = "places"
+
+    def __init__(self, status: str, places: Sequence[Dict[str, Any]], **top_level: Optional[str]):
+        """Initialize the record.
+
+        Args:
+            status: Response status
+            places: Google place results
+            **top_level: error_message and next_page_token of the response
+        """
+        super().__init__(status, **top_level)
+        self.place_ids = tuple(_intern(place.get("place_id")) for place in places)
+        self.names = tuple(_intern(place.get("name")) for place in places)
+        self.addresses = tuple(_intern(place.get("formatted_address")) for place in places)
+        self.vicinities = tuple(_intern(place.get("vicinity")) for place in places)
+        self.types = tuple(_type_list(place.get("types")) for place in places)
+        self.business_statuses = tuple(_intern(place.get("business_status")) for place in places)
+        self.coordinates = _coordinates(places)
+        self.ratings = array("d", (_optional_float(place.get("rating")) for place in places))
+        self.ratings_total = array("i", (_optional_int(place.get("user_ratings_total")) for place in places))
+        self.price_levels = array("b", (_optional_int(place.get("price_level")) for place in places))
+        self.opening_hours = tuple(_freeze(place.get("opening_hours")) for place in places)
+        self.photos = tuple(_freeze(place.get("photos")) for place in places)
+
+    @classmethod
+    def pack(cls, result: Dict[str, Any]) -> "CompactPlaces":
+        return cls(result.get("status", "OK"), result["results"], **cls._top_level(result))
+
+    def __len__(self) -> int:
+        return len(self.place_ids)
+
+    def _place(self, index: int) -> Dict[str, Any]:
+        """Rebuild one Google place result."""
+        place: Dict[str, Any] = {}
+        for name, column in (
+            ("place_id", self.place_ids),
+            ("name", self.names),
+            ("formatted_address", self.addresses),
+            ("vicinity", self.vicinities),
+            ("business_status", self.business_statuses),
+        ):
+            if column[index] is not None:
+                place[name] = column[index]
+        location = _point(self.coordinates, index)
+        if location is not None:
+            place["geometry"] = {"location": location}
+        if not math.isnan(self.ratings[index]):
+            place["rating"] = self.ratings[index]
+        if self.ratings_total[index] != _MISSING:
+            place["user_ratings_total"] = self.ratings_total[index]
+        if self.price_levels[index] != _MISSING:
+            place["price_level"] = self.price_levels[index]
+        if self.opening_hours[index] is not None:
+            place["opening_hours"] = _thaw(self.opening_hours[index])
+        if self.photos[index] is not None:
+            place["photos"] = _thaw(self.photos[index])
+        if self.types[index]:
+            place["types"] = list(self.types[index])
+        return place
+
+    def expand(self) -> Dict[str, Any]:
+        return self._response([self._place(index) for index in range(len(self))])
+
+
+class CompactGeocode(CompactResult):
+    """Geocode or reverse geocode response stored as columns."""
+
+    __slots__ = (
+        "addresses", "place_ids", "types", "location_types", "coordinates", "partial_match", "components",
+    )
+
+    kind = "geocode"
+
+    def __init__(self, status: str, results: Sequence[Dict[str, Any]], **top_level: Optional[str]):
+        """Initialize the record.
+
+        Args:
+            status: Response status
+            results: Google geocoding results
+            **top_level: error_message of the response
+        """
+        super().__init__(status, **top_level)
+        self.addresses = tuple(_intern(item.get("formatted_address")) for item in results)
+        self.place_ids = tuple(_intern(item.get("place_id")) for item in results)
+        self.types = tuple(_type_list(item.get("types")) for item in results)
+        self.location_types = tuple(
+            _intern((item.get("geometry") or {}).get("location_type")) for item in results
+        )
+        self.coordinates = _coordinates(results)
+        self.partial_match = array("b", (_optional_bool(item.get("partial_match")) for item in results))
+        self.components = tuple(_freeze(item.get("address_components")) for item in results)
+
+    @classmethod
+    def pack(cls, result: Dict[str, Any]) -> "CompactGeocode":
+        return cls(result.get("status", "OK"), result["results"], **cls._top_level(result))
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def expand(self) -> Dict[str, Any]:
+        results = []
+        for index in range(len(self)):
+            geometry: Dict[str, Any] = {}
+            location = _point(self.coordinates, index)
+            if location is not None:
+                geometry["location"] = location
+            if self.location_types[index] is not None:
+                geometry["location_type"] = self.location_types[index]
+            item: Dict[str, Any] = {"geometry": geometry} if geometry else {}
+            if self.addresses[index] is not None:
+                item["formatted_address"] = self.addresses[index]
+            if self.place_ids[index] is not None:
+                item["place_id"] = self.place_ids[index]
+            if self.types[index]:
+                item["types"] = list(self.types[index])
+            if self.partial_match[index] != _MISSING:
+                item["partial_match"] = bool(self.partial_match[index])
+            if self.components[index] is not None:
+                item["address_components"] = _thaw(self.components[index])
+            results.append(item)
+        return self._response(results)
+
+
+class CompactElevation(CompactResult):
+    """Elevation response stored as columns."""
+
+    __slots__ = ("coordinates", "elevations", "resolutions")
+
+    kind = "elevation"
+
+    def __init__(self, status: str, results: Sequence[Dict[str, Any]], **top_level: Optional[str]):
+        """Initialize the record.
+
+        Args:
+            status: Response status
+            results: Google elevation results
+            **top_level: error_message of the response
+        """
+        super().__init__(status, **top_level)
+        self.coordinates = _coordinates(results)
+        self.elevations = array("d", (_optional_float(item.get("elevation")) for item in results))
+        self.resolutions = array("d", (_optional_float(item.get("resolution")) for item in results))
+
+    @classmethod
+    def pack(cls, result: Dict[str, Any]) -> "CompactElevation":
+        return cls(result.get("status", "OK"), result["results"], **cls._top_level(result))
+
+    def __len__(self) -> int:
+        return len(self.elevations)
+
+    def expand(self) -> Dict[str, Any]:
+        results = []
+        for index in range(len(self)):
+            item: Dict[str, Any] = {}
+            location = _point(self.coordinates, index)
+            if location is not None:
+                item["location"] = location
+            if not math.isnan(self.elevations[index]):
+                item["elevation"] = self.elevations[index]
+            if not math.isnan(self.resolutions[index]):
+                item["resolution"] = self.resolutions[index]
+            results.append(item)
+        return self._response(results)
+
+
+# Record type used in the tool cache for each tool type
+RECORD_TYPES: Dict[ToolType, Type[CompactResult]] = {
+    ToolType.SEARCH_PLACES: CompactPlaces,
+    ToolType.GEOCODE: CompactGeocode,
+    ToolType.REVERSE_GEOCODE: CompactGeocode,
+    ToolType.ELEVATION: CompactElevation,
+}
+
+# Record types by snapshot name
+RECORD_KINDS: Dict[str, Type[CompactResult]] = {
+    record_type.kind: record_type for record_type in RECORD_TYPES.values()
+}
+
+
+def pack_result(tool_type: ToolType, result: Dict[str, Any]) -> Any:
+    """Convert a tool response to its compact record, if it has one.
+
+    Args:
+        tool_type: Type of the tool
+        result: Tool response
+
+    Returns:
+        Compact record, or the response itself
+    """
+    record_type = RECORD_TYPES.get(tool_type)
+    if record_type is None or not record_type.accepts(result):
+        return result
+    return record_type.pack(result)
+
+
+def unpack_result(value: Any) -> Dict[str, Any]:
+    """Convert a cached value back to a tool response.
+
+    Args:
+        value: Compact record or plain response
+
+    Returns:
+        Tool response
+    """
+    if isinstance(value, CompactResult):
+        return value.expand()
+    return value
@@ -0,0 +1,316 @@
+"""Resilience primitives for calls to upstream services.
+
+This module provides bounded retries with jittered exponential backoff,
+per-upstream circuit breakers and hedged requests. Together they keep a slow
+or failing upstream from stalling or failing whole queries.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from georgian_guide.core.metrics import Histogram, metrics
+
+T = TypeVar("T")
+
+# Exception class names (from httpx, openai and the standard library) that
+# indicate a transient failure worth retrying
+TRANSIENT_ERROR_NAMES = frozenset({
+    "TimeoutError",
+    "ConnectionError",
+    "TransportError",
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+})
+
+
+class TransientError(Exception):
+    """Error that is expected to go away when the call is retried."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the upstream's circuit is open."""
+
+
+def is_transient(error: BaseException) -> bool:
+    """Check whether an error is transient and the call may be retried.
+
+    Args:
+        error: The raised error
+
+    Returns:
+        True if the error is transient
+    """
+    if isinstance(error, (TransientError, asyncio.TimeoutError, ConnectionError)):
+        return True
+
+    # HTTP errors carry the status code on the response
+    response = getattr(error, "response", None)
+    status_code = getattr(response, "status_code", None)
+    if isinstance(status_code, int) and (status_code == 429 or status_code >= 500):
+        return True
+
+    return any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(error).__mro__)
+
+
+@dataclass
+class RetryPolicy:
+    """Bounded retries with "full jitter" exponential backoff."""
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before the given retry.
+
+        Args:
+            attempt: Number of attempts made so far (1 for the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Circuit breaker for one upstream.
+
+    After ``failure_threshold`` consecutive transient failures the circuit
+    opens and calls fail fast for ``reset_timeout`` seconds. Then a single
+    trial call is let through (half-open); its outcome closes or re-opens the
+    circuit.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker.
+
+        Args:
+            name: Upstream name used in errors and metrics
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Check that a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            metrics.counter("circuit_rejected_total", upstream=self.name).inc()
+            raise CircuitOpenError(f"Circuit for {self.name} is open")
+        if state == "half_open":
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Record a call that says nothing about the upstream's health."""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit past the threshold."""
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                metrics.counter("circuit_opened_total", upstream=self.name).inc()
+            self.opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breaker_defaults: Dict[str, float] = {"failure_threshold": 5, "reset_timeout": 30.0}
+_default_retry_policy = RetryPolicy()
+
+
+def get_breaker(upstream: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for an upstream.
+
+    Args:
+        upstream: Upstream name
+
+    Returns:
+        Circuit breaker
+    """
+    breaker = _breakers.get(upstream)
+    if breaker is None:
+        breaker = _breakers[upstream] = CircuitBreaker(
+            upstream,
+            failure_threshold=int(_breaker_defaults["failure_threshold"]),
+            reset_timeout=_breaker_defaults["reset_timeout"],
+        )
+    return breaker
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Return the process-wide retry policy.
+
+    Returns:
+        Retry policy
+    """
+    return _default_retry_policy
+
+
+def configure_resilience(
+    retry_policy: RetryPolicy,
+    failure_threshold: int,
+    reset_timeout: float
+) -> None:
+    """Set the process-wide retry policy and circuit breaker parameters.
+
+    Args:
+        retry_policy: Retry policy for upstream calls
+        failure_threshold: Consecutive failures that open a circuit
+        reset_timeout: Seconds a circuit stays open before a trial call
+    """
+    global _default_retry_policy
+    _default_retry_policy = retry_policy
+    _breaker_defaults.update(failure_threshold=failure_threshold, reset_timeout=reset_timeout)
+    _breakers.clear()
+
+
+async def call_with_retries(
+    call: Callable[[], Awaitable[T]],
+    breaker: Optional[CircuitBreaker] = None,
+    policy: Optional[RetryPolicy] = None,
+    record_success: bool = True
+) -> T:
+    """Call an upstream with retries, guarded by a circuit breaker.
+
+    Only transient errors are retried and counted against the breaker; other
+    errors (bad parameters, overload back-pressure) are raised immediately.
+
+    Args:
+        call: Function starting one attempt
+        breaker: Circuit breaker of the upstream
+        policy: Retry policy (defaults to the process-wide policy)
+        record_success: Whether a successful attempt closes the circuit; False
+            when the caller records the outcome itself, e.g. once a stream
+            started by the call has been read to the end
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        CircuitOpenError: If the breaker rejects the call
+    """
+    policy = policy or get_retry_policy()
+    attempt = 0
+
+    while True:
+        if breaker is not None:
+            breaker.before_call()
+        attempt += 1
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            # The caller went away; the call says nothing about the upstream
+            if breaker is not None:
+                breaker.release()
+            upstream = breaker.name if breaker is not None else "unknown"
+            metrics.counter("upstream_calls_cancelled_total", upstream=upstream).inc()
+            raise
+        except Exception as e:
+            if not is_transient(e):
+                if breaker is not None:
+                    breaker.release()
+                raise
+            if breaker is not None:
+                breaker.record_failure()
+            if attempt >= policy.max_attempts:
+                raise
+            upstream = breaker.name if breaker is not None else "unknown"
+            metrics.counter("retries_total", upstream=upstream).inc()
+            await asyncio.sleep(policy.backoff(attempt))
+            continue
+
+        if breaker is not None and record_success:
+            breaker.record_success()
+        return result
+
+
+async def hedged(
+    call: Callable[[], Awaitable[T]],
+    latency: Histogram,
+    percentile: float = 95,
+    min_samples: int = 20,
+    min_delay: float = 0.05
+) -> T:
+    """Run a call, starting one duplicate if it is slower than usual.
+
+    The duplicate is started once the first attempt has taken longer than the
+    given percentile of recent latencies; whichever finishes first wins and the
+    other is cancelled. Only first attempts are recorded in the histogram: a
+    duplicate that wins hides how slow the first attempt would have been, so
+    recording it would pull the hedge delay down over time. A first attempt
+    cancelled because its duplicate won is recorded with the time it had taken.
+
+    Args:
+        call: Function starting one attempt
+        latency: Histogram of recent latencies in seconds
+        percentile: Latency percentile after which to hedge
+        min_samples: Samples needed before hedging is enabled
+        min_delay: Minimum hedge delay in seconds
+
+    Returns:
+        Result of the first attempt to succeed
+    """
+    start = time.monotonic()
+
+    async def timed() -> T:
+        result = await call()
+        latency.observe(time.monotonic() - start)
+        return result
+
+    if latency.count < min_samples:
+        return await timed()
+
+    delay = max(min_delay, latency.percentile(percentile))
+    primary = asyncio.ensure_future(timed())
+    attempts = {primary}
+    hedging = False
+    try:
+        done, _ = await asyncio.wait(attempts, timeout=delay)
+        if not done:
+            metrics.counter("hedged_requests_total").inc()
+            attempts.add(asyncio.ensure_future(call()))
+            hedging = True
+
+        while True:
+            done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is None:
+                    return attempt.result()
+            if not attempts:
+                # Every attempt failed; surface the last error
+                return attempt.result()
+    finally:
+        if hedging and not primary.done():
+            latency.observe(time.monotonic() - start)
+        for attempt in attempts:
+            attempt.cancel()
@@ -0,0 +1,287 @@
+"""Upstream scheduler for the Georgian Guide application.
+
+This module rate limits calls to upstream services (Google Maps, OpenAI) with
+token buckets per upstream and per call key (e.g. tool type). Callers that
+cannot proceed immediately wait in a bounded priority queue, so interactive
+requests are served before batch and prefetch work, and callers are rejected
+outright once the queue is full instead of piling up. A waiter follows the
+priority of its request context, so a call whose priority is raised while it
+waits (a shared call an interactive request joined) moves up the queue.
+"""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from georgian_guide.core.config import Settings
+from georgian_guide.core.context import Priority, RequestContext, get_context
+from georgian_guide.core.metrics import metrics
+
+
+class SchedulerQueueFull(RuntimeError):
+    """Raised when an upstream's wait queue is full."""
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (defaults to one second of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until_available(self, tokens: float = 1.0) -> float:
+        """Return the seconds until the given number of tokens is available.
+
+        Args:
+            tokens: Number of tokens needed
+
+        Returns:
+            Seconds to wait (0.0 if the tokens are available now)
+        """
+        self._refill()
+        if self.tokens >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.rate
+
+    def take(self, tokens: float = 1.0) -> None:
+        """Remove tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to remove
+        """
+        self._refill()
+        self.tokens -= tokens
+
+
+@dataclass(order=True)
+class _Waiter:
+    """Caller waiting for a permit."""
+
+    priority: int
+    sequence: int
+    key: str = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued: float = field(compare=False)
+    # Context the priority was taken from (None if it was given explicitly)
+    context: Optional[RequestContext] = field(default=None, compare=False)
+
+
+@dataclass
+class _Lane:
+    """Waiters and buckets of one upstream."""
+
+    bucket: Optional[TokenBucket]
+    key_buckets: Dict[str, TokenBucket] = field(default_factory=dict)
+    waiters: List[_Waiter] = field(default_factory=list)
+    wakeup: Optional[asyncio.Event] = None
+    dispatcher: Optional[asyncio.Task] = None
+
+
+class UpstreamScheduler:
+    """Priority scheduler that rate limits calls to upstream services."""
+
+    def __init__(
+        self,
+        upstream_rates: Optional[Mapping[str, float]] = None,
+        key_rates: Optional[Mapping[Tuple[str, str], float]] = None,
+        max_queue: int = 100
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            upstream_rates: Requests per second allowed per upstream
+            key_rates: Requests per second allowed per (upstream, key)
+            max_queue: Maximum number of waiting callers per upstream
+        """
+        self.upstream_rates = dict(upstream_rates or {})
+        self.key_rates = dict(key_rates or {})
+        self.max_queue = max_queue
+        self._lanes: Dict[str, _Lane] = {}
+        self._sequence = itertools.count()
+
+    def _lane(self, upstream: str) -> _Lane:
+        lane = self._lanes.get(upstream)
+        if lane is None:
+            rate = self.upstream_rates.get(upstream)
+            lane = self._lanes[upstream] = _Lane(TokenBucket(rate) if rate else None)
+        return lane
+
+    def _buckets(self, upstream: str, lane: _Lane, key: str) -> List[TokenBucket]:
+        buckets = [lane.bucket] if lane.bucket else []
+        bucket = lane.key_buckets.get(key)
+        if bucket is None and (upstream, key) in self.key_rates:
+            bucket = lane.key_buckets[key] = TokenBucket(self.key_rates[(upstream, key)])
+        if bucket is not None:
+            buckets.append(bucket)
+        return buckets
+
+    def _wait_time(self, upstream: str, lane: _Lane, key: str) -> float:
+        return max(
+            (b.time_until_available() for b in self._buckets(upstream, lane, key)),
+            default=0.0
+        )
+
+    def _grant(self, upstream: str, lane: _Lane, key: str, priority: Priority, waited: float) -> None:
+        for bucket in self._buckets(upstream, lane, key):
+            bucket.take()
+        metrics.histogram(
+            "scheduler_wait_seconds", upstream=upstream, priority=priority.name.lower()
+        ).observe(waited)
+        metrics.counter("scheduler_granted_total", upstream=upstream, key=key).inc()
+
+    async def acquire(self, upstream: str, key: str = "", priority: Optional[Priority] = None) -> None:
+        """Wait until a call to an upstream is allowed.
+
+        Args:
+            upstream: Upstream service name, e.g. "google_maps" or "openai"
+            key: Call key within the upstream, e.g. the tool type
+            priority: Request priority (defaults to the current request's priority)
+
+        Raises:
+            SchedulerQueueFull: If too many callers are already waiting
+        """
+        context = get_context() if priority is None else None
+        priority = context.priority if context is not None else priority
+        lane = self._lane(upstream)
+
+        # Fast path: nobody is waiting and tokens are available
+        if not lane.waiters and self._wait_time(upstream, lane, key) == 0.0:
+            self._grant(upstream, lane, key, priority, 0.0)
+            return
+
+        if len(lane.waiters) >= self.max_queue:
+            metrics.counter("scheduler_rejected_total", upstream=upstream).inc()
+            raise SchedulerQueueFull(f"Too many requests waiting for {upstream}")
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            priority=int(priority),
+            sequence=next(self._sequence),
+            key=key,
+            future=loop.create_future(),
+            enqueued=time.monotonic(),
+            context=context,
+        )
+        lane.waiters.append(waiter)
+        metrics.gauge("scheduler_queue_depth", upstream=upstream).set(len(lane.waiters))
+
+        dispatcher = lane.dispatcher
+        if dispatcher is None or dispatcher.done() or dispatcher.get_loop() is not loop:
+            lane.wakeup = asyncio.Event()
+            lane.dispatcher = loop.create_task(self._dispatch(upstream, lane))
+        elif lane.wakeup is not None:
+            lane.wakeup.set()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # A cancelled caller gives up its place in the queue
+            if waiter in lane.waiters:
+                lane.waiters.remove(waiter)
+                metrics.gauge("scheduler_queue_depth", upstream=upstream).set(len(lane.waiters))
+            raise
+
+    async def _dispatch(self, upstream: str, lane: _Lane) -> None:
+        """Grant permits to waiting callers in priority order."""
+        while lane.waiters:
+            lane.waiters = [w for w in lane.waiters if not w.future.done()]
+            for waiter in lane.waiters:
+                if waiter.context is not None:
+                    waiter.priority = int(waiter.context.priority)
+            next_wait = None
+
+            for waiter in sorted(lane.waiters):
+                wait = self._wait_time(upstream, lane, waiter.key)
+                if wait == 0.0:
+                    lane.waiters.remove(waiter)
+                    self._grant(
+                        upstream,
+                        lane,
+                        waiter.key,
+                        Priority(waiter.priority),
+                        time.monotonic() - waiter.enqueued
+                    )
+                    waiter.future.set_result(None)
+                    break
+                next_wait = wait if next_wait is None else min(next_wait, wait)
+            else:
+                if next_wait is not None:
+                    # Sleep until a token is due, or until a new caller arrives
+                    lane.wakeup.clear()
+                    try:
+                        await asyncio.wait_for(lane.wakeup.wait(), timeout=next_wait)
+                    except asyncio.TimeoutError:
+                        pass
+
+            metrics.gauge("scheduler_queue_depth", upstream=upstream).set(len(lane.waiters))
+
+    def queue_depth(self, upstream: str) -> int:
+        """Return the number of callers waiting for an upstream.
+
+        Args:
+            upstream: Upstream service name
+
+        Returns:
+            Number of waiting callers
+        """
+        lane = self._lanes.get(upstream)
+        return len(lane.waiters) if lane else 0
+
+
+def create_scheduler(settings: Settings) -> UpstreamScheduler:
+    """Create a scheduler with the rate limits from the settings.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Upstream scheduler
+    """
+    return UpstreamScheduler(
+        upstream_rates=settings.upstream_rate_limits,
+        key_rates={
+            ("google_maps", tool_type.value): rate
+            for tool_type, rate in settings.tool_rate_limits.items()
+        },
+        max_queue=settings.scheduler_max_queue
+    )
+
+
+_default_scheduler: Optional[UpstreamScheduler] = None
+
+
+def get_scheduler() -> UpstreamScheduler:
+    """Return the process-wide scheduler.
+
+    Returns:
+        Shared upstream scheduler (unlimited until configured)
+    """
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = UpstreamScheduler()
+    return _default_scheduler
+
+
+def set_scheduler(scheduler: UpstreamScheduler) -> None:
+    """Replace the process-wide scheduler.
+
+    Args:
+        scheduler: Scheduler to use from now on
+    """
+    global _default_scheduler
+    _default_scheduler = scheduler
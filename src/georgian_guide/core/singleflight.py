@@ -0,0 +1,104 @@
+"""Deduplication of concurrent identical upstream calls.
+
+When several requests miss a cache for the same key at the same time, only the
+first starts the upstream call; the others wait for its result. The shared
+call runs in its own task, so a waiter that is cancelled (its client went away
+or its deadline passed) does not cancel work the other waiters still need. The
+call is only cancelled when every waiter has left. It runs in a context of its
+own, without the trace, stage callback, profile or deadline of the request
+that started it, at the highest priority among the callers waiting for it.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, List, TypeVar
+
+from georgian_guide.core.context import Priority, RequestContext, get_context, request_context
+from georgian_guide.core.metrics import metrics
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    """An in-flight call and the priorities of the callers waiting for it."""
+
+    def __init__(self, task: "asyncio.Task[T]", context: RequestContext):
+        self.task = task
+        # Context the call runs in; its priority follows the waiters
+        self.context = context
+        self.priorities: List[Priority] = []
+
+    @property
+    def waiters(self) -> int:
+        """Return the number of callers waiting for the call."""
+        return len(self.priorities)
+
+    def join(self, priority: Priority) -> None:
+        """Add a waiter, raising the call's priority to the waiter's."""
+        self.priorities.append(priority)
+        self.context.priority = min(self.priorities)
+
+    def leave(self, priority: Priority) -> None:
+        """Remove a waiter, lowering the call's priority to the remaining waiters'."""
+        self.priorities.remove(priority)
+        if self.priorities:
+            self.context.priority = min(self.priorities)
+
+
+class SingleFlight(Generic[T]):
+    """Shares the result of one in-flight call between concurrent callers."""
+
+    def __init__(self, name: str):
+        """Initialize the group.
+
+        Args:
+            name: Name of the calls in metrics, e.g. "router"
+        """
+        self.name = name
+        self._flights: Dict[str, _Flight[T]] = {}
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a call, or join the identical call already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            call: Function starting the call
+
+        Returns:
+            Result of the (shared) call
+        """
+        priority = get_context().priority
+        flight = self._flights.get(key)
+        if flight is None:
+            # The shared call does not belong to the request that happened to
+            # start it: each waiter enforces its own deadline, and the call
+            # reports no stages to it and is not recorded in its trace or profile
+            with request_context(
+                budget=None, trace=None, stage_callback=None, profile=None, priority=priority
+            ) as context:
+                task = asyncio.ensure_future(call())
+            flight = self._flights[key] = _Flight(task, context)
+            task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            metrics.counter("singleflight_shared_total", call=self.name).inc()
+
+        flight.join(priority)
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Nobody else needs the result
+                metrics.counter("singleflight_cancelled_total", call=self.name).inc()
+                flight.task.cancel()
+                self._forget(key, flight)
+            raise
+        finally:
+            flight.leave(priority)
+
+    def _forget(self, key: str, flight: _Flight[T]) -> None:
+        """Remove a finished call, so the next caller starts a fresh one."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        """Return the number of calls in flight."""
+        return len(self._flights)
@@ -0,0 +1,155 @@
+"""Cache snapshots for the Georgian Guide application.
+
+A snapshot holds the fresh entries of the router, tool and answer caches, so a
+newly started worker can begin with the caches warmed at deploy time instead
+of empty ones. The file starts with a small JSON header giving the position of
+each cache's section; workers memory-map the file and decode only the sections
+they need, so every worker of a host shares the same page cache. Compact tool
+records are written expanded, tagged with their record type, and packed again
+on load.
+
+Layout::
+
+    b"GGSNAP01" | header length (uint32 LE) | header JSON | section JSON ...
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from typing import Any, Dict, Mapping, Optional, Type
+
+from pydantic import BaseModel
+
+from georgian_guide.core.cache import TTLCache
+from georgian_guide.core.records import RECORD_KINDS, CompactResult
+from georgian_guide.schemas.query import AssistantResponse, RouterResponse
+
+SNAPSHOT_MAGIC = b"GGSNAP01"
+_LENGTH = struct.Struct("<I")
+
+# Model of the values of each cache (None for plain JSON values)
+SNAPSHOT_MODELS: Dict[str, Optional[Type[BaseModel]]] = {
+    "router": RouterResponse,
+    "tools": None,
+    "responses": AssistantResponse,
+}
+
+
+def processor_caches(processor: Any) -> Dict[str, TTLCache]:
+    """Collect the caches of a query processor that snapshots cover.
+
+    Args:
+        processor: Query processor
+
+    Returns:
+        Caches keyed by snapshot section name (missing caches are left out)
+    """
+    caches = {
+        "router": getattr(processor.router, "cache", None),
+        "tools": getattr(processor.tools, "cache", None),
+        "responses": getattr(processor, "response_cache", None),
+    }
+    return {name: cache for name, cache in caches.items() if cache is not None}
+
+
+def _encode(value: Any) -> Any:
+    """Convert a cached value to JSON-compatible data."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, CompactResult):
+        return {"$record": value.kind, "result": value.expand()}
+    return value
+
+
+def _decode(value: Any, model: Optional[Type[BaseModel]]) -> Any:
+    """Convert snapshot data back to a cached value."""
+    if model is not None:
+        return model.model_validate(value)
+    if isinstance(value, dict) and value.get("$record") in RECORD_KINDS:
+        return RECORD_KINDS[value["$record"]].pack(value["result"])
+    return value
+
+
+def save_snapshot(path: str, caches: Mapping[str, TTLCache]) -> Dict[str, int]:
+    """Write the fresh entries of caches to a snapshot file.
+
+    The file is written next to its destination and renamed into place, so
+    workers starting meanwhile never read a partial snapshot.
+
+    Args:
+        path: Snapshot file path
+        caches: Caches keyed by section name
+
+    Returns:
+        Number of entries written per section
+    """
+    sections: Dict[str, bytes] = {}
+    counts: Dict[str, int] = {}
+    for name, cache in caches.items():
+        entries = [[key, _encode(value), ttl] for key, value, ttl in cache.items()]
+        sections[name] = json.dumps(entries, ensure_ascii=False, separators=(",", ":")).encode()
+        counts[name] = len(entries)
+
+    # Section offsets depend on the header length, which depends on the offsets;
+    # offsets are therefore relative to the end of the header
+    positions = {}
+    offset = 0
+    for name, body in sections.items():
+        positions[name] = [offset, len(body), counts[name]]
+        offset += len(body)
+    header = json.dumps({"created_at": time.time(), "sections": positions}).encode()
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(_LENGTH.pack(len(header)))
+        f.write(header)
+        for body in sections.values():
+            f.write(body)
+    os.replace(temporary, path)
+    return counts
+
+
+def load_snapshot(path: str, caches: Mapping[str, TTLCache]) -> Dict[str, int]:
+    """Load the entries of a snapshot file into caches.
+
+    Entries keep the freshness they had when the snapshot was written, minus
+    the snapshot's age; entries that expired since are skipped.
+
+    Args:
+        path: Snapshot file path
+        caches: Caches to fill, keyed by section name
+
+    Returns:
+        Number of entries loaded per section
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a cache snapshot
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        prefix = len(SNAPSHOT_MAGIC) + _LENGTH.size
+        if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a cache snapshot")
+        (header_length,) = _LENGTH.unpack(data[len(SNAPSHOT_MAGIC):prefix])
+        header = json.loads(data[prefix:prefix + header_length])
+        start = prefix + header_length
+        age = max(0.0, time.time() - header["created_at"])
+
+        counts: Dict[str, int] = {}
+        for name, cache in caches.items():
+            if name not in header["sections"]:
+                continue
+            offset, length, _ = header["sections"][name]
+            model = SNAPSHOT_MODELS.get(name)
+            loaded = 0
+            for key, value, ttl in json.loads(data[start + offset:start + offset + length]):
+                remaining = ttl - age
+                if remaining <= 0:
+                    continue
+                cache.set(key, _decode(value, model), remaining)
+                loaded += 1
+            counts[name] = loaded
+    return counts
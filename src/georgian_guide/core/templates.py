@@ -0,0 +1,312 @@
+"""Deterministic answers rendered from tool results.
+
+Tool results are described as short lines of text in the response language.
+``TemplateOutputReceiver`` answers simple single-tool results (one distance,
+one elevation, one geocoded place) this way instead of calling the output
+model, and when the output model cannot finish before the request deadline,
+``fallback_response`` lists whatever facts the tools found.
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from georgian_guide.core.interfaces import OutputReceiverInterface
+from georgian_guide.core.language import message, resolve_language
+from georgian_guide.core.metrics import metrics
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import AssistantResponse, StreamEvent, ToolCallResult, UserQuery
+
+# Places listed per search
+MAX_PLACES = 5
+
+# Units of distances and durations, per language
+UNITS: Dict[str, Dict[str, str]] = {
+    "en": {"m": "m", "km": "km", "h": "h", "min": "min"},
+    "ka": {"m": "მ", "km": "კმ", "h": "სთ", "min": "წთ"},
+    "ru": {"m": "м", "km": "км", "h": "ч", "min": "мин"},
+}
+
+# Follow-up questions offered with template answers, per shape and language
+FOLLOW_UP_QUESTIONS: Dict[str, Dict[str, List[str]]] = {
+    "distance": {
+        "en": ["How do I get there by public transport?", "What is worth seeing on the way?"],
+        "ka": ["როგორ მივიდე იქ საზოგადოებრივი ტრანსპორტით?", "რისი ნახვა ღირს გზაში?"],
+        "ru": ["Как добраться туда на общественном транспорте?", "Что стоит посмотреть по дороге?"],
+    },
+    "elevation": {
+        "en": ["Are there hiking trails nearby?", "How do I get there?"],
+        "ka": ["არის ახლოს სალაშქრო ბილიკები?", "როგორ მივიდე იქ?"],
+        "ru": ["Есть ли поблизости пешие маршруты?", "Как туда добраться?"],
+    },
+    "place": {
+        "en": ["What is there to see nearby?", "Where can I eat nearby?"],
+        "ka": ["რისი ნახვა შეიძლება ახლოს?", "სად შემიძლია ვჭამო ახლოს?"],
+        "ru": ["Что посмотреть поблизости?", "Где поблизости можно поесть?"],
+    },
+}
+
+
+def format_distance(meters: float, language: str) -> str:
+    """Format a distance in meters, e.g. "850 m" or "21.4 km"."""
+    units = UNITS.get(language, UNITS["en"])
+    if meters < 1000:
+        return f"{round(meters)} {units['m']}"
+    return f"{meters / 1000:.1f}".rstrip("0").rstrip(".") + f" {units['km']}"
+
+
+def format_duration(seconds: float, language: str) -> str:
+    """Format a duration in seconds, e.g. "25 min" or "1 h 5 min"."""
+    units = UNITS.get(language, UNITS["en"])
+    minutes = max(1, round(seconds / 60))
+    if minutes < 60:
+        return f"{minutes} {units['min']}"
+    hours, minutes = divmod(minutes, 60)
+    text = f"{hours} {units['h']}"
+    return f"{text} {minutes} {units['min']}" if minutes else text
+
+
+def _measure(value: Any, format_value: Any, language: str) -> str:
+    """Format a Google distance or duration object, preferring its numeric value."""
+    value = value or {}
+    if isinstance(value.get("value"), (int, float)):
+        return format_value(value["value"], language)
+    return str(value.get("text") or "")
+
+
+def _trip(origin: str, destination: str, element: Dict[str, Any], language: str) -> str:
+    """Describe one leg of a trip."""
+    return message(
+        "fact_trip",
+        language,
+        origin=origin,
+        destination=destination,
+        distance=_measure(element.get("distance"), format_distance, language),
+        duration=_measure(element.get("duration"), format_duration, language)
+    )
+
+
+def _coordinates(value: float) -> str:
+    """Format a coordinate with 4 decimals (about 10 m)."""
+    return f"{value:.4f}"
+
+
+def describe_result(result: ToolCallResult, language: str) -> List[str]:
+    """Describe the facts of a successful tool result as short lines.
+
+    Args:
+        result: Tool result
+        language: Supported language code
+
+    Returns:
+        Lines of text (empty if the result has nothing to show)
+    """
+    data = result.result
+    tool_type = result.tool_type
+    lines: List[str] = []
+
+    if tool_type == ToolType.SEARCH_PLACES:
+        for place in data.get("results", [])[:MAX_PLACES]:
+            line = f"• {place.get('name', '?')}"
+            address = place.get("address") or place.get("formatted_address") or place.get("vicinity")
+            if address:
+                line += f" — {address}"
+            if place.get("rating") is not None:
+                line += f" (★ {place['rating']})"
+            lines.append(line)
+    elif tool_type == ToolType.PLACE_DETAILS:
+        place = data.get("result", {})
+        for name in ("name", "formatted_address", "formatted_phone_number", "website"):
+            if place.get(name):
+                lines.append(str(place[name]))
+    elif tool_type in (ToolType.GEOCODE, ToolType.REVERSE_GEOCODE):
+        for item in data.get("results", [])[:1]:
+            location = (item.get("geometry") or {}).get("location") or {}
+            if "lat" in location and "lng" in location:
+                lines.append(message(
+                    "fact_place",
+                    language,
+                    address=item.get("formatted_address", "?"),
+                    lat=_coordinates(location["lat"]),
+                    lng=_coordinates(location["lng"])
+                ))
+            elif item.get("formatted_address"):
+                lines.append(item["formatted_address"])
+    elif tool_type == ToolType.DISTANCE_MATRIX:
+        origins = data.get("origin_addresses", [])
+        destinations = data.get("destination_addresses", [])
+        for origin, row in zip(origins, data.get("rows", [])):
+            for destination, element in zip(destinations, row.get("elements", [])):
+                if element.get("status", "OK") == "OK":
+                    lines.append(_trip(origin, destination, element, language))
+    elif tool_type == ToolType.DIRECTIONS:
+        for leg in (data.get("routes") or [{}])[0].get("legs", []):
+            lines.append(_trip(leg.get("start_address", ""), leg.get("end_address", ""), leg, language))
+    elif tool_type == ToolType.ELEVATION:
+        for item in data.get("results", [])[:3]:
+            if item.get("elevation") is None:
+                continue
+            location = item.get("location") or {}
+            place = ", ".join(
+                _coordinates(location[name]) if name in location else "?" for name in ("lat", "lng")
+            )
+            meters = str(round(item["elevation"]))
+            lines.append(message("fact_elevation", language, place=place, meters=meters))
+    elif tool_type == ToolType.REACHABILITY:
+        for item in data.get("reachable", [])[:MAX_PLACES]:
+            lines.append(f"• {item.get('name', '?')} — {format_duration(item.get('minutes', 0) * 60, language)}")
+    elif tool_type == ToolType.KNOWLEDGE:
+        for passage in data.get("passages", [])[:1]:
+            lines.append(passage.get("text", ""))
+    elif tool_type == ToolType.ITINERARY:
+        for number, stop in enumerate(data.get("stops", []), start=1):
+            line = f"{number}. {stop.get('name', '?')}"
+            if stop.get("arrive") and stop.get("depart"):
+                line += f" {stop['arrive']}–{stop['depart']}"
+            lines.append(line)
+
+    return lines
+
+
+def simple_shape(tool_results: List[ToolCallResult]) -> Optional[str]:
+    """Check whether tool results can be answered from a template alone.
+
+    Args:
+        tool_results: Results from tool executions
+
+    Returns:
+        "distance", "elevation" or "place" for a single successful result of
+        that shape, otherwise None
+    """
+    if len(tool_results) != 1 or not tool_results[0].success:
+        return None
+    result = tool_results[0]
+    data = result.result
+    if data.get("status", "OK") != "OK":
+        return None
+
+    if result.tool_type == ToolType.DISTANCE_MATRIX:
+        rows = data.get("rows", [])
+        elements = rows[0].get("elements", []) if len(rows) == 1 else []
+        if (
+            len(elements) == 1
+            and elements[0].get("status") == "OK"
+            and len(data.get("origin_addresses", [])) == 1
+            and len(data.get("destination_addresses", [])) == 1
+        ):
+            return "distance"
+    elif result.tool_type == ToolType.ELEVATION:
+        results = data.get("results", [])
+        if len(results) == 1 and results[0].get("elevation") is not None:
+            return "elevation"
+    elif result.tool_type == ToolType.GEOCODE:
+        results = data.get("results", [])
+        # A fuzzy gazetteer match may be a namesake; the model words it with care
+        if (
+            len(results) == 1
+            and results[0].get("formatted_address")
+            and not results[0].get("partial_match")
+            and results[0].get("match", "exact") == "exact"
+        ):
+            return "place"
+    return None
+
+
+def fallback_response(query: UserQuery, tool_results: List[ToolCallResult]) -> AssistantResponse:
+    """Build an answer listing the facts found by the tools.
+
+    Args:
+        query: The user query
+        tool_results: Results from tool executions
+
+    Returns:
+        Assistant response without follow-up questions
+    """
+    language = resolve_language(query.language, query.query)
+    lines = [
+        line
+        for result in tool_results if result.success
+        for line in describe_result(result, language)
+    ]
+    if not lines:
+        return AssistantResponse(response=message("deadline_empty", language))
+    return AssistantResponse(
+        response="\n".join([message("deadline_partial", language)] + lines)
+    )
+
+
+class TemplateOutputReceiver(OutputReceiverInterface):
+    """Output receiver answering simple tool results from templates.
+
+    Results of a whitelisted shape (see ``simple_shape``) are rendered
+    directly; everything else is passed on to the wrapped receiver.
+    """
+
+    def __init__(self, receiver: OutputReceiverInterface):
+        """Initialize the output receiver.
+
+        Args:
+            receiver: Receiver for results without a template (the LLM receiver)
+        """
+        self.receiver = receiver
+
+    def render(self, query: UserQuery, tool_results: List[ToolCallResult]) -> Optional[AssistantResponse]:
+        """Render the answer from a template, if the results have a simple shape.
+
+        Args:
+            query: The original user query
+            tool_results: Results from tool executions
+
+        Returns:
+            The answer, or None if the results need the wrapped receiver
+        """
+        shape = simple_shape(tool_results)
+        if shape is None:
+            return None
+        language = resolve_language(query.language, query.query)
+        result = tool_results[0]
+        metrics.counter("template_answers_total", shape=shape).inc()
+        return AssistantResponse(
+            response="\n".join(describe_result(result, language)),
+            source_information=[{"type": "Google Maps", "name": result.tool_type.value}],
+            follow_up_questions=list(FOLLOW_UP_QUESTIONS[shape][language])
+        )
+
+    async def process_results(
+        self,
+        query: UserQuery,
+        tool_results: List[ToolCallResult]
+    ) -> AssistantResponse:
+        """Generate the final response.
+
+        Args:
+            query: The original user query
+            tool_results: Results from tool executions
+
+        Returns:
+            Final assistant response
+        """
+        response = self.render(query, tool_results)
+        if response is None:
+            return await self.receiver.process_results(query, tool_results)
+        return response
+
+    async def stream_results(
+        self,
+        query: UserQuery,
+        tool_results: List[ToolCallResult]
+    ) -> AsyncIterator[StreamEvent]:
+        """Generate the final response as a stream of events.
+
+        Args:
+            query: The original user query
+            tool_results: Results from tool executions
+
+        Yields:
+            'delta' events with answer text, then a 'done' event
+        """
+        response = self.render(query, tool_results)
+        if response is None:
+            async for event in self.receiver.stream_results(query, tool_results):
+                yield event
+            return
+        yield StreamEvent(event="delta", text=response.response)
+        yield StreamEvent(event="done", response=response)
@@ -0,0 +1,120 @@
+"""Text normalization for Georgian place names.
+
+Georgian names reach the application in Georgian script, in Cyrillic and in
+several Latin transliterations ("Mtskheta", "Mcxeta", "Mtsketa"). This module
+transliterates Georgian and Cyrillic text to Latin and reduces names to a
+canonical key that most spelling variants share.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Tuple
+
+# Georgian (Mkhedruli) letters -> national system romanization
+GEORGIAN_TO_LATIN: Dict[str, str] = {
+    "ა": "a", "ბ": "b", "გ": "g", "დ": "d", "ე": "e", "ვ": "v", "ზ": "z",
+    "თ": "t", "ი": "i", "კ": "k", "ლ": "l", "მ": "m", "ნ": "n", "ო": "o",
+    "პ": "p", "ჟ": "zh", "რ": "r", "ს": "s", "ტ": "t", "უ": "u", "ფ": "p",
+    "ქ": "k", "ღ": "gh", "ყ": "q", "შ": "sh", "ჩ": "ch", "ც": "ts", "ძ": "dz",
+    "წ": "ts", "ჭ": "ch", "ხ": "kh", "ჯ": "j", "ჰ": "h",
+}
+
+# Russian Cyrillic letters -> Latin, following common transliteration of Georgian names
+CYRILLIC_TO_LATIN: Dict[str, str] = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e",
+    "ж": "zh", "з": "z", "и": "i", "й": "i", "к": "k", "л": "l", "м": "m",
+    "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u",
+    "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "sh", "ъ": "",
+    "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya",
+}
+
+_TRANSLITERATION = str.maketrans({**GEORGIAN_TO_LATIN, **CYRILLIC_TO_LATIN})
+
+# Spelling variants folded together by the canonical key, applied in order
+# ("kh" must become "x" before "ts" becomes "c", so "tskh" -> "cx")
+CANONICAL_REPLACEMENTS: Tuple[Tuple[str, str], ...] = (
+    ("kh", "x"),
+    ("ts", "c"),
+    ("tz", "c"),
+    ("ch", "c"),
+    ("gh", "g"),
+    ("sh", "s"),
+    ("zh", "z"),
+    ("dz", "z"),
+    ("th", "t"),
+    ("ph", "p"),
+    ("q", "k"),
+    ("y", "i"),
+    ("w", "v"),
+    ("f", "p"),
+)
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+_REPEATED = re.compile(r"(.)\1+")
+
+
+def has_georgian(text: str) -> bool:
+    """Check whether the text contains Georgian script."""
+    return any("Ⴀ" <= char <= "ჿ" for char in text)
+
+
+def has_cyrillic(text: str) -> bool:
+    """Check whether the text contains Cyrillic script."""
+    return any("Ѐ" <= char <= "ӿ" for char in text)
+
+
+def transliterate(text: str) -> str:
+    """Transliterate Georgian and Cyrillic text to lowercase Latin.
+
+    Args:
+        text: Text in any script
+
+    Returns:
+        Lowercase Latin text with diacritics and apostrophes removed
+    """
+    text = text.lower().translate(_TRANSLITERATION)
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).replace("'", "")
+
+
+def is_transliterable(text: str) -> bool:
+    """Check whether all letters of the text are Latin after transliteration.
+
+    Args:
+        text: Text in any script
+
+    Returns:
+        False if the text has letters of a script other than Latin, Georgian
+        or Cyrillic
+    """
+    return all(char.isascii() or not char.isalnum() for char in transliterate(text))
+
+
+def canonical_key(text: str) -> str:
+    """Reduce a place name to its canonical key.
+
+    "Mtskheta", "Mcxeta" and "მცხეთა" all become "mcxeta"; "Sighnaghi" and
+    "Signagi" both become "signagi".
+
+    Args:
+        text: Place name in any script or transliteration
+
+    Returns:
+        Canonical key (lowercase Latin letters and digits only)
+    """
+    key = _NON_ALPHANUMERIC.sub("", transliterate(text))
+    for variant, replacement in CANONICAL_REPLACEMENTS:
+        key = key.replace(variant, replacement)
+    return _REPEATED.sub(r"\1", key)
+
+
+def normalize_query(text: str) -> str:
+    """Normalize a user query for use in cache keys.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Case-folded query with whitespace collapsed
+    """
+    return " ".join(text.casefold().split())
@@ -0,0 +1,200 @@
+"""Pre-flight validation of tool calls.
+
+This module validates the parameters chosen by the router against the tool
+request schemas before any tool runs, coercing the common shapes LLMs produce
+("41.7,44.8" strings for locations, "Car" for the driving travel mode, a single
+address where a list is expected). Invalid calls are reported with readable
+errors so they can be sent back to the router for repair.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from georgian_guide.schemas.base import ToolType, TravelMode
+from georgian_guide.schemas.query import ToolCall
+from georgian_guide.schemas.tools import TOOL_REQUEST_SCHEMAS
+
+_COORDINATES = re.compile(r"^\s*\(?\s*(-?\d+(?:\.\d+)?)\s*[,;\s]\s*(-?\d+(?:\.\d+)?)\s*\)?\s*$")
+
+# Common ways of naming a travel mode, mapped to the TravelMode value
+TRAVEL_MODE_ALIASES: Dict[str, TravelMode] = {
+    "drive": TravelMode.DRIVING,
+    "driving": TravelMode.DRIVING,
+    "car": TravelMode.DRIVING,
+    "taxi": TravelMode.DRIVING,
+    "walk": TravelMode.WALKING,
+    "walking": TravelMode.WALKING,
+    "foot": TravelMode.WALKING,
+    "on foot": TravelMode.WALKING,
+    "bicycle": TravelMode.BICYCLING,
+    "bicycling": TravelMode.BICYCLING,
+    "bike": TravelMode.BICYCLING,
+    "cycling": TravelMode.BICYCLING,
+    "transit": TravelMode.TRANSIT,
+    "public transport": TravelMode.TRANSIT,
+    "public transportation": TravelMode.TRANSIT,
+    "bus": TravelMode.TRANSIT,
+    "metro": TravelMode.TRANSIT,
+    "subway": TravelMode.TRANSIT,
+    "train": TravelMode.TRANSIT,
+    "marshrutka": TravelMode.TRANSIT,
+}
+
+
+@dataclass
+class ValidatedCall:
+    """Tool call whose parameters passed validation."""
+
+    tool_call: ToolCall
+    parameters: Dict[str, Any]
+
+
+@dataclass
+class InvalidCall:
+    """Tool call whose parameters failed validation."""
+
+    tool_call: ToolCall
+    error: str
+
+
+def coerce_location(value: Any) -> Any:
+    """Coerce common location shapes into a {latitude, longitude} dict.
+
+    Args:
+        value: "lat,lng" string, [lat, lng] pair or dict with lat/lng keys
+
+    Returns:
+        Location dict, or the value unchanged if it is not recognised
+    """
+    if isinstance(value, str):
+        match = _COORDINATES.match(value)
+        if match:
+            return {"latitude": float(match.group(1)), "longitude": float(match.group(2))}
+    elif isinstance(value, (list, tuple)) and len(value) == 2:
+        return {"latitude": value[0], "longitude": value[1]}
+    elif isinstance(value, dict):
+        latitude = value.get("latitude", value.get("lat"))
+        longitude = value.get("longitude", value.get("lng", value.get("lon")))
+        if latitude is not None and longitude is not None:
+            return {"latitude": latitude, "longitude": longitude}
+    return value
+
+
+def coerce_travel_mode(value: Any) -> Any:
+    """Coerce a travel mode name into a TravelMode value.
+
+    Args:
+        value: Travel mode name, e.g. "Car" or "public transport"
+
+    Returns:
+        TravelMode value, or the value unchanged if it is not recognised
+    """
+    if isinstance(value, str):
+        return TRAVEL_MODE_ALIASES.get(value.strip().lower(), value)
+    return value
+
+
+def _as_list(value: Any) -> Any:
+    """Wrap a single string into a list, splitting "a|b" lists."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split("|") if item.strip()]
+    return value
+
+
+def coerce_parameters(tool_type: ToolType, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce router parameters into the shapes expected by a tool's schema.
+
+    Args:
+        tool_type: Type of the tool
+        parameters: Parameters as produced by the router
+
+    Returns:
+        Coerced parameters
+    """
+    params = dict(parameters)
+
+    if "mode" in params:
+        params["mode"] = coerce_travel_mode(params["mode"])
+    if "location" in params and params["location"] not in (None, ""):
+        params["location"] = coerce_location(params["location"])
+    elif params.get("location") == "":
+        del params["location"]
+
+    if tool_type == ToolType.REVERSE_GEOCODE and "latitude" not in params:
+        location = coerce_location(params.pop("location", None))
+        if isinstance(location, dict):
+            params.update(location)
+    elif tool_type == ToolType.ELEVATION and "locations" in params:
+        locations = params["locations"]
+        if isinstance(locations, (str, dict)):
+            locations = _as_list(locations) if isinstance(locations, str) else [locations]
+        params["locations"] = [coerce_location(location) for location in locations]
+    elif tool_type == ToolType.REACHABILITY and "destinations" in params:
+        params["destinations"] = _as_list(params["destinations"])
+    elif tool_type == ToolType.DISTANCE_MATRIX:
+        for name in ("origins", "destinations"):
+            if name in params:
+                params[name] = _as_list(params[name])
+    elif tool_type == ToolType.ITINERARY and "stops" in params:
+        params["stops"] = [
+            {"name": stop} if isinstance(stop, str) else stop
+            for stop in _as_list(params["stops"])
+        ]
+
+    return params
+
+
+def _format_error(error: ValidationError) -> str:
+    """Format a pydantic validation error as a short, readable message."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc']) or 'parameters'}: {item['msg']}"
+        for item in error.errors()
+    )
+
+
+def validate_tool_call(tool_call: ToolCall) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Validate and coerce the parameters of one tool call.
+
+    Tool types without a request schema are passed through unchanged.
+
+    Args:
+        tool_call: Tool call selected by the router
+
+    Returns:
+        (validated parameters, None) or (None, error message)
+    """
+    parameters = {param.name: param.value for param in tool_call.parameters}
+    schema = TOOL_REQUEST_SCHEMAS.get(tool_call.tool_type)
+    if schema is None:
+        return parameters, None
+
+    try:
+        request = schema.model_validate(coerce_parameters(tool_call.tool_type, parameters))
+    except ValidationError as e:
+        return None, _format_error(e)
+    return request.model_dump(mode="json", exclude_none=True), None
+
+
+def validate_tool_calls(
+    tool_calls: Sequence[ToolCall]
+) -> Tuple[List[ValidatedCall], List[InvalidCall]]:
+    """Validate the parameters of every tool call.
+
+    Args:
+        tool_calls: Tool calls selected by the router
+
+    Returns:
+        Valid and invalid tool calls
+    """
+    valid: List[ValidatedCall] = []
+    invalid: List[InvalidCall] = []
+    for tool_call in tool_calls:
+        parameters, error = validate_tool_call(tool_call)
+        if error is None:
+            valid.append(ValidatedCall(tool_call, parameters))
+        else:
+            invalid.append(InvalidCall(tool_call, error))
+    return valid, invalid
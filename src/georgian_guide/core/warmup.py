@@ -0,0 +1,191 @@
+"""Cache warm-up for the Georgian Guide application.
+
+At deploy time the most frequent queries are run through the pipeline with
+bounded concurrency, filling the router, tool and answer caches, which are
+then written to a snapshot for the API workers to load. A coverage report
+compares the warmed queries with the real query distribution.
+"""
+
+import asyncio
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from georgian_guide.core.context import Priority, request_context
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.processor import QueryProcessor
+from georgian_guide.core.query_log import query_from_entry
+from georgian_guide.core.text import normalize_query
+from georgian_guide.schemas.query import UserQuery
+
+
+def read_queries(path: str) -> List[UserQuery]:
+    """Read queries from a file.
+
+    Lines are either plain query text or JSON objects with the fields of a
+    user query (e.g. a query log); blank lines are skipped.
+
+    Args:
+        path: Query file path
+
+    Returns:
+        Queries in file order, including repeats
+    """
+    queries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("{"):
+                queries.append(query_from_entry(json.loads(line)))
+            else:
+                queries.append(UserQuery(query=line))
+    return queries
+
+
+def top_queries(queries: Iterable[UserQuery], limit: Optional[int] = None) -> List[UserQuery]:
+    """Return the most frequent distinct queries.
+
+    Args:
+        queries: Queries, including repeats
+        limit: Maximum number of queries returned
+
+    Returns:
+        Distinct queries, most frequent first (first spelling seen is kept)
+    """
+    counts: Counter = Counter()
+    first: Dict[str, UserQuery] = {}
+    for query in queries:
+        key = QueryProcessor.response_cache_key(query)
+        counts[key] += 1
+        first.setdefault(key, query)
+    return [first[key] for key, _ in counts.most_common(limit)]
+
+
+@dataclass
+class WarmupResult:
+    """Outcome of a warm-up run."""
+
+    succeeded: int = 0
+    failed: int = 0
+    # Queries answered without a cacheable answer (failed tools or answer)
+    uncached: int = 0
+    seconds: float = 0.0
+    # Answer cache keys of the queries answered
+    warmed: Set[str] = field(default_factory=set)
+
+
+async def warm_up(
+    processor: QueryProcessor,
+    queries: Sequence[UserQuery],
+    concurrency: int = 4
+) -> WarmupResult:
+    """Run queries through the pipeline to fill its caches.
+
+    Args:
+        processor: Query processor whose caches are filled
+        queries: Queries to run
+        concurrency: Maximum number of queries processed at once
+
+    Returns:
+        Warm-up result
+    """
+    result = WarmupResult()
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.monotonic()
+
+    async def run(query: UserQuery) -> None:
+        async with semaphore:
+            try:
+                # Warm-up traffic yields to any live requests sharing the upstreams
+                with request_context(priority=Priority.PREFETCH):
+                    await processor.process_query(query)
+            except Exception:
+                result.failed += 1
+                metrics.counter("warmup_queries_total", status="failed").inc()
+                return
+            key = QueryProcessor.response_cache_key(query)
+            if processor.response_cache is not None and processor.response_cache.get(key) is None:
+                result.uncached += 1
+                metrics.counter("warmup_queries_total", status="uncached").inc()
+                return
+            result.succeeded += 1
+            result.warmed.add(key)
+            metrics.counter("warmup_queries_total", status="succeeded").inc()
+
+    await asyncio.gather(*(run(query) for query in queries))
+    result.seconds = time.monotonic() - start
+    return result
+
+
+@dataclass
+class CoverageReport:
+    """Share of real traffic answered from warmed caches."""
+
+    total: int
+    distinct: int
+    covered: int
+    covered_distinct: int
+    # Most frequent queries that were not warmed, with their counts
+    uncovered: List[Tuple[str, int]]
+
+    @property
+    def traffic_coverage(self) -> float:
+        """Fraction of all queries that hit a warmed answer."""
+        return self.covered / self.total if self.total else 0.0
+
+    @property
+    def distinct_coverage(self) -> float:
+        """Fraction of distinct queries that were warmed."""
+        return self.covered_distinct / self.distinct if self.distinct else 0.0
+
+    def format(self) -> str:
+        """Format the report for the terminal."""
+        lines = [
+            f"Queries: {self.total} ({self.distinct} distinct)",
+            f"Traffic covered: {self.covered}/{self.total} ({self.traffic_coverage:.1%})",
+            f"Distinct queries covered: {self.covered_distinct}/{self.distinct} "
+            f"({self.distinct_coverage:.1%})",
+        ]
+        if self.uncovered:
+            lines.append("Most frequent uncovered queries:")
+            lines.extend(f"  {count:6d}  {query}" for query, count in self.uncovered)
+        return "\n".join(lines)
+
+
+def coverage_report(
+    warmed: Set[str],
+    distribution: Iterable[UserQuery],
+    show_uncovered: int = 10
+) -> CoverageReport:
+    """Compare warmed queries with a real query distribution.
+
+    Args:
+        warmed: Answer cache keys of the warmed queries
+        distribution: Real queries, including repeats
+        show_uncovered: Number of uncovered queries listed
+
+    Returns:
+        Coverage report
+    """
+    counts: Counter = Counter()
+    text: Dict[str, str] = {}
+    for query in distribution:
+        key = QueryProcessor.response_cache_key(query)
+        counts[key] += 1
+        text.setdefault(key, normalize_query(query.query))
+
+    covered_keys = [key for key in counts if key in warmed]
+    uncovered = [
+        (text[key], count) for key, count in counts.most_common() if key not in warmed
+    ][:show_uncovered]
+    return CoverageReport(
+        total=sum(counts.values()),
+        distinct=len(counts),
+        covered=sum(counts[key] for key in covered_keys),
+        covered_distinct=len(covered_keys),
+        uncovered=uncovered,
+    )
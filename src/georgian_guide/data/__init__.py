@@ -0,0 +1,4 @@
+"""Data package for georgian_guide.
+
+This package contains curated reference data shipped with the application.
+"""
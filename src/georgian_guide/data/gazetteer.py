@@ -0,0 +1,113 @@
+"""Gazetteer of Georgian cities, regions and landmarks.
+
+Each entry is ``(name, kind, latitude, longitude, city, aliases)``. ``kind`` is
+the Google Maps result type reported for the entry, ``city`` is the locality a
+landmark belongs to (None for cities and regions) and ``aliases`` lists other
+spellings, including the Georgian and Russian names. Coordinates are the
+approximate center of the place.
+"""
+
+from typing import Optional, Tuple
+
+GazetteerRow = Tuple[str, str, float, float, Optional[str], Tuple[str, ...]]
+
+GAZETTEER: Tuple[GazetteerRow, ...] = (
+    # Cities and towns
+    ("Tbilisi", "locality", 41.7151, 44.8271, None, ("თბილისი", "Тбилиси", "Tiflis")),
+    ("Batumi", "locality", 41.6168, 41.6367, None, ("ბათუმი", "Батуми", "Batum")),
+    ("Kutaisi", "locality", 42.2679, 42.7181, None, ("ქუთაისი", "Кутаиси")),
+    ("Rustavi", "locality", 41.5495, 44.9932, None, ("რუსთავი", "Рустави")),
+    ("Zugdidi", "locality", 42.5088, 41.8709, None, ("ზუგდიდი", "Зугдиди")),
+    ("Gori", "locality", 41.9842, 44.1158, None, ("გორი", "Гори")),
+    ("Poti", "locality", 42.1462, 41.6719, None, ("ფოთი", "Поти")),
+    ("Telavi", "locality", 41.9198, 45.4731, None, ("თელავი", "Телави")),
+    ("Mtskheta", "locality", 41.8452, 44.7180, None, ("მცხეთა", "Мцхета")),
+    ("Sighnaghi", "locality", 41.6197, 45.9219, None, ("სიღნაღი", "Сигнахи", "Signagi")),
+    ("Borjomi", "locality", 41.8421, 43.3893, None, ("ბორჯომი", "Боржоми")),
+    ("Bakuriani", "locality", 41.7498, 43.5319, None, ("ბაკურიანი", "Бакуриани")),
+    ("Gudauri", "locality", 42.4779, 44.4767, None, ("გუდაური", "Гудаури")),
+    ("Stepantsminda", "locality", 42.6567, 44.6433, None, ("სტეფანწმინდა", "Kazbegi", "ყაზბეგი", "Казбеги", "Степанцминда")),
+    ("Mestia", "locality", 43.0455, 42.7276, None, ("მესტია", "Местиа", "Местия")),
+    ("Ushguli", "locality", 42.9167, 43.0150, None, ("უშგული", "Ушгули")),
+    ("Akhaltsikhe", "locality", 41.6390, 42.9826, None, ("ახალციხე", "Ахалцихе")),
+    ("Akhalkalaki", "locality", 41.4056, 43.4862, None, ("ახალქალაქი", "Ахалкалаки")),
+    ("Zestaponi", "locality", 42.1101, 43.0525, None, ("ზესტაფონი", "Зестафони")),
+    ("Khashuri", "locality", 41.9945, 43.5990, None, ("ხაშური", "Хашури")),
+    ("Kobuleti", "locality", 41.8214, 41.7792, None, ("ქობულეთი", "Кобулети")),
+    ("Ozurgeti", "locality", 41.9244, 42.0068, None, ("ოზურგეთი", "Озургети")),
+    ("Ambrolauri", "locality", 42.5211, 43.1625, None, ("ამბროლაური", "Амбролаури")),
+    ("Oni", "locality", 42.5794, 43.4425, None, ("ონი", "Они")),
+    ("Lagodekhi", "locality", 41.8267, 46.2767, None, ("ლაგოდეხი", "Лагодехи")),
+    ("Kvareli", "locality", 41.9484, 45.8081, None, ("ყვარელი", "Кварели")),
+    ("Tskaltubo", "locality", 42.3294, 42.6000, None, ("წყალტუბო", "Цхалтубо", "Tsqaltubo")),
+    ("Chiatura", "locality", 42.2903, 43.2814, None, ("ჭიათურა", "Чиатура")),
+    ("Marneuli", "locality", 41.4759, 44.8086, None, ("მარნეული", "Марнеули")),
+    ("Dusheti", "locality", 42.0847, 44.6961, None, ("დუშეთი", "Душети")),
+    ("Pasanauri", "locality", 42.3500, 44.6889, None, ("ფასანაური", "Пасанаури")),
+    ("Tsinandali", "locality", 41.8935, 45.5706, None, ("წინანდალი", "Цинандали")),
+    ("Samtredia", "locality", 42.1545, 42.3351, None, ("სამტრედია", "Самтредиа")),
+    ("Senaki", "locality", 42.2704, 42.0675, None, ("სენაკი", "Сенаки")),
+    ("Martvili", "locality", 42.4142, 42.3797, None, ("მარტვილი", "Мартвили")),
+    ("Sagarejo", "locality", 41.7346, 45.3306, None, ("საგარეჯო", "Сагареджо")),
+    ("Gurjaani", "locality", 41.7443, 45.8009, None, ("გურჯაანი", "Гурджаани")),
+    ("Shatili", "locality", 42.6594, 45.1583, None, ("შატილი", "Шатили")),
+
+    # Regions
+    ("Kakheti", "administrative_area_level_1", 41.6500, 45.7000, None, ("კახეთი", "Кахетия")),
+    ("Imereti", "administrative_area_level_1", 42.1500, 42.8500, None, ("იმერეთი", "Имеретия")),
+    ("Adjara", "administrative_area_level_1", 41.6000, 42.0000, None, ("აჭარა", "Аджария", "Ajara")),
+    ("Svaneti", "administrative_area_level_1", 42.9500, 42.7500, None, ("სვანეთი", "Сванетия")),
+    ("Samegrelo", "administrative_area_level_1", 42.4500, 42.0500, None, ("სამეგრელო", "Мегрелия", "Mingrelia")),
+    ("Racha", "administrative_area_level_1", 42.5500, 43.3000, None, ("რაჭა", "Рача")),
+    ("Guria", "administrative_area_level_1", 41.9500, 42.1000, None, ("გურია", "Гурия")),
+    ("Tusheti", "administrative_area_level_1", 42.3800, 45.6500, None, ("თუშეთი", "Тушетия")),
+    ("Khevsureti", "administrative_area_level_1", 42.5500, 45.1000, None, ("ხევსურეთი", "Хевсуретия")),
+    ("Samtskhe-Javakheti", "administrative_area_level_1", 41.5500, 43.3000, None, ("სამცხე-ჯავახეთი", "Самцхе-Джавахетия")),
+    ("Kvemo Kartli", "administrative_area_level_1", 41.4500, 44.5000, None, ("ქვემო ქართლი", "Квемо-Картли")),
+    ("Shida Kartli", "administrative_area_level_1", 42.0500, 43.9500, None, ("შიდა ქართლი", "Шида-Картли")),
+    ("Mtskheta-Mtianeti", "administrative_area_level_1", 42.2000, 44.7000, None, ("მცხეთა-მთიანეთი", "Мцхета-Мтианети")),
+
+    # Tbilisi landmarks
+    ("Freedom Square", "tourist_attraction", 41.6934, 44.8015, "Tbilisi", ("Liberty Square", "Tavisuplebis Moedani", "თავისუფლების მოედანი", "Площадь Свободы")),
+    ("Rustaveli Avenue", "route", 41.6990, 44.7975, "Tbilisi", ("Rustaveli", "რუსთაველის გამზირი", "Проспект Руставели")),
+    ("Narikala Fortress", "tourist_attraction", 41.6880, 44.8086, "Tbilisi", ("Narikala", "ნარიყალა", "Нарикала")),
+    ("Holy Trinity Cathedral", "place_of_worship", 41.6974, 44.8167, "Tbilisi", ("Sameba", "Sameba Cathedral", "სამების საკათედრო ტაძარი", "Цминда Самеба")),
+    ("Mtatsminda Park", "amusement_park", 41.6944, 44.7861, "Tbilisi", ("Mtatsminda", "მთაწმინდა", "Мтацминда")),
+    ("Bridge of Peace", "tourist_attraction", 41.6932, 44.8081, "Tbilisi", ("Peace Bridge", "მშვიდობის ხიდი", "Мост Мира")),
+    ("Abanotubani", "tourist_attraction", 41.6880, 44.8105, "Tbilisi", ("Sulfur Baths", "Sulphur Baths", "აბანოთუბანი", "Абанотубани")),
+    ("Dry Bridge Market", "tourist_attraction", 41.7009, 44.8042, "Tbilisi", ("Dry Bridge", "მშრალი ხიდი", "Сухой мост")),
+    ("Fabrika", "point_of_interest", 41.7094, 44.8024, "Tbilisi", ("ფაბრიკა", "Фабрика")),
+    ("Chronicles of Georgia", "tourist_attraction", 41.7717, 44.8017, "Tbilisi", ("საქართველოს მატიანე", "Хроники Грузии")),
+    ("Rike Park", "park", 41.6933, 44.8107, "Tbilisi", ("Rike", "რიყე", "Парк Рике")),
+    ("Metekhi Church", "place_of_worship", 41.6906, 44.8113, "Tbilisi", ("Metekhi", "მეტეხი", "Метехи")),
+    ("Tbilisi Sea", "natural_feature", 41.7540, 44.8220, "Tbilisi", ("თბილისის ზღვა", "Тбилисское море")),
+    ("Kartlis Deda", "tourist_attraction", 41.6876, 44.8045, "Tbilisi", ("Mother of Georgia", "ქართლის დედა", "Мать Грузии")),
+    ("Tbilisi International Airport", "airport", 41.6692, 44.9547, "Tbilisi", ("Tbilisi Airport", "თბილისის საერთაშორისო აეროპორტი", "Аэропорт Тбилиси")),
+    ("Tbilisi Central Station", "train_station", 41.7215, 44.7985, "Tbilisi", ("Tbilisi Railway Station", "Station Square", "სადგურის მოედანი", "Вокзал Тбилиси")),
+
+    # Landmarks outside Tbilisi
+    ("Jvari Monastery", "place_of_worship", 41.8384, 44.7335, "Mtskheta", ("Jvari", "ჯვრის მონასტერი", "Джвари")),
+    ("Svetitskhoveli Cathedral", "place_of_worship", 41.8421, 44.7209, "Mtskheta", ("Svetitskhoveli", "სვეტიცხოველი", "Светицховели")),
+    ("Gergeti Trinity Church", "place_of_worship", 42.6625, 44.6206, "Stepantsminda", ("Gergeti", "Tsminda Sameba", "გერგეტის სამება", "Гергети")),
+    ("Mount Kazbek", "natural_feature", 42.6969, 44.5183, "Stepantsminda", ("Kazbek", "Mkinvartsveri", "მყინვარწვერი", "Казбек")),
+    ("Uplistsikhe", "tourist_attraction", 41.9670, 44.2075, "Gori", ("უფლისციხე", "Уплисцихе")),
+    ("Vardzia", "tourist_attraction", 41.3811, 43.2847, None, ("ვარძია", "Вардзия")),
+    ("David Gareja", "place_of_worship", 41.4472, 45.3767, None, ("David Gareji", "Davit Gareja", "დავითგარეჯა", "Давид Гареджа")),
+    ("Ananuri", "tourist_attraction", 42.1636, 44.7031, None, ("Ananuri Fortress", "ანანური", "Ананури")),
+    ("Gelati Monastery", "place_of_worship", 42.2946, 42.7681, "Kutaisi", ("Gelati", "გელათი", "Гелати")),
+    ("Bagrati Cathedral", "place_of_worship", 42.2772, 42.7046, "Kutaisi", ("Bagrati", "ბაგრატის ტაძარი", "Баграти")),
+    ("Prometheus Cave", "tourist_attraction", 42.3767, 42.6006, "Tskaltubo", ("პრომეთეს მღვიმე", "Пещера Прометея")),
+    ("Sataplia", "park", 42.3107, 42.6725, "Kutaisi", ("Sataplia Nature Reserve", "სათაფლია", "Сатаплиа")),
+    ("Martvili Canyon", "natural_feature", 42.4575, 42.3772, "Martvili", ("მარტვილის კანიონი", "Мартвильский каньон")),
+    ("Okatse Canyon", "natural_feature", 42.4553, 42.5444, None, ("ოკაცეს კანიონი", "Каньон Окаце")),
+    ("Katskhi Pillar", "place_of_worship", 42.2889, 43.2150, "Chiatura", ("Katskhi", "კაცხის სვეტი", "Кацхийский столп")),
+    ("Batumi Boulevard", "tourist_attraction", 41.6520, 41.6330, "Batumi", ("Batumi Seaside Boulevard", "ბათუმის ბულვარი", "Батумский бульвар")),
+    ("Ali and Nino", "tourist_attraction", 41.6555, 41.6393, "Batumi", ("Ali and Nino Statue", "ალი და ნინო", "Али и Нино")),
+    ("Gonio Fortress", "tourist_attraction", 41.5733, 41.5730, "Batumi", ("Gonio", "გონიოს ციხე", "Гонио")),
+    ("Batumi Botanical Garden", "park", 41.6940, 41.7080, "Batumi", ("ბათუმის ბოტანიკური ბაღი", "Батумский ботанический сад")),
+    ("Batumi International Airport", "airport", 41.5993, 41.5997, "Batumi", ("Batumi Airport", "ბათუმის აეროპორტი", "Аэропорт Батуми")),
+    ("Kutaisi International Airport", "airport", 42.1767, 42.4826, "Kutaisi", ("Kutaisi Airport", "ქუთაისის აეროპორტი", "Аэропорт Кутаиси")),
+)
+
+# Names of the country itself, dropped from the end of addresses
+COUNTRY_NAMES: Tuple[str, ...] = ("Georgia", "Sakartvelo", "საქართველო", "Грузия")
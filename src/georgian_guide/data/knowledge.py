@@ -0,0 +1,121 @@
+"""Travel knowledge about Georgia for questions the map tools cannot answer.
+
+Each entry is ``(title, text)``. Texts are short articles on culture,
+etiquette, seasons and practicalities; paragraphs (separated by blank lines)
+are indexed as separate passages, so each should make sense on its own.
+"""
+
+from typing import Tuple
+
+KnowledgeEntry = Tuple[str, str]
+
+KNOWLEDGE: Tuple[KnowledgeEntry, ...] = (
+    # Food, wine and the supra
+    ("Supra etiquette", """
+A supra is a traditional Georgian feast. It is led by the tamada (toastmaster), who proposes the toasts in a fixed order: to peace, to the hosts, to the dead, to parents, to children, to Georgia and many more. Guests drink only after a toast, usually wine, and do not drink between toasts or toast on their own without the tamada's leave.
+
+When a toast is proposed, guests may add to it in turn before drinking. Drinking the glass to the bottom ("gaumarjos", to victory) is customary for important toasts, but sipping is accepted; it is fine to refuse more wine by leaving the glass full. Beer is traditionally drunk only for toasts to enemies, so avoid toasting with it.
+
+The table is kept full: new dishes are stacked on top of others before the old ones are finished, and leftovers show generosity rather than waste. Guests are expected to try everything, praise the hosts and stay long; a supra easily lasts four hours or more.
+"""),
+    ("Georgian wine and qvevri", """
+Georgia is one of the oldest wine regions in the world, with evidence of winemaking from about 6000 BC. Traditional wine is fermented and aged in qvevri, large clay vessels buried in the ground; the method is on UNESCO's list of intangible cultural heritage.
+
+Qvevri white wines are fermented with the skins, giving amber ("orange") wines with tannin, such as Rkatsiteli and Mtsvane. The best-known red grape is Saperavi. Kakheti in the east is the main wine region, with Telavi, Sighnaghi and Tsinandali as bases for winery visits; Imereti and Racha in the west make lighter wines, including semi-sweet Khvanchkara.
+
+Rtveli is the grape harvest, from mid-September to October, when many families and wineries welcome visitors to pick grapes and make wine.
+"""),
+    ("How to eat khinkali", """
+Khinkali are dumplings filled with spiced meat (or cheese, potato or mushrooms) and broth, a specialty of the mountain regions. They are eaten by hand: hold the dumpling by its twisted top knot, bite a small hole, suck out the hot broth, then eat the rest. The knot (kudi) is left on the plate, and counting the knots is a popular way to keep score. Using a knife and fork is considered odd. Khinkali are usually sprinkled with black pepper and ordered by the piece, five or more per person.
+"""),
+    ("Khachapuri varieties", """
+Khachapuri is cheese-filled bread, the national dish. Imeruli is round and filled with cheese; Megruli also has cheese on top. Adjaruli, from Adjara and Batumi, is boat-shaped with melted cheese, an egg yolk and butter in the middle: stir the yolk and butter into the cheese and tear off pieces of the crust to dip. Penovani is made of flaky pastry, and Achma is a layered, lasagne-like version.
+"""),
+    ("Chacha and churchkhela", """
+Chacha is a strong grape brandy distilled from the pomace left after winemaking, often 50-60% alcohol when homemade. It is offered to guests as a welcome and drunk in small shots. Churchkhela is a traditional sweet made by dipping strings of walnuts or hazelnuts into thickened grape juice and drying them; it looks like a candle and is sold at markets and roadside stalls, especially in autumn.
+"""),
+    ("Vegetarian food and fasting", """
+Georgian cuisine is rich in vegetarian dishes: pkhali (vegetable and walnut pastes), badrijani (aubergine rolls with walnut paste), lobio (bean stew served in a clay pot), ajapsandali (vegetable stew), and mushroom or cheese khinkali. During Orthodox fasts, especially Lent, many restaurants offer fasting menus without meat, dairy or eggs.
+"""),
+    # Culture and customs
+    ("Visiting churches and monasteries", """
+Orthodox churches and monasteries are active places of worship. Women should cover their hair and wear a skirt below the knee; scarves and wraparound skirts are often provided at the entrance. Men should wear long trousers and remove hats. Shoulders should be covered. Keep quiet during services, do not stand with your back to the altar, and ask before taking photos, which are forbidden in some churches.
+"""),
+    ("Georgian hospitality", """
+Georgians say that a guest is a gift from God, and hospitality is taken seriously. Visitors are often invited home, offered food, wine or chacha, and it can be impolite to refuse outright; accepting a little is the graceful response. Bringing a small gift such as sweets or wine is appreciated when visiting a home.
+"""),
+    ("Georgian language and alphabet", """
+Georgian is a Kartvelian language unrelated to its neighbours, written in its own Mkhedruli alphabet of 33 letters with no capital letters. Useful words: gamarjoba (hello), madloba (thank you), ki (yes), ara (no), nakhvamdis (goodbye) and gaumarjos (cheers). Russian is widely understood by older people, and English is common among young people and in tourist areas.
+"""),
+    ("Polyphonic singing and dance", """
+Georgian polyphonic singing, usually in three voices, is on UNESCO's list of intangible cultural heritage and is often heard at feasts and in churches. National dance ensembles such as Sukhishvili perform energetic dances with acrobatic leaps by men and gliding movements by women; performances are held at the Tbilisi Concert Hall and on tour.
+"""),
+    ("Public holidays and festivals", """
+Main public holidays: New Year (1-2 January), Orthodox Christmas (7 January), Epiphany (19 January), Mother's Day (3 March), Independence Day (26 May), St. Mary's Day (28 August), Mtskhetoba (14 October), and St. George's Day (Giorgoba, 23 November). Orthodox Easter is a movable holiday, with Good Friday to Easter Monday off. Tbilisoba, the city festival of Tbilisi, takes place in October.
+"""),
+    # Seasons and regions
+    ("Best time to visit Georgia", """
+Late spring (May-June) and early autumn (September-October) are the best seasons for most of Georgia: mild weather, green or golden landscapes, and the grape harvest in autumn. July and August are hot in Tbilisi and the lowlands (often above 35 °C) but the best time for high mountain hiking and the Black Sea coast. Winter (December-March) is ski season in Gudauri, Bakuriani and Tetnuldi; Tbilisi winters are mild but grey.
+"""),
+    ("Best season for Svaneti", """
+Svaneti, with its main town Mestia, is best visited from late June to late September, when the mountain trails are free of snow. The classic four-day trek from Mestia to Ushguli is usually passable from July to September. Ushguli, one of the highest permanently inhabited villages in Europe, is reachable by road year-round but the road may close after heavy snow. In winter Mestia is a ski destination with the Hatsvali and Tetnuldi resorts.
+"""),
+    ("Kazbegi and the Georgian Military Road", """
+Stepantsminda (Kazbegi) lies about three hours north of Tbilisi on the Georgian Military Road, past the Zhinvali reservoir, Ananuri fortress and the Gudauri ski resort. The Gergeti Trinity Church above the town is reached by a 1.5-2 hour hike or by 4x4. The road crosses the Jvari Pass (2,379 m) and is occasionally closed in winter because of snow and avalanches; check the road status before going between December and March.
+"""),
+    ("Tusheti access", """
+Tusheti is a remote mountain region in the north-east, reached only by the Abano Pass road, one of the most dangerous roads in the world. The road is usually open from June to early October and closed by snow the rest of the year. Only experienced drivers with 4x4 vehicles should drive it; most visitors take a shared 4x4 from Kvemo Alvani. Omalo is the main village, with guesthouses open in summer.
+"""),
+    ("Black Sea coast and Batumi", """
+The Black Sea beach season runs from late June to September, with the warmest water in August. Batumi is the main resort, with a long seaside boulevard, a botanical garden and lively nightlife; beaches are pebbly. Quieter resorts include Kobuleti, Ureki (known for its magnetic black sand) and Gonio. The coast is humid and rainy, especially in autumn.
+"""),
+    ("Skiing in Georgia", """
+The ski season usually runs from late December to early April. Gudauri, two hours from Tbilisi, is the largest resort and known for freeriding and heli-skiing. Bakuriani, near Borjomi, is family-friendly; Tetnuldi and Hatsvali near Mestia offer long runs and few crowds. Ski passes and equipment rental are inexpensive compared with the Alps.
+"""),
+    ("Vardzia and the south", """
+Vardzia is a 12th-century cave monastery carved into a cliff above the Mtkvari river, built under Queen Tamar; it is about 4-5 hours from Tbilisi, often combined with Borjomi, Akhaltsikhe and the Rabati castle. The region of Samtskhe-Javakheti is higher and cooler than Tbilisi, with volcanic lakes such as Paravani.
+"""),
+    ("David Gareja monastery", """
+David Gareja is a complex of cave monasteries in the semi-desert of Kakheti, about two hours south-east of Tbilisi, on the border with Azerbaijan. The Lavra monastery can be visited freely; the Udabno caves with medieval frescoes are reached by a hiking trail along the ridge, which may be restricted because of the border. Bring water and sun protection; avoid the midday heat in summer.
+"""),
+    # Practicalities
+    ("Visas and entry", """
+Citizens of the EU, the UK, the US, Canada, Australia and many other countries can enter Georgia visa-free and stay up to one year. Others can apply for an e-visa online. Travellers who have entered Abkhazia or South Ossetia from Russia are considered to have entered Georgia illegally; these regions can only be entered from Georgia proper, and usually not at all.
+"""),
+    ("Occupied territories", """
+Abkhazia and South Ossetia (Tskhinvali region) are Georgian territories occupied by Russia and not under the control of the Georgian government. Most governments advise against travel there. Entering them from Russia is illegal under Georgian law. The administrative boundary lines near Gori and Zugdidi should not be approached.
+"""),
+    ("Money and tipping", """
+The currency is the Georgian lari (GEL), divided into 100 tetri. Cards are accepted in cities, but cash is needed in villages, markets and for marshrutkas. ATMs are everywhere in towns. Restaurants often add a 10-18% service charge to the bill; if not, leaving about 10% is customary. Tipping taxi drivers is not expected.
+"""),
+    ("Safety", """
+Georgia is generally safe for travellers, with low rates of violent crime; Tbilisi is safe to walk at night in central areas. The main risks are traffic, as driving can be aggressive, and mountain hazards. Stray dogs with ear tags are vaccinated and usually peaceful. The emergency number is 112.
+"""),
+    ("Tap water and health", """
+Tap water in Tbilisi and most cities is safe to drink, and Georgia is famous for its mineral waters such as Borjomi and Nabeghlavi. In mountain villages, spring water is usually fine. Pharmacies (aptiaki) are everywhere and open late; many are open 24 hours in cities.
+"""),
+    ("Getting around by marshrutka", """
+Marshrutkas are minibuses connecting towns and villages. In Tbilisi, intercity marshrutkas leave from Didube (for the north and west), Samgori/Ortachala (for Kakheti and the south) and the Station Square. Most leave when full rather than on a timetable; pay the driver in cash. Fares are low, e.g. a few lari to Mtskheta and around 20-30 lari to Batumi.
+"""),
+    ("Trains", """
+Georgian Railways run comfortable double-decker trains between Tbilisi and Batumi (about 5 hours) several times a day, plus trains to Kutaisi, Zugdidi, Poti and Borjomi. Tickets can be bought online or at stations and sell out in summer, so book ahead. A night train connects Tbilisi with Yerevan in Armenia.
+"""),
+    ("Taxis and ride-hailing", """
+Ride-hailing apps such as Bolt and Yandex Go work in Tbilisi, Batumi and Kutaisi and are the easiest way to avoid haggling. Street taxis have no meters, so agree on the price before getting in. For day trips, hiring a driver for the day is common and affordable.
+"""),
+    ("Public transport in Tbilisi", """
+Tbilisi has two metro lines, buses, and the cable car to Narikala. Pay with a Metromoney card, a bank card or a phone at the validator; one fare gives 90 minutes of transfers. The metro runs from about 6:00 to midnight. The funicular climbs from the city to Mtatsminda park.
+"""),
+    ("Driving in Georgia", """
+Traffic drives on the right. Foreign licences are valid for a year. Roads between major cities are good, but mountain roads can be narrow, unpaved and shared with livestock. Drivers are often impatient and overtake aggressively, so drive defensively. Police are generally honest; fines are paid at banks or online. Drink-driving limits are strict and checked.
+"""),
+    ("SIM cards and internet", """
+Local SIM cards from Magti, Silknet (Geocell) and Cellfie are cheap and available at the airport and shops with a passport; prepaid data packages cover most regions including mountain towns. Free Wi-Fi is common in cafes and hotels.
+"""),
+    ("Sulfur baths", """
+The sulfur baths of Abanotubani in Old Tbilisi are fed by natural hot springs, which gave Tbilisi its name (tbili means warm). Public and private rooms can be rented by the hour; the brick-domed Chreli (Orbeliani) bath with its blue mosaic facade is the most famous. A kisi massage scrub is a traditional extra. Book private rooms ahead in the evenings.
+"""),
+    ("Hiking safety in the mountains", """
+Mountain weather changes fast, even in summer; carry warm layers and rain gear. Leave your route with your guesthouse before longer hikes, and note the emergency number 112. Shepherd dogs guarding flocks can be aggressive; keep distance and carry a stick. Trail maps and GPX tracks are available on the Caucasus Trekking and Transcaucasian Trail websites.
+"""),
+)
@@ -0,0 +1,53 @@
+"""Popular queries used to warm the caches at deploy time.
+
+The list covers the questions visitors ask most about Tbilisi and the main
+destinations of Georgia, in English, Georgian and Russian. It is used when the
+warm-up command is not given a log of real queries.
+"""
+
+from typing import Tuple
+
+POPULAR_QUERIES: Tuple[str, ...] = (
+    # Tbilisi
+    "Where can I eat khinkali in Tbilisi?",
+    "Best Georgian restaurants in Old Tbilisi",
+    "Wine bars near Rustaveli Avenue",
+    "How do I get from Tbilisi airport to Freedom Square?",
+    "Sulfur baths in Abanotubani",
+    "How to get to Narikala Fortress from Freedom Square",
+    "Hotels near Rustaveli metro station",
+    "What is there to see in Tbilisi?",
+    "Coffee shops in Vake, Tbilisi",
+    "Dry Bridge market opening hours",
+    "Distance from Tbilisi to Mtskheta",
+    "Day trip from Tbilisi to Kazbegi",
+    "How far is Sighnaghi from Tbilisi?",
+    "Pharmacies open now in Tbilisi",
+    "ATMs near Tbilisi Central Station",
+    # Other destinations
+    "Restaurants on Batumi Boulevard",
+    "How to get from Batumi to Kutaisi",
+    "Things to do in Kutaisi",
+    "Hiking trails near Stepantsminda",
+    "Gergeti Trinity Church elevation",
+    "Wineries in Kakheti",
+    "How long is the drive from Tbilisi to Batumi?",
+    "Hotels in Mestia",
+    "Prometheus Cave opening hours",
+    "Ski resorts in Gudauri",
+    "Uplistsikhe cave town from Gori",
+    "Vardzia from Borjomi",
+    # Georgian
+    "სად ვჭამო ხინკალი თბილისში?",
+    "რესტორნები ძველ თბილისში",
+    "როგორ მივიდე მცხეთაში თბილისიდან?",
+    "სასტუმროები ბათუმში",
+    "რა ვნახო ქუთაისში?",
+    # Russian
+    "Где поесть хинкали в Тбилиси?",
+    "Рестораны в старом Тбилиси",
+    "Как доехать из Тбилиси в Казбеги?",
+    "Гостиницы в Батуми",
+    "Что посмотреть в Кутаиси?",
+    "Винодельни в Кахетии",
+)
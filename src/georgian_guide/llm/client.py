@@ -0,0 +1,86 @@
+"""OpenAI client helpers for the Georgian Guide application.
+
+The ``openai`` package is large and slow to import, so it is only imported when
+a client is first needed. All chat completions go through ``chat_completion``,
+which applies the upstream rate limiter, retries and the OpenAI circuit breaker.
+"""
+
+import os
+from typing import Any, AsyncIterator
+
+from georgian_guide.core.resilience import call_with_retries, get_breaker, is_transient
+from georgian_guide.core.scheduler import get_scheduler
+
+
+def create_openai_client() -> Any:
+    """Create an async OpenAI client using the OPENAI_API_KEY environment variable.
+
+    Returns:
+        AsyncOpenAI client instance
+    """
+    from openai import AsyncOpenAI
+
+    # Retries are handled by call_with_retries so they share the circuit breaker
+    return AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"), max_retries=0)
+
+
+async def chat_completion(client: Any, purpose: str, **kwargs: Any) -> Any:
+    """Create a chat completion through the rate limiter and resilience layer.
+
+    Args:
+        client: AsyncOpenAI client
+        purpose: Name of the calling component, used as the rate limiter key
+        **kwargs: Arguments for ``client.chat.completions.create``
+
+    Returns:
+        Chat completion response
+    """
+    async def attempt() -> Any:
+        # Wait for the OpenAI rate limiter to admit the call
+        await get_scheduler().acquire("openai", purpose)
+        return await client.chat.completions.create(**kwargs)
+
+    return await call_with_retries(attempt, breaker=get_breaker("openai"))
+
+
+async def stream_chat_completion(client: Any, purpose: str, **kwargs: Any) -> AsyncIterator[Any]:
+    """Stream a chat completion through the rate limiter and resilience layer.
+
+    A stream can fail after it was created, so the circuit breaker records
+    the outcome of the whole stream rather than of its creation. The
+    completion is stopped when the caller stops reading.
+
+    Args:
+        client: AsyncOpenAI client
+        purpose: Name of the calling component, used as the rate limiter key
+        **kwargs: Arguments for ``client.chat.completions.create``
+
+    Yields:
+        Completion chunks
+    """
+    breaker = get_breaker("openai")
+
+    async def attempt() -> Any:
+        await get_scheduler().acquire("openai", purpose)
+        return await client.chat.completions.create(stream=True, **kwargs)
+
+    stream = await call_with_retries(attempt, breaker=breaker, record_success=False)
+    try:
+        async for chunk in stream:
+            yield chunk
+    except Exception as e:
+        if is_transient(e):
+            breaker.record_failure()
+        else:
+            breaker.release()
+        raise
+    except BaseException:
+        # The caller stopped reading; the stream says nothing about the upstream
+        breaker.release()
+        raise
+    else:
+        breaker.record_success()
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            await close()
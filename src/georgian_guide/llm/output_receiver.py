@@ -6,26 +6,35 @@ generates the final response.
 
 import json
 import os
-from typing import Any, Dict, List
-
-import openai
-from openai import OpenAI
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 
 from georgian_guide.core.interfaces import OutputReceiverInterface
-from georgian_guide.schemas.query import AssistantResponse, ToolCallResult, UserQuery
+from georgian_guide.core.language import DEFAULT_LANGUAGE, build_prompts, message, resolve_language
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.scheduler import SchedulerQueueFull
+from georgian_guide.llm.client import chat_completion, create_openai_client, stream_chat_completion
+from georgian_guide.llm.streaming import StreamingJSONParser
+from georgian_guide.llm.tiering import EscalationRequired, ModelCascade
+from georgian_guide.schemas.query import AssistantResponse, StreamEvent, ToolCallResult, UserQuery
+
+# Answer quality matters most here, so only the large model is used by default
+DEFAULT_OUTPUT_MODELS = ("gpt-4o",)
 
 
 class OpenAIOutputReceiver(OutputReceiverInterface):
     """Output receiver implementation using OpenAI's API."""
     
-    def __init__(self, model: str = "gpt-4o"):
+    def __init__(self, model: Optional[str] = None, models: Optional[Sequence[str]] = None):
         """Initialize the output receiver.
         
         Args:
-            model: The OpenAI model to use for response generation
+            model: A single OpenAI model to use for response generation
+            models: Cascade of OpenAI models to try, cheapest first
         """
-        self.model = model
-        self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.models = [model] if model else list(models or DEFAULT_OUTPUT_MODELS)
+        self.cascade: ModelCascade[AssistantResponse] = ModelCascade(self.models, "output")
+        self._client = None
         
         # Define the system message that instructs the LLM on how to format responses
         self.system_message = """
@@ -45,7 +54,8 @@ Your response should be:
 - Culturally aware of Georgian customs and traditions
 
 If tool calls failed or returned no results, mention this briefly and suggest
-alternatives or ask for clarification if needed.
+alternatives or ask for clarification if needed. Places with an open_status of
+"unknown" may or may not be open; say that their hours could not be checked.
 
 Also suggest 1-3 relevant follow-up questions the user might want to ask.
 
@@ -62,6 +72,22 @@ YOUR RESPONSE MUST BE VALID JSON in the following format:
   ]
 }
 """
+        
+        # One system prompt per response language, built once, so answers are
+        # written in the user's language without a translation pass
+        self.system_messages = build_prompts(
+            self.system_message,
+            "Write the response, the source details and the follow-up questions in "
+            "{language}, whatever the language of the query and the tool results. "
+            "Keep the JSON keys in English."
+        )
+    
+    @property
+    def client(self) -> Any:
+        """OpenAI client, created on first use."""
+        if self._client is None:
+            self._client = create_openai_client()
+        return self._client
     
     async def process_results(
         self, 
@@ -77,52 +103,213 @@ YOUR RESPONSE MUST BE VALID JSON in the following format:
         Returns:
             Final assistant response
         """
+        language = resolve_language(query.language, query.query)
+        
         try:
-            # Format the tool results for the LLM
-            formatted_results = []
+            # Send to OpenAI's API, escalating to a larger model if the
+            # answer is malformed
+            return await self.cascade.run(
+                lambda model: chat_completion(
+                    self.client,
+                    "output",
+                    model=model,
+                    messages=self._messages(query, tool_results, language),
+                    response_format={"type": "json_object"}
+                ),
+                lambda completion: self.parse_response(completion, language)
+            )
             
-            for result in tool_results:
-                formatted_results.append({
-                    "tool_type": result.tool_type.value,
-                    "success": result.success,
-                    "result": result.result,
-                    "error_message": result.error_message
-                })
+        except SchedulerQueueFull:
+            # Overload is reported to the caller instead of degrading the answer
+            raise
+        except Exception as e:
+            # In case of an error, return a basic error response; it is
+            # flagged so that it is not cached as the answer
+            return AssistantResponse(
+                response=message("output_error", language, error=str(e)),
+                source_information=[],
+                follow_up_questions=[],
+                failed=True
+            )
+    
+    async def stream_results(
+        self,
+        query: UserQuery,
+        tool_results: List[ToolCallResult]
+    ) -> AsyncIterator[StreamEvent]:
+        """Generate the final response, streaming the answer text as it is written.
+        
+        The cascade is tried cheapest model first, like ``process_results``,
+        but text that was already sent cannot be taken back: a model may only
+        be escalated from while none of its answer has been streamed. A
+        completion cut off mid-way keeps the text received and is marked as
+        failed, so it is not cached.
+        
+        Args:
+            query: The original user query
+            tool_results: Results from tool executions
+            
+        Yields:
+            'delta' events with answer text, then a 'done' event
+        """
+        language = resolve_language(query.language, query.query)
+        messages = self._messages(query, tool_results, language)
+        start = time.monotonic()
+        
+        for index, model in enumerate(self.models):
+            is_last = index == len(self.models) - 1
+            labels = {"component": "output", "model": model}
+            metrics.counter("llm_tier_calls_total", **labels).inc()
+            parser = StreamingJSONParser()
+            streamed = False
+            truncated = False
+            
+            try:
+                async for chunk in stream_chat_completion(
+                    self.client,
+                    "output",
+                    model=model,
+                    messages=messages,
+                    response_format={"type": "json_object"}
+                ):
+                    if not chunk.choices:
+                        continue
+                    text = parser.feed(chunk.choices[0].delta.content or "")
+                    if text:
+                        if not streamed:
+                            metrics.histogram("llm_stream_first_text_seconds").observe(
+                                time.monotonic() - start
+                            )
+                            streamed = True
+                        yield StreamEvent(event="delta", text=text)
+            except SchedulerQueueFull:
+                raise
+            except Exception as e:
+                if not streamed:
+                    if not is_last:
+                        metrics.counter("llm_escalations_total", reason=type(e).__name__, **labels).inc()
+                        continue
+                    response = AssistantResponse(
+                        response=message("output_error", language, error=str(e)), failed=True
+                    )
+                    yield StreamEvent(event="delta", text=response.response)
+                    yield StreamEvent(event="done", response=response)
+                    return
+                metrics.counter("llm_stream_truncated_total").inc()
+                truncated = True
+            
+            data = parser.finish()
+            if not streamed and not is_last and not self._has_answer(data):
+                metrics.counter("llm_escalations_total", reason="missing_response", **labels).inc()
+                continue
+            
+            metrics.counter("llm_tier_served_total", **labels).inc()
+            response = self._build_response(data, language)
+            if truncated:
+                response = response.model_copy(update={"failed": True})
+            if not streamed:
+                yield StreamEvent(event="delta", text=response.response)
+            yield StreamEvent(event="done", response=response)
+            return
+    
+    @staticmethod
+    def _has_answer(response_data: Dict[str, Any]) -> bool:
+        """Check whether the model's JSON answer has a usable response text."""
+        response = response_data.get("response")
+        return isinstance(response, str) and bool(response.strip())
+    
+    def _messages(
+        self,
+        query: UserQuery,
+        tool_results: List[ToolCallResult],
+        language: str
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages asking for the answer.
+        
+        Args:
+            query: The original user query
+            tool_results: Results from tool executions
+            language: Response language
             
-            # Create the user message with query and results
-            user_message = f"""
+        Returns:
+            System and user messages
+        """
+        # Format the tool results for the LLM; results are serialized once,
+        # compactly and without escaping Georgian text, to keep the prompt small
+        formatted_results = []
+        
+        for result in tool_results:
+            formatted_results.append({
+                "tool_type": result.tool_type.value,
+                "success": result.success,
+                "result": result.result,
+                "error_message": result.error_message
+            })
+        
+        # Follow-up questions ("how far is it from there?") refer to earlier places
+        recent_places = ""
+        if query.recent_places:
+            recent_places = "\nPlaces From Earlier In The Conversation:\n" + json.dumps(
+                query.recent_places, ensure_ascii=False, separators=(",", ":")
+            ) + "\n"
+        
+        # Create the user message with query and results
+        user_message = f"""
 User Query: {query.query}
-
+{recent_places}
 Tool Results:
-{json.dumps(formatted_results, indent=2)}
+{json.dumps(formatted_results, ensure_ascii=False, separators=(",", ":"))}
 
 Please generate a response based on this information.
 """
+        return [
+            {"role": "system", "content": self.system_messages[language]},
+            {"role": "user", "content": user_message}
+        ]
+    
+    @classmethod
+    def _build_response(cls, response_data: Dict[str, Any], language: str) -> AssistantResponse:
+        """Build the response from the fields of the model's JSON answer.
+        
+        Args:
+            response_data: Parsed JSON answer
+            language: Response language
             
-            # Send to OpenAI's API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_message},
-                    {"role": "user", "content": user_message}
-                ],
-                response_format={"type": "json_object"}
-            )
-            
-            # Extract and parse the response content
-            content = response.choices[0].message.content
-            response_data = json.loads(content)
+        Returns:
+            Assistant response (fields of the wrong type are left empty; an
+            apology flagged as failed, so it is not cached, if there is no answer)
+        """
+        response = response_data.get("response")
+        sources = response_data.get("source_information")
+        questions = response_data.get("follow_up_questions")
+        has_answer = cls._has_answer(response_data)
+        return AssistantResponse(
+            response=response if has_answer else message("no_answer", language),
+            failed=not has_answer,
+            source_information=[item for item in sources if isinstance(item, dict)]
+            if isinstance(sources, list) else [],
+            follow_up_questions=[item for item in questions if isinstance(item, str)]
+            if isinstance(questions, list) else []
+        )
+    
+    def parse_response(self, completion: Any, language: str = DEFAULT_LANGUAGE) -> AssistantResponse:
+        """Parse and validate a response completion.
+        
+        Args:
+            completion: Chat completion returned by OpenAI
+            language: Response language
             
-            return AssistantResponse(
-                response=response_data.get("response", "Sorry, I couldn't generate a proper response."),
-                source_information=response_data.get("source_information", []),
-                follow_up_questions=response_data.get("follow_up_questions", [])
-            )
+        Returns:
+            Final assistant response
             
-        except Exception as e:
-            # In case of an error, return a basic error response
-            return AssistantResponse(
-                response=f"I apologize, but I encountered an error while processing your request: {str(e)}. Could you please try again?",
-                source_information=[],
-                follow_up_questions=[]
-            ) 
\ No newline at end of file
+        Raises:
+            EscalationRequired: If the completion has no usable answer
+        """
+        # Extract and parse the response content
+        content = completion.choices[0].message.content
+        response_data = json.loads(content)
+        response = self._build_response(response_data, language)
+        
+        if not self._has_answer(response_data):
+            raise EscalationRequired("missing_response", result=response)
+        return response
@@ -6,27 +6,47 @@ appropriate tools.
 
 import json
 import os
-from typing import Any, Dict, List, Optional
-
-import openai
-from openai import OpenAI
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from georgian_guide.core.cache import TTLCache, make_cache_key
+from georgian_guide.core.context import record_cache
 from georgian_guide.core.interfaces import RouterInterface
+from georgian_guide.core.language import build_prompts, message, resolve_language
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.scheduler import SchedulerQueueFull
+from georgian_guide.core.singleflight import SingleFlight
+from georgian_guide.core.text import normalize_query
+from georgian_guide.llm.client import chat_completion, create_openai_client
+from georgian_guide.llm.tiering import EscalationRequired, ModelCascade
 from georgian_guide.schemas.base import Location, ToolType
 from georgian_guide.schemas.query import RouterResponse, ToolCall, ToolParameter, UserQuery
+from georgian_guide.schemas.tools import TOOL_REQUEST_SCHEMAS
+
+# Routing is a small extraction task, so a small model is tried first
+DEFAULT_ROUTER_MODELS = ("gpt-4o-mini", "gpt-4o")
 
 
 class OpenAILLMRouter(RouterInterface):
     """Router implementation using OpenAI's API."""
     
-    def __init__(self, model: str = "gpt-4o"):
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        models: Optional[Sequence[str]] = None,
+        cache: Optional[TTLCache[RouterResponse]] = None
+    ):
         """Initialize the router.
         
         Args:
-            model: The OpenAI model to use for routing
+            model: A single OpenAI model to use for routing (disables tiering)
+            models: Cascade of OpenAI models to try, cheapest first
+            cache: Cache of routing decisions, keyed by language and query
         """
-        self.model = model
-        self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        self.models = [model] if model else list(models or DEFAULT_ROUTER_MODELS)
+        self.cascade: ModelCascade[RouterResponse] = ModelCascade(self.models, "router")
+        self.cache = cache
+        self.flights: SingleFlight[RouterResponse] = SingleFlight("router")
+        self._client = None
         
         # Define the system message that instructs the LLM on how to route queries
         self.system_message = """
@@ -38,14 +58,25 @@ You have access to the following Google Maps tools:
 1. GEOCODE: Convert an address into geographic coordinates
 2. REVERSE_GEOCODE: Convert coordinates into an address
 3. SEARCH_PLACES: Search for places using keyword queries
+   (optional open_now true, or open_at "HH:MM", to keep only places open then)
 4. PLACE_DETAILS: Get detailed information about a specific place
 5. DISTANCE_MATRIX: Calculate travel distance and time between origins and destinations
 6. ELEVATION: Get elevation data for locations
 7. DIRECTIONS: Get directions between two points
+8. ITINERARY: Plan the best order to visit several stops in one trip
+   (parameters: origin, stops, optional mode, start_time "HH:MM", return_to_origin)
+9. REACHABILITY: Find the towns and sights reachable from an origin within a travel time
+   (parameters: origin, max_minutes, optional mode, optional destinations to check)
+10. KNOWLEDGE: Look up Georgian culture, customs, food, seasons and practical travel
+   advice (parameters: query in English)
 
 Analyze the user's query and select the most appropriate tool(s) to use.
 For each tool, provide the necessary parameters.
 
+Queries may be written in English, Georgian or Russian, in Georgian, Cyrillic or
+Latin script. Understand them directly. In tool parameters, keep place names as
+the user wrote them and write search queries in English.
+
 YOUR RESPONSE MUST BE VALID JSON in the following format:
 {
   "selected_tools": [
@@ -70,10 +101,33 @@ If the user's query is unclear or missing important information, set
 Examples:
 - For "Find restaurants near Liberty Square in Tbilisi", use GEOCODE to get coordinates
   of Liberty Square, then SEARCH_PLACES to find restaurants nearby.
+- For "Restaurants open now near Rustaveli", use SEARCH_PLACES with open_now true
+  instead of PLACE_DETAILS calls for each restaurant.
 - For "How far is Mtskheta from Tbilisi?", use DISTANCE_MATRIX to calculate the distance.
 - For "Tell me about Fabrika in Tbilisi", use SEARCH_PLACES to find it, then PLACE_DETAILS
   to get more information.
+- For "A day visiting Mtskheta, Jvari, Ananuri and Gudauri from Tbilisi", use ITINERARY
+  with origin "Tbilisi" and those stops instead of several DIRECTIONS calls.
+- For "What can I reach within an hour's drive of Kutaisi?", use REACHABILITY with
+  origin "Kutaisi" and max_minutes 60.
+- For a follow-up like "How far is it from there?", take "it" and "there" from the places
+  from earlier in the conversation listed after the query.
+- For "What is supra etiquette?" or "Best season for Svaneti?", use KNOWLEDGE; such
+  questions need neither map tools nor clarification.
 """
+        
+        # One system prompt per response language, built once
+        self.system_messages = build_prompts(
+            self.system_message,
+            "Write the clarification question in {language}."
+        )
+    
+    @property
+    def client(self) -> Any:
+        """OpenAI client, created on first use."""
+        if self._client is None:
+            self._client = create_openai_client()
+        return self._client
     
     async def route(self, query: UserQuery) -> RouterResponse:
         """Route a user query to the appropriate tools.
@@ -84,63 +138,203 @@ Examples:
         Returns:
             Router response with selected tools
         """
+        language = resolve_language(query.language, query.query)
+        
+        # Routing decisions are cached per language, because the clarification
+        # question is written in the response language
+        key = make_cache_key("route", language, normalize_query(query.query), query.recent_places)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            record_cache("router", cached is not None)
+            if cached is not None:
+                metrics.counter("router_cache_hits_total", language=language).inc()
+                return cached
+        
+        # Identical queries arriving together share one routing call
+        return await self.flights.run(key, lambda: self._route(query, language, key))
+    
+    async def _route(self, query: UserQuery, language: str, key: str) -> RouterResponse:
+        """Route a query with the LLM and cache the decision.
+        
+        Args:
+            query: The user query
+            language: Response language
+            key: Cache key of the routing decision
+            
+        Returns:
+            Router response with selected tools
+        """
+        try:
+            # Try the cheapest model first and escalate on invalid or
+            # low-confidence routing decisions
+            router_response = await self.cascade.run(
+                lambda model: chat_completion(
+                    self.client,
+                    "router",
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": self.system_messages[language]},
+                        {"role": "user", "content": self._user_message(query)}
+                    ],
+                    response_format={"type": "json_object"}
+                ),
+                self.parse_response
+            )
+            
+        except SchedulerQueueFull:
+            # Overload is reported to the caller instead of degrading the answer
+            raise
+        except Exception as e:
+            # In case of an error, return a response requesting clarification
+            return RouterResponse(
+                selected_tools=[],
+                query_analysis=f"Error analyzing query: {str(e)}",
+                requires_clarification=True,
+                clarification_question=message("router_error", language)
+            )
+        
+        if self.cache is not None:
+            self.cache.set(key, router_response)
+        return router_response
+    
+    @staticmethod
+    def _user_message(query: UserQuery) -> str:
+        """Return the query, with the places a follow-up question may refer to."""
+        if not query.recent_places:
+            return query.query
+        places = json.dumps(query.recent_places, ensure_ascii=False, separators=(",", ":"))
+        return f"{query.query}\n\nPlaces from earlier in the conversation:\n{places}"
+    
+    async def repair(
+        self,
+        query: UserQuery,
+        tool_calls: List[ToolCall],
+        errors: List[str]
+    ) -> List[ToolCall]:
+        """Ask the cheapest model to fix tool calls whose parameters failed validation.
+        
+        Args:
+            query: The user query
+            tool_calls: The invalid tool calls
+            errors: Validation error for each tool call
+            
+        Returns:
+            Corrected tool calls (the original calls if the repair fails)
+        """
+        language = resolve_language(query.language, query.query)
+        invalid_calls = [
+            {
+                "tool_type": tool_call.tool_type.name,
+                "parameters": [param.model_dump() for param in tool_call.parameters],
+                "error": error
+            }
+            for tool_call, error in zip(tool_calls, errors)
+        ]
+        repair_message = f"""
+User Query: {query.query}
+
+These tool calls have invalid parameters:
+{json.dumps(invalid_calls, ensure_ascii=False)}
+
+Return corrected tool calls as {{"selected_tools": [...]}} in the same format.
+Use {{"latitude": ..., "longitude": ...}} objects for locations.
+"""
         try:
-            # Send the query to OpenAI's API
-            response = self.client.chat.completions.create(
-                model=self.model,
+            completion = await chat_completion(
+                self.client,
+                "router",
+                model=self.models[0],
                 messages=[
-                    {"role": "system", "content": self.system_message},
-                    {"role": "user", "content": query.query}
+                    {"role": "system", "content": self.system_messages[language]},
+                    {"role": "user", "content": repair_message}
                 ],
                 response_format={"type": "json_object"}
             )
+            router_data = json.loads(completion.choices[0].message.content)
+            repaired, _ = self._parse_tool_calls(router_data)
+            return repaired
+        except SchedulerQueueFull:
+            raise
+        except Exception:
+            return tool_calls
+    
+    def _parse_tool_calls(self, router_data: Dict[str, Any]) -> Tuple[List[ToolCall], List[str]]:
+        """Convert raw router output into tool calls.
+        
+        Args:
+            router_data: Parsed JSON produced by the model
             
-            # Extract and parse the response content
-            content = response.choices[0].message.content
-            router_data = json.loads(content)
+        Returns:
+            Tool calls, and the problems that make the decision low-confidence
+        """
+        selected_tools = []
+        problems = []
+        for tool_data in router_data.get("selected_tools", []):
+            tool_type_str = tool_data.get("tool_type", "")
             
-            # Convert the raw data to our schema objects
-            selected_tools = []
-            for tool_data in router_data.get("selected_tools", []):
-                tool_type_str = tool_data.get("tool_type", "")
-                
-                # Convert string tool type to enum value
-                try:
-                    tool_type = ToolType(tool_type_str.lower())
-                except ValueError:
-                    # Skip invalid tool types
-                    continue
-                
-                # Convert parameters
-                parameters = []
-                for param in tool_data.get("parameters", []):
-                    parameters.append(
-                        ToolParameter(
-                            name=param.get("name", ""),
-                            value=param.get("value", "")
-                        )
-                    )
-                
-                selected_tools.append(
-                    ToolCall(
-                        tool_type=tool_type,
-                        parameters=parameters,
-                        explanation=tool_data.get("explanation", "")
+            # Convert string tool type to enum value
+            try:
+                tool_type = ToolType(tool_type_str.lower())
+            except ValueError:
+                # Skip invalid tool types
+                problems.append("unknown_tool_type")
+                continue
+            
+            # Convert parameters
+            parameters = []
+            for param in tool_data.get("parameters", []):
+                parameters.append(
+                    ToolParameter(
+                        name=param.get("name", ""),
+                        value=param.get("value", "")
                     )
                 )
             
-            return RouterResponse(
-                selected_tools=selected_tools,
-                query_analysis=router_data.get("query_analysis", ""),
-                requires_clarification=router_data.get("requires_clarification", False),
-                clarification_question=router_data.get("clarification_question")
+            # Check that every required parameter of the tool was provided
+            schema = TOOL_REQUEST_SCHEMAS.get(tool_type)
+            if schema is not None:
+                required = {
+                    name for name, field in schema.model_fields.items() if field.is_required()
+                }
+                if not required.issubset(param.name for param in parameters):
+                    problems.append("missing_parameters")
+            
+            selected_tools.append(
+                ToolCall(
+                    tool_type=tool_type,
+                    parameters=parameters,
+                    explanation=tool_data.get("explanation", "")
+                )
             )
+        
+        return selected_tools, problems
+    
+    def parse_response(self, completion: Any) -> RouterResponse:
+        """Parse and validate a routing completion.
+        
+        Args:
+            completion: Chat completion returned by OpenAI
             
-        except Exception as e:
-            # In case of an error, return a response requesting clarification
-            return RouterResponse(
-                selected_tools=[],
-                query_analysis=f"Error analyzing query: {str(e)}",
-                requires_clarification=True,
-                clarification_question="I'm having trouble understanding your request. Could you please rephrase it?"
-            ) 
\ No newline at end of file
+        Returns:
+            Router response with selected tools
+            
+        Raises:
+            EscalationRequired: If the routing decision has low confidence
+        """
+        # Extract and parse the response content
+        content = completion.choices[0].message.content
+        router_data = json.loads(content)
+        
+        # Convert the raw data to our schema objects
+        selected_tools, problems = self._parse_tool_calls(router_data)
+        
+        router_response = RouterResponse(
+            selected_tools=selected_tools,
+            query_analysis=router_data.get("query_analysis", ""),
+            requires_clarification=router_data.get("requires_clarification", False),
+            clarification_question=router_data.get("clarification_question")
+        )
+        
+        if problems:
+            raise EscalationRequired(problems[0], result=router_response)
+        return router_response
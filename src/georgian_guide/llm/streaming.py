@@ -0,0 +1,270 @@
+"""Incremental parsing of streamed JSON answers.
+
+The output model answers with a JSON object such as
+``{"response": "...", "source_information": [...], "follow_up_questions": [...]}``.
+When the completion is streamed, ``StreamingJSONParser`` decodes the
+``response`` string character by character as the tokens arrive, so the text
+can be forwarded to the user immediately, and parses the other fields once
+their values are complete. If the stream ends early, ``finish`` salvages what
+it can: the partial response text and the complete elements of truncated
+arrays.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_CLOSERS = {"[": "]", "{": "}"}
+
+
+def _scan(raw: str) -> Tuple[List[str], bool]:
+    """Return the unclosed brackets and whether a string is open at the end of raw JSON."""
+    stack: List[str] = []
+    in_string = escaped = False
+    for char in raw:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "[{":
+            stack.append(char)
+        elif char in "]}" and stack:
+            stack.pop()
+    return stack, in_string
+
+
+def _close(raw: str) -> str:
+    """Close the open brackets of truncated JSON that ends outside a string."""
+    stack, _ = _scan(raw)
+    raw = raw.rstrip().rstrip(",").rstrip()
+    return raw + "".join(_CLOSERS[bracket] for bracket in reversed(stack))
+
+
+def repair_json(raw: str) -> Optional[Any]:
+    """Parse truncated JSON, dropping incomplete trailing elements.
+
+    A string cut off mid-way is dropped rather than kept partially, so e.g. a
+    follow-up question is either complete or missing.
+
+    Args:
+        raw: Truncated JSON value
+
+    Returns:
+        The parsed value, or None if nothing could be recovered
+    """
+    while raw.strip():
+        _, in_string = _scan(raw)
+        if not in_string:
+            try:
+                return json.loads(_close(raw))
+            except ValueError:
+                pass
+        # Cut back to the last separator outside strings and try again
+        cut = _last_separator(raw)
+        if cut is None:
+            return None
+        raw = raw[:cut]
+    return None
+
+
+def _last_separator(raw: str) -> Optional[int]:
+    """Return the position of the last ',' outside strings (or None)."""
+    position = None
+    in_string = escaped = False
+    for index, char in enumerate(raw):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ",":
+            position = index
+    return position
+
+
+class StreamingJSONParser:
+    """Incremental parser for a streamed top-level JSON object.
+
+    The value of ``stream_field`` (a string) is decoded as it arrives; other
+    values are collected and parsed when they are complete.
+    """
+
+    def __init__(self, stream_field: str = "response"):
+        """Initialize the parser.
+
+        Args:
+            stream_field: Key whose string value is streamed
+        """
+        self.stream_field = stream_field
+        self.fields: Dict[str, Any] = {}
+        self._state = "start"
+        self._key = ""
+        self._raw = ""
+        self._escape = ""
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._pending_surrogate: Optional[int] = None
+
+    def feed(self, chunk: str) -> str:
+        """Parse the next chunk of the completion.
+
+        Args:
+            chunk: Text received from the model
+
+        Returns:
+            Newly decoded text of the streamed field
+        """
+        out: List[str] = []
+        for char in chunk:
+            self._step(char, out)
+        return "".join(out)
+
+    def _step(self, char: str, out: List[str]) -> None:
+        """Advance the state machine by one character."""
+        state = self._state
+        if state == "start":
+            if char == "{":
+                self._state = "key_or_end"
+        elif state == "key_or_end":
+            if char == '"':
+                self._key, self._escaped, self._state = "", False, "key"
+            elif char == "}":
+                self._state = "done"
+        elif state == "key":
+            if self._escaped:
+                self._key += _ESCAPES.get(char, char)
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._state = "colon"
+            else:
+                self._key += char
+        elif state == "colon":
+            if char == ":":
+                self._state = "value"
+        elif state == "value":
+            if char.isspace():
+                return
+            if self._key == self.stream_field and char == '"':
+                self._state = "stream"
+                self.fields[self._key] = ""
+            else:
+                self._raw = ""
+                self._stack, self._in_string, self._escaped = [], False, False
+                self._state = "raw"
+                self._raw_step(char)
+        elif state == "stream":
+            self._stream_step(char, out)
+        elif state == "raw":
+            self._raw_step(char)
+        elif state == "after_value":
+            if char == ",":
+                self._state = "key_or_end"
+            elif char == "}":
+                self._state = "done"
+
+    def _stream_step(self, char: str, out: List[str]) -> None:
+        """Decode one character of the streamed string."""
+        if self._escape:
+            self._escape += char
+            if self._escape[1] != "u":
+                self._emit(_ESCAPES.get(char, char), out)
+                self._escape = ""
+            elif len(self._escape) == 6:
+                try:
+                    self._emit_code_point(int(self._escape[2:], 16), out)
+                except ValueError:
+                    # Not a valid escape; pass it through as written
+                    self._emit(self._escape, out)
+                self._escape = ""
+        elif char == "\\":
+            self._escape = char
+        elif char == '"':
+            self._flush_surrogate(out)
+            self._state = "after_value"
+        else:
+            self._emit(char, out)
+
+    def _emit(self, text: str, out: List[str]) -> None:
+        """Output decoded text of the streamed field."""
+        self._flush_surrogate(out)
+        out.append(text)
+        self.fields[self.stream_field] += text
+
+    def _emit_code_point(self, code: int, out: List[str]) -> None:
+        """Output a \\u escape, joining surrogate pairs."""
+        if 0xD800 <= code < 0xDC00:
+            self._flush_surrogate(out)
+            self._pending_surrogate = code
+        elif 0xDC00 <= code < 0xE000 and self._pending_surrogate is not None:
+            high, self._pending_surrogate = self._pending_surrogate, None
+            self._emit(chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00)), out)
+        else:
+            self._emit(chr(code), out)
+
+    def _flush_surrogate(self, out: List[str]) -> None:
+        """Output a lone high surrogate as a replacement character."""
+        if self._pending_surrogate is not None:
+            self._pending_surrogate = None
+            out.append("�")
+            self.fields[self.stream_field] += "�"
+
+    def _raw_step(self, char: str) -> None:
+        """Collect one character of a non-streamed value."""
+        if not self._stack and not self._in_string and char in ",}" and self._raw:
+            # End of a scalar value
+            self._complete_raw()
+            self._state = "key_or_end" if char == "," else "done"
+            return
+        self._raw += char
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if not self._stack:
+                    self._complete_raw()
+        elif char == '"':
+            self._in_string = True
+        elif char in "[{":
+            self._stack.append(char)
+        elif char in "]}":
+            if self._stack:
+                self._stack.pop()
+            if not self._stack:
+                self._complete_raw()
+
+    def _complete_raw(self) -> None:
+        """Parse a complete non-streamed value."""
+        try:
+            self.fields[self._key] = json.loads(self._raw)
+        except ValueError:
+            pass
+        self._raw = ""
+        self._state = "after_value"
+
+    def finish(self) -> Dict[str, Any]:
+        """Finish parsing, recovering the fields of a truncated completion.
+
+        Returns:
+            Parsed fields (the streamed field holds the text received so far)
+        """
+        if self._state == "raw" and self._raw:
+            value = repair_json(self._raw)
+            if value is not None:
+                self.fields[self._key] = value
+        self._state = "done"
+        return self.fields
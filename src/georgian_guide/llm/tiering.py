@@ -0,0 +1,131 @@
+"""Model tiering for the LLM components.
+
+A model cascade tries the cheapest model first and escalates to the next, more
+capable model only when the result fails validation or looks unreliable. Each
+tier's latency, cost and escalation rate is recorded in the metrics registry so
+the cascade can be tuned offline.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from georgian_guide.core.metrics import metrics
+
+T = TypeVar("T")
+
+# USD prices per million (input, output) tokens, used for cost metrics
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+}
+
+
+class EscalationRequired(Exception):
+    """Raised by a result parser when the result should be checked by a larger model."""
+
+    def __init__(self, reason: str, result: Any = None):
+        """Initialize the exception.
+
+        Args:
+            reason: Short, metric-friendly reason for escalating
+            result: The parsed result, used if no larger model is left
+        """
+        super().__init__(reason)
+        self.reason = reason
+        self.result = result
+
+
+@dataclass
+class ModelTier:
+    """One model in a cascade."""
+
+    model: str
+
+    def cost(self, usage: Any) -> float:
+        """Compute the cost of a completion from its token usage.
+
+        Args:
+            usage: The ``usage`` object of a chat completion
+
+        Returns:
+            Cost in USD (0.0 for unknown models or missing usage)
+        """
+        if usage is None or self.model not in MODEL_PRICES:
+            return 0.0
+        input_price, output_price = MODEL_PRICES[self.model]
+        return (
+            getattr(usage, "prompt_tokens", 0) * input_price
+            + getattr(usage, "completion_tokens", 0) * output_price
+        ) / 1_000_000
+
+
+class ModelCascade(Generic[T]):
+    """Cascade of models from cheapest to most capable."""
+
+    def __init__(self, models: Sequence[str], component: str):
+        """Initialize the cascade.
+
+        Args:
+            models: Model names, cheapest first
+            component: Name of the LLM component, used in metrics
+        """
+        if not models:
+            raise ValueError("A model cascade needs at least one model")
+        self.tiers: List[ModelTier] = [ModelTier(model) for model in models]
+        self.component = component
+
+    async def run(
+        self,
+        complete: Callable[[str], Awaitable[Any]],
+        parse: Callable[[Any], T]
+    ) -> T:
+        """Run the cascade.
+
+        Args:
+            complete: Function requesting a chat completion from a model
+            parse: Function validating a completion and converting it to the
+                result; raises EscalationRequired (or any error) to escalate
+
+        Returns:
+            Result from the first tier whose completion passes validation
+        """
+        last_error: Optional[EscalationRequired] = None
+
+        for index, tier in enumerate(self.tiers):
+            is_last = index == len(self.tiers) - 1
+            labels = {"component": self.component, "model": tier.model}
+
+            start = time.monotonic()
+            completion = await complete(tier.model)
+            metrics.histogram("llm_tier_latency_seconds", **labels).observe(
+                time.monotonic() - start
+            )
+            metrics.counter("llm_tier_calls_total", **labels).inc()
+            metrics.counter("llm_tier_cost_usd", **labels).inc(
+                tier.cost(getattr(completion, "usage", None))
+            )
+
+            try:
+                result = parse(completion)
+            except EscalationRequired as e:
+                if is_last:
+                    metrics.counter("llm_tier_served_total", **labels).inc()
+                    return e.result
+                last_error = e
+            except Exception as e:
+                if is_last:
+                    raise
+                last_error = EscalationRequired(type(e).__name__)
+            else:
+                metrics.counter("llm_tier_served_total", **labels).inc()
+                return result
+
+            metrics.counter(
+                "llm_escalations_total", reason=last_error.reason, **labels
+            ).inc()
+
+        raise RuntimeError("unreachable")
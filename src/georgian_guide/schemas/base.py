@@ -19,6 +19,9 @@ class ToolType(str, Enum):
     DISTANCE_MATRIX = "distance_matrix"
     ELEVATION = "elevation"
     DIRECTIONS = "directions"
+    ITINERARY = "itinerary"
+    REACHABILITY = "reachability"
+    KNOWLEDGE = "knowledge"
 
 
 class Location(BaseModel):
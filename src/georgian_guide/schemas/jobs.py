@@ -0,0 +1,42 @@
+"""Job schemas for the Georgian Guide application.
+
+This module defines the schema models for queries processed asynchronously
+through the job queue.
+"""
+
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from georgian_guide.schemas.query import AssistantResponse, UserQuery
+
+
+class JobStatus(str, Enum):
+    """Enumeration of job states."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobRequest(UserQuery):
+    """Schema representing a query submitted as a job."""
+
+    callback_url: Optional[str] = Field(
+        None,
+        description="URL the finished job is POSTed to"
+    )
+
+
+class Job(BaseModel):
+    """Schema representing the state of a job."""
+
+    job_id: str = Field(..., description="Unique job identifier")
+    status: JobStatus = Field(..., description="Current state of the job")
+    stage: Optional[str] = Field(None, description="Pipeline stage the job is in")
+    created_at: float = Field(..., description="Submission time (Unix seconds)")
+    updated_at: float = Field(..., description="Time of the last update (Unix seconds)")
+    result: Optional[AssistantResponse] = Field(None, description="Answer once the job succeeded")
+    error: Optional[str] = Field(None, description="Error message if the job failed")
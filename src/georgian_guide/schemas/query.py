@@ -15,11 +15,18 @@ class UserQuery(BaseModel):
     
     query: str = Field(..., description="The natural language query from the user")
     user_id: Optional[str] = Field(None, description="Optional user identifier for personalization")
-    language: Optional[str] = Field("en", description="Preferred language for responses")
+    language: Optional[str] = Field(
+        None,
+        description="Preferred language for responses ('en', 'ka' or 'ru'; None to detect it from the query)"
+    )
     location: Optional[Dict[str, float]] = Field(
         None, 
         description="User's current location as {latitude: float, longitude: float}"
     )
+    recent_places: Optional[List[Dict[str, Any]]] = Field(
+        None,
+        description="Places resolved by earlier queries of a conversation, for follow-up questions"
+    )
 
 
 class ToolParameter(BaseModel):
@@ -69,4 +76,31 @@ class AssistantResponse(BaseModel):
     follow_up_questions: List[str] = Field(
         default_factory=list,
         description="Suggested follow-up questions"
-    ) 
\ No newline at end of file
+    )
+    degraded: bool = Field(False, description="Whether parts of the answer were cut to meet the deadline")
+    failed: bool = Field(
+        False,
+        description="Whether writing the answer failed (the response apologizes or was cut off)"
+    )
+    degraded_parts: List[str] = Field(
+        default_factory=list,
+        description="Parts cut or served stale, e.g. 'tool:directions', 'stale:search_places', 'answer'"
+    )
+
+
+class StreamEvent(BaseModel):
+    """Schema representing one event of a streamed answer."""
+    
+    event: str = Field(
+        ...,
+        description="Event type: 'tools' (tool results), 'delta' (answer text) or 'done' (final answer)"
+    )
+    text: Optional[str] = Field(None, description="Answer text added by a 'delta' event")
+    tool_results: Optional[List[ToolCallResult]] = Field(
+        None,
+        description="Results of the tools run for the query, carried by the 'tools' event"
+    )
+    response: Optional[AssistantResponse] = Field(
+        None,
+        description="Complete answer carried by the 'done' event"
+    )
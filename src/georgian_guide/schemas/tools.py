@@ -3,11 +3,17 @@
 This module defines the schema models for Google Maps MCP tools.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
-from georgian_guide.schemas.base import Location, TravelMode
+from georgian_guide.schemas.base import Location, ToolType, TravelMode
+
+# Local times accepted by the tools: "HH:MM" today, or an ISO date or datetime
+LOCAL_TIME_PATTERN = (
+    r"^(([01]?\d|2[0-3]):[0-5]\d"
+    r"|\d{4}-\d{2}-\d{2}([T ]([01]\d|2[0-3]):[0-5]\d(:[0-5]\d(\.\d+)?)?([+-]\d{2}:\d{2})?)?)$"
+)
 
 
 class GeocodeRequest(BaseModel):
@@ -43,6 +49,12 @@ class PlacesSearchRequest(BaseModel):
     query: str = Field(..., description="Search query")
     location: Optional[Location] = Field(None, description="Optional center point for the search")
     radius: Optional[float] = Field(None, description="Search radius in meters (max 50000)")
+    open_now: Optional[bool] = Field(None, description="Only return places open now")
+    open_at: Optional[str] = Field(
+        None,
+        description="Only return places open at 'HH:MM' today or an ISO datetime, Georgian time",
+        pattern=LOCAL_TIME_PATTERN
+    )
 
 
 class PlacesSearchResponse(BaseModel):
@@ -107,4 +119,89 @@ class DirectionsResponse(BaseModel):
     """Schema for Google Maps directions response."""
     
     routes: List[Dict[str, Any]] = Field(..., description="Directions routes")
-    status: str = Field(..., description="Status of the directions request") 
\ No newline at end of file
+    status: str = Field(..., description="Status of the directions request") 
+
+
+class ItineraryStop(BaseModel):
+    """Schema for one stop of an itinerary."""
+    
+    name: str = Field(..., description="Place name, address or coordinates of the stop")
+    visit_minutes: int = Field(60, ge=0, le=720, description="Time spent at the stop")
+    opening_hours: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Google opening_hours object with periods, used as a time window"
+    )
+
+
+class ItineraryRequest(BaseModel):
+    """Schema for itinerary request."""
+    
+    origin: str = Field(..., description="Starting point address or coordinates")
+    stops: List[ItineraryStop] = Field(
+        ..., min_length=1, max_length=24, description="Stops to visit, in any order"
+    )
+    return_to_origin: bool = Field(True, description="Whether the trip ends at the origin")
+    mode: Optional[TravelMode] = Field(None, description="Travel mode")
+    start_time: Optional[str] = Field(
+        None,
+        pattern=LOCAL_TIME_PATTERN,
+        description="Departure as 'HH:MM' today or an ISO datetime, Georgian time (default now)"
+    )
+
+
+class ItineraryResponse(BaseModel):
+    """Schema for itinerary response."""
+    
+    status: str = Field(..., description="Status of the itinerary request")
+    stops: List[Dict[str, Any]] = Field(..., description="Scheduled stops in visiting order")
+    unreachable: List[str] = Field(default_factory=list, description="Stops that cannot be reached")
+
+
+class ReachabilityRequest(BaseModel):
+    """Schema for reachability request."""
+    
+    origin: str = Field(..., description="Starting point address or coordinates")
+    max_minutes: float = Field(..., gt=0, le=600, description="Maximum travel time in minutes")
+    mode: Optional[TravelMode] = Field(None, description="Travel mode")
+    destinations: Optional[List[str]] = Field(
+        None,
+        max_length=200,
+        description="Candidate destinations (default: towns and sights of the gazetteer)"
+    )
+
+
+class ReachabilityResponse(BaseModel):
+    """Schema for reachability response."""
+    
+    status: str = Field(..., description="Status of the reachability request")
+    reachable: List[Dict[str, Any]] = Field(..., description="Reachable destinations, nearest first")
+    checked: int = Field(..., description="Number of candidate destinations checked")
+
+
+class KnowledgeRequest(BaseModel):
+    """Schema for knowledge request."""
+    
+    query: str = Field(..., min_length=1, description="Question or keywords, in English")
+    top_k: int = Field(3, ge=1, le=5, description="Maximum number of passages")
+
+
+class KnowledgeResponse(BaseModel):
+    """Schema for knowledge response."""
+    
+    status: str = Field(..., description="Status of the knowledge request")
+    passages: List[Dict[str, Any]] = Field(..., description="Matching passages, best first")
+
+
+# Request schema used to validate the parameters of each tool type
+TOOL_REQUEST_SCHEMAS: Dict[ToolType, Type[BaseModel]] = {
+    ToolType.GEOCODE: GeocodeRequest,
+    ToolType.REVERSE_GEOCODE: ReverseGeocodeRequest,
+    ToolType.SEARCH_PLACES: PlacesSearchRequest,
+    ToolType.PLACE_DETAILS: PlaceDetailsRequest,
+    ToolType.DISTANCE_MATRIX: DistanceMatrixRequest,
+    ToolType.ELEVATION: ElevationRequest,
+    ToolType.DIRECTIONS: DirectionsRequest,
+    ToolType.ITINERARY: ItineraryRequest,
+    ToolType.REACHABILITY: ReachabilityRequest,
+    ToolType.KNOWLEDGE: KnowledgeRequest,
+}
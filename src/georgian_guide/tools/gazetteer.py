@@ -0,0 +1,123 @@
+"""Local geocoding from the offline gazetteer.
+
+This module wraps the geocode tool so that well-known Georgian places are
+resolved from the gazetteer without a Google Maps round-trip. Addresses the
+gazetteer cannot resolve with enough confidence go to the wrapped tool.
+"""
+
+from typing import Any, Dict, Optional
+
+from georgian_guide.core.gazetteer import Gazetteer, GazetteerMatch
+from georgian_guide.core.interfaces import ToolInterface
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.text import canonical_key, is_transliterable, normalize_query
+
+
+def canonical_geocode_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Key geocode calls on the canonical form of the address.
+
+    Used for the geocode cache key, so that "Mtskheta" and "Mcxeta" share
+    a cache entry. Addresses with digits keep their normalized text, since the
+    canonical form folds repeated characters and would give "Rustaveli Avenue 1"
+    and "Rustaveli Avenue 11" one entry; so do addresses in other scripts
+    (Armenian, Chinese, ...), which have no canonical form.
+
+    Args:
+        parameters: Geocode parameters
+
+    Returns:
+        Parameters with the address replaced by its canonical key
+    """
+    address = parameters.get("address")
+    if not isinstance(address, str):
+        return parameters
+    key = canonical_key(address)
+    if not key or any(char.isdigit() for char in address) or not is_transliterable(address):
+        key = normalize_query(address)
+    return {**parameters, "address": key}
+
+
+def pin_location(gazetteer: Optional[Gazetteer], name: str, min_confidence: float = 0.9) -> str:
+    """Replace a well-known place name with its coordinates.
+
+    Used for distance matrix origins and destinations, so the matrix cannot
+    pick a namesake elsewhere.
+
+    Args:
+        gazetteer: Gazetteer of known places (None leaves names unchanged)
+        name: Place name, address or coordinates
+        min_confidence: Minimum match confidence for pinning
+
+    Returns:
+        "lat,lng" coordinates of a known place, otherwise the name
+    """
+    match = gazetteer.resolve(name) if gazetteer is not None else None
+    if match is not None and match.confidence >= min_confidence:
+        return f"{match.entry.latitude},{match.entry.longitude}"
+    return name
+
+
+def geocode_result(match: GazetteerMatch) -> Dict[str, Any]:
+    """Build a geocoding response for a gazetteer match.
+
+    Args:
+        match: Gazetteer match
+
+    Returns:
+        Response in the shape of the Google geocoding API
+    """
+    entry = match.entry
+    return {
+        "status": "OK",
+        "results": [{
+            "formatted_address": entry.formatted_address,
+            "geometry": {
+                "location": {"lat": entry.latitude, "lng": entry.longitude},
+                "location_type": "APPROXIMATE",
+            },
+            "types": [entry.kind],
+            "partial_match": match.confidence < 1.0,
+            "source": "gazetteer",
+            "match": "exact" if match.confidence == 1.0 else "fuzzy",
+        }],
+    }
+
+
+class GazetteerGeocodeTool(ToolInterface):
+    """Geocode tool answering from the gazetteer when it is confident."""
+
+    def __init__(self, tool: ToolInterface, gazetteer: Gazetteer, min_confidence: float = 0.9):
+        """Initialize the wrapper.
+
+        Args:
+            tool: Geocode tool used for addresses the gazetteer cannot resolve
+            gazetteer: Gazetteer of known places
+            min_confidence: Minimum match confidence for answering locally.
+                Confidence is one minus the edit distance per character, so
+                0.9 allows one typo in names of ten letters or more; shorter
+                names must match exactly, since "Goris" or "Tel Aviv" are
+                other places, not misspelled Gori and Telavi
+        """
+        self.tool = tool
+        self.gazetteer = gazetteer
+        self.min_confidence = min_confidence
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Geocode an address.
+
+        Args:
+            parameters: Geocode parameters
+
+        Returns:
+            Geocoding results
+        """
+        address = parameters.get("address")
+        match = self.gazetteer.resolve(address) if isinstance(address, str) else None
+        if match is not None and match.confidence >= self.min_confidence:
+            metrics.counter(
+                "gazetteer_hits_total", match="exact" if match.confidence == 1.0 else "fuzzy"
+            ).inc()
+            return geocode_result(match)
+
+        metrics.counter("gazetteer_misses_total").inc()
+        return await self.tool.execute(parameters)
@@ -3,10 +3,12 @@
 This module implements the tools for interacting with Google Maps MCP.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
 
 from georgian_guide.core.interfaces import ToolInterface
-from georgian_guide.schemas.base import Location, TravelMode
+from georgian_guide.schemas.base import Location, ToolType, TravelMode
 from georgian_guide.schemas.tools import (
     DirectionsRequest,
     DirectionsResponse,
@@ -23,12 +25,28 @@ from georgian_guide.schemas.tools import (
     ReverseGeocodeRequest,
     ReverseGeocodeResponse,
 )
+from georgian_guide.tools.session import MapsBackend, MapsSession
 
+if TYPE_CHECKING:
+    from georgian_guide.tools.registry import ToolRegistry
 
-class BaseGoogleMapsTool(ToolInterface):
-    """Base class for all Google Maps MCP tools."""
+
+# MCP function name -> (required parameters, optional parameters)
+MCP_FUNCTIONS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "mcp_google_maps_maps_geocode": (("address",), ()),
+    "mcp_google_maps_maps_reverse_geocode": (("latitude", "longitude"), ()),
+    "mcp_google_maps_maps_search_places": (("query",), ("location", "radius")),
+    "mcp_google_maps_maps_place_details": (("place_id",), ()),
+    "mcp_google_maps_maps_distance_matrix": (("origins", "destinations"), ("mode",)),
+    "mcp_google_maps_maps_elevation": (("locations",), ()),
+    "mcp_google_maps_maps_directions": (("origin", "destination"), ("mode",)),
+}
+
+
+class MCPMapsBackend(MapsBackend):
+    """Backend calling Google Maps through the MCP functions."""
     
-    async def _make_mcp_call(self, function_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def call(self, function_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Make a call to Google Maps using MCP.
         
         This function directly calls the MCP functions provided by Claude in Cursor.
@@ -41,58 +59,98 @@ class BaseGoogleMapsTool(ToolInterface):
         Returns:
             Function response
         """
-        # In Cursor, the following functions are available via Claude's MCP capabilities
-        # They will be automatically called when this code runs in Cursor
-        
-        # Note: This code should be executed in Cursor with Claude to work properly
-        # The MCP call will be handled by the Cursor environment
-        
-        # We're just passing through the function call and its parameters
-        # to be handled by the MCP framework
-        if function_name == "mcp_google_maps_maps_geocode":
-            # The MCP call will be handled by Cursor
-            return await mcp_google_maps_maps_geocode(address=parameters["address"])
-        elif function_name == "mcp_google_maps_maps_reverse_geocode":
-            return await mcp_google_maps_maps_reverse_geocode(
-                latitude=parameters["latitude"], 
-                longitude=parameters["longitude"]
-            )
-        elif function_name == "mcp_google_maps_maps_search_places":
-            search_params = {}
-            if "query" in parameters:
-                search_params["query"] = parameters["query"]
-            if "location" in parameters:
-                search_params["location"] = parameters["location"]
-            if "radius" in parameters:
-                search_params["radius"] = parameters["radius"]
-            return await mcp_google_maps_maps_search_places(**search_params)
-        elif function_name == "mcp_google_maps_maps_place_details":
-            return await mcp_google_maps_maps_place_details(place_id=parameters["place_id"])
-        elif function_name == "mcp_google_maps_maps_distance_matrix":
-            matrix_params = {
-                "origins": parameters["origins"],
-                "destinations": parameters["destinations"]
-            }
-            if "mode" in parameters:
-                matrix_params["mode"] = parameters["mode"]
-            return await mcp_google_maps_maps_distance_matrix(**matrix_params)
-        elif function_name == "mcp_google_maps_maps_elevation":
-            return await mcp_google_maps_maps_elevation(locations=parameters["locations"])
-        elif function_name == "mcp_google_maps_maps_directions":
-            directions_params = {
-                "origin": parameters["origin"],
-                "destination": parameters["destination"]
-            }
-            if "mode" in parameters:
-                directions_params["mode"] = parameters["mode"]
-            return await mcp_google_maps_maps_directions(**directions_params)
-        else:
+        if function_name not in MCP_FUNCTIONS:
             raise ValueError(f"Unknown MCP function: {function_name}")
+        
+        required, optional = MCP_FUNCTIONS[function_name]
+        arguments = {name: parameters[name] for name in required}
+        arguments.update({name: parameters[name] for name in optional if name in parameters})
+        
+        # The MCP functions are looked up at call time because the Cursor
+        # environment replaces the module-level stubs defined below
+        function = globals()[function_name]
+        return await function(**arguments)
+
+
+_default_session: Optional[MapsSession] = None
+
+
+def get_default_session() -> MapsSession:
+    """Return the process-wide MCP session used by tools created without one.
+    
+    Returns:
+        Shared Maps session
+    """
+    global _default_session
+    if _default_session is None:
+        _default_session = MapsSession(MCPMapsBackend())
+    return _default_session
+
+
+class BaseGoogleMapsTool(ToolInterface):
+    """Base class for all Google Maps MCP tools."""
+    
+    tool_type: ToolType
+    response_schema: Type[BaseModel]
+    upstream = "google_maps"
+    
+    def __init__(self, session: Optional[MapsSession] = None):
+        """Initialize the tool.
+        
+        Args:
+            session: Shared Maps session (defaults to the process-wide MCP session)
+        """
+        self.session = session or get_default_session()
+    
+    @classmethod
+    def from_registry(cls, registry: "ToolRegistry") -> "BaseGoogleMapsTool":
+        """Create the tool using the registry's shared Maps session.
+        
+        Args:
+            registry: Tool registry building the tool
+            
+        Returns:
+            Tool instance
+        """
+        return cls(session=registry.session)
+    
+    async def _make_mcp_call(self, function_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Make a call to Google Maps through the shared session.
+        
+        Args:
+            function_name: The name of the MCP function to call
+            parameters: Parameters for the function
+            
+        Returns:
+            Function response
+        """
+        return await self.session.call(self.tool_type, function_name, parameters)
+    
+    def _parse_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Check a backend response against the tool's response schema.
+        
+        The upstream dict itself is returned rather than a dumped copy of the
+        model, so large places and directions payloads are not copied on their
+        way to the output stage. Responses from trusted backends are passed
+        through without validation.
+        
+        Args:
+            response: Raw backend response
+            
+        Returns:
+            The backend response
+        """
+        if not self.session.backend.trusted:
+            self.response_schema.model_validate(response)
+        return response
 
 
 class GeocodeMapsTool(BaseGoogleMapsTool):
     """Google Maps geocode tool implementation."""
     
+    tool_type = ToolType.GEOCODE
+    response_schema = GeocodeResponse
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the geocode tool.
         
@@ -107,12 +165,15 @@ class GeocodeMapsTool(BaseGoogleMapsTool):
             "mcp_google_maps_maps_geocode",
             {"address": request.address}
         )
-        return GeocodeResponse(**response).dict()
+        return self._parse_response(response)
 
 
 class ReverseGeocodeMapsTool(BaseGoogleMapsTool):
     """Google Maps reverse geocode tool implementation."""
     
+    tool_type = ToolType.REVERSE_GEOCODE
+    response_schema = ReverseGeocodeResponse
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the reverse geocode tool.
         
@@ -127,12 +188,15 @@ class ReverseGeocodeMapsTool(BaseGoogleMapsTool):
             "mcp_google_maps_maps_reverse_geocode",
             {"latitude": request.latitude, "longitude": request.longitude}
         )
-        return ReverseGeocodeResponse(**response).dict()
+        return self._parse_response(response)
 
 
 class SearchPlacesMapsTool(BaseGoogleMapsTool):
     """Google Maps search places tool implementation."""
     
+    tool_type = ToolType.SEARCH_PLACES
+    response_schema = PlacesSearchResponse
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the search places tool.
         
@@ -161,12 +225,15 @@ class SearchPlacesMapsTool(BaseGoogleMapsTool):
             mcp_params
         )
         
-        return PlacesSearchResponse(**response).dict()
+        return self._parse_response(response)
 
 
 class PlaceDetailsMapsTool(BaseGoogleMapsTool):
     """Google Maps place details tool implementation."""
     
+    tool_type = ToolType.PLACE_DETAILS
+    response_schema = PlaceDetailsResponse
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the place details tool.
         
@@ -181,12 +248,15 @@ class PlaceDetailsMapsTool(BaseGoogleMapsTool):
             "mcp_google_maps_maps_place_details",
             {"place_id": request.place_id}
         )
-        return PlaceDetailsResponse(**response).dict()
+        return self._parse_response(response)
 
 
 class DistanceMatrixMapsTool(BaseGoogleMapsTool):
     """Google Maps distance matrix tool implementation."""
     
+    tool_type = ToolType.DISTANCE_MATRIX
+    response_schema = DistanceMatrixResponse
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the distance matrix tool.
         
@@ -212,12 +282,15 @@ class DistanceMatrixMapsTool(BaseGoogleMapsTool):
             mcp_params
         )
         
-        return DistanceMatrixResponse(**response).dict()
+        return self._parse_response(response)
 
 
 class ElevationMapsTool(BaseGoogleMapsTool):
     """Google Maps elevation tool implementation."""
     
+    tool_type = ToolType.ELEVATION
+    response_schema = ElevationResponse
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the elevation tool.
         
@@ -240,12 +313,15 @@ class ElevationMapsTool(BaseGoogleMapsTool):
             {"locations": locations}
         )
         
-        return ElevationResponse(**response).dict()
+        return self._parse_response(response)
 
 
 class DirectionsMapsTool(BaseGoogleMapsTool):
     """Google Maps directions tool implementation."""
     
+    tool_type = ToolType.DIRECTIONS
+    response_schema = DirectionsResponse
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the directions tool.
         
@@ -271,7 +347,7 @@ class DirectionsMapsTool(BaseGoogleMapsTool):
             mcp_params
         )
         
-        return DirectionsResponse(**response).dict()
+        return self._parse_response(response)
 
 
 # Define MCP functions that will be used in Cursor environment
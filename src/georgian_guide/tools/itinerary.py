@@ -0,0 +1,177 @@
+"""Itinerary tool implementation.
+
+This module implements the tool that plans a multi-stop trip: it requests the
+travel times between all stops in one batched distance matrix call and solves
+the visiting order locally, respecting the stops' opening hours.
+"""
+
+import asyncio
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from georgian_guide.core.gazetteer import Gazetteer, get_gazetteer
+from georgian_guide.core.interfaces import ToolInterface
+from georgian_guide.core.itinerary import ItineraryPlanner, Plan, Stop
+from georgian_guide.core.opening_hours import (
+    MINUTES_PER_DAY,
+    WEEK_MINUTES,
+    WeeklyHours,
+    minute_of_week,
+    parse_local_time,
+)
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.tools import ItineraryRequest
+from georgian_guide.tools.gazetteer import pin_location
+from georgian_guide.tools.matrix import travel_matrix
+
+if TYPE_CHECKING:
+    from georgian_guide.tools.registry import ToolRegistry
+
+_DAY_NAMES = ("Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat")
+
+
+def format_minute(minute: float) -> str:
+    """Format minutes since the start of the week as e.g. "Sat 09:40"."""
+    minute = int(round(minute)) % WEEK_MINUTES
+    day, rest = divmod(minute, MINUTES_PER_DAY)
+    return f"{_DAY_NAMES[day]} {rest // 60:02d}:{rest % 60:02d}"
+
+
+class ItineraryTool(ToolInterface):
+    """Tool planning the visiting order of a multi-stop trip."""
+
+    tool_type = ToolType.ITINERARY
+
+    def __init__(self, matrix_tool: ToolInterface, gazetteer: Optional[Gazetteer] = None):
+        """Initialize the tool.
+
+        Args:
+            matrix_tool: Distance matrix tool used for travel times
+            gazetteer: Gazetteer used to pin well-known stops to coordinates
+        """
+        self.matrix_tool = matrix_tool
+        self.gazetteer = gazetteer
+
+    @classmethod
+    def from_registry(cls, registry: "ToolRegistry") -> "ItineraryTool":
+        """Create the tool using the registry's distance matrix tool.
+
+        Args:
+            registry: Tool registry building the tool
+
+        Returns:
+            Tool instance
+        """
+        gazetteer = get_gazetteer() if registry.settings.gazetteer_enabled else None
+        return cls(registry[ToolType.DISTANCE_MATRIX], gazetteer)
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Plan the trip.
+
+        Args:
+            parameters: Tool parameters
+
+        Returns:
+            Scheduled stops in visiting order
+        """
+        request = ItineraryRequest(**parameters)
+        names = [request.origin] + [stop.name for stop in request.stops]
+        points = [pin_location(self.gazetteer, name) for name in names]
+        seconds = await travel_matrix(
+            self.matrix_tool,
+            points,
+            points,
+            mode=request.mode.value if request.mode else None
+        )
+
+        reachable = self._connected_stops(seconds, len(request.stops))
+        unreachable = [
+            request.stops[index].name for index in range(len(request.stops)) if index not in reachable
+        ]
+        if not reachable:
+            return {"status": "ZERO_RESULTS", "stops": [], "unreachable": unreachable}
+
+        points_used = [0] + [index + 1 for index in reachable]
+        travel = [[seconds[i][j] / 60 for j in points_used] for i in points_used]
+        stops = [
+            Stop(
+                name=request.stops[index].name,
+                visit_minutes=request.stops[index].visit_minutes,
+                hours=WeeklyHours.from_google(request.stops[index].opening_hours)
+            )
+            for index in reachable
+        ]
+        start = parse_local_time(request.start_time)
+        planner = ItineraryPlanner(travel, stops, minute_of_week(start), request.return_to_origin)
+        # Large trips take long enough to stall the event loop, so solve in a thread
+        plan = await asyncio.to_thread(planner.solve)
+
+        return self._format(request, stops, plan, unreachable)
+
+    @staticmethod
+    def _connected_stops(seconds: List[List[float]], count: int) -> List[int]:
+        """Choose the stops the trip can visit.
+
+        Stops that cannot be reached from the origin and back are left out.
+        Then, while some stops cannot reach each other, the stop cut off from
+        the most others is left out too.
+
+        Args:
+            seconds: Travel times between the origin (index 0) and the stops
+            count: Number of stops
+
+        Returns:
+            Indices of the stops kept
+        """
+        kept = [
+            index for index in range(count)
+            if not math.isinf(seconds[0][index + 1]) and not math.isinf(seconds[index + 1][0])
+        ]
+        while True:
+            cut_off = {
+                index: sum(
+                    math.isinf(seconds[index + 1][other + 1]) or math.isinf(seconds[other + 1][index + 1])
+                    for other in kept if other != index
+                )
+                for index in kept
+            }
+            worst = max(kept, key=lambda index: cut_off[index], default=None)
+            if worst is None or cut_off[worst] == 0:
+                return kept
+            kept.remove(worst)
+
+    @staticmethod
+    def _format(
+        request: ItineraryRequest,
+        stops: List[Stop],
+        plan: Plan,
+        unreachable: List[str]
+    ) -> Dict[str, Any]:
+        """Turn a plan into a compact response."""
+        scheduled = []
+        for visit in plan.visits:
+            entry = {
+                "name": stops[visit.stop].name,
+                "travel_min": round(visit.travel_minutes),
+                "arrive": format_minute(visit.arrive),
+                "depart": format_minute(visit.depart),
+            }
+            if visit.start > visit.arrive:
+                entry["wait_min"] = round(visit.start - visit.arrive)
+            if not visit.open:
+                entry["closed"] = True
+            scheduled.append(entry)
+
+        travel_minutes = sum(visit.travel_minutes for visit in plan.visits)
+        result: Dict[str, Any] = {
+            "status": "OK",
+            "origin": request.origin,
+            "stops": scheduled,
+            "unreachable": unreachable,
+            "total_travel_min": round(travel_minutes + (plan.return_minutes or 0)),
+            "finish": format_minute(plan.finish),
+            "solver": plan.solver,
+        }
+        if plan.return_minutes is not None:
+            result["return_travel_min"] = round(plan.return_minutes)
+        return result
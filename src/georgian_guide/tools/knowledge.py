@@ -0,0 +1,71 @@
+"""Knowledge tool implementation.
+
+This module implements the tool answering cultural and practical travel
+questions from the local knowledge index, without an upstream call. Passages
+are shortened to a fixed size, and passages scoring far below the best one are
+left out, so retrieved knowledge takes a bounded part of the answer prompt.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict
+
+from georgian_guide.core.interfaces import ToolInterface
+from georgian_guide.core.knowledge import KnowledgeIndex, bound_snippet, get_knowledge_index
+from georgian_guide.core.metrics import metrics
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.tools import KnowledgeRequest
+
+if TYPE_CHECKING:
+    from georgian_guide.tools.registry import ToolRegistry
+
+
+class KnowledgeTool(ToolInterface):
+    """Tool retrieving passages of the travel knowledge corpus."""
+
+    tool_type = ToolType.KNOWLEDGE
+
+    def __init__(self, index: KnowledgeIndex, snippet_chars: int = 600, relative_cutoff: float = 0.35):
+        """Initialize the tool.
+
+        Args:
+            index: Knowledge index
+            snippet_chars: Maximum length of each returned passage
+            relative_cutoff: Minimum score of a passage relative to the best one
+        """
+        self.index = index
+        self.snippet_chars = snippet_chars
+        self.relative_cutoff = relative_cutoff
+
+    @classmethod
+    def from_registry(cls, registry: "ToolRegistry") -> "KnowledgeTool":
+        """Create the tool with the index configured in the settings.
+
+        Args:
+            registry: Tool registry building the tool
+
+        Returns:
+            Tool instance
+        """
+        settings = registry.settings
+        return cls(get_knowledge_index(settings.knowledge_index_path), settings.knowledge_snippet_chars)
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Retrieve the passages answering a question.
+
+        Args:
+            parameters: Tool parameters
+
+        Returns:
+            Matching passages, best first
+        """
+        request = KnowledgeRequest(**parameters)
+        hits = self.index.search(request.query, request.top_k)
+        if hits:
+            hits = [hit for hit in hits if hit.score >= hits[0].score * self.relative_cutoff]
+        metrics.counter("knowledge_queries_total", result="hit" if hits else "miss").inc()
+        return {
+            "status": "OK" if hits else "ZERO_RESULTS",
+            "passages": [
+                {"title": hit.title, "text": bound_snippet(hit.text, self.snippet_chars)}
+                for hit in hits
+            ],
+        }
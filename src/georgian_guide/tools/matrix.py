@@ -0,0 +1,82 @@
+"""Batched distance matrix requests.
+
+Google limits a distance matrix request to 25 origins, 25 destinations and
+100 elements. This module splits larger matrices into blocks within those
+limits, requests the blocks concurrently through the distance matrix tool and
+reassembles the travel times.
+"""
+
+import asyncio
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from georgian_guide.core.interfaces import ToolInterface
+
+MAX_MATRIX_SIDE = 25
+MAX_MATRIX_ELEMENTS = 100
+
+
+def _blocks(rows: int, columns: int) -> List[Tuple[range, range]]:
+    """Split a rows x columns matrix into (row range, column range) blocks."""
+    column_step = min(columns, MAX_MATRIX_SIDE)
+    row_step = max(1, min(rows, MAX_MATRIX_SIDE, MAX_MATRIX_ELEMENTS // column_step))
+    return [
+        (range(r, min(r + row_step, rows)), range(c, min(c + column_step, columns)))
+        for r in range(0, rows, row_step)
+        for c in range(0, columns, column_step)
+    ]
+
+
+def _element_value(element: Dict[str, Any], field: str) -> float:
+    """Read a duration or distance value from a matrix element (inf if missing)."""
+    if element.get("status", "OK") != "OK" or field not in element:
+        return math.inf
+    return float(element[field]["value"])
+
+
+async def travel_matrix(
+    matrix_tool: ToolInterface,
+    origins: Sequence[str],
+    destinations: Sequence[str],
+    mode: Optional[str] = None,
+    field: str = "duration",
+    failed: float = math.inf
+) -> List[List[float]]:
+    """Request travel durations or distances between all origins and destinations.
+
+    Args:
+        matrix_tool: Distance matrix tool
+        origins: Origin addresses or "lat,lng" coordinates
+        destinations: Destination addresses or "lat,lng" coordinates
+        mode: Travel mode value
+        field: "duration" (seconds) or "distance" (meters)
+        failed: Value of the elements of blocks whose request failed
+
+    Returns:
+        Matrix of values indexed [origin][destination] (``math.inf`` where no
+        route was found)
+    """
+    blocks = _blocks(len(origins), len(destinations))
+
+    async def fetch(row_range: range, column_range: range) -> Dict[str, Any]:
+        parameters: Dict[str, Any] = {
+            "origins": [origins[i] for i in row_range],
+            "destinations": [destinations[j] for j in column_range],
+        }
+        if mode:
+            parameters["mode"] = mode
+        return await matrix_tool.execute(parameters)
+
+    responses = await asyncio.gather(*(fetch(rows, columns) for rows, columns in blocks))
+
+    matrix = [[math.inf] * len(destinations) for _ in origins]
+    for (row_range, column_range), response in zip(blocks, responses):
+        if response.get("status", "OK") != "OK":
+            for i in row_range:
+                for j in column_range:
+                    matrix[i][j] = failed
+            continue
+        for i, row in zip(row_range, response.get("rows", [])):
+            for j, element in zip(column_range, row.get("elements", [])):
+                matrix[i][j] = _element_value(element, field)
+    return matrix
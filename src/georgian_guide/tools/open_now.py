@@ -0,0 +1,136 @@
+"""Opening-hours filtering of place searches.
+
+Search results carry opening hours only partially, so "open now" questions
+used to need a place details call per candidate. This module answers them
+from the opening hours index instead: every place details result adds its
+place's weekly hours to the index, and searches with ``open_now`` or
+``open_at`` keep the candidates the index finds open. Details calls are left
+for the candidates whose hours are still unknown; candidates whose hours stay
+unknown are kept too, marked with an ``open_status`` of "unknown".
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from georgian_guide.core.interfaces import ToolInterface
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.opening_hours import OpeningHoursIndex, parse_local_time
+
+
+class HoursRecordingDetailsTool(ToolInterface):
+    """Place details tool adding the opening hours it returns to the index."""
+
+    def __init__(self, tool: ToolInterface, index: OpeningHoursIndex):
+        """Initialize the wrapper.
+
+        Args:
+            tool: The place details tool
+            index: Opening hours index to fill
+        """
+        self.tool = tool
+        self.index = index
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the details of a place.
+
+        Args:
+            parameters: Place details parameters
+
+        Returns:
+            Place details
+        """
+        result = await self.tool.execute(parameters)
+        place = result.get("result") or {}
+        place_id = place.get("place_id") or parameters.get("place_id")
+        if isinstance(place_id, str):
+            self.index.add_google(place_id, place.get("opening_hours"))
+        return result
+
+
+class OpenNowSearchTool(ToolInterface):
+    """Places search tool filtering the results by opening hours."""
+
+    def __init__(
+        self,
+        tool: ToolInterface,
+        index: OpeningHoursIndex,
+        details_tool: Optional[ToolInterface] = None,
+        details_limit: int = 5
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            tool: The places search tool
+            index: Opening hours index
+            details_tool: Place details tool used for places with unknown hours
+            details_limit: Maximum details calls per search
+        """
+        self.tool = tool
+        self.index = index
+        self.details_tool = details_tool
+        self.details_limit = details_limit
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Search for places, keeping only the open ones if asked to.
+
+        Args:
+            parameters: Places search parameters
+
+        Returns:
+            Places search results
+        """
+        open_now = parameters.get("open_now")
+        open_at = parameters.get("open_at")
+        if not open_now and not open_at:
+            return await self.tool.execute(parameters)
+
+        # Search without the filter, so filtered and unfiltered searches share a cache entry
+        search = {name: value for name, value in parameters.items() if name not in ("open_now", "open_at")}
+        result = await self.tool.execute(search)
+        places = [place for place in result.get("results", []) if isinstance(place.get("place_id"), str)]
+        moment = parse_local_time(open_at)
+
+        # Search results sometimes carry periods, and open_now answers for the present
+        known_now: Dict[str, bool] = {}
+        for place in places:
+            place_id = place["place_id"]
+            if place_id in self.index:
+                continue
+            opening_hours = place.get("opening_hours") or {}
+            if not self.index.add_google(place_id, opening_hours) and not open_at:
+                if isinstance(opening_hours.get("open_now"), bool):
+                    known_now[place_id] = opening_hours["open_now"]
+
+        place_ids = [place["place_id"] for place in places]
+        _, unknown = self.index.filter_open(place_ids, moment)
+        await self._fetch_hours([place_id for place_id in unknown if place_id not in known_now])
+
+        open_places, unknown = self.index.filter_open(place_ids, moment)
+        is_open = set(open_places) | {place_id for place_id, value in known_now.items() if value}
+        still_unknown = {place_id for place_id in unknown if place_id not in known_now}
+        metrics.counter("open_now_candidates_total", hours="indexed").inc(len(place_ids) - len(unknown))
+        metrics.counter("open_now_candidates_total", hours="search").inc(len(known_now))
+        metrics.counter("open_now_candidates_total", hours="unknown").inc(len(still_unknown))
+
+        kept = [
+            {**place, "open_status": "open" if place["place_id"] in is_open else "unknown"}
+            for place in places
+            if place["place_id"] in is_open or place["place_id"] in still_unknown
+        ]
+        return {**result, "status": "OK" if kept else "ZERO_RESULTS", "results": kept}
+
+    async def _fetch_hours(self, place_ids: List[str]) -> None:
+        """Look up the hours of places through place details calls."""
+        if self.details_tool is None or not place_ids:
+            return
+        place_ids = place_ids[:self.details_limit]
+        metrics.counter("open_now_details_calls_total").inc(len(place_ids))
+        results = await asyncio.gather(
+            *(self.details_tool.execute({"place_id": place_id}) for place_id in place_ids),
+            return_exceptions=True
+        )
+        for place_id, result in zip(place_ids, results):
+            # The details tool indexes the hours itself when wrapped; index them
+            # here too in case it is not
+            if isinstance(result, dict) and place_id not in self.index:
+                self.index.add_google(place_id, (result.get("result") or {}).get("opening_hours"))
@@ -0,0 +1,183 @@
+"""Reachability tool implementation.
+
+This module implements the tool answering "what can I reach within an hour of
+Kutaisi?": it checks the travel time from the origin to a set of candidate
+destinations (the towns and sights of the gazetteer by default) with one
+batched distance matrix, and keeps the destinations within the time limit.
+
+Candidates that are too far away in a straight line to be reached at the
+mode's top speed are skipped without a request. Travel times are cached per
+origin and mode, so asking again with another time limit only requests the
+candidates not checked before.
+"""
+
+import math
+from itertools import compress
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional
+
+from georgian_guide.core.cache import TTLCache, make_cache_key
+from georgian_guide.core.context import record_cache
+from georgian_guide.core.gazetteer import Gazetteer, get_gazetteer
+from georgian_guide.core.geo import Coordinates, haversine
+from georgian_guide.core.interfaces import ToolInterface
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.validation import coerce_location
+from georgian_guide.schemas.base import ToolType, TravelMode
+from georgian_guide.schemas.tools import ReachabilityRequest
+from georgian_guide.tools.gazetteer import pin_location
+from georgian_guide.tools.matrix import travel_matrix
+
+if TYPE_CHECKING:
+    from georgian_guide.tools.registry import ToolRegistry
+
+# Gazetteer kinds offered as destinations by default
+DESTINATION_KINDS = frozenset({
+    "locality", "tourist_attraction", "natural_feature", "park", "place_of_worship",
+    "amusement_park", "point_of_interest",
+})
+
+# Straight-line speed no route of the mode beats, in meters per second
+MAX_SPEEDS = {
+    TravelMode.DRIVING: 130 / 3.6,
+    TravelMode.TRANSIT: 130 / 3.6,
+    TravelMode.BICYCLING: 35 / 3.6,
+    TravelMode.WALKING: 8 / 3.6,
+}
+
+
+class Candidate(NamedTuple):
+    """A destination to check."""
+
+    name: str
+    kind: Optional[str]
+    point: str
+    coordinates: Optional[Coordinates]
+
+
+class ReachabilityTool(ToolInterface):
+    """Tool finding the destinations reachable from an origin within a time limit."""
+
+    tool_type = ToolType.REACHABILITY
+
+    def __init__(
+        self,
+        matrix_tool: ToolInterface,
+        gazetteer: Optional[Gazetteer] = None,
+        cache: Optional[TTLCache[Dict[str, float]]] = None
+    ):
+        """Initialize the tool.
+
+        Args:
+            matrix_tool: Distance matrix tool used for travel times
+            gazetteer: Gazetteer providing the default destinations and coordinates
+            cache: Cache of travel times by origin and mode
+        """
+        self.matrix_tool = matrix_tool
+        self.gazetteer = gazetteer
+        self.cache = cache if cache is not None else TTLCache(max_size=256)
+
+    @classmethod
+    def from_registry(cls, registry: "ToolRegistry") -> "ReachabilityTool":
+        """Create the tool using the registry's distance matrix tool.
+
+        Args:
+            registry: Tool registry building the tool
+
+        Returns:
+            Tool instance
+        """
+        gazetteer = get_gazetteer() if registry.settings.gazetteer_enabled else None
+        cache: TTLCache[Dict[str, float]] = TTLCache(max_size=256, ttl=registry.settings.tool_cache_ttl)
+        return cls(registry[ToolType.DISTANCE_MATRIX], gazetteer, cache)
+
+    def _coordinates(self, name: str) -> Optional[Coordinates]:
+        """Return the coordinates of "lat,lng" strings and well-known places."""
+        location = coerce_location(name)
+        if isinstance(location, dict):
+            return float(location["latitude"]), float(location["longitude"])
+        match = self.gazetteer.resolve(name) if self.gazetteer is not None else None
+        if match is not None and match.confidence >= 0.9:
+            return match.entry.latitude, match.entry.longitude
+        return None
+
+    def _candidates(self, request: ReachabilityRequest, origin: str) -> List[Candidate]:
+        """Build the candidate destinations of a request."""
+        if request.destinations:
+            return [
+                Candidate(name, None, pin_location(self.gazetteer, name), self._coordinates(name))
+                for name in dict.fromkeys(request.destinations)
+            ]
+        if self.gazetteer is None:
+            return []
+        candidates = []
+        for entry in self.gazetteer.entries:
+            point = f"{entry.latitude},{entry.longitude}"
+            if entry.kind in DESTINATION_KINDS and point != origin:
+                candidates.append(Candidate(entry.name, entry.kind, point, (entry.latitude, entry.longitude)))
+        return candidates
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Find the reachable destinations.
+
+        Args:
+            parameters: Tool parameters
+
+        Returns:
+            Reachable destinations, nearest first
+        """
+        request = ReachabilityRequest(**parameters)
+        mode = request.mode or TravelMode.DRIVING
+        limit = request.max_minutes * 60
+        origin = pin_location(self.gazetteer, request.origin)
+        candidates = self._candidates(request, origin)
+
+        # Skip candidates no route could reach in time
+        origin_coordinates = self._coordinates(request.origin)
+        if origin_coordinates is not None:
+            radius = limit * MAX_SPEEDS[mode]
+            candidates = [
+                candidate for candidate in candidates
+                if candidate.coordinates is None
+                or haversine(*origin_coordinates, *candidate.coordinates) <= radius
+            ]
+
+        key = make_cache_key(self.tool_type.value, origin, mode.value)
+        seconds = dict(self.cache.get(key) or {})
+        missing = [candidate.point for candidate in candidates if candidate.point not in seconds]
+        record_cache("reachability", not missing)
+        if missing:
+            metrics.counter("reachability_matrix_elements_total").inc(len(missing))
+            row = (await travel_matrix(
+                self.matrix_tool, [origin], missing, mode=mode.value, failed=math.nan
+            ))[0]
+            seconds.update(zip(missing, row))
+            # Blocks whose request failed are left out, so the next call retries them
+            self.cache.set(key, {
+                point: value for point, value in seconds.items() if not math.isnan(value)
+            })
+
+        durations = [seconds[candidate.point] for candidate in candidates]
+        unchecked = sum(1 for duration in durations if math.isnan(duration))
+        reachable = sorted(
+            compress(zip(durations, candidates), map(limit.__ge__, durations)),
+            key=lambda item: item[0]
+        )
+        return {
+            "status": "OK" if reachable else "ZERO_RESULTS",
+            "origin": request.origin,
+            "max_minutes": request.max_minutes,
+            "mode": mode.value,
+            "reachable": [self._format(candidate, duration) for duration, candidate in reachable],
+            "checked": len(candidates) - unchecked,
+            "unchecked": unchecked,
+        }
+
+    @staticmethod
+    def _format(candidate: Candidate, duration: float) -> Dict[str, Any]:
+        """Describe a reachable destination."""
+        item: Dict[str, Any] = {"name": candidate.name, "minutes": math.ceil(duration / 60)}
+        if candidate.kind:
+            item["kind"] = candidate.kind
+        if candidate.coordinates is not None:
+            item["location"] = {"lat": candidate.coordinates[0], "lng": candidate.coordinates[1]}
+        return item
@@ -0,0 +1,186 @@
+"""Tool registry for the Georgian Guide application.
+
+This module provides the registry that builds tool implementations from the
+application settings. Tools are created lazily on first use and all Google Maps
+tools share one Maps session (and therefore one connection pool). Tool classes
+may be referenced by import path, so their modules (and whatever they pull in)
+are only imported when a tool is first used.
+"""
+
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Union
+
+from georgian_guide.core.cache import SpatialCache, TTLCache
+from georgian_guide.core.config import Settings
+from georgian_guide.core.gazetteer import get_gazetteer
+from georgian_guide.core.interfaces import ToolInterface
+from georgian_guide.core.opening_hours import OpeningHoursIndex
+from georgian_guide.core.resilience import get_breaker
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.tools.gazetteer import GazetteerGeocodeTool, canonical_geocode_parameters
+from georgian_guide.tools.open_now import HoursRecordingDetailsTool, OpenNowSearchTool
+from georgian_guide.tools.resilient import ResilientTool
+from georgian_guide.tools.reverse_geocode import CellCachedReverseGeocodeTool
+from georgian_guide.tools.session import MapsSession, create_maps_session
+
+# A tool factory is a tool class with a ``from_registry`` classmethod or a
+# callable taking the registry
+ToolFactory = Callable[["ToolRegistry"], ToolInterface]
+
+# Default tool implementations, referenced as "module:attribute" import paths
+DEFAULT_TOOL_PATHS: Dict[ToolType, str] = {
+    ToolType.GEOCODE: "georgian_guide.tools.google_maps:GeocodeMapsTool",
+    ToolType.REVERSE_GEOCODE: "georgian_guide.tools.google_maps:ReverseGeocodeMapsTool",
+    ToolType.SEARCH_PLACES: "georgian_guide.tools.google_maps:SearchPlacesMapsTool",
+    ToolType.PLACE_DETAILS: "georgian_guide.tools.google_maps:PlaceDetailsMapsTool",
+    ToolType.DISTANCE_MATRIX: "georgian_guide.tools.google_maps:DistanceMatrixMapsTool",
+    ToolType.ELEVATION: "georgian_guide.tools.google_maps:ElevationMapsTool",
+    ToolType.DIRECTIONS: "georgian_guide.tools.google_maps:DirectionsMapsTool",
+    ToolType.ITINERARY: "georgian_guide.tools.itinerary:ItineraryTool",
+    ToolType.REACHABILITY: "georgian_guide.tools.reachability:ReachabilityTool",
+    ToolType.KNOWLEDGE: "georgian_guide.tools.knowledge:KnowledgeTool",
+}
+
+
+def import_factory(path: str) -> Any:
+    """Resolve a "module:attribute" import path.
+
+    Args:
+        path: Import path of the tool class or factory function
+
+    Returns:
+        The imported object
+    """
+    module_name, _, attribute = path.partition(":")
+    return getattr(import_module(module_name), attribute)
+
+
+class ToolRegistry(Mapping[ToolType, ToolInterface]):
+    """Mapping of tool types to tools that builds each tool once, on first use."""
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        factories: Optional[Mapping[ToolType, Union[str, ToolFactory]]] = None,
+        session: Optional[MapsSession] = None
+    ):
+        """Initialize the registry.
+
+        Args:
+            settings: Application settings (defaults to settings from the environment)
+            factories: Tool factories or "module:attribute" import paths by tool type
+            session: Maps session to use (defaults to one created from the settings)
+        """
+        self.settings = settings or Settings.from_env()
+        self._factories: Dict[ToolType, Union[str, Any]] = dict(
+            DEFAULT_TOOL_PATHS if factories is None else factories
+        )
+        self._instances: Dict[ToolType, ToolInterface] = {}
+        self._session = session
+        self.cache: TTLCache[Any] = TTLCache(
+            max_size=self.settings.tool_cache_size,
+            ttl=self.settings.tool_cache_ttl,
+            stale_ttl=self.settings.tool_cache_stale_ttl
+        )
+        self.reverse_geocode_cache: SpatialCache[Any] = SpatialCache(
+            precision=self.settings.reverse_geocode_precision,
+            tolerance=self.settings.reverse_geocode_tolerance,
+            max_cells=self.settings.tool_cache_size,
+            ttl=self.settings.tool_cache_ttl
+        )
+        self.opening_hours = OpeningHoursIndex(max_places=self.settings.opening_hours_index_size)
+
+    @property
+    def session(self) -> MapsSession:
+        """Maps session shared by all tools, created on first use."""
+        if self._session is None:
+            self._session = create_maps_session(self.settings)
+        return self._session
+
+    def register(self, tool_type: ToolType, factory: Union[str, ToolFactory]) -> None:
+        """Register (or replace) the factory for a tool type.
+
+        Args:
+            tool_type: Tool type to register
+            factory: Tool factory or "module:attribute" import path
+        """
+        self._factories[tool_type] = factory
+        self._instances.pop(tool_type, None)
+
+    def __getitem__(self, tool_type: ToolType) -> ToolInterface:
+        """Return the tool for a tool type, creating it if necessary."""
+        tool = self._instances.get(tool_type)
+        if tool is None:
+            factory = self._factories[tool_type]
+            if isinstance(factory, str):
+                factory = import_factory(factory)
+            if hasattr(factory, "from_registry"):
+                tool = factory.from_registry(self)
+            else:
+                tool = factory(self)
+            self._instances[tool_type] = tool = self.wrap(tool_type, tool)
+        return tool
+
+    def wrap(self, tool_type: ToolType, tool: ToolInterface) -> ToolInterface:
+        """Wrap a tool that calls an upstream service with the resilience layer.
+
+        Tools declare their upstream with an ``upstream`` attribute; tools
+        without one run locally and are returned unchanged. The geocode tool
+        is additionally fronted by the offline gazetteer, the reverse geocode
+        tool by the spatial cache of nearby lookups, and place searches by the
+        opening hours filter, which place details results feed.
+
+        Args:
+            tool_type: Type of the tool
+            tool: The tool instance
+
+        Returns:
+            The tool, wrapped if it calls an upstream
+        """
+        upstream = getattr(tool, "upstream", None)
+        if upstream is None:
+            return tool
+
+        is_geocode = tool_type == ToolType.GEOCODE and self.settings.gazetteer_enabled
+        tool = ResilientTool(
+            tool,
+            tool_type,
+            cache=self.cache,
+            breaker=get_breaker(upstream),
+            hedge=tool_type in self.settings.hedged_tools,
+            hedge_percentile=self.settings.hedge_percentile,
+            cache_parameters=canonical_geocode_parameters if is_geocode else None
+        )
+        if is_geocode:
+            # Well-known places are geocoded locally, before the cache
+            tool = GazetteerGeocodeTool(
+                tool, get_gazetteer(), min_confidence=self.settings.gazetteer_min_confidence
+            )
+        if tool_type == ToolType.REVERSE_GEOCODE and self.settings.reverse_geocode_tolerance > 0:
+            tool = CellCachedReverseGeocodeTool(tool, self.reverse_geocode_cache)
+        if tool_type == ToolType.PLACE_DETAILS:
+            tool = HoursRecordingDetailsTool(tool, self.opening_hours)
+        if tool_type == ToolType.SEARCH_PLACES:
+            details = self[ToolType.PLACE_DETAILS] if ToolType.PLACE_DETAILS in self else None
+            tool = OpenNowSearchTool(
+                tool, self.opening_hours, details, details_limit=self.settings.open_now_details_limit
+            )
+        return tool
+
+    def __contains__(self, tool_type: object) -> bool:
+        """Check whether a tool type is registered without instantiating it."""
+        return tool_type in self._factories
+
+    def __iter__(self) -> Iterator[ToolType]:
+        """Iterate over the registered tool types."""
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        """Return the number of registered tool types."""
+        return len(self._factories)
+
+    async def aclose(self) -> None:
+        """Close the shared Maps session if it was opened."""
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
@@ -0,0 +1,165 @@
+"""Resilient tool wrapper.
+
+This module wraps upstream-backed tools with a result cache, retries, a
+per-upstream circuit breaker and (for latency-critical tools) hedged requests.
+Concurrent cache misses for the same call share one upstream request.
+When the upstream keeps failing, the last known result is served from the
+stale cache instead of failing the tool call. Under a request deadline, calls
+are cut off when the deadline passes, and a stale result is served right away
+when a typical call would not finish in time.
+
+Place, geocode and elevation results are cached as compact records (see
+``core/records.py``); a fresh result is returned as the upstream sent it, and a
+cached one is expanded back from its record.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+from georgian_guide.core.cache import TTLCache, make_cache_key
+from georgian_guide.core.context import Budget, DeadlineExceeded, get_context, record_cache
+from georgian_guide.core.interfaces import ToolInterface
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.records import pack_result, unpack_result
+from georgian_guide.core.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    call_with_retries,
+    hedged,
+    is_transient,
+)
+from georgian_guide.core.singleflight import SingleFlight
+from georgian_guide.schemas.base import ToolType
+
+
+class ResilientTool(ToolInterface):
+    """Tool wrapper adding caching, retries, circuit breaking and hedging."""
+
+    def __init__(
+        self,
+        tool: ToolInterface,
+        tool_type: ToolType,
+        cache: TTLCache[Any],
+        breaker: CircuitBreaker,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge: bool = False,
+        hedge_percentile: float = 95,
+        cache_parameters: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            tool: The wrapped tool
+            tool_type: Type of the wrapped tool
+            cache: Result cache shared by the tools (holds responses or compact records)
+            breaker: Circuit breaker of the tool's upstream
+            retry_policy: Retry policy (defaults to the process-wide policy)
+            hedge: Whether to hedge slow calls with a duplicate request
+            hedge_percentile: Latency percentile after which to hedge
+            cache_parameters: Function normalizing parameters for the cache key
+        """
+        self.tool = tool
+        self.tool_type = tool_type
+        self.cache = cache
+        self.breaker = breaker
+        self.retry_policy = retry_policy
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.cache_parameters = cache_parameters
+        self.latency = metrics.histogram("tool_latency_seconds", tool=tool_type.value)
+        self.flights: SingleFlight[Dict[str, Any]] = SingleFlight(tool_type.value)
+
+    def cache_key(self, parameters: Dict[str, Any]) -> str:
+        """Return the cache key for a tool call.
+
+        Args:
+            parameters: Tool parameters
+
+        Returns:
+            Cache key
+        """
+        if self.cache_parameters is not None:
+            parameters = self.cache_parameters(parameters)
+        return make_cache_key(self.tool_type.value, parameters)
+
+    async def _attempt(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one attempt, hedged if enabled."""
+        if self.hedge:
+            return await hedged(
+                lambda: self.tool.execute(parameters),
+                self.latency,
+                percentile=self.hedge_percentile
+            )
+        start = time.monotonic()
+        result = await self.tool.execute(parameters)
+        self.latency.observe(time.monotonic() - start)
+        return result
+
+    async def _fetch(self, key: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Call the upstream with retries and cache the result."""
+        result = await call_with_retries(
+            lambda: self._attempt(parameters),
+            breaker=self.breaker,
+            policy=self.retry_policy
+        )
+        self.cache.set(key, pack_result(self.tool_type, result))
+        return result
+
+    async def _call(self, key: str, parameters: Dict[str, Any], budget: Optional[Budget]) -> Dict[str, Any]:
+        """Fetch a result, sharing identical calls in flight, cut off at the request deadline."""
+        def call() -> Any:
+            return self.flights.run(key, lambda: self._fetch(key, parameters))
+
+        if budget is None:
+            return await call()
+        remaining = budget.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"No time left to call {self.tool_type.value}")
+        try:
+            return await asyncio.wait_for(call(), remaining)
+        except asyncio.TimeoutError as e:
+            raise DeadlineExceeded(f"Deadline passed while calling {self.tool_type.value}") from e
+
+    def _stale(self, key: str, budget: Optional[Budget]) -> Optional[Dict[str, Any]]:
+        """Return the stale result for a cache key, if there is one."""
+        stale = unpack_result(self.cache.get_stale(key))
+        if stale is not None:
+            metrics.counter("tool_stale_served_total", tool=self.tool_type.value).inc()
+            if budget is not None:
+                budget.degrade(f"stale:{self.tool_type.value}")
+        return stale
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the wrapped tool.
+
+        Args:
+            parameters: Tool parameters
+
+        Returns:
+            Tool execution results
+        """
+        key = self.cache_key(parameters)
+        cached = unpack_result(self.cache.get(key))
+        record_cache("tools", cached is not None)
+        if cached is not None:
+            metrics.counter("tool_cache_hits_total", tool=self.tool_type.value).inc()
+            return cached
+        metrics.counter("tool_cache_misses_total", tool=self.tool_type.value).inc()
+
+        budget = get_context().budget
+        if budget is not None and budget.remaining() < self.latency.percentile(90):
+            # A typical call would miss the deadline; a stale result beats none
+            stale = self._stale(key, budget)
+            if stale is not None:
+                return stale
+
+        try:
+            return await self._call(key, parameters, budget)
+        except Exception as e:
+            if isinstance(e, CircuitOpenError) or is_transient(e):
+                stale = self._stale(key, budget)
+                if stale is not None:
+                    return stale
+            raise
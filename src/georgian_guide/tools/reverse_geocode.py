@@ -0,0 +1,59 @@
+"""Reverse geocoding from nearby cached lookups.
+
+GPS fixes of a user walking around are never identical, so the exact-key tool
+cache rarely helps reverse geocoding. This module wraps the reverse geocode
+tool with a spatial cache: the address of a point looked up earlier within the
+tolerance radius answers without a Google Maps round-trip.
+"""
+
+from typing import Any, Dict
+
+from georgian_guide.core.cache import SpatialCache
+from georgian_guide.core.context import record_cache
+from georgian_guide.core.interfaces import ToolInterface
+from georgian_guide.core.metrics import metrics
+from georgian_guide.core.records import pack_result, unpack_result
+from georgian_guide.schemas.base import ToolType
+
+
+class CellCachedReverseGeocodeTool(ToolInterface):
+    """Reverse geocode tool answering from nearby cached lookups."""
+
+    def __init__(self, tool: ToolInterface, cache: SpatialCache[Any]):
+        """Initialize the wrapper.
+
+        Args:
+            tool: Reverse geocode tool used when no nearby lookup is cached
+            cache: Spatial cache of reverse geocode results
+        """
+        self.tool = tool
+        self.cache = cache
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Reverse geocode a point.
+
+        Args:
+            parameters: Reverse geocode parameters
+
+        Returns:
+            Reverse geocoding results
+        """
+        try:
+            latitude, longitude = float(parameters["latitude"]), float(parameters["longitude"])
+        except (KeyError, TypeError, ValueError):
+            return await self.tool.execute(parameters)
+
+        nearest = self.cache.nearest(latitude, longitude)
+        record_cache("reverse_geocode", nearest is not None)
+        if nearest is not None:
+            value, _, same_cell = nearest
+            metrics.counter(
+                "reverse_geocode_cell_hits_total", cell="same" if same_cell else "neighbor"
+            ).inc()
+            return unpack_result(value)
+
+        metrics.counter("reverse_geocode_cell_misses_total").inc()
+        result = await self.tool.execute(parameters)
+        if result.get("status") == "OK":
+            self.cache.set(latitude, longitude, pack_result(ToolType.REVERSE_GEOCODE, result))
+        return result
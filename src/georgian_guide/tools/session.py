@@ -0,0 +1,229 @@
+"""Shared Google Maps backend session.
+
+This module defines the backends that Google Maps tools call into and the
+session object that all tools share. The session owns the single pooled
+connection to the backend and enforces per-tool concurrency limits.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from georgian_guide.core.config import Settings
+from georgian_guide.core.scheduler import get_scheduler
+from georgian_guide.schemas.base import ToolType
+
+
+class MapsBackend(ABC):
+    """Abstract interface for a Google Maps backend."""
+
+    # Whether responses come straight from Google and can skip schema validation
+    trusted = False
+
+    @abstractmethod
+    async def call(self, function_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a Google Maps function.
+
+        Args:
+            function_name: The name of the MCP function to call
+            parameters: Parameters for the function
+
+        Returns:
+            Function response
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """Release the resources held by the backend."""
+        pass
+
+
+def _format_location(location: Dict[str, float]) -> str:
+    """Format a {latitude, longitude} dict as a "lat,lng" string."""
+    return f"{location['latitude']},{location['longitude']}"
+
+
+# MCP function name -> (Google Maps web service path, parameter builder)
+HTTP_ENDPOINTS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "mcp_google_maps_maps_geocode": (
+        "geocode/json",
+        lambda p: {"address": p["address"]},
+    ),
+    "mcp_google_maps_maps_reverse_geocode": (
+        "geocode/json",
+        lambda p: {"latlng": f"{p['latitude']},{p['longitude']}"},
+    ),
+    "mcp_google_maps_maps_search_places": (
+        "place/textsearch/json",
+        lambda p: {
+            "query": p["query"],
+            **({"location": _format_location(p["location"])} if "location" in p else {}),
+            **({"radius": p["radius"]} if "radius" in p else {}),
+        },
+    ),
+    "mcp_google_maps_maps_place_details": (
+        "place/details/json",
+        lambda p: {"place_id": p["place_id"]},
+    ),
+    "mcp_google_maps_maps_distance_matrix": (
+        "distancematrix/json",
+        lambda p: {
+            "origins": "|".join(p["origins"]),
+            "destinations": "|".join(p["destinations"]),
+            **({"mode": p["mode"]} if "mode" in p else {}),
+        },
+    ),
+    "mcp_google_maps_maps_elevation": (
+        "elevation/json",
+        lambda p: {"locations": "|".join(_format_location(loc) for loc in p["locations"])},
+    ),
+    "mcp_google_maps_maps_directions": (
+        "directions/json",
+        lambda p: {
+            "origin": p["origin"],
+            "destination": p["destination"],
+            **({"mode": p["mode"]} if "mode" in p else {}),
+        },
+    ),
+}
+
+
+class HTTPMapsBackend(MapsBackend):
+    """Backend calling the Google Maps web services over one pooled HTTP client."""
+
+    base_url = "https://maps.googleapis.com/maps/api/"
+    trusted = True
+
+    def __init__(self, settings: Settings):
+        """Initialize the backend.
+
+        Args:
+            settings: Application settings
+        """
+        if not settings.google_maps_api_key:
+            raise ValueError("GOOGLE_MAPS_API_KEY is required for the 'http' Maps backend")
+
+        import httpx
+
+        self.api_key = settings.google_maps_api_key
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=settings.maps_timeout,
+            # HTTP/2 lets concurrent tool calls share one multiplexed connection
+            http2=settings.maps_http2 and find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=settings.maps_max_connections,
+                max_keepalive_connections=settings.maps_max_keepalive,
+                keepalive_expiry=settings.maps_keepalive_expiry,
+            ),
+        )
+
+    async def call(self, function_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a Google Maps web service.
+
+        Args:
+            function_name: The name of the MCP function to call
+            parameters: Parameters for the function
+
+        Returns:
+            Web service response
+        """
+        if function_name not in HTTP_ENDPOINTS:
+            raise ValueError(f"Unknown MCP function: {function_name}")
+
+        path, build_params = HTTP_ENDPOINTS[function_name]
+        response = await self.client.get(
+            path,
+            params={**build_params(parameters), "key": self.api_key}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.client.aclose()
+
+
+class MapsSession:
+    """Backend session shared by all Google Maps tools.
+
+    Every call is first admitted by the upstream scheduler (rate limits and
+    priorities) and then goes through a per-tool semaphore so that one tool
+    type cannot monopolise the shared connection pool.
+    """
+
+    def __init__(
+        self,
+        backend: MapsBackend,
+        concurrency: Optional[Mapping[ToolType, int]] = None,
+        default_concurrency: int = 8
+    ):
+        """Initialize the session.
+
+        Args:
+            backend: Backend that executes the calls
+            concurrency: Maximum concurrent calls per tool type
+            default_concurrency: Maximum concurrent calls for other tool types
+        """
+        self.backend = backend
+        self.concurrency = dict(concurrency or {})
+        self.default_concurrency = default_concurrency
+        self._semaphores: Dict[ToolType, asyncio.Semaphore] = {}
+
+    def _semaphore(self, tool_type: ToolType) -> asyncio.Semaphore:
+        """Return the semaphore limiting calls for a tool type."""
+        semaphore = self._semaphores.get(tool_type)
+        if semaphore is None:
+            limit = self.concurrency.get(tool_type, self.default_concurrency)
+            semaphore = self._semaphores[tool_type] = asyncio.Semaphore(limit)
+        return semaphore
+
+    async def call(
+        self,
+        tool_type: ToolType,
+        function_name: str,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Call a Google Maps function on behalf of a tool.
+
+        Args:
+            tool_type: Type of the calling tool
+            function_name: The name of the MCP function to call
+            parameters: Parameters for the function
+
+        Returns:
+            Function response
+        """
+        await get_scheduler().acquire("google_maps", tool_type.value)
+        async with self._semaphore(tool_type):
+            return await self.backend.call(function_name, parameters)
+
+    async def aclose(self) -> None:
+        """Close the underlying backend."""
+        await self.backend.aclose()
+
+
+def create_maps_session(settings: Settings) -> MapsSession:
+    """Create the shared Maps session described by the settings.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Maps session
+    """
+    if settings.maps_backend == "http":
+        backend: MapsBackend = HTTPMapsBackend(settings)
+    elif settings.maps_backend == "mcp":
+        from georgian_guide.tools.google_maps import MCPMapsBackend
+
+        backend = MCPMapsBackend()
+    else:
+        raise ValueError(f"Unknown Maps backend: {settings.maps_backend}")
+
+    return MapsSession(
+        backend,
+        concurrency=settings.tool_concurrency,
+        default_concurrency=settings.default_tool_concurrency
+    )
@@ -0,0 +1,106 @@
+"""Cache warm-up command for the Georgian Guide application.
+
+Run at deploy time to precompute answers to the most frequent queries and
+write them to a cache snapshot that API workers load at startup::
+
+    python -m georgian_guide.warmup --output cache.snapshot --queries queries.jsonl
+
+Like the CLI, only lightweight modules are imported before the arguments are
+parsed.
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import List, Optional
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser.
+
+    Returns:
+        Argument parser
+    """
+    parser = argparse.ArgumentParser(description="Warm the Georgian Guide caches")
+    parser.add_argument("--output", required=True, help="Snapshot file to write")
+    parser.add_argument(
+        "--queries",
+        help="Query file (text lines or a JSONL query log); defaults to the curated popular queries"
+    )
+    parser.add_argument("--top", type=int, default=200, help="Number of most frequent queries to run")
+    parser.add_argument("--concurrency", type=int, default=4, help="Queries processed at once")
+    parser.add_argument(
+        "--report",
+        help="Query log the coverage report is computed against (defaults to --queries)"
+    )
+    parser.add_argument("--knowledge-index", help="Also write the knowledge index to this file")
+    return parser
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Warm the caches and write the snapshot.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    from georgian_guide.core.factory import (
+        create_processor,
+        create_tool_registry,
+        load_environment,
+    )
+    from georgian_guide.core.knowledge import save_index
+    from georgian_guide.core.snapshot import processor_caches, save_snapshot
+    from georgian_guide.core.warmup import coverage_report, read_queries, top_queries, warm_up
+    from georgian_guide.data.knowledge import KNOWLEDGE
+    from georgian_guide.data.popular_queries import POPULAR_QUERIES
+    from georgian_guide.schemas.query import UserQuery
+
+    try:
+        load_environment()
+    except ValueError as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+
+    if args.queries:
+        queries = read_queries(args.queries)
+    else:
+        queries = [UserQuery(query=text) for text in POPULAR_QUERIES]
+    selected = top_queries(queries, args.top)
+
+    tools = create_tool_registry()
+    processor = create_processor(tools=tools)
+    try:
+        print(f"Warming caches with {len(selected)} queries...")
+        result = await warm_up(processor, selected, args.concurrency)
+    finally:
+        await tools.aclose()
+
+    counts = save_snapshot(args.output, processor_caches(processor))
+    print(
+        f"Answered {result.succeeded} queries ({result.failed} failed, "
+        f"{result.uncached} not cacheable) in {result.seconds:.1f}s"
+    )
+    print("Snapshot entries: " + ", ".join(f"{name}={count}" for name, count in counts.items()))
+    if args.knowledge_index:
+        size = save_index(args.knowledge_index, KNOWLEDGE)
+        print(f"Knowledge index: {size} bytes")
+
+    report_path = args.report or args.queries
+    if report_path:
+        distribution = read_queries(report_path)
+        print()
+        print(coverage_report(result.warmed, distribution).format())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the warm-up command.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    args = build_parser().parse_args(argv)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Tests for cancellation and shared in-flight calls."""
+
+import asyncio
+
+import pytest
+
+from georgian_guide.api.main import ClientDisconnected, unless_disconnected
+from georgian_guide.core.context import (
+    Priority,
+    RequestTrace,
+    get_context,
+    report_stage,
+    request_context,
+)
+from georgian_guide.core.singleflight import SingleFlight
+
+
+def test_shared_call_survives_until_its_last_waiter_leaves():
+    """Test that one cancelled waiter does not cancel work others still need."""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "routed"
+
+    async def run():
+        flights = SingleFlight("test")
+        first = asyncio.ensure_future(flights.run("q", fetch))
+        second = asyncio.ensure_future(flights.run("q", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        result = await second
+
+        third = asyncio.ensure_future(flights.run("q", fetch))
+        await asyncio.sleep(0.01)
+        third.cancel()
+        await asyncio.gather(third, return_exceptions=True)
+        await asyncio.sleep(0)
+        return first, result, len(flights)
+
+    first, result, in_flight = asyncio.run(run())
+
+    assert first.cancelled() and result == "routed"
+    assert len(calls) == 2 and in_flight == 0
+
+
+def test_shared_call_runs_in_its_own_context_at_the_waiters_priority():
+    """Test that the shared call carries no request state of its first caller."""
+    trace, stages, seen = RequestTrace(), [], []
+
+    async def fetch():
+        seen.append(get_context().priority)
+        await asyncio.sleep(0.02)
+        seen.append(get_context().priority)
+        report_stage("fetching")
+        return get_context()
+
+    async def run():
+        flights = SingleFlight("test")
+        with request_context(priority=Priority.PREFETCH, trace=trace, stage_callback=stages.append):
+            first = asyncio.ensure_future(flights.run("q", fetch))
+        await asyncio.sleep(0.01)
+        with request_context(priority=Priority.INTERACTIVE):
+            second = asyncio.ensure_future(flights.run("q", fetch))
+        return await asyncio.gather(first, second)
+
+    context, _ = asyncio.run(run())
+
+    assert seen == [Priority.PREFETCH, Priority.INTERACTIVE]
+    assert context.trace is None and context.stage_callback is None and context.budget is None
+    assert stages == [] and trace.stages == []
+
+
+def test_work_is_cancelled_when_the_client_disconnects():
+    """Test that a disconnect cancels the work and unwinds it."""
+    unwound = []
+
+    class DisconnectingRequest:
+        def __init__(self, after):
+            self.messages = [{"type": "http.request", "body": b""}]
+            self.after = after
+
+        async def receive(self):
+            if self.messages:
+                return self.messages.pop()
+            await asyncio.sleep(self.after)
+            return {"type": "http.disconnect"}
+
+    async def work():
+        try:
+            await asyncio.sleep(1)
+        finally:
+            unwound.append(True)
+        return "answer"
+
+    with pytest.raises(ClientDisconnected):
+        asyncio.run(unless_disconnected(DisconnectingRequest(0.01), work()))
+    assert unwound == [True]
+
+    async def quick():
+        return "answer"
+
+    assert asyncio.run(unless_disconnected(DisconnectingRequest(1), quick())) == "answer"
@@ -0,0 +1,106 @@
+"""Tests for deadline-aware query processing."""
+
+import asyncio
+
+from georgian_guide.core.cache import TTLCache
+from georgian_guide.core.context import Budget, request_context
+from georgian_guide.core.interfaces import OutputReceiverInterface, ToolInterface
+from georgian_guide.core.processor import QueryProcessor
+from georgian_guide.core.resilience import CircuitBreaker, RetryPolicy
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import AssistantResponse, UserQuery
+from georgian_guide.tools.resilient import ResilientTool
+from tests.test_processor import StubRouter, tool_call
+
+PLACES = {"status": "OK", "results": [
+    {"name": "Zakhar Zakharich", "formatted_address": "Tbilisi", "rating": 4.6},
+]}
+
+
+class SlowTool(ToolInterface):
+    """Tool answering after a delay."""
+
+    def __init__(self, delay, result):
+        self.delay = delay
+        self.result = result
+        self.calls = 0
+
+    async def execute(self, parameters):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+class SlowReceiver(OutputReceiverInterface):
+    """Output receiver taking longer than any deadline in these tests."""
+
+    async def process_results(self, query, tool_results):
+        await asyncio.sleep(5)
+        return AssistantResponse(response="too late")
+
+
+def run(processor, query, seconds):
+    async def process():
+        with request_context(budget=Budget.start(seconds)):
+            return await processor.process_query(query)
+    return asyncio.run(process())
+
+
+def test_slow_answer_falls_back_to_template():
+    """Test that the answer is rendered from the tool results at the deadline."""
+    router = StubRouter([tool_call(ToolType.SEARCH_PLACES, query="khinkali")])
+    processor = QueryProcessor(
+        router,
+        SlowReceiver(),
+        {ToolType.SEARCH_PLACES: SlowTool(0, PLACES)},
+        response_cache=TTLCache()
+    )
+
+    response = run(processor, UserQuery(query="khinkali"), 0.2)
+
+    assert "Zakhar Zakharich — Tbilisi (★ 4.6)" in response.response
+    assert response.degraded and response.degraded_parts == ["answer"]
+    assert len(processor.response_cache) == 0
+
+
+def test_optional_tool_is_dropped_or_served_stale_when_it_would_not_fit():
+    """Test that a typically slow optional tool does not hold up the answer."""
+    cache = TTLCache(ttl=0.0, stale_ttl=60.0)
+    elevation = SlowTool(3.0, {"status": "OK", "results": []})
+    tools = {
+        ToolType.SEARCH_PLACES: SlowTool(0, PLACES),
+        ToolType.ELEVATION: ResilientTool(
+            elevation,
+            ToolType.ELEVATION,
+            cache,
+            CircuitBreaker("test"),
+            RetryPolicy(max_attempts=1)
+        ),
+    }
+    router = StubRouter([
+        tool_call(ToolType.SEARCH_PLACES, query="Kazbegi"),
+        tool_call(ToolType.ELEVATION, locations=[{"latitude": 42.66, "longitude": 44.64}]),
+    ])
+
+    class Receiver(OutputReceiverInterface):
+        async def process_results(self, query, tool_results):
+            self.tool_results = tool_results
+            return AssistantResponse(response="ok")
+
+    receiver = Receiver()
+    processor = QueryProcessor(
+        router, receiver, tools, output_reserve=1.0, tool_latency=lambda tool_type: 3.0
+    )
+
+    response = run(processor, UserQuery(query="Kazbegi"), 2.0)
+    assert response.degraded_parts == ["tool:elevation"]
+    assert elevation.calls == 0
+
+    stale = {"status": "OK", "results": [{"elevation": 1740.0}]}
+    key = tools[ToolType.ELEVATION].cache_key(
+        {"locations": [{"latitude": 42.66, "longitude": 44.64}]}
+    )
+    cache.set(key, stale)
+    response = run(processor, UserQuery(query="Kazbegi"), 2.0)
+    assert response.degraded_parts == ["stale:elevation"]
+    assert receiver.tool_results[1].result == stale
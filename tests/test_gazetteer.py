@@ -0,0 +1,70 @@
+"""Tests for the gazetteer and place name normalization."""
+
+import asyncio
+
+from georgian_guide.core.gazetteer import get_gazetteer
+from georgian_guide.core.text import canonical_key, transliterate
+from georgian_guide.tools.gazetteer import GazetteerGeocodeTool, canonical_geocode_parameters
+
+
+def test_spelling_variants_share_a_canonical_key():
+    """Test that Georgian, Cyrillic and Latin spellings fold together."""
+    assert transliterate("მცხეთა") == "mtskheta"
+    assert {canonical_key(name) for name in ("Mtskheta", "Mcxeta", "მცხეთა", "Мцхета")} == {"mcxeta"}
+    assert canonical_key("Sighnaghi") == canonical_key("Signagi")
+
+
+def test_resolve_addresses():
+    """Test exact, fuzzy, contextual and rejected lookups."""
+    gazetteer = get_gazetteer()
+
+    assert gazetteer.resolve("Kazbegi").entry.name == "Stepantsminda"
+    assert gazetteer.resolve("Liberty Square, Tbilisi, Georgia").entry.name == "Freedom Square"
+
+    fuzzy = gazetteer.resolve("Tbilsi")
+    assert fuzzy.entry.name == "Tbilisi" and 0.8 <= fuzzy.confidence < 1.0
+
+    # House numbers and places in another city are left to Google
+    assert gazetteer.resolve("12 Rustaveli Ave, Tbilisi") is None
+    assert gazetteer.resolve("Rustaveli Avenue, Batumi") is None
+
+
+def test_other_scripts_keep_distinct_cache_keys():
+    """Test that addresses without a canonical form do not share a cache key."""
+    keys = {
+        canonical_geocode_parameters({"address": address})["address"]
+        for address in ("東京タワー", "Երևան", "القاهرة")
+    }
+    assert len(keys) == 3 and "" not in keys
+    assert canonical_geocode_parameters({"address": "Мцхета"})["address"] == "mcxeta"
+
+
+def test_house_numbers_keep_distinct_cache_keys():
+    """Test that addresses differing only in their house number do not share a cache key."""
+    groups = [
+        ("Rustaveli Avenue 1, Tbilisi", "Rustaveli Avenue 11, Tbilisi", "Rustaveli Avenue 111, Tbilisi"),
+        ("Chavchavadze Ave 100", "Chavchavadze Ave 10"),
+        ("Marjanishvili 5", "Marjanishvili 55"),
+    ]
+    for addresses in groups:
+        keys = {canonical_geocode_parameters({"address": address})["address"] for address in addresses}
+        assert len(keys) == len(addresses)
+
+
+def test_only_near_exact_matches_are_geocoded_locally():
+    """Test that short near-misses go to Google instead of a namesake."""
+
+    class UpstreamGeocode:
+        def __init__(self):
+            self.addresses = []
+
+        async def execute(self, parameters):
+            self.addresses.append(parameters["address"])
+            return {"status": "OK", "results": []}
+
+    upstream = UpstreamGeocode()
+    tool = GazetteerGeocodeTool(upstream, get_gazetteer())
+    for address in ("Tel Aviv", "Gori Fortress", "Gelato", "Goris", "Sanaki", "Mtskheta", "Svetitskoveli"):
+        asyncio.run(tool.execute({"address": address}))
+
+    assert upstream.addresses == ["Tel Aviv", "Gori Fortress", "Gelato", "Goris", "Sanaki"]
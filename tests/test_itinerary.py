@@ -0,0 +1,119 @@
+"""Tests for the itinerary planner and tool."""
+
+import asyncio
+import itertools
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from georgian_guide.core.itinerary import ItineraryPlanner, Stop
+from georgian_guide.core.opening_hours import WeeklyHours
+from georgian_guide.tools.itinerary import ItineraryTool
+from georgian_guide.tools.matrix import MAX_MATRIX_ELEMENTS
+
+MONDAY_9AM = 1 * 24 * 60 + 9 * 60
+
+
+def random_travel(count, seed):
+    """Build a random asymmetric travel-time matrix for count points."""
+    rng = random.Random(seed)
+    return [[0 if i == j else rng.randint(5, 90) for j in range(count)] for i in range(count)]
+
+
+def test_held_karp_matches_brute_force():
+    """Test that the exact solver finds the optimal order."""
+    travel = random_travel(7, seed=1)
+    stops = [Stop(f"s{i}", visit_minutes=30) for i in range(6)]
+    planner = ItineraryPlanner(travel, stops, MONDAY_9AM)
+
+    best = min(
+        planner.schedule(order).finish for order in itertools.permutations(range(6))
+    )
+    plan = planner.solve()
+
+    assert plan.solver == "held_karp"
+    assert plan.finish == best
+
+
+def test_opening_hours_reorder_stops():
+    """Test that a stop opening late is visited last even if it is closest."""
+    travel = [[0, 10, 20], [10, 0, 10], [20, 10, 0]]
+    opens_at_noon = WeeklyHours.from_google({"periods": [
+        {"open": {"day": day, "time": "1200"}, "close": {"day": day, "time": "1800"}}
+        for day in range(7)
+    ]})
+    stops = [Stop("museum", 60, opens_at_noon), Stop("park", 60)]
+
+    plan = ItineraryPlanner(travel, stops, MONDAY_9AM, return_to_start=False).solve()
+
+    assert [stops[visit.stop].name for visit in plan.visits] == ["park", "museum"]
+    assert all(visit.open for visit in plan.visits)
+
+
+def test_local_search_for_many_stops():
+    """Test that larger trips use local search and beat the greedy tour."""
+    travel = random_travel(16, seed=2)
+    planner = ItineraryPlanner(travel, [Stop(f"s{i}", 0) for i in range(15)], MONDAY_9AM)
+
+    plan = planner.solve()
+
+    assert plan.solver == "local_search"
+    assert sorted(plan.order) == list(range(15))
+    assert plan.finish <= planner.nearest_neighbour().finish
+
+
+class FakeMatrixTool:
+    """Distance matrix tool answering with 10 minutes between different points."""
+
+    def __init__(self, blocked=()):
+        self.calls = []
+        # (origin, destination) pairs without a route, besides any leg to "Nowhere"
+        self.blocked = set(blocked)
+
+    async def execute(self, parameters):
+        self.calls.append(parameters)
+        return {
+            "status": "OK",
+            "rows": [
+                {"elements": [
+                    {"status": "OK" if "Nowhere" not in (o, d) and (o, d) not in self.blocked else "ZERO_RESULTS",
+                     "duration": {"value": 0 if o == d else 600},
+                     "distance": {"value": 1000}}
+                    for d in parameters["destinations"]
+                ]}
+                for o in parameters["origins"]
+            ],
+        }
+
+
+def test_tool_batches_matrix_and_reports_unreachable_stops():
+    """Test the itinerary tool end to end with a fake matrix tool."""
+    matrix_tool = FakeMatrixTool()
+    tool = ItineraryTool(matrix_tool)
+    stops = [{"name": f"Stop {i}", "visit_minutes": 30} for i in range(10)] + [{"name": "Nowhere"}]
+
+    result = asyncio.run(tool.execute({"origin": "Tbilisi", "stops": stops, "start_time": "09:00"}))
+
+    assert all(
+        len(call["origins"]) * len(call["destinations"]) <= MAX_MATRIX_ELEMENTS
+        for call in matrix_tool.calls
+    )
+    assert len(result["stops"]) == 10
+    assert result["unreachable"] == ["Nowhere"]
+    assert result["total_travel_min"] == 110
+
+
+def test_tool_drops_stops_cut_off_from_other_stops():
+    """Test that stops reachable only from the origin are reported, not scheduled."""
+    matrix_tool = FakeMatrixTool(blocked={("Stop 0", "Island"), ("Island", "Stop 0"), ("Island", "Stop 1")})
+    tool = ItineraryTool(matrix_tool)
+    stops = [{"name": "Stop 0"}, {"name": "Island"}, {"name": "Stop 1"}]
+
+    result = asyncio.run(tool.execute({"origin": "Tbilisi", "stops": stops, "start_time": "09:00"}))
+
+    assert [stop["name"] for stop in result["stops"]] in (["Stop 0", "Stop 1"], ["Stop 1", "Stop 0"])
+    assert result["unreachable"] == ["Island"]
+
+    with pytest.raises(ValidationError):
+        asyncio.run(tool.execute({"origin": "Tbilisi", "stops": stops, "start_time": "9am"}))
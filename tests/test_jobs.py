@@ -0,0 +1,160 @@
+"""Tests for the asynchronous job queue."""
+
+import asyncio
+
+import pytest
+
+from georgian_guide.core.context import Priority, get_context, report_stage
+from georgian_guide.core.interfaces import QueryProcessorInterface
+from georgian_guide.core.jobs import InvalidCallbackUrl, JobQueue, JobQueueFull, JobStore, check_callback_url
+from georgian_guide.core.scheduler import SchedulerQueueFull
+from georgian_guide.schemas.jobs import JobRequest, JobStatus
+from georgian_guide.schemas.query import AssistantResponse
+
+
+class StubProcessor(QueryProcessorInterface):
+    """Processor answering with the query text and recording stages."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.priorities = []
+
+    async def process_query(self, query):
+        self.priorities.append(get_context().priority)
+        report_stage("routing")
+        if self.fail:
+            raise ValueError("boom")
+        return AssistantResponse(response=f"answer: {query.query}")
+
+
+async def wait_finished(queue, job_id):
+    """Poll a job until it leaves the queued and running states."""
+    for _ in range(200):
+        job = await queue.get(job_id)
+        if job.status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_job_runs_at_batch_priority_and_notifies():
+    """Test that a job is answered, records its stage and is sent to its callback."""
+    processor = StubProcessor()
+    notified = []
+
+    async def notify(url, job):
+        notified.append((url, job.status))
+
+    async def run():
+        queue = JobQueue(JobStore(":memory:"), processor, workers=2, notify=notify)
+        queue.start()
+        job = await queue.submit(JobRequest(query="Tbilisi", callback_url="http://hook"))
+        assert job.status == JobStatus.QUEUED
+        finished = await wait_finished(queue, job.job_id)
+        await queue.stop()
+        return finished
+
+    job = asyncio.run(run())
+
+    assert job.result.response == "answer: Tbilisi"
+    assert job.stage == "routing"
+    assert processor.priorities == [Priority.BATCH]
+    assert notified == [("http://hook", JobStatus.SUCCEEDED)]
+
+
+def test_failed_job_records_error():
+    """Test that a processing error marks the job failed."""
+    async def run():
+        queue = JobQueue(JobStore(":memory:"), StubProcessor(fail=True), workers=1)
+        queue.start()
+        job = await queue.submit(JobRequest(query="Batumi"))
+        finished = await wait_finished(queue, job.job_id)
+        await queue.stop()
+        return finished
+
+    job = asyncio.run(run())
+
+    assert job.status == JobStatus.FAILED
+    assert job.error == "boom"
+
+
+def test_jobs_survive_restart(tmp_path):
+    """Test that a job queued before a restart is processed afterwards."""
+    path = str(tmp_path / "jobs.sqlite3")
+
+    async def submit():
+        store = JobStore(path)
+        job = await JobQueue(store, StubProcessor()).submit(JobRequest(query="Mtskheta"))
+        store.close()
+        return job.job_id
+
+    async def restart(job_id):
+        queue = JobQueue(JobStore(path), StubProcessor(), workers=1)
+        queue.start()
+        finished = await wait_finished(queue, job_id)
+        await queue.stop()
+        return finished
+
+    job_id = asyncio.run(submit())
+    job = asyncio.run(restart(job_id))
+
+    assert job.status == JobStatus.SUCCEEDED
+    assert job.result.response == "answer: Mtskheta"
+
+
+def test_expired_lease_is_reclaimed_and_queue_is_bounded():
+    """Test lease expiry and the bound on queued jobs."""
+    store = JobStore(":memory:")
+    store.create(JobRequest(query="Kutaisi"), max_queued=1)
+    try:
+        store.create(JobRequest(query="Gori"), max_queued=1)
+    except JobQueueFull:
+        pass
+    else:
+        raise AssertionError("queue bound not enforced")
+
+    job_id, _, attempt = store.claim(lease_seconds=-1)
+    assert attempt == 1
+    # The lease already expired, as if the worker had died
+    reclaimed_id, _, attempt = store.claim(lease_seconds=60)
+    assert reclaimed_id == job_id
+    assert attempt == 2
+    assert store.claim(lease_seconds=60) is None
+
+
+def test_load_shed_requeues_keep_their_attempts():
+    """Test that jobs put back because of overload are not failed as interrupted."""
+
+    class OverloadedProcessor(StubProcessor):
+        def __init__(self):
+            super().__init__()
+            self.rejections = 4
+
+        async def process_query(self, query):
+            if self.rejections:
+                self.rejections -= 1
+                raise SchedulerQueueFull("busy")
+            return await super().process_query(query)
+
+    async def run():
+        queue = JobQueue(JobStore(":memory:"), OverloadedProcessor(), workers=1, poll_interval=0.01)
+        queue.start()
+        job = await queue.submit(JobRequest(query="Zugdidi"))
+        finished = await wait_finished(queue, job.job_id)
+        await queue.stop()
+        return finished
+
+    job = asyncio.run(run())
+
+    assert job.status == JobStatus.SUCCEEDED
+
+
+def test_callback_urls_must_be_public_http():
+    """Test the callback URL checks."""
+    assert check_callback_url("https://hooks.example.com/done") == "hooks.example.com"
+    for url in ("ftp://example.com/", "http://localhost:8000/", "http://169.254.169.254/", "http://10.0.0.5/"):
+        with pytest.raises(InvalidCallbackUrl):
+            check_callback_url(url)
+    assert check_callback_url("http://jobs-sink:8080/", ["jobs-sink"]) == "jobs-sink"
+    with pytest.raises(InvalidCallbackUrl):
+        check_callback_url("https://hooks.example.com/", ["jobs-sink"])
@@ -0,0 +1,41 @@
+"""Tests for the knowledge index and tool."""
+
+import asyncio
+
+from georgian_guide.core.knowledge import KnowledgeIndex, bound_snippet, build_index, save_index
+from georgian_guide.data.knowledge import KNOWLEDGE
+from georgian_guide.tools.knowledge import KnowledgeTool
+
+
+def test_search_ranks_matching_passages_first(tmp_path):
+    """Test ranking, script-independent queries and the index file round trip."""
+    index = KnowledgeIndex(build_index(KNOWLEDGE))
+
+    assert index.search("What is supra etiquette?")[0].title == "Supra etiquette"
+    assert index.search("When should I go to Svaneti?")[0].title == "Best season for Svaneti"
+    # Georgian-script queries are transliterated like the corpus
+    assert index.search("სუფრა")[0].title == "Supra etiquette"
+    assert index.search("zzzz") == []
+
+    path = tmp_path / "knowledge.index"
+    assert save_index(str(path), KNOWLEDGE) == path.stat().st_size
+    opened = KnowledgeIndex.open(str(path))
+    assert len(opened) == len(index)
+    assert opened.search("tipping") == index.search("tipping")
+
+
+def test_knowledge_tool_bounds_passages():
+    """Test that the tool returns bounded passages."""
+    tool = KnowledgeTool(KnowledgeIndex(build_index(KNOWLEDGE)), snippet_chars=120)
+
+    result = asyncio.run(tool.execute({"query": "can I drink tap water", "top_k": 5}))
+    assert result["status"] == "OK"
+    assert all(len(passage["text"]) <= 120 for passage in result["passages"])
+
+    empty = asyncio.run(tool.execute({"query": "zzzz"}))
+    assert empty == {"status": "ZERO_RESULTS", "passages": []}
+
+    text = "First sentence here. Second sentence that runs on for quite a while."
+    assert bound_snippet(text, 30) == "First sentence here."
+    assert bound_snippet(text, 40) == "First sentence here. Second sentence…"
+    assert bound_snippet(text, len(text)) == text
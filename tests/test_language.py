@@ -0,0 +1,53 @@
+"""Tests for response language handling."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from georgian_guide.core.cache import TTLCache
+from georgian_guide.core.language import message, resolve_language
+from georgian_guide.llm.router import OpenAILLMRouter
+from georgian_guide.schemas.query import UserQuery
+
+
+class RecordingCompletions:
+    """Fake chat completions API recording the system prompts it receives."""
+
+    def __init__(self):
+        self.system_prompts = []
+
+    async def create(self, model, messages, **kwargs):
+        self.system_prompts.append(messages[0]["content"])
+        content = json.dumps({"selected_tools": [], "query_analysis": ""})
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=None,
+        )
+
+
+def test_resolve_language():
+    """Test explicit, aliased, detected and unsupported languages."""
+    assert resolve_language("ka-GE", "Where is Mtskheta?") == "ka"
+    assert resolve_language("Russian", "Where is Mtskheta?") == "ru"
+    assert resolve_language(None, "სად არის მცხეთა?") == "ka"
+    assert resolve_language(None, "Где находится Мцхета?") == "ru"
+    assert resolve_language("de", "Wo ist Mtskheta?") == "en"
+    assert message("output_error", "ka", error="x").startswith("ბოდიში")
+
+
+def test_router_prompts_and_cache_are_partitioned_by_language():
+    """Test that the same query is routed separately for each language."""
+    completions = RecordingCompletions()
+    router = OpenAILLMRouter(models=["small"], cache=TTLCache())
+    router._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    async def run():
+        await router.route(UserQuery(query="სად არის მცხეთა?", language=None))
+        await router.route(UserQuery(query="სად  არის მცხეთა?", language="ka"))
+        await router.route(UserQuery(query="სად არის მცხეთა?", language="en"))
+
+    asyncio.run(run())
+
+    assert len(completions.system_prompts) == 2
+    assert completions.system_prompts[0].rstrip().endswith("in Georgian.")
+    assert completions.system_prompts[1].rstrip().endswith("in English.")
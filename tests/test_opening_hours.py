@@ -0,0 +1,49 @@
+"""Tests for the opening hours index."""
+
+import random
+from datetime import datetime, timedelta
+
+from georgian_guide.core.opening_hours import (
+    SLOT_MINUTES,
+    WEEK_MINUTES,
+    OpeningHoursIndex,
+    WeeklyHours,
+    tbilisi_tz,
+)
+
+
+def random_hours(rng):
+    """Build Google opening hours with quarter-hour open and close times."""
+    periods = []
+    for day in rng.sample(range(7), rng.randint(1, 7)):
+        opens = rng.randrange(0, 96) * SLOT_MINUTES
+        closes = (opens + rng.randint(1, 60) * SLOT_MINUTES) % (24 * 60)
+        close_day = (day + 1) % 7 if closes <= opens else day
+        periods.append({
+            "open": {"day": day, "time": f"{opens // 60:02d}{opens % 60:02d}"},
+            "close": {"day": close_day, "time": f"{closes // 60:02d}{closes % 60:02d}"},
+        })
+    return {"periods": periods}
+
+
+def test_index_matches_weekly_hours():
+    """Test that the slot bitsets answer like the interval lists, across places and times."""
+    rng = random.Random(7)
+    index = OpeningHoursIndex(max_places=150)
+    hours = {}
+    for number in range(200):
+        google = random_hours(rng)
+        hours[f"p{number}"] = WeeklyHours.from_google(google)
+        assert index.add_google(f"p{number}", google)
+    assert not index.add_google("closed", {"weekday_text": []})
+
+    # The older half was dropped when the index filled up
+    assert len(index) == 125 and "p0" not in index and "p199" in index
+    for _ in range(50):
+        minute = rng.randrange(WEEK_MINUTES)
+        expected = [place_id for place_id in hours if place_id in index and hours[place_id].is_open(minute)]
+        # 7 January 2024 was a Sunday
+        moment = datetime(2024, 1, 7, tzinfo=tbilisi_tz()) + timedelta(minutes=minute)
+        open_places, unknown = index.filter_open(list(hours), moment)
+        assert open_places == expected
+        assert unknown == [place_id for place_id in hours if place_id not in index]
@@ -0,0 +1,113 @@
+"""Tests for the query processor."""
+
+import asyncio
+
+from georgian_guide.core.interfaces import (
+    OutputReceiverInterface,
+    RouterInterface,
+    ToolInterface,
+)
+from georgian_guide.core.processor import QueryProcessor
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import (
+    AssistantResponse,
+    RouterResponse,
+    ToolCall,
+    ToolParameter,
+    UserQuery,
+)
+
+
+def tool_call(tool_type, **parameters):
+    """Build a tool call with the given parameters."""
+    return ToolCall(
+        tool_type=tool_type,
+        parameters=[ToolParameter(name=k, value=v) for k, v in parameters.items()],
+        explanation="",
+    )
+
+
+class StubRouter(RouterInterface):
+    """Router returning fixed tool calls and repairs."""
+
+    def __init__(self, tool_calls, repaired=None):
+        self.tool_calls = tool_calls
+        self.repaired = repaired
+        self.repair_requests = []
+
+    async def route(self, query):
+        return RouterResponse(selected_tools=self.tool_calls, query_analysis="")
+
+    async def repair(self, query, tool_calls, errors):
+        self.repair_requests.append((tool_calls, errors))
+        return self.repaired if self.repaired is not None else tool_calls
+
+
+class RecordingTool(ToolInterface):
+    """Tool recording the parameters it is called with."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, parameters):
+        self.calls.append(parameters)
+        return {"status": "OK"}
+
+
+class EchoReceiver(OutputReceiverInterface):
+    """Output receiver exposing the tool results it received."""
+
+    async def process_results(self, query, tool_results):
+        self.tool_results = tool_results
+        return AssistantResponse(response="ok")
+
+
+def make_processor(router):
+    tools = {ToolType.SEARCH_PLACES: RecordingTool(), ToolType.DIRECTIONS: RecordingTool()}
+    receiver = EchoReceiver()
+    return QueryProcessor(router=router, output_receiver=receiver, tools=tools), tools, receiver
+
+
+def test_parameters_are_coerced_before_execution():
+    """Test that string locations and travel modes are coerced up front."""
+    router = StubRouter([
+        tool_call(ToolType.SEARCH_PLACES, query="khinkali", location="41.6938, 44.8015"),
+        tool_call(ToolType.DIRECTIONS, origin="Tbilisi", destination="Mtskheta", mode="Car"),
+    ])
+    processor, tools, _ = make_processor(router)
+
+    asyncio.run(processor.process_query(UserQuery(query="khinkali near me")))
+
+    assert tools[ToolType.SEARCH_PLACES].calls == [
+        {"query": "khinkali", "location": {"latitude": 41.6938, "longitude": 44.8015}}
+    ]
+    assert tools[ToolType.DIRECTIONS].calls[0]["mode"] == "driving"
+    assert router.repair_requests == []
+
+
+def test_invalid_calls_are_repaired_once_without_executing():
+    """Test that invalid calls go back to the router and never reach the tool."""
+    router = StubRouter(
+        [tool_call(ToolType.DIRECTIONS, origin="Tbilisi")],
+        repaired=[tool_call(ToolType.DIRECTIONS, origin="Tbilisi", destination="Kazbegi")],
+    )
+    processor, tools, receiver = make_processor(router)
+
+    asyncio.run(processor.process_query(UserQuery(query="Route to Kazbegi")))
+
+    assert len(router.repair_requests) == 1
+    assert "destination" in router.repair_requests[0][1][0]
+    assert tools[ToolType.DIRECTIONS].calls == [{"origin": "Tbilisi", "destination": "Kazbegi"}]
+    assert [result.success for result in receiver.tool_results] == [True]
+
+
+def test_unrepairable_calls_fail_without_network():
+    """Test that calls still invalid after repair become failed results."""
+    router = StubRouter([tool_call(ToolType.DIRECTIONS, origin="Tbilisi")])
+    processor, tools, receiver = make_processor(router)
+
+    asyncio.run(processor.process_query(UserQuery(query="Route")))
+
+    assert tools[ToolType.DIRECTIONS].calls == []
+    assert receiver.tool_results[0].success is False
+    assert receiver.tool_results[0].error_message.startswith("Invalid parameters")
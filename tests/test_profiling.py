@@ -0,0 +1,60 @@
+"""Tests for the request profiler."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from georgian_guide.api.main import app
+from georgian_guide.core.profiling import Profiler
+
+
+def spin(seconds):
+    """Keep the event loop busy."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+async def slow_tool():
+    await asyncio.sleep(0.05)
+    spin(0.05)
+
+
+def test_profile_covers_child_tasks_awaits_and_cpu():
+    """Test that running and awaiting frames of the request's tasks are sampled."""
+    async def run():
+        profiler = Profiler(interval=0.002, lag_interval=0.01)
+        profiler.install()
+        with profiler.profile("test") as profile:
+            await asyncio.gather(slow_tool(), asyncio.sleep(0.08))
+        # Work after the request ends is not attributed to it
+        samples = profile.samples
+        await asyncio.sleep(0.02)
+        await profiler.close()
+        return profile, samples
+
+    profile, samples = asyncio.run(run())
+    stacks = profile.collapsed()
+
+    assert profile.samples == samples > 0
+    assert profile.duration > 0 and profile.tasks == []
+    assert "cpu;tests.test_profiling:slow_tool;tests.test_profiling:spin " in stacks
+    assert "await;tests.test_profiling:slow_tool;asyncio.tasks:sleep;Future " in stacks
+    assert profile.max_loop_lag > 0.01
+
+
+def test_admin_endpoints_need_a_configured_token(monkeypatch):
+    """Test that /admin is disabled without a token and checks it otherwise."""
+    monkeypatch.setattr(app.state, "profiler", Profiler(), raising=False)
+    monkeypatch.setattr(app.state, "settings", SimpleNamespace(admin_token=None), raising=False)
+    client = TestClient(app)
+
+    assert client.get("/admin/profiles").status_code == 404
+
+    app.state.settings.admin_token = "secret"
+    assert client.get("/admin/profiles").status_code == 403
+    assert client.get("/admin/profiles", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    response = client.get("/admin/profiles", headers={"X-Admin-Token": "secret"})
+    assert response.json() == {"profiles": []}
@@ -0,0 +1,57 @@
+"""Tests for the query log."""
+
+import asyncio
+import json
+
+from georgian_guide.core.context import RequestTrace, record_cache, report_stage, request_context
+from georgian_guide.core.query_log import QueryLog, log_entry, query_from_entry
+from georgian_guide.schemas.query import UserQuery
+
+
+def test_entry_records_stages_and_cache_outcomes():
+    """Test that the trace of a request ends up in its log entry."""
+    trace = RequestTrace()
+    with request_context(trace=trace):
+        report_stage("routing")
+        record_cache("router", False)
+        report_stage("running_tools")
+        record_cache("tools", True)
+        record_cache("tools", False)
+
+    entry = log_entry(UserQuery(query="Batumi"), "/query", "ok", trace, 1700000000.0)
+
+    assert entry["query"] == "Batumi"
+    assert entry["ts"] == 1700000000.0
+    assert list(entry["stages"]) == ["routing", "running_tools"]
+    assert entry["cache"] == {"router": [0, 1], "tools": [1, 1]}
+    assert "location" not in entry
+
+
+def test_detected_language_survives_the_round_trip():
+    """Test that a query without a language is replayed without one."""
+    query = UserQuery(query="რა ვნახო თბილისში?", language=None)
+    entry = json.loads(json.dumps(log_entry(query, "/query", "ok", RequestTrace(), 0.0)))
+
+    assert entry["language"] is None
+    assert query_from_entry(entry).language is None
+    assert query_from_entry({"query": "Batumi"}).language is None
+    assert query_from_entry({"query": "Batumi", "language": "ru"}).language == "ru"
+
+
+def test_log_is_flushed_in_the_background_and_rotated(tmp_path):
+    """Test asynchronous flushing and size-based rotation."""
+    path = tmp_path / "queries.jsonl"
+    log = QueryLog(str(path), max_bytes=100, backups=2, flush_interval=0.01)
+
+    async def run():
+        log.start()
+        for index in range(3):
+            log.record({"query": f"q{index}", "padding": "x" * 80})
+            await asyncio.sleep(0.05)
+        await log.stop()
+
+    asyncio.run(run())
+
+    assert [json.loads(line)["query"] for line in path.read_text().splitlines()] == ["q2"]
+    assert json.loads((tmp_path / "queries.jsonl.1").read_text())["query"] == "q1"
+    assert json.loads((tmp_path / "queries.jsonl.2").read_text())["query"] == "q0"
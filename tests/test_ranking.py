@@ -0,0 +1,69 @@
+"""Tests for place ranking."""
+
+from georgian_guide.core.geo import extract_coordinates, haversine
+from georgian_guide.core.ranking import PlaceRanker
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import ToolCallResult, UserQuery
+
+
+def place(place_id, name, lat, lng, rating, total):
+    """Build a Google Places text search result."""
+    return {
+        "place_id": place_id,
+        "name": name,
+        "geometry": {"location": {"lat": lat, "lng": lng}},
+        "rating": rating,
+        "user_ratings_total": total,
+        "photos": [{"photo_reference": "x" * 100}],
+    }
+
+
+def test_extract_coordinates_shapes():
+    """Test that all supported location shapes are read."""
+    assert extract_coordinates({"geometry": {"location": {"lat": 41.7, "lng": 44.8}}}) == (41.7, 44.8)
+    assert extract_coordinates({"location": {"latitude": 41.7, "longitude": 44.8}}) == (41.7, 44.8)
+    assert extract_coordinates({"name": "no location"}) is None
+    # Liberty Square to Mtskheta is about 18 km
+    assert 17_000 < haversine(41.6938, 44.8015, 41.8421, 44.7194) < 19_000
+
+
+def test_rank_merges_dedupes_and_scores():
+    """Test merging by place_id, duplicate removal and distance-aware scoring."""
+    ranker = PlaceRanker(top_k=3)
+    origin = (41.6938, 44.8015)
+    places = [
+        place("a", "Shavi Lomi", 41.7000, 44.7900, 4.6, 2000),
+        place("b", "Barbarestan", 41.6960, 44.8040, 4.8, 3000),
+        place("a", "Shavi Lomi", 41.7000, 44.7900, 4.6, 2100),
+        # Same restaurant listed twice a few meters apart
+        place("c", "Barbarestan", 41.69601, 44.80401, 4.8, 10),
+        # Highly rated, but in Mtskheta
+        place("d", "Salobie", 41.8421, 44.7194, 4.9, 5000),
+        place("e", "Unrated", 41.6940, 44.8010, None, None),
+    ]
+
+    ranked = ranker.rank(places, origin)
+
+    assert [p["place_id"] for p in ranked] == ["b", "a", "d"]
+    assert ranked[1]["user_ratings_total"] == 2100
+    assert "photos" not in ranked[0]
+    assert ranked[0]["location"] == {"lat": 41.696, "lng": 44.804}
+    assert ranked[2]["distance_m"] > 15000
+
+
+def test_apply_merges_searches_into_one_result():
+    """Test that overlapping searches reach the output stage as one result."""
+    first = {"status": "OK", "results": [place("a", "Shavi Lomi", 41.70, 44.79, 4.6, 2000)]}
+    second = {"status": "OK", "results": [place("a", "Shavi Lomi", 41.70, 44.79, 4.6, 2000)]}
+    results = [
+        ToolCallResult(tool_type=ToolType.DIRECTIONS, result={}, success=True),
+        ToolCallResult(tool_type=ToolType.SEARCH_PLACES, result=first, success=True),
+        ToolCallResult(tool_type=ToolType.SEARCH_PLACES, result=second, success=True),
+    ]
+
+    merged = PlaceRanker().apply(UserQuery(query="khinkali"), results)
+
+    assert [r.tool_type for r in merged] == [ToolType.DIRECTIONS, ToolType.SEARCH_PLACES]
+    assert [p["place_id"] for p in merged[1].result["results"]] == ["a"]
+    # Tool results may be shared with the cache, so they are never modified
+    assert "photos" in first["results"][0]
@@ -0,0 +1,81 @@
+"""Tests for the reachability tool."""
+
+import asyncio
+
+from georgian_guide.core.gazetteer import get_gazetteer
+from georgian_guide.core.geo import haversine
+from georgian_guide.tools.matrix import MAX_MATRIX_ELEMENTS
+from georgian_guide.tools.reachability import ReachabilityTool
+
+
+class StraightLineMatrixTool:
+    """Distance matrix tool driving straight at 60 km/h between "lat,lng" points."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, parameters):
+        self.calls.append(parameters)
+
+        def point(value):
+            return tuple(float(part) for part in value.split(","))
+
+        return {
+            "status": "OK",
+            "rows": [
+                {"elements": [
+                    {"status": "OK", "duration": {"value": haversine(*point(o), *point(d)) / (60 / 3.6)}}
+                    for d in parameters["destinations"]
+                ]}
+                for o in parameters["origins"]
+            ],
+        }
+
+
+def test_reachable_destinations_are_batched_prefiltered_and_cached():
+    """Test the reachability tool against the gazetteer's destinations."""
+    matrix_tool = StraightLineMatrixTool()
+    tool = ReachabilityTool(matrix_tool, get_gazetteer())
+
+    result = asyncio.run(tool.execute({"origin": "Kutaisi", "max_minutes": 60}))
+
+    minutes = [item["minutes"] for item in result["reachable"]]
+    assert minutes == sorted(minutes) and 0 < len(minutes) < result["checked"]
+    assert max(minutes) <= 60
+    assert "Tbilisi" not in [item["name"] for item in result["reachable"]]
+    assert all(
+        len(call["origins"]) * len(call["destinations"]) <= MAX_MATRIX_ELEMENTS
+        for call in matrix_tool.calls
+    )
+    # Destinations more than 130 km away in a straight line were not requested
+    requested = sum(len(call["destinations"]) for call in matrix_tool.calls)
+    assert requested == result["checked"] < len(get_gazetteer())
+
+    # A shorter limit is answered from the cache, a longer one requests only the new candidates
+    matrix_tool.calls = []
+    shorter = asyncio.run(tool.execute({"origin": "Kutaisi", "max_minutes": 30}))
+    assert matrix_tool.calls == []
+    assert shorter["reachable"] == [item for item in result["reachable"] if item["minutes"] <= 30]
+
+    longer = asyncio.run(tool.execute({"origin": "Kutaisi", "max_minutes": 120}))
+    assert sum(len(call["destinations"]) for call in matrix_tool.calls) == longer["checked"] - result["checked"]
+
+
+def test_failed_matrix_blocks_are_retried_instead_of_cached():
+    """Test that destinations of a failed request are not cached as unreachable."""
+    matrix_tool = StraightLineMatrixTool()
+    answer = matrix_tool.execute
+
+    async def rate_limited(parameters):
+        matrix_tool.calls.append(parameters)
+        return {"status": "OVER_QUERY_LIMIT", "rows": []}
+
+    matrix_tool.execute = rate_limited
+    tool = ReachabilityTool(matrix_tool, get_gazetteer())
+    failed = asyncio.run(tool.execute({"origin": "Kutaisi", "max_minutes": 60}))
+    assert failed["reachable"] == [] and failed["checked"] == 0 and failed["unchecked"] > 0
+
+    matrix_tool.execute = answer
+    result = asyncio.run(tool.execute({"origin": "Kutaisi", "max_minutes": 60}))
+    assert result["reachable"] and result["checked"] == failed["unchecked"]
+    assert result["unchecked"] == 0
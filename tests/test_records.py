@@ -0,0 +1,126 @@
+"""Tests for compact cache records."""
+
+import asyncio
+
+from georgian_guide.core.cache import TTLCache
+from georgian_guide.core.ranking import compact_place
+from georgian_guide.core.records import CompactPlaces, pack_result
+from georgian_guide.core.resilience import CircuitBreaker
+from georgian_guide.core.snapshot import load_snapshot, save_snapshot
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.tools.resilient import ResilientTool
+
+SEARCH = {
+    "status": "OK",
+    "results": [
+        {
+            "place_id": "ChIJ1",
+            "name": "Funicular",
+            "formatted_address": "Mtatsminda, Tbilisi",
+            "geometry": {"location": {"lat": 41.6947213, "lng": 44.7864579}, "viewport": {}},
+            "rating": 4.4,
+            "user_ratings_total": 9120,
+            "price_level": 2,
+            "business_status": "OPERATIONAL",
+            "opening_hours": {"open_now": False},
+            "types": ["restaurant", "food"],
+            "photos": [{"photo_reference": "x" * 200}],
+        },
+        {"place_id": "ChIJ2", "name": "Bridge of Peace", "geometry": {"location": {"lat": 41.693, "lng": 44.8083}}},
+    ],
+}
+
+
+def test_places_record_keeps_what_the_pipeline_reads():
+    """Test that expanding a record gives the same compact places as the raw response."""
+    record = pack_result(ToolType.SEARCH_PLACES, SEARCH)
+    expanded = record.expand()
+
+    assert isinstance(record, CompactPlaces)
+    assert [compact_place(place, None) for place in expanded["results"]] == [
+        compact_place(place, None) for place in SEARCH["results"]
+    ]
+    assert "viewport" not in expanded["results"][0]["geometry"]
+    assert "rating" not in expanded["results"][1]
+    # Type lists are shared between records
+    assert pack_result(ToolType.SEARCH_PLACES, SEARCH).types[0] is record.types[0]
+    # Responses of other shapes are cached as they are
+    assert pack_result(ToolType.SEARCH_PLACES, {"error": "x"}) == {"error": "x"}
+    assert pack_result(ToolType.DIRECTIONS, SEARCH) is SEARCH
+
+
+def test_fresh_results_are_returned_whole_and_cached_compact():
+    """Test that a cache miss returns the upstream response, and the cache its record."""
+    class Search:
+        async def execute(self, parameters):
+            return SEARCH
+
+    cache = TTLCache(max_size=10, ttl=60)
+    tool = ResilientTool(Search(), ToolType.SEARCH_PLACES, cache, CircuitBreaker("records"))
+
+    assert asyncio.run(tool.execute({"query": "funicular"})) is SEARCH
+    assert asyncio.run(tool.execute({"query": "funicular"})) == pack_result(
+        ToolType.SEARCH_PLACES, SEARCH
+    ).expand()
+
+
+def test_records_round_trip_and_survive_snapshots(tmp_path):
+    """Test the exact round trip of the fields kept and the snapshot round trip."""
+    search = {
+        "status": "OK",
+        "next_page_token": "page2",
+        "results": [
+            {
+                "place_id": "ChIJ3",
+                "name": "Narikala",
+                "geometry": {"location": {"lat": 41.6879417, "lng": 44.8085611}},
+                "types": ["tourist_attraction"],
+                "rating": 4.7,
+                "opening_hours": {
+                    "open_now": True,
+                    "periods": [{"open": {"day": 1, "time": "0900"}, "close": {"day": 1, "time": "1800"}}],
+                    "weekday_text": ["Monday: 9:00 AM – 6:00 PM"],
+                },
+                "photos": [{
+                    "height": 3024, "width": 4032, "photo_reference": "AUc7tXW",
+                    "html_attributions": ['<a href="https://maps.google.com/">Nino</a>'],
+                }],
+            },
+            {
+                "place_id": "ChIJ4",
+                "name": "Sioni",
+                "geometry": {"location": {"lat": -0.0000001, "lng": -179.9999999}},
+            },
+            {"place_id": "ChIJ5", "name": "Somewhere"},
+        ],
+    }
+    assert pack_result(ToolType.SEARCH_PLACES, search).expand() == search
+    geocode = {"status": "OK", "results": [{
+        "formatted_address": "Rustaveli Ave 8, Tbilisi, Georgia",
+        "geometry": {"location": {"lat": 41.6979, "lng": 44.7986}, "location_type": "ROOFTOP"},
+        "address_components": [
+            {"long_name": "8", "short_name": "8", "types": ["street_number"]},
+            {"long_name": "Georgia", "short_name": "GE", "types": ["country", "political"]},
+        ],
+    }]}
+    assert pack_result(ToolType.GEOCODE, geocode).expand() == geocode
+    denied = {"status": "REQUEST_DENIED", "error_message": "Invalid key", "results": []}
+    assert pack_result(ToolType.GEOCODE, denied).expand() == denied
+    assert pack_result(ToolType.ELEVATION, {"status": "OK", "results": [{"elevation": 490.5}]}).expand() == {
+        "status": "OK", "results": [{"elevation": 490.5}]
+    }
+
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set("search", pack_result(ToolType.SEARCH_PLACES, SEARCH))
+    cache.set("elevation", pack_result(ToolType.ELEVATION, {
+        "status": "OK", "results": [{"elevation": 490.5, "location": {"lat": 41.7, "lng": 44.8}}]
+    }))
+    path = str(tmp_path / "snapshot")
+    save_snapshot(path, {"tools": cache})
+    loaded = TTLCache(max_size=10, ttl=60)
+    load_snapshot(path, {"tools": loaded})
+
+    assert loaded.get("search").expand() == cache.get("search").expand()
+    assert loaded.get("elevation").expand()["results"] == [
+        {"location": {"lat": 41.7, "lng": 44.8}, "elevation": 490.5}
+    ]
@@ -0,0 +1,88 @@
+"""Tests for the resilience layer."""
+
+import asyncio
+
+import pytest
+
+from georgian_guide.core.cache import TTLCache
+from georgian_guide.core.metrics import Histogram
+from georgian_guide.core.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    TransientError,
+    call_with_retries,
+    hedged,
+)
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.tools.resilient import ResilientTool
+
+NO_DELAY = RetryPolicy(max_attempts=3, base_delay=0.0)
+
+
+class FlakyTool:
+    """Tool that fails a given number of times before succeeding."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    async def execute(self, parameters):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise TransientError("upstream unavailable")
+        return {"status": "OK", "call": self.calls}
+
+
+def test_transient_errors_are_retried():
+    """Test that transient errors are retried up to the attempt limit."""
+    tool = FlakyTool(failures=2)
+    result = asyncio.run(call_with_retries(lambda: tool.execute({}), policy=NO_DELAY))
+    assert result["call"] == 3
+
+
+def test_permanent_errors_are_not_retried():
+    """Test that non-transient errors are raised immediately."""
+    calls = []
+
+    async def bad_request():
+        calls.append(1)
+        raise ValueError("invalid address")
+
+    with pytest.raises(ValueError):
+        asyncio.run(call_with_retries(bad_request, policy=NO_DELAY))
+    assert len(calls) == 1
+
+
+def test_open_circuit_serves_stale_cache():
+    """Test that an open circuit fails fast and falls back to the stale cache."""
+    cache = TTLCache(ttl=0.0, stale_ttl=60.0)
+    breaker = CircuitBreaker("maps", failure_threshold=1, reset_timeout=60.0)
+    tool = ResilientTool(FlakyTool(failures=0), ToolType.GEOCODE, cache, breaker, NO_DELAY)
+
+    first = asyncio.run(tool.execute({"address": "Sighnaghi"}))
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert asyncio.run(tool.execute({"address": "Sighnaghi"})) == first
+
+
+def test_hedged_request_beats_slow_primary():
+    """Test that a hedged duplicate finishes when the primary stalls."""
+    latency = Histogram()
+    for _ in range(20):
+        latency.observe(0.005)
+    delays = iter([1.0, 0.0])
+
+    async def call():
+        await asyncio.sleep(next(delays))
+        return "done"
+
+    async def run():
+        return await asyncio.wait_for(hedged(call, latency, min_delay=0.02), timeout=0.5)
+
+    assert asyncio.run(run()) == "done"
+    # The duplicate's quick answer is not recorded; the stalled primary is
+    assert latency.count == 21 and latency.percentile(100) >= 0.02
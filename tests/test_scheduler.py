@@ -0,0 +1,87 @@
+"""Tests for the upstream scheduler."""
+
+import asyncio
+import time
+
+import pytest
+
+from georgian_guide.core.context import Priority, request_context
+from georgian_guide.core.scheduler import (
+    SchedulerQueueFull,
+    TokenBucket,
+    UpstreamScheduler,
+)
+
+
+def test_token_bucket_wait_time():
+    """Test that an empty bucket reports the time until the next token."""
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.time_until_available() == 0.0
+    bucket.take()
+    assert 0.0 < bucket.time_until_available() <= 0.1
+
+
+def test_interactive_requests_are_served_first():
+    """Test that waiting interactive callers beat earlier batch callers."""
+    scheduler = UpstreamScheduler(upstream_rates={"maps": 20})
+    order = []
+
+    async def call(name, priority):
+        await scheduler.acquire("maps", priority=priority)
+        order.append(name)
+
+    async def run():
+        # Drain the initial burst so every caller has to queue
+        bucket = scheduler._lane("maps").bucket
+        bucket.tokens, bucket.updated = 0, time.monotonic()
+        tasks = [asyncio.create_task(call(f"batch{i}", Priority.BATCH)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("interactive", Priority.INTERACTIVE)))
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order[0] == "interactive"
+    assert order[1:] == ["batch0", "batch1", "batch2"]
+
+
+def test_full_queue_rejects_callers():
+    """Test back-pressure once the bounded queue is full."""
+    scheduler = UpstreamScheduler(upstream_rates={"maps": 1}, max_queue=1)
+
+    async def run():
+        scheduler._lane("maps").bucket.tokens = 0
+        waiting = asyncio.create_task(scheduler.acquire("maps"))
+        await asyncio.sleep(0)
+        with pytest.raises(SchedulerQueueFull):
+            await scheduler.acquire("maps")
+        waiting.cancel()
+
+    asyncio.run(run())
+
+
+def test_raised_priority_moves_a_waiter_ahead():
+    """Test that a waiter whose request priority is raised overtakes batch work."""
+    scheduler = UpstreamScheduler(upstream_rates={"maps": 20})
+    order = []
+
+    async def call(name):
+        await scheduler.acquire("maps")
+        order.append(name)
+
+    async def run():
+        bucket = scheduler._lane("maps").bucket
+        bucket.tokens, bucket.updated = 0, time.monotonic()
+        with request_context(priority=Priority.PREFETCH) as shared:
+            tasks = [asyncio.create_task(call("shared"))]
+        await asyncio.sleep(0)
+        with request_context(priority=Priority.BATCH):
+            tasks += [asyncio.create_task(call(f"batch{i}")) for i in range(2)]
+        await asyncio.sleep(0)
+        # An interactive request joins the shared call while it waits
+        shared.priority = Priority.INTERACTIVE
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+
+    assert order == ["shared", "batch0", "batch1"]
@@ -20,7 +20,7 @@ def test_user_query_schema():
     """Test the UserQuery schema."""
     query = UserQuery(query="I want to eat khinkali in Tbilisi")
     assert query.query == "I want to eat khinkali in Tbilisi"
-    assert query.language == "en"  # Default value
+    assert query.language is None  # Detected from the query by default
     assert query.user_id is None
     assert query.location is None
 
@@ -0,0 +1,180 @@
+"""Tests for streamed answers."""
+
+import asyncio
+import json
+import random
+from types import SimpleNamespace
+
+from georgian_guide.core.cache import TTLCache
+from georgian_guide.core.context import Budget, request_context
+from georgian_guide.core.resilience import get_breaker
+from georgian_guide.llm.output_receiver import OpenAIOutputReceiver
+from georgian_guide.llm.streaming import StreamingJSONParser, repair_json
+from georgian_guide.schemas.query import UserQuery
+from tests.test_processor import StubRouter, make_processor
+
+ANSWER = {
+    "response": 'Try "Zakhar Zakharich" \\ khinkali სახლი \U0001f95f\n',
+    "source_information": [{"name": "Zakhar Zakharich", "rating": 4.6}],
+    "follow_up_questions": ["Is it open now?", "How far is it?"],
+}
+
+
+def test_parser_decodes_any_chunking():
+    """Test that the streamed text and fields do not depend on chunk boundaries."""
+    raw = json.dumps(ANSWER)
+    for seed in range(20):
+        rng = random.Random(seed)
+        parser = StreamingJSONParser()
+        text, position = "", 0
+        while position < len(raw):
+            size = rng.randint(1, 7)
+            text += parser.feed(raw[position:position + size])
+            position += size
+        assert text == ANSWER["response"]
+        assert parser.finish() == ANSWER
+
+
+def test_truncated_completion_keeps_complete_parts():
+    """Test recovery of a completion cut off mid-way."""
+    raw = json.dumps(ANSWER)
+    parser = StreamingJSONParser()
+    text = parser.feed(raw[:raw.index("How far")])
+    fields = parser.finish()
+
+    assert text == ANSWER["response"]
+    assert fields["source_information"] == ANSWER["source_information"]
+    assert fields["follow_up_questions"] == ["Is it open now?"]
+    assert repair_json('[{"a": 1}, {"b": ') == [{"a": 1}]
+
+
+class StreamingCompletions:
+    """Stand-in for the OpenAI client streaming a completion in small chunks."""
+
+    def __init__(self, content, fail_after=None, by_model=None):
+        self.content = content
+        self.fail_after = fail_after
+        # Model -> content, for models answering differently
+        self.by_model = by_model or {}
+        self.models = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        assert kwargs["stream"] is True
+        self.models.append(kwargs["model"])
+        content = self.by_model.get(kwargs["model"], self.content)
+
+        async def chunks():
+            for index in range(0, len(content), 5):
+                if self.fail_after is not None and index >= self.fail_after:
+                    raise ConnectionError("stream reset")
+                yield SimpleNamespace(choices=[
+                    SimpleNamespace(delta=SimpleNamespace(content=content[index:index + 5]))
+                ])
+
+        return chunks()
+
+
+async def collect(events):
+    return [event async for event in events]
+
+
+def test_receiver_streams_text_and_survives_a_reset_stream():
+    """Test the streaming output receiver on complete and interrupted streams."""
+    raw = json.dumps(ANSWER)
+    receiver = OpenAIOutputReceiver()
+    query = UserQuery(query="khinkali")
+
+    receiver._client = StreamingCompletions(raw)
+    events = asyncio.run(collect(receiver.stream_results(query, [])))
+    assert len(events) > 2
+    assert "".join(event.text for event in events[:-1]) == ANSWER["response"]
+    assert events[-1].response.follow_up_questions == ANSWER["follow_up_questions"]
+    assert not events[-1].response.failed
+
+    breaker = get_breaker("openai")
+    receiver._client = StreamingCompletions(raw, fail_after=raw.index("How far"))
+    events = asyncio.run(collect(receiver.stream_results(query, [])))
+    assert events[-1].response.response == ANSWER["response"]
+    assert events[-1].response.follow_up_questions == ["Is it open now?"]
+    # The cut-off answer is flagged, and the breaker saw the failed stream
+    assert events[-1].response.failed
+    assert breaker.failures == 1
+    breaker.record_success()
+
+
+def test_stream_escalates_until_text_was_sent():
+    """Test that the streamed answer uses the cascade while nothing was sent."""
+    receiver = OpenAIOutputReceiver(models=["small", "large"])
+    receiver._client = StreamingCompletions(json.dumps(ANSWER), by_model={"small": "{}"})
+
+    events = asyncio.run(collect(receiver.stream_results(UserQuery(query="khinkali"), [])))
+
+    assert receiver._client.models == ["small", "large"]
+    assert "".join(event.text for event in events[:-1]) == ANSWER["response"]
+
+
+def test_processor_streams_non_streaming_receivers():
+    """Test that receivers without streaming support send their answer as one delta."""
+    processor, _, _ = make_processor(StubRouter([]))
+    events = asyncio.run(collect(processor.stream_query(UserQuery(query="Batumi"))))
+
+    assert [event.event for event in events] == ["delta", "done"]
+    assert events[0].text == events[1].response.response
+
+
+def test_interrupted_stream_is_not_cached():
+    """Test that an answer cut off mid-stream is not cached."""
+    processor, _, _ = make_processor(StubRouter([]))
+    processor.response_cache = TTLCache()
+    receiver = OpenAIOutputReceiver()
+    raw = json.dumps(ANSWER)
+    receiver._client = StreamingCompletions(raw, fail_after=raw.index("How far"))
+    processor.output_receiver = receiver
+
+    events = asyncio.run(collect(processor.stream_query(UserQuery(query="Batumi"))))
+
+    assert events[-1].response.failed
+    assert len(list(processor.response_cache.items())) == 0
+    get_breaker("openai").record_success()
+
+
+def test_missing_answer_is_not_cached():
+    """Test that the apology for an answer without text is flagged and not cached."""
+    processor, _, _ = make_processor(StubRouter([]))
+    processor.response_cache = TTLCache()
+    receiver = OpenAIOutputReceiver(models=["small"])
+    processor.output_receiver = receiver
+
+    async def create(**kwargs):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))])
+
+    receiver._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    response = asyncio.run(processor.process_query(UserQuery(query="Batumi")))
+    assert response.failed and response.response
+    response = asyncio.run(processor.process_query(UserQuery(query="ბათუმი", language="ka")))
+    assert response.response == "ბოდიში, სათანადო პასუხის მომზადება ვერ მოვახერხე."
+
+    receiver._client = StreamingCompletions("{}")
+    events = asyncio.run(collect(processor.stream_query(UserQuery(query="Batumi"))))
+    assert events[-1].response.failed
+    assert len(list(processor.response_cache.items())) == 0
+
+
+def test_stream_without_an_answer_still_ends_with_done():
+    """Test that a receiver ending without events is answered from the template fallback."""
+    class SilentReceiver:
+        async def stream_results(self, query, tool_results):
+            return
+            yield
+
+    processor, _, _ = make_processor(StubRouter([]))
+    processor.response_cache = TTLCache()
+    processor.output_receiver = SilentReceiver()
+
+    for budget in (None, Budget.start(5.0)):
+        with request_context(budget=budget):
+            events = asyncio.run(collect(processor.stream_query(UserQuery(query="Batumi"))))
+        assert [event.event for event in events] == ["delta", "done"]
+        assert events[-1].response.failed
+    assert len(list(processor.response_cache.items())) == 0
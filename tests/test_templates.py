@@ -0,0 +1,66 @@
+"""Tests for template answers."""
+
+import asyncio
+
+from georgian_guide.core.gazetteer import get_gazetteer
+from georgian_guide.core.templates import TemplateOutputReceiver
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import ToolCallResult, UserQuery
+from georgian_guide.tools.gazetteer import geocode_result
+from tests.test_processor import EchoReceiver
+
+DISTANCE = {
+    "status": "OK",
+    "origin_addresses": ["Tbilisi, Georgia"],
+    "destination_addresses": ["Mtskheta, Georgia"],
+    "rows": [{"elements": [{
+        "status": "OK",
+        "distance": {"value": 21430, "text": "21.4 km"},
+        "duration": {"value": 1740, "text": "29 mins"},
+    }]}],
+}
+
+
+def result(tool_type, data, success=True):
+    return ToolCallResult(tool_type=tool_type, result=data, success=success)
+
+
+def test_simple_results_are_rendered_without_the_wrapped_receiver():
+    """Test localized template answers for a distance and an elevation."""
+    receiver = TemplateOutputReceiver(EchoReceiver())
+
+    response = asyncio.run(receiver.process_results(
+        UserQuery(query="რა მანძილია თბილისიდან მცხეთამდე?", language="ka"),
+        [result(ToolType.DISTANCE_MATRIX, DISTANCE)]
+    ))
+    assert response.response == "Tbilisi, Georgia → Mtskheta, Georgia: 21.4 კმ, დაახლოებით 29 წთ"
+    assert len(response.follow_up_questions) == 2
+
+    response = asyncio.run(receiver.process_results(
+        UserQuery(query="Kazbegi elevation", language="en"),
+        [result(ToolType.ELEVATION, {"status": "OK", "results": [
+            {"elevation": 1740.4, "location": {"lat": 42.6571, "lng": 44.6417}},
+        ]})]
+    ))
+    assert response.response == "42.6571, 44.6417: 1740 m above sea level"
+    assert not hasattr(receiver.receiver, "tool_results")
+
+
+def test_other_results_go_to_the_wrapped_receiver():
+    """Test that failed, combined or ambiguous results are not templated."""
+    receiver = TemplateOutputReceiver(EchoReceiver())
+    query = UserQuery(query="Mtskheta")
+    geocode = {"status": "OK", "results": [
+        {"formatted_address": "Mtskheta, Georgia"}, {"formatted_address": "Mtskheta Street, Tbilisi"},
+    ]}
+
+    for tool_results in (
+        [result(ToolType.DISTANCE_MATRIX, {}, success=False)],
+        [result(ToolType.DISTANCE_MATRIX, DISTANCE), result(ToolType.SEARCH_PLACES, {"results": []})],
+        [result(ToolType.GEOCODE, geocode)],
+        # Near-miss spellings resolved by the gazetteer are not stated as fact
+        [result(ToolType.GEOCODE, geocode_result(get_gazetteer().resolve("Svetitskoveli")))],
+    ):
+        response = asyncio.run(receiver.process_results(query, tool_results))
+        assert response.response == "ok"
+        assert receiver.receiver.tool_results == tool_results
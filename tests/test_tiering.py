@@ -0,0 +1,84 @@
+"""Tests for LLM model tiering."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from georgian_guide.core.metrics import metrics
+from georgian_guide.llm.router import OpenAILLMRouter
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import UserQuery
+
+
+def completion(data):
+    """Build a fake chat completion returning the given JSON data."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(data)))],
+        usage=SimpleNamespace(prompt_tokens=1000, completion_tokens=100),
+    )
+
+
+class FakeCompletions:
+    """Fake chat completions API answering per model."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.models = []
+
+    async def create(self, model, **kwargs):
+        self.models.append(model)
+        return completion(self.answers[model])
+
+
+def make_router(answers):
+    router = OpenAILLMRouter(models=["small", "large"])
+    completions = FakeCompletions(answers)
+    router._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return router, completions
+
+
+def test_small_model_answer_is_used_when_valid():
+    """Test that a valid routing decision from the small model is not escalated."""
+    router, completions = make_router({
+        "small": {
+            "selected_tools": [{
+                "tool_type": "GEOCODE",
+                "parameters": [{"name": "address", "value": "Mtskheta"}],
+                "explanation": "Find Mtskheta",
+            }],
+            "query_analysis": "",
+        },
+    })
+
+    response = asyncio.run(router.route(UserQuery(query="Where is Mtskheta?")))
+
+    assert completions.models == ["small"]
+    assert response.selected_tools[0].tool_type == ToolType.GEOCODE
+
+
+def test_missing_parameters_escalate_to_large_model():
+    """Test that a low-confidence routing decision is escalated."""
+    metrics.reset()
+    router, completions = make_router({
+        "small": {
+            "selected_tools": [{"tool_type": "DIRECTIONS", "parameters": [], "explanation": ""}],
+        },
+        "large": {
+            "selected_tools": [{
+                "tool_type": "DIRECTIONS",
+                "parameters": [
+                    {"name": "origin", "value": "Tbilisi"},
+                    {"name": "destination", "value": "Kazbegi"},
+                ],
+                "explanation": "Route to Kazbegi",
+            }],
+        },
+    })
+
+    response = asyncio.run(router.route(UserQuery(query="Tbilisi to Kazbegi")))
+
+    assert completions.models == ["small", "large"]
+    assert len(response.selected_tools[0].parameters) == 2
+    counters = metrics.snapshot()["counters"]
+    assert counters["llm_escalations_total{component=router,model=small,reason=missing_parameters}"] == 1
+    assert counters["llm_tier_served_total{component=router,model=large}"] == 1
@@ -0,0 +1,182 @@
+"""Tests for the tools package."""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from georgian_guide.core.config import Settings
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.tools import PlacesSearchRequest
+from georgian_guide.tools import google_maps
+from georgian_guide.tools.registry import ToolRegistry
+from georgian_guide.tools.session import MapsBackend, MapsSession
+
+
+class RecordingBackend(MapsBackend):
+    """Backend that records calls and tracks peak concurrency."""
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def call(self, function_name, parameters):
+        self.calls.append((function_name, parameters))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return self.response
+
+
+def test_registry_builds_tools_once_with_shared_session():
+    """Test that the registry caches tools and shares one session."""
+    registry = ToolRegistry(Settings())
+
+    geocode = registry[ToolType.GEOCODE]
+    directions = registry[ToolType.DIRECTIONS]
+
+    assert registry[ToolType.GEOCODE] is geocode
+    assert geocode.tool.tool.session is directions.tool.session is registry.session
+    assert ToolType.ELEVATION in registry
+    assert len(registry) == 10
+
+
+def test_mcp_backend_dispatch_table(monkeypatch):
+    """Test that the MCP backend passes only the declared parameters."""
+    received = {}
+
+    async def fake_directions(origin, destination, mode=None):
+        received.update(origin=origin, destination=destination, mode=mode)
+        return {"routes": [], "status": "OK"}
+
+    monkeypatch.setattr(google_maps, "mcp_google_maps_maps_directions", fake_directions)
+
+    tool = google_maps.DirectionsMapsTool(MapsSession(google_maps.MCPMapsBackend()))
+    result = asyncio.run(tool.execute({"origin": "Tbilisi", "destination": "Mtskheta"}))
+
+    assert result["status"] == "OK"
+    assert received == {"origin": "Tbilisi", "destination": "Mtskheta", "mode": None}
+
+
+def test_session_enforces_per_tool_concurrency():
+    """Test that the session limits concurrent calls per tool type."""
+    backend = RecordingBackend({"results": [], "status": "OK"})
+    session = MapsSession(backend, concurrency={ToolType.GEOCODE: 2})
+    tool = google_maps.GeocodeMapsTool(session)
+
+    async def run():
+        await asyncio.gather(*(tool.execute({"address": "Batumi"}) for _ in range(6)))
+
+    asyncio.run(run())
+
+    assert len(backend.calls) == 6
+    assert backend.peak == 2
+
+
+def test_tool_results_are_not_copied():
+    """Test that tools return the backend payload itself, validated unless trusted."""
+    payload = {"results": [{"place_id": "abc"}], "status": "OK"}
+    backend = RecordingBackend(payload)
+    tool = google_maps.SearchPlacesMapsTool(MapsSession(backend))
+
+    assert asyncio.run(tool.execute({"query": "khinkali"})) is payload
+
+    backend.response = {"status": "OK"}
+    with pytest.raises(ValidationError):
+        asyncio.run(tool.execute({"query": "khinkali"}))
+
+    backend.trusted = True
+    assert asyncio.run(tool.execute({"query": "khinkali"})) is backend.response
+
+
+def test_gazetteer_answers_known_places_and_canonicalizes_cache_keys():
+    """Test that known places skip the backend and spellings share cache entries."""
+    backend = RecordingBackend({"results": [], "status": "OK"})
+    registry = ToolRegistry(Settings())
+    registry._session = MapsSession(backend)
+    geocode = registry[ToolType.GEOCODE]
+
+    for address in ("Mtskheta", "Mcxeta", "მცხეთა", "Мцхета, Georgia"):
+        result = asyncio.run(geocode.execute({"address": address}))
+        assert result["results"][0]["formatted_address"] == "Mtskheta, Georgia"
+
+    for address in ("Cafe Linville", "cafe  linville"):
+        asyncio.run(geocode.execute({"address": address}))
+    assert backend.calls == [("mcp_google_maps_maps_geocode", {"address": "Cafe Linville"})]
+
+
+def test_nearby_reverse_geocodes_share_one_lookup():
+    """Test that points within the tolerance are answered from the spatial cache."""
+    backend = RecordingBackend({
+        "results": [{
+            "formatted_address": "Erekle II St, Tbilisi",
+            "geometry": {"location": {"lat": 41.6938, "lng": 44.8066}},
+        }],
+        "status": "OK",
+    })
+    registry = ToolRegistry(Settings(reverse_geocode_precision=8, reverse_geocode_tolerance=60))
+    registry._session = MapsSession(backend)
+    reverse_geocode = registry[ToolType.REVERSE_GEOCODE]
+
+    # 20 m and 45 m away in neighbouring cells, then 200 m away
+    for latitude, longitude in ((41.6938, 44.8066), (41.69398, 44.8066), (41.6938, 44.80714), (41.6956, 44.8066)):
+        result = asyncio.run(reverse_geocode.execute({"latitude": latitude, "longitude": longitude}))
+        assert result["results"][0]["formatted_address"] == "Erekle II St, Tbilisi"
+
+    assert [parameters["latitude"] for _, parameters in backend.calls] == [41.6938, 41.6956]
+
+
+def test_open_now_search_calls_details_only_for_unknown_hours():
+    """Test that indexed hours and the search's open_now flag spare details calls."""
+    always_open = {"periods": [{"open": {"day": 0, "time": "0000"}}]}
+    backend = RecordingBackend({
+        "results": [
+            {"place_id": "indexed", "name": "Indexed"},
+            {"place_id": "flagged", "name": "Flagged", "opening_hours": {"open_now": False}},
+            {"place_id": "unknown", "name": "Unknown"},
+        ],
+        "status": "OK",
+    })
+    registry = ToolRegistry(Settings())
+    registry._session = MapsSession(backend)
+    registry.opening_hours.add_google("indexed", always_open)
+    search = registry[ToolType.SEARCH_PLACES]
+
+    async def call(function_name, parameters):
+        backend.calls.append((function_name, parameters))
+        if function_name == "mcp_google_maps_maps_place_details":
+            return {"result": {"place_id": parameters["place_id"], "opening_hours": always_open}, "status": "OK"}
+        return backend.response
+
+    backend.call = call
+    result = asyncio.run(search.execute({"query": "khinkali", "open_now": True}))
+
+    assert [place["place_id"] for place in result["results"]] == ["indexed", "unknown"]
+    assert backend.calls == [
+        ("mcp_google_maps_maps_search_places", {"query": "khinkali"}),
+        ("mcp_google_maps_maps_place_details", {"place_id": "unknown"}),
+    ]
+    assert "unknown" in registry.opening_hours
+
+
+def test_open_now_search_keeps_places_with_unknown_hours():
+    """Test that places past the details limit are kept and marked as unchecked."""
+    backend = RecordingBackend({
+        "results": [{"place_id": f"p{number}", "name": f"Place {number}"} for number in range(3)],
+        "status": "OK",
+    })
+    registry = ToolRegistry(Settings(open_now_details_limit=0))
+    registry._session = MapsSession(backend)
+    registry.opening_hours.add_google("p0", {"periods": [{"open": {"day": 0, "time": "0000"}}]})
+    search = registry[ToolType.SEARCH_PLACES]
+
+    result = asyncio.run(search.execute({"query": "khinkali", "open_at": "21:30"}))
+
+    assert [(place["place_id"], place["open_status"]) for place in result["results"]] == [
+        ("p0", "open"), ("p1", "unknown"), ("p2", "unknown"),
+    ]
+    with pytest.raises(ValidationError):
+        PlacesSearchRequest(query="khinkali", open_at="9pm")
@@ -0,0 +1,136 @@
+"""Tests for the answer cache, cache snapshots and the warm-up."""
+
+import asyncio
+import time
+
+from georgian_guide.core.cache import TTLCache
+from georgian_guide.core.interfaces import (
+    OutputReceiverInterface,
+    RouterInterface,
+    ToolInterface,
+)
+from georgian_guide.core.processor import QueryProcessor
+from georgian_guide.core.snapshot import load_snapshot, processor_caches, save_snapshot
+from georgian_guide.core.warmup import coverage_report, top_queries, warm_up
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import (
+    AssistantResponse,
+    RouterResponse,
+    ToolCall,
+    ToolParameter,
+    UserQuery,
+)
+
+
+class CachingRouter(RouterInterface):
+    """Router selecting one place search and counting its calls."""
+
+    def __init__(self):
+        self.cache = TTLCache()
+        self.calls = 0
+
+    async def route(self, query):
+        self.calls += 1
+        call = ToolCall(
+            tool_type=ToolType.SEARCH_PLACES,
+            parameters=[ToolParameter(name="query", value=query.query)],
+            explanation="",
+        )
+        return RouterResponse(selected_tools=[call], query_analysis="")
+
+    async def repair(self, query, tool_calls, errors):
+        return tool_calls
+
+
+class PlacesTool(ToolInterface):
+    """Place search tool that can be made to fail."""
+
+    def __init__(self):
+        self.fail = False
+
+    async def execute(self, parameters):
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return {"status": "OK", "results": []}
+
+
+class TextReceiver(OutputReceiverInterface):
+    """Output receiver answering with the query text, or apologizing for "Gori"."""
+
+    async def process_results(self, query, tool_results):
+        if query.query == "Gori":
+            return AssistantResponse(response="I apologize, but I encountered an error", failed=True)
+        return AssistantResponse(response=query.query)
+
+
+def make_processor():
+    tool = PlacesTool()
+    processor = QueryProcessor(
+        router=CachingRouter(),
+        output_receiver=TextReceiver(),
+        tools={ToolType.SEARCH_PLACES: tool},
+        response_cache=TTLCache(),
+    )
+    return processor, tool
+
+
+def test_answers_are_cached_unless_a_tool_failed():
+    """Test that complete answers are reused and degraded ones are not."""
+    processor, tool = make_processor()
+
+    async def run():
+        tool.fail = True
+        await processor.process_query(UserQuery(query="Khinkali in Tbilisi"))
+        tool.fail = False
+        await processor.process_query(UserQuery(query="Khinkali in Tbilisi"))
+        # Same query with different spacing and case
+        await processor.process_query(UserQuery(query="  khinkali in  TBILISI"))
+
+    asyncio.run(run())
+
+    assert processor.router.calls == 2
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Test that snapshot entries are restored with their model types."""
+    path = str(tmp_path / "cache.snapshot")
+    source = {"router": TTLCache(), "tools": TTLCache(), "responses": TTLCache()}
+    source["router"].set("r", RouterResponse(selected_tools=[], query_analysis="x"))
+    source["tools"].set("t", {"status": "OK", "name": "თბილისი"})
+    source["tools"].set("expired", {"status": "OK"}, ttl=-1)
+    source["responses"].set("a", AssistantResponse(response="hi"), ttl=60)
+
+    counts = save_snapshot(path, source)
+    target = {"router": TTLCache(), "tools": TTLCache(), "responses": TTLCache()}
+    loaded = load_snapshot(path, target)
+
+    assert counts == {"router": 1, "tools": 1, "responses": 1}
+    assert loaded == counts
+    assert isinstance(target["router"].get("r"), RouterResponse)
+    assert target["tools"].get("t") == {"status": "OK", "name": "თბილისი"}
+    assert target["responses"].get("a").response == "hi"
+    # Freshness is carried over rather than reset to the cache TTL
+    assert next(target["responses"].items())[2] <= 60
+
+
+def test_warm_up_fills_caches_and_reports_coverage(tmp_path):
+    """Test the warm-up of the most frequent queries and its coverage report."""
+    log = [UserQuery(query=text) for text in ["Batumi"] * 5 + ["Kutaisi"] * 3 + ["Gori"]]
+    selected = top_queries(log, limit=3)
+    assert [query.query for query in selected] == ["Batumi", "Kutaisi", "Gori"]
+
+    processor, _ = make_processor()
+    result = asyncio.run(warm_up(processor, selected, concurrency=2))
+    path = str(tmp_path / "cache.snapshot")
+    save_snapshot(path, processor_caches(processor))
+
+    fresh, _ = make_processor()
+    load_snapshot(path, processor_caches(fresh))
+    asyncio.run(fresh.process_query(UserQuery(query="Batumi")))
+
+    report = coverage_report(result.warmed, log)
+    # The failed answer to "Gori" is neither cached nor counted as warmed
+    assert (result.succeeded, result.uncached) == (2, 1)
+    assert fresh.router.calls == 0
+    assert (report.covered, report.total) == (8, 9)
+    assert report.uncovered == [("gori", 1)]
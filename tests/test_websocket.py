@@ -0,0 +1,112 @@
+"""Tests for the WebSocket chat endpoint."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from georgian_guide.api.main import app
+from georgian_guide.core.context import report_stage
+from georgian_guide.schemas.base import ToolType
+from georgian_guide.schemas.query import AssistantResponse, StreamEvent, ToolCallResult
+
+
+class StubProcessor:
+    """Processor streaming a canned answer, slowly for queries mentioning "slow"."""
+
+    def __init__(self):
+        self.queries = []
+
+    async def stream_query(self, query):
+        self.queries.append(query)
+        report_stage("routing")
+        if "slow" in query.query:
+            await asyncio.sleep(10)
+        if "wine bars" in query.query:
+            yield StreamEvent(event="tools", tool_results=[ToolCallResult(
+                tool_type=ToolType.SEARCH_PLACES,
+                result={"status": "OK", "results": [{
+                    "name": "Vino Underground", "address": "15 Galaktion Tabidze St",
+                    "location": {"lat": 41.6931, "lng": 44.8015}, "rating": 4.6,
+                }]},
+                success=True
+            )])
+        else:
+            yield StreamEvent(event="tools", tool_results=[
+                ToolCallResult(tool_type=ToolType.KNOWLEDGE, result={"status": "OK"}, success=True)
+            ])
+        yield StreamEvent(event="delta", text="Gaumarjos")
+        yield StreamEvent(event="done", response=AssistantResponse(
+            response="Gaumarjos", follow_up_questions=["Where to drink wine?"]
+        ))
+
+
+def receive_until_done(websocket, query_id):
+    messages = []
+    while not messages or messages[-1]["type"] != "done":
+        message = websocket.receive_json()
+        assert message["id"] == query_id
+        messages.append(message)
+    return messages
+
+
+@pytest.fixture
+def processor(monkeypatch):
+    """Serve the app with a stub processor, restoring its state afterwards."""
+    processor = StubProcessor()
+    monkeypatch.setattr(app.state, "processor", processor, raising=False)
+    monkeypatch.setattr(app.state, "settings", SimpleNamespace(request_deadline=0), raising=False)
+    monkeypatch.setattr(app.state, "query_log", None, raising=False)
+    return processor
+
+
+def test_socket_streams_events_and_keeps_session_state(processor):
+    """Test the event stream, session state, concurrent queries and cancellation."""
+    with TestClient(app).websocket_connect("/ws") as websocket:
+        websocket.send_json({
+            "type": "query", "id": "a", "query": "supra toasts",
+            "location": {"latitude": 41.69, "longitude": 44.8}, "language": "en",
+        })
+        messages = receive_until_done(websocket, "a")
+        assert [message["type"] for message in messages] == ["stage", "tools", "delta", "done"]
+        assert messages[1]["tools"] == [{"tool_type": "knowledge", "success": True, "status": "OK"}]
+        assert messages[-1]["response"]["follow_up_questions"] == ["Where to drink wine?"]
+
+        # A slow query does not hold up the next one on the same socket
+        websocket.send_json({"type": "query", "id": "b", "query": "slow question"})
+        assert websocket.receive_json() == {"type": "stage", "id": "b", "stage": "routing"}
+        websocket.send_json({"type": "query", "id": "c", "query": "follow-up"})
+        receive_until_done(websocket, "c")
+        websocket.send_json({"type": "cancel", "id": "b"})
+        assert websocket.receive_json() == {"type": "cancelled", "id": "b"}
+
+        websocket.send_json({"type": "dance"})
+        assert websocket.receive_json()["status"] == 400
+
+    # The follow-up kept the location and language of the first query
+    assert processor.queries[-1].location == {"latitude": 41.69, "longitude": 44.8}
+    assert processor.queries[-1].language == "en"
+
+
+def test_invalid_context_is_rejected_and_places_carry_over(processor):
+    """Test that bad values are not remembered and follow-ups see earlier places."""
+    with TestClient(app).websocket_connect("/ws") as websocket:
+        websocket.send_json({"type": "context", "language": "ka"})
+        websocket.send_json({"type": "context", "id": "x", "location": {"latitude": "north"}})
+        assert websocket.receive_json()["status"] == 422
+        websocket.send_json({"type": "query", "id": "a", "query": "wine bars", "language": 5})
+        assert websocket.receive_json()["status"] == 422
+
+        websocket.send_json({"type": "query", "id": "b", "query": "wine bars"})
+        receive_until_done(websocket, "b")
+        websocket.send_json({"type": "query", "id": "c", "query": "How far is it from there?"})
+        receive_until_done(websocket, "c")
+
+    first, follow_up = processor.queries
+    assert first.language == follow_up.language == "ka"
+    assert first.location is None and first.recent_places is None
+    assert follow_up.recent_places == [{
+        "name": "Vino Underground", "address": "15 Galaktion Tabidze St",
+        "location": {"lat": 41.6931, "lng": 44.8015},
+    }]